@@ -0,0 +1,31 @@
+C     -*- fortran -*-
+C     This file is autogenerated with f2py (version:2)
+C     It contains Fortran 77 wrappers to fortran functions.
+
+      subroutine f2pywrapmsta1 (msta1f2pywrap, x, mp)
+      external msta1
+      double precision x
+      integer mp
+      integer msta1f2pywrap, msta1
+      msta1f2pywrap = msta1(x, mp)
+      end
+
+
+      subroutine f2pywrapmsta2 (msta2f2pywrap, x, n, mp)
+      external msta2
+      double precision x
+      integer n
+      integer mp
+      integer msta2f2pywrap, msta2
+      msta2f2pywrap = msta2(x, n, mp)
+      end
+
+
+      subroutine f2pywrapenvj (envjf2pywrap, n, x)
+      external envj
+      integer n
+      double precision x
+      real*8 envjf2pywrap, envj
+      envjf2pywrap = envj(n, x)
+      end
+
@@ -0,0 +1,4105 @@
+/* File: mieangfuncsmodule.c
+ * This file is auto-generated with f2py (version:2).
+ * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
+ * written by Pearu Peterson <pearu@cens.ioc.ee>.
+ * Generation date: Fri Oct 16 23:22:28 2026
+ * Do not edit this file directly unless you know what you are doing!!!
+ */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*********************** See f2py2e/cfuncs.py: includes ***********************/
+#include "Python.h"
+#include <stdarg.h>
+#include "fortranobject.h"
+#include <math.h>
+
+/**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
+static PyObject *mieangfuncs_error;
+static PyObject *mieangfuncs_module;
+
+/*********************** See f2py2e/cfuncs.py: typedefs ***********************/
+typedef struct {double r,i;} complex_double;
+
+/****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
+/*need_typedefs_generated*/
+
+/********************** See f2py2e/cfuncs.py: cppmacros **********************/
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F
+#else
+#define F_FUNC(f,F) _##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F##_
+#else
+#define F_FUNC(f,F) _##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F
+#else
+#define F_FUNC(f,F) f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F##_
+#else
+#define F_FUNC(f,F) f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_FUNC_US(f,F) F_FUNC(f##_,F##_)
+#else
+#define F_FUNC_US(f,F) F_FUNC(f,F)
+#endif
+
+#define rank(var) var ## _Rank
+#define shape(var,dim) var ## _Dims[dim]
+#define old_rank(var) (PyArray_NDIM((PyArrayObject *)(capi_ ## var ## _tmp)))
+#define old_shape(var,dim) PyArray_DIM(((PyArrayObject *)(capi_ ## var ## _tmp)),dim)
+#define fshape(var,dim) shape(var,rank(var)-dim-1)
+#define len(var) shape(var,0)
+#define flen(var) fshape(var,0)
+#define old_size(var) PyArray_SIZE((PyArrayObject *)(capi_ ## var ## _tmp))
+/* #define index(i) capi_i ## i */
+#define slen(var) capi_ ## var ## _len
+#define size(var, ...) f2py_size((PyArrayObject *)(capi_ ## var ## _tmp), ## __VA_ARGS__, -1)
+
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
+#ifndef max
+#define max(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef min
+#define min(a,b) ((a < b) ? (a) : (b))
+#endif
+#ifndef MAX
+#define MAX(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef MIN
+#define MIN(a,b) ((a < b) ? (a) : (b))
+#endif
+
+#define CHECKSCALAR(check,tcheck,name,show,var)\
+    if (!(check)) {\
+        char errstring[256];\
+        sprintf(errstring, "%s: "show, "("tcheck") failed for "name, var);\
+        PyErr_SetString(mieangfuncs_error,errstring);\
+        /*goto capi_fail;*/\
+    } else 
+#define pyobj_from_complex_double1(v) (PyComplex_FromDoubles(v.r,v.i))
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_WRAPPEDFUNC(f,F) _F2PYWRAP##F
+#else
+#define F_WRAPPEDFUNC(f,F) _f2pywrap##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_WRAPPEDFUNC(f,F) _F2PYWRAP##F##_
+#else
+#define F_WRAPPEDFUNC(f,F) _f2pywrap##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_WRAPPEDFUNC(f,F) F2PYWRAP##F
+#else
+#define F_WRAPPEDFUNC(f,F) f2pywrap##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_WRAPPEDFUNC(f,F) F2PYWRAP##F##_
+#else
+#define F_WRAPPEDFUNC(f,F) f2pywrap##f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_WRAPPEDFUNC_US(f,F) F_WRAPPEDFUNC(f##_,F##_)
+#else
+#define F_WRAPPEDFUNC_US(f,F) F_WRAPPEDFUNC(f,F)
+#endif
+
+
+/************************ See f2py2e/cfuncs.py: cfuncs ************************/
+static int f2py_size(PyArrayObject* var, ...)
+{
+  npy_int sz = 0;
+  npy_int dim;
+  npy_int rank;
+  va_list argp;
+  va_start(argp, var);
+  dim = va_arg(argp, npy_int);
+  if (dim==-1)
+    {
+      sz = PyArray_SIZE(var);
+    }
+  else
+    {
+      rank = PyArray_NDIM(var);
+      if (dim>=1 && dim<=rank)
+        sz = PyArray_DIM(var, dim-1);
+      else
+        fprintf(stderr, "f2py_size: 2nd argument value=%d fails to satisfy 1<=value<=%d. Result will be 0.\n", dim, rank);
+    }
+  va_end(argp);
+  return sz;
+}
+
+static int double_from_pyobj(double* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyFloat_Check(obj)) {
+#ifdef __sgi
+        *v = PyFloat_AsDouble(obj);
+#else
+        *v = PyFloat_AS_DOUBLE(obj);
+#endif
+        return 1;
+    }
+    tmp = PyNumber_Float(obj);
+    if (tmp) {
+#ifdef __sgi
+        *v = PyFloat_AsDouble(tmp);
+#else
+        *v = PyFloat_AS_DOUBLE(tmp);
+#endif
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (double_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = mieangfuncs_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int int_from_pyobj(int* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyInt_Check(obj)) {
+        *v = (int)PyInt_AS_LONG(obj);
+        return 1;
+    }
+    tmp = PyNumber_Int(obj);
+    if (tmp) {
+        *v = PyInt_AS_LONG(tmp);
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (int_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = mieangfuncs_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int complex_double_from_pyobj(complex_double* v,PyObject *obj,const char *errmess) {
+    Py_complex c;
+    if (PyComplex_Check(obj)) {
+        c=PyComplex_AsCComplex(obj);
+        (*v).r=c.real, (*v).i=c.imag;
+        return 1;
+    }
+    if (PyArray_IsScalar(obj, ComplexFloating)) {
+        if (PyArray_IsScalar(obj, CFloat)) {
+            npy_cfloat new;
+            PyArray_ScalarAsCtype(obj, &new);
+            (*v).r = (double)new.real;
+            (*v).i = (double)new.imag;
+        }
+        else if (PyArray_IsScalar(obj, CLongDouble)) {
+            npy_clongdouble new;
+            PyArray_ScalarAsCtype(obj, &new);
+            (*v).r = (double)new.real;
+            (*v).i = (double)new.imag;
+        }
+        else { /* if (PyArray_IsScalar(obj, CDouble)) */
+            PyArray_ScalarAsCtype(obj, v);
+        }
+        return 1;
+    }
+    if (PyArray_CheckScalar(obj)) { /* 0-dim array or still array scalar */
+        PyObject *arr;
+        if (PyArray_Check(obj)) {
+            arr = PyArray_Cast((PyArrayObject *)obj, NPY_CDOUBLE);
+        }
+        else {
+            arr = PyArray_FromScalar(obj, PyArray_DescrFromType(NPY_CDOUBLE));
+        }
+        if (arr==NULL) return 0;
+        (*v).r = ((npy_cdouble *)PyArray_DATA(arr))->real;
+        (*v).i = ((npy_cdouble *)PyArray_DATA(arr))->imag;
+        return 1;
+    }
+    /* Python does not provide PyNumber_Complex function :-( */
+    (*v).i=0.0;
+    if (PyFloat_Check(obj)) {
+#ifdef __sgi
+        (*v).r = PyFloat_AsDouble(obj);
+#else
+        (*v).r = PyFloat_AS_DOUBLE(obj);
+#endif
+        return 1;
+    }
+    if (PyInt_Check(obj)) {
+        (*v).r = (double)PyInt_AS_LONG(obj);
+        return 1;
+    }
+    if (PyLong_Check(obj)) {
+        (*v).r = PyLong_AsDouble(obj);
+        return (!PyErr_Occurred());
+    }
+    if (PySequence_Check(obj) && !(PyString_Check(obj) || PyUnicode_Check(obj))) {
+        PyObject *tmp = PySequence_GetItem(obj,0);
+        if (tmp) {
+            if (complex_double_from_pyobj(v,tmp,errmess)) {
+                Py_DECREF(tmp);
+                return 1;
+            }
+            Py_DECREF(tmp);
+        }
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL)
+            err = PyExc_TypeError;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+
+/********************* See f2py2e/cfuncs.py: userincludes *********************/
+/*need_userincludes*/
+
+/********************* See f2py2e/capi_rules.py: usercode *********************/
+
+
+/* See f2py2e/rules.py */
+extern void F_FUNC_US(calc_scat_field,CALC_SCAT_FIELD)(double*,double*,complex_double*,double*,complex_double*);
+extern void F_FUNC_US(mie_fields,MIE_FIELDS)(int*,double*,complex_double*,int*,double*,int*,int*,complex_double*,complex_double*,complex_double*);
+extern void F_FUNC_US(mie_internal_fields,MIE_INTERNAL_FIELDS)(int*,double*,complex_double*,complex_double*,int*,double*,complex_double*,complex_double*,complex_double*);
+extern void F_FUNC_US(tmatrix_fields,TMATRIX_FIELDS)(int*,double*,complex_double*,int*,double*,double*,int*,complex_double*,complex_double*,complex_double*);
+extern void F_FUNC_US(mie_int_point,MIE_INT_POINT)(int*,complex_double*,complex_double*,double*,complex_double*);
+extern void F_FUNC_US(asm_mie_fullradial,ASM_MIE_FULLRADIAL)(int*,complex_double*,double*,complex_double*);
+extern void F_FUNC_US(asm_mie_far,ASM_MIE_FAR)(int*,complex_double*,double*,complex_double*);
+extern void F_FUNC_US(asm_mie_far_arr,ASM_MIE_FAR_ARR)(int*,complex_double*,int*,double*,complex_double*);
+extern void F_FUNC_US(radial_field_mie,RADIAL_FIELD_MIE)(int*,complex_double*,double*,double*,complex_double*);
+extern void F_FUNC(fieldstocart,FIELDSTOCART)(complex_double*,double*,double*,complex_double*);
+extern void F_FUNC_US(radial_vect_to_cart,RADIAL_VECT_TO_CART)(complex_double*,double*,double*,complex_double*);
+extern void F_FUNC(getsphercoords,GETSPHERCOORDS)(double*,double*,double*,double*);
+extern void F_FUNC(incfield,INCFIELD)(double*,double*,double*,double*);
+extern void F_FUNC(pisandtaus,PISANDTAUS)(int*,double*,double*,double*);
+extern void F_FUNC_US(dn_1_down,DN_1_DOWN)(complex_double*,int*,int*,complex_double*,complex_double*);
+extern void F_FUNC_US(lentz_dn1,LENTZ_DN1)(complex_double*,int*,double*,double*,complex_double*);
+extern void F_FUNC(rotcoef,ROTCOEF)(double*,int*,int*,double*,int*);
+extern void F_FUNC(asmfr,ASMFR)(complex_double*,int*,double*,double*,double*,complex_double*);
+extern void F_FUNC_US(ms_radial_fields,MS_RADIAL_FIELDS)(complex_double*,int*,double*,double*,double*,complex_double*);
+extern void F_FUNC(asm,ASM)(complex_double*,int*,double*,double*,complex_double*);
+extern void F_FUNC_US(asm_arr,ASM_ARR)(complex_double*,int*,int*,double*,double*,complex_double*);
+extern void F_FUNC(asmsum,ASMSUM)(complex_double*,int*,double*,double*,complex_double*);
+extern void F_FUNC(sbesjy,SBESJY)(double*,int*,double*,double*,double*,double*,int*);
+extern void F_FUNC(csphjy,CSPHJY)(int*,complex_double*,int*,complex_double*,complex_double*,complex_double*,complex_double*);
+extern void F_WRAPPEDFUNC(msta1,MSTA1)(int*,double*,int*);
+extern void F_WRAPPEDFUNC(msta2,MSTA2)(int*,double*,int*,int*);
+extern void F_WRAPPEDFUNC(envj,ENVJ)(double*,int*,double*);
+/*eof externroutines*/
+
+/******************** See f2py2e/capi_rules.py: usercode1 ********************/
+
+
+/******************* See f2py2e/cb_rules.py: buildcallback *******************/
+/*need_callbacks*/
+
+/*********************** See f2py2e/rules.py: buildapi ***********************/
+
+/****************************** calc_scat_field ******************************/
+static char doc_f2py_rout_mieangfuncs_calc_scat_field[] = "\
+escat_sph = calc_scat_field(kr,phi,ascatm,einc)\n\nWrapper for ``calc_scat_field``.\
+\n\nParameters\n----------\n"
+"kr : input float\n"
+"phi : input float\n"
+"ascatm : input rank-2 array('D') with bounds (2,2)\n"
+"einc : input rank-1 array('d') with bounds (2)\n"
+"\nReturns\n-------\n"
+"escat_sph : rank-1 array('D') with bounds (2)";
+/* extern void F_FUNC_US(calc_scat_field,CALC_SCAT_FIELD)(double*,double*,complex_double*,double*,complex_double*); */
+static PyObject *f2py_rout_mieangfuncs_calc_scat_field(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,complex_double*,double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double kr = 0;
+  PyObject *kr_capi = Py_None;
+  double phi = 0;
+  PyObject *phi_capi = Py_None;
+  complex_double *ascatm = NULL;
+  npy_intp ascatm_Dims[2] = {-1, -1};
+  const int ascatm_Rank = 2;
+  PyArrayObject *capi_ascatm_tmp = NULL;
+  int capi_ascatm_intent = 0;
+  PyObject *ascatm_capi = Py_None;
+  double *einc = NULL;
+  npy_intp einc_Dims[1] = {-1};
+  const int einc_Rank = 1;
+  PyArrayObject *capi_einc_tmp = NULL;
+  int capi_einc_intent = 0;
+  PyObject *einc_capi = Py_None;
+  complex_double *escat_sph = NULL;
+  npy_intp escat_sph_Dims[1] = {-1};
+  const int escat_sph_Rank = 1;
+  PyArrayObject *capi_escat_sph_tmp = NULL;
+  int capi_escat_sph_intent = 0;
+  static char *capi_kwlist[] = {"kr","phi","ascatm","einc",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO:mieangfuncs.calc_scat_field",\
+    capi_kwlist,&kr_capi,&phi_capi,&ascatm_capi,&einc_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable phi */
+    f2py_success = double_from_pyobj(&phi,phi_capi,"mieangfuncs.calc_scat_field() 2nd argument (phi) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable kr */
+    f2py_success = double_from_pyobj(&kr,kr_capi,"mieangfuncs.calc_scat_field() 1st argument (kr) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable einc */
+  einc_Dims[0]=2;
+  capi_einc_intent |= F2PY_INTENT_IN;
+  capi_einc_tmp = array_from_pyobj(NPY_DOUBLE,einc_Dims,einc_Rank,capi_einc_intent,einc_capi);
+  if (capi_einc_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 4th argument `einc' of mieangfuncs.calc_scat_field to C/Fortran array" );
+  } else {
+    einc = (double *)(PyArray_DATA(capi_einc_tmp));
+
+  /* Processing variable escat_sph */
+  escat_sph_Dims[0]=2;
+  capi_escat_sph_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_escat_sph_tmp = array_from_pyobj(NPY_CDOUBLE,escat_sph_Dims,escat_sph_Rank,capi_escat_sph_intent,Py_None);
+  if (capi_escat_sph_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `escat_sph' of mieangfuncs.calc_scat_field to C/Fortran array" );
+  } else {
+    escat_sph = (complex_double *)(PyArray_DATA(capi_escat_sph_tmp));
+
+  /* Processing variable ascatm */
+  ascatm_Dims[0]=2,ascatm_Dims[1]=2;
+  capi_ascatm_intent |= F2PY_INTENT_IN;
+  capi_ascatm_tmp = array_from_pyobj(NPY_CDOUBLE,ascatm_Dims,ascatm_Rank,capi_ascatm_intent,ascatm_capi);
+  if (capi_ascatm_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 3rd argument `ascatm' of mieangfuncs.calc_scat_field to C/Fortran array" );
+  } else {
+    ascatm = (complex_double *)(PyArray_DATA(capi_ascatm_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&kr,&phi,ascatm,einc,escat_sph);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_escat_sph_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_ascatm_tmp!=ascatm_capi) {
+    Py_XDECREF(capi_ascatm_tmp); }
+  }  /*if (capi_ascatm_tmp == NULL) ... else of ascatm*/
+  /* End of cleaning variable ascatm */
+  }  /*if (capi_escat_sph_tmp == NULL) ... else of escat_sph*/
+  /* End of cleaning variable escat_sph */
+  if((PyObject *)capi_einc_tmp!=einc_capi) {
+    Py_XDECREF(capi_einc_tmp); }
+  }  /*if (capi_einc_tmp == NULL) ... else of einc*/
+  /* End of cleaning variable einc */
+  } /*if (f2py_success) of kr*/
+  /* End of cleaning variable kr */
+  } /*if (f2py_success) of phi*/
+  /* End of cleaning variable phi */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/*************************** end of calc_scat_field ***************************/
+
+/********************************* mie_fields *********************************/
+static char doc_f2py_rout_mieangfuncs_mie_fields[] = "\
+es_x,es_y,es_z = mie_fields(calc_points,asbs,einc,rad,rad_dep,[n_pts,nstop])\n\nWrapper for ``mie_fields``.\
+\n\nParameters\n----------\n"
+"calc_points : input rank-2 array('d') with bounds (3,n_pts)\n"
+"asbs : input rank-2 array('D') with bounds (2,nstop)\n"
+"einc : input rank-1 array('d') with bounds (2)\n"
+"rad : input int\n"
+"rad_dep : input int\n"
+"\nOther Parameters\n----------------\n"
+"n_pts : input int, optional\n    Default: shape(calc_points,1)\n"
+"nstop : input int, optional\n    Default: shape(asbs,1)\n"
+"\nReturns\n-------\n"
+"es_x : rank-1 array('D') with bounds (n_pts)\n"
+"es_y : rank-1 array('D') with bounds (n_pts)\n"
+"es_z : rank-1 array('D') with bounds (n_pts)";
+/* extern void F_FUNC_US(mie_fields,MIE_FIELDS)(int*,double*,complex_double*,int*,double*,int*,int*,complex_double*,complex_double*,complex_double*); */
+static PyObject *f2py_rout_mieangfuncs_mie_fields(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,complex_double*,int*,double*,int*,int*,complex_double*,complex_double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n_pts = 0;
+  PyObject *n_pts_capi = Py_None;
+  double *calc_points = NULL;
+  npy_intp calc_points_Dims[2] = {-1, -1};
+  const int calc_points_Rank = 2;
+  PyArrayObject *capi_calc_points_tmp = NULL;
+  int capi_calc_points_intent = 0;
+  PyObject *calc_points_capi = Py_None;
+  complex_double *asbs = NULL;
+  npy_intp asbs_Dims[2] = {-1, -1};
+  const int asbs_Rank = 2;
+  PyArrayObject *capi_asbs_tmp = NULL;
+  int capi_asbs_intent = 0;
+  PyObject *asbs_capi = Py_None;
+  int nstop = 0;
+  PyObject *nstop_capi = Py_None;
+  double *einc = NULL;
+  npy_intp einc_Dims[1] = {-1};
+  const int einc_Rank = 1;
+  PyArrayObject *capi_einc_tmp = NULL;
+  int capi_einc_intent = 0;
+  PyObject *einc_capi = Py_None;
+  int rad = 0;
+  PyObject *rad_capi = Py_None;
+  int rad_dep = 0;
+  PyObject *rad_dep_capi = Py_None;
+  complex_double *es_x = NULL;
+  npy_intp es_x_Dims[1] = {-1};
+  const int es_x_Rank = 1;
+  PyArrayObject *capi_es_x_tmp = NULL;
+  int capi_es_x_intent = 0;
+  complex_double *es_y = NULL;
+  npy_intp es_y_Dims[1] = {-1};
+  const int es_y_Rank = 1;
+  PyArrayObject *capi_es_y_tmp = NULL;
+  int capi_es_y_intent = 0;
+  complex_double *es_z = NULL;
+  npy_intp es_z_Dims[1] = {-1};
+  const int es_z_Rank = 1;
+  PyArrayObject *capi_es_z_tmp = NULL;
+  int capi_es_z_intent = 0;
+  static char *capi_kwlist[] = {"calc_points","asbs","einc","rad","rad_dep","n_pts","nstop",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOO|OO:mieangfuncs.mie_fields",\
+    capi_kwlist,&calc_points_capi,&asbs_capi,&einc_capi,&rad_capi,&rad_dep_capi,&n_pts_capi,&nstop_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable asbs */
+  asbs_Dims[0]=2;
+  capi_asbs_intent |= F2PY_INTENT_IN;
+  capi_asbs_tmp = array_from_pyobj(NPY_CDOUBLE,asbs_Dims,asbs_Rank,capi_asbs_intent,asbs_capi);
+  if (capi_asbs_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 2nd argument `asbs' of mieangfuncs.mie_fields to C/Fortran array" );
+  } else {
+    asbs = (complex_double *)(PyArray_DATA(capi_asbs_tmp));
+
+  /* Processing variable rad */
+    rad = (int)PyObject_IsTrue(rad_capi);
+    f2py_success = 1;
+  if (f2py_success) {
+  /* Processing variable einc */
+  einc_Dims[0]=2;
+  capi_einc_intent |= F2PY_INTENT_IN;
+  capi_einc_tmp = array_from_pyobj(NPY_DOUBLE,einc_Dims,einc_Rank,capi_einc_intent,einc_capi);
+  if (capi_einc_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 3rd argument `einc' of mieangfuncs.mie_fields to C/Fortran array" );
+  } else {
+    einc = (double *)(PyArray_DATA(capi_einc_tmp));
+
+  /* Processing variable calc_points */
+  calc_points_Dims[0]=3;
+  capi_calc_points_intent |= F2PY_INTENT_IN;
+  capi_calc_points_tmp = array_from_pyobj(NPY_DOUBLE,calc_points_Dims,calc_points_Rank,capi_calc_points_intent,calc_points_capi);
+  if (capi_calc_points_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 1st argument `calc_points' of mieangfuncs.mie_fields to C/Fortran array" );
+  } else {
+    calc_points = (double *)(PyArray_DATA(capi_calc_points_tmp));
+
+  /* Processing variable rad_dep */
+    rad_dep = (int)PyObject_IsTrue(rad_dep_capi);
+    f2py_success = 1;
+  if (f2py_success) {
+  /* Processing variable nstop */
+  if (nstop_capi == Py_None) nstop = shape(asbs,1); else
+    f2py_success = int_from_pyobj(&nstop,nstop_capi,"mieangfuncs.mie_fields() 2nd keyword (nstop) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(shape(asbs,1)==nstop,"shape(asbs,1)==nstop","2nd keyword nstop","mie_fields:nstop=%d",nstop) {
+  /* Processing variable n_pts */
+  if (n_pts_capi == Py_None) n_pts = shape(calc_points,1); else
+    f2py_success = int_from_pyobj(&n_pts,n_pts_capi,"mieangfuncs.mie_fields() 1st keyword (n_pts) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(shape(calc_points,1)==n_pts,"shape(calc_points,1)==n_pts","1st keyword n_pts","mie_fields:n_pts=%d",n_pts) {
+  /* Processing variable es_y */
+  es_y_Dims[0]=n_pts;
+  capi_es_y_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_es_y_tmp = array_from_pyobj(NPY_CDOUBLE,es_y_Dims,es_y_Rank,capi_es_y_intent,Py_None);
+  if (capi_es_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `es_y' of mieangfuncs.mie_fields to C/Fortran array" );
+  } else {
+    es_y = (complex_double *)(PyArray_DATA(capi_es_y_tmp));
+
+  /* Processing variable es_x */
+  es_x_Dims[0]=n_pts;
+  capi_es_x_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_es_x_tmp = array_from_pyobj(NPY_CDOUBLE,es_x_Dims,es_x_Rank,capi_es_x_intent,Py_None);
+  if (capi_es_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `es_x' of mieangfuncs.mie_fields to C/Fortran array" );
+  } else {
+    es_x = (complex_double *)(PyArray_DATA(capi_es_x_tmp));
+
+  /* Processing variable es_z */
+  es_z_Dims[0]=n_pts;
+  capi_es_z_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_es_z_tmp = array_from_pyobj(NPY_CDOUBLE,es_z_Dims,es_z_Rank,capi_es_z_intent,Py_None);
+  if (capi_es_z_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `es_z' of mieangfuncs.mie_fields to C/Fortran array" );
+  } else {
+    es_z = (complex_double *)(PyArray_DATA(capi_es_z_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+      Py_BEGIN_ALLOW_THREADS
+        (*f2py_func)(&n_pts,calc_points,asbs,&nstop,einc,&rad,&rad_dep,es_x,es_y,es_z);
+      Py_END_ALLOW_THREADS
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNN",capi_es_x_tmp,capi_es_y_tmp,capi_es_z_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_es_z_tmp == NULL) ... else of es_z*/
+  /* End of cleaning variable es_z */
+  }  /*if (capi_es_x_tmp == NULL) ... else of es_x*/
+  /* End of cleaning variable es_x */
+  }  /*if (capi_es_y_tmp == NULL) ... else of es_y*/
+  /* End of cleaning variable es_y */
+  } /*CHECKSCALAR(shape(calc_points,1)==n_pts)*/
+  } /*if (f2py_success) of n_pts*/
+  /* End of cleaning variable n_pts */
+  } /*CHECKSCALAR(shape(asbs,1)==nstop)*/
+  } /*if (f2py_success) of nstop*/
+  /* End of cleaning variable nstop */
+  } /*if (f2py_success) of rad_dep*/
+  /* End of cleaning variable rad_dep */
+  if((PyObject *)capi_calc_points_tmp!=calc_points_capi) {
+    Py_XDECREF(capi_calc_points_tmp); }
+  }  /*if (capi_calc_points_tmp == NULL) ... else of calc_points*/
+  /* End of cleaning variable calc_points */
+  if((PyObject *)capi_einc_tmp!=einc_capi) {
+    Py_XDECREF(capi_einc_tmp); }
+  }  /*if (capi_einc_tmp == NULL) ... else of einc*/
+  /* End of cleaning variable einc */
+  } /*if (f2py_success) of rad*/
+  /* End of cleaning variable rad */
+  if((PyObject *)capi_asbs_tmp!=asbs_capi) {
+    Py_XDECREF(capi_asbs_tmp); }
+  }  /*if (capi_asbs_tmp == NULL) ... else of asbs*/
+  /* End of cleaning variable asbs */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of mie_fields *****************************/
+
+/**************************** mie_internal_fields ****************************/
+static char doc_f2py_rout_mieangfuncs_mie_internal_fields[] = "\
+eint_x,eint_y,eint_z = mie_internal_fields(calc_points,m,csds,einc,[n_pts,nstop])\n\nWrapper for ``mie_internal_fields``.\
+\n\nParameters\n----------\n"
+"calc_points : input rank-2 array('d') with bounds (3,n_pts)\n"
+"m : input complex\n"
+"csds : input rank-2 array('D') with bounds (2,nstop)\n"
+"einc : input rank-1 array('d') with bounds (2)\n"
+"\nOther Parameters\n----------------\n"
+"n_pts : input int, optional\n    Default: shape(calc_points,1)\n"
+"nstop : input int, optional\n    Default: shape(csds,1)\n"
+"\nReturns\n-------\n"
+"eint_x : rank-1 array('D') with bounds (n_pts)\n"
+"eint_y : rank-1 array('D') with bounds (n_pts)\n"
+"eint_z : rank-1 array('D') with bounds (n_pts)";
+/* extern void F_FUNC_US(mie_internal_fields,MIE_INTERNAL_FIELDS)(int*,double*,complex_double*,complex_double*,int*,double*,complex_double*,complex_double*,complex_double*); */
+static PyObject *f2py_rout_mieangfuncs_mie_internal_fields(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,complex_double*,complex_double*,int*,double*,complex_double*,complex_double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n_pts = 0;
+  PyObject *n_pts_capi = Py_None;
+  double *calc_points = NULL;
+  npy_intp calc_points_Dims[2] = {-1, -1};
+  const int calc_points_Rank = 2;
+  PyArrayObject *capi_calc_points_tmp = NULL;
+  int capi_calc_points_intent = 0;
+  PyObject *calc_points_capi = Py_None;
+  complex_double m;
+  PyObject *m_capi = Py_None;
+  complex_double *csds = NULL;
+  npy_intp csds_Dims[2] = {-1, -1};
+  const int csds_Rank = 2;
+  PyArrayObject *capi_csds_tmp = NULL;
+  int capi_csds_intent = 0;
+  PyObject *csds_capi = Py_None;
+  int nstop = 0;
+  PyObject *nstop_capi = Py_None;
+  double *einc = NULL;
+  npy_intp einc_Dims[1] = {-1};
+  const int einc_Rank = 1;
+  PyArrayObject *capi_einc_tmp = NULL;
+  int capi_einc_intent = 0;
+  PyObject *einc_capi = Py_None;
+  complex_double *eint_x = NULL;
+  npy_intp eint_x_Dims[1] = {-1};
+  const int eint_x_Rank = 1;
+  PyArrayObject *capi_eint_x_tmp = NULL;
+  int capi_eint_x_intent = 0;
+  complex_double *eint_y = NULL;
+  npy_intp eint_y_Dims[1] = {-1};
+  const int eint_y_Rank = 1;
+  PyArrayObject *capi_eint_y_tmp = NULL;
+  int capi_eint_y_intent = 0;
+  complex_double *eint_z = NULL;
+  npy_intp eint_z_Dims[1] = {-1};
+  const int eint_z_Rank = 1;
+  PyArrayObject *capi_eint_z_tmp = NULL;
+  int capi_eint_z_intent = 0;
+  static char *capi_kwlist[] = {"calc_points","m","csds","einc","n_pts","nstop",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO|OO:mieangfuncs.mie_internal_fields",\
+    capi_kwlist,&calc_points_capi,&m_capi,&csds_capi,&einc_capi,&n_pts_capi,&nstop_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable csds */
+  csds_Dims[0]=2;
+  capi_csds_intent |= F2PY_INTENT_IN;
+  capi_csds_tmp = array_from_pyobj(NPY_CDOUBLE,csds_Dims,csds_Rank,capi_csds_intent,csds_capi);
+  if (capi_csds_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 3rd argument `csds' of mieangfuncs.mie_internal_fields to C/Fortran array" );
+  } else {
+    csds = (complex_double *)(PyArray_DATA(capi_csds_tmp));
+
+  /* Processing variable m */
+    f2py_success = complex_double_from_pyobj(&m,m_capi,"mieangfuncs.mie_internal_fields() 2nd argument (m) can't be converted to complex_double");
+  if (f2py_success) {
+  /* Processing variable calc_points */
+  calc_points_Dims[0]=3;
+  capi_calc_points_intent |= F2PY_INTENT_IN;
+  capi_calc_points_tmp = array_from_pyobj(NPY_DOUBLE,calc_points_Dims,calc_points_Rank,capi_calc_points_intent,calc_points_capi);
+  if (capi_calc_points_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 1st argument `calc_points' of mieangfuncs.mie_internal_fields to C/Fortran array" );
+  } else {
+    calc_points = (double *)(PyArray_DATA(capi_calc_points_tmp));
+
+  /* Processing variable einc */
+  einc_Dims[0]=2;
+  capi_einc_intent |= F2PY_INTENT_IN;
+  capi_einc_tmp = array_from_pyobj(NPY_DOUBLE,einc_Dims,einc_Rank,capi_einc_intent,einc_capi);
+  if (capi_einc_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 4th argument `einc' of mieangfuncs.mie_internal_fields to C/Fortran array" );
+  } else {
+    einc = (double *)(PyArray_DATA(capi_einc_tmp));
+
+  /* Processing variable nstop */
+  if (nstop_capi == Py_None) nstop = shape(csds,1); else
+    f2py_success = int_from_pyobj(&nstop,nstop_capi,"mieangfuncs.mie_internal_fields() 2nd keyword (nstop) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(shape(csds,1)==nstop,"shape(csds,1)==nstop","2nd keyword nstop","mie_internal_fields:nstop=%d",nstop) {
+  /* Processing variable n_pts */
+  if (n_pts_capi == Py_None) n_pts = shape(calc_points,1); else
+    f2py_success = int_from_pyobj(&n_pts,n_pts_capi,"mieangfuncs.mie_internal_fields() 1st keyword (n_pts) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(shape(calc_points,1)==n_pts,"shape(calc_points,1)==n_pts","1st keyword n_pts","mie_internal_fields:n_pts=%d",n_pts) {
+  /* Processing variable eint_x */
+  eint_x_Dims[0]=n_pts;
+  capi_eint_x_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_eint_x_tmp = array_from_pyobj(NPY_CDOUBLE,eint_x_Dims,eint_x_Rank,capi_eint_x_intent,Py_None);
+  if (capi_eint_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `eint_x' of mieangfuncs.mie_internal_fields to C/Fortran array" );
+  } else {
+    eint_x = (complex_double *)(PyArray_DATA(capi_eint_x_tmp));
+
+  /* Processing variable eint_z */
+  eint_z_Dims[0]=n_pts;
+  capi_eint_z_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_eint_z_tmp = array_from_pyobj(NPY_CDOUBLE,eint_z_Dims,eint_z_Rank,capi_eint_z_intent,Py_None);
+  if (capi_eint_z_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `eint_z' of mieangfuncs.mie_internal_fields to C/Fortran array" );
+  } else {
+    eint_z = (complex_double *)(PyArray_DATA(capi_eint_z_tmp));
+
+  /* Processing variable eint_y */
+  eint_y_Dims[0]=n_pts;
+  capi_eint_y_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_eint_y_tmp = array_from_pyobj(NPY_CDOUBLE,eint_y_Dims,eint_y_Rank,capi_eint_y_intent,Py_None);
+  if (capi_eint_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `eint_y' of mieangfuncs.mie_internal_fields to C/Fortran array" );
+  } else {
+    eint_y = (complex_double *)(PyArray_DATA(capi_eint_y_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+      Py_BEGIN_ALLOW_THREADS
+        (*f2py_func)(&n_pts,calc_points,&m,csds,&nstop,einc,eint_x,eint_y,eint_z);
+      Py_END_ALLOW_THREADS
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNN",capi_eint_x_tmp,capi_eint_y_tmp,capi_eint_z_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_eint_y_tmp == NULL) ... else of eint_y*/
+  /* End of cleaning variable eint_y */
+  }  /*if (capi_eint_z_tmp == NULL) ... else of eint_z*/
+  /* End of cleaning variable eint_z */
+  }  /*if (capi_eint_x_tmp == NULL) ... else of eint_x*/
+  /* End of cleaning variable eint_x */
+  } /*CHECKSCALAR(shape(calc_points,1)==n_pts)*/
+  } /*if (f2py_success) of n_pts*/
+  /* End of cleaning variable n_pts */
+  } /*CHECKSCALAR(shape(csds,1)==nstop)*/
+  } /*if (f2py_success) of nstop*/
+  /* End of cleaning variable nstop */
+  if((PyObject *)capi_einc_tmp!=einc_capi) {
+    Py_XDECREF(capi_einc_tmp); }
+  }  /*if (capi_einc_tmp == NULL) ... else of einc*/
+  /* End of cleaning variable einc */
+  if((PyObject *)capi_calc_points_tmp!=calc_points_capi) {
+    Py_XDECREF(capi_calc_points_tmp); }
+  }  /*if (capi_calc_points_tmp == NULL) ... else of calc_points*/
+  /* End of cleaning variable calc_points */
+  }  /*if (f2py_success) of m frompyobj*/
+  /* End of cleaning variable m */
+  if((PyObject *)capi_csds_tmp!=csds_capi) {
+    Py_XDECREF(capi_csds_tmp); }
+  }  /*if (capi_csds_tmp == NULL) ... else of csds*/
+  /* End of cleaning variable csds */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/************************* end of mie_internal_fields *************************/
+
+/******************************* tmatrix_fields *******************************/
+static char doc_f2py_rout_mieangfuncs_tmatrix_fields[] = "\
+es_x,es_y,es_z = tmatrix_fields(calc_points,amn,lmax,euler_gamma,inc_pol,rad,[n_pts])\n\nWrapper for ``tmatrix_fields``.\
+\n\nParameters\n----------\n"
+"calc_points : input rank-2 array('d') with bounds (3,n_pts)\n"
+"amn : input rank-3 array('D') with bounds (2,lmax*(lmax+2),2)\n"
+"lmax : input int\n"
+"euler_gamma : input float\n"
+"inc_pol : input rank-1 array('d') with bounds (2)\n"
+"rad : input int\n"
+"\nOther Parameters\n----------------\n"
+"n_pts : input int, optional\n    Default: shape(calc_points,1)\n"
+"\nReturns\n-------\n"
+"es_x : rank-1 array('D') with bounds (n_pts)\n"
+"es_y : rank-1 array('D') with bounds (n_pts)\n"
+"es_z : rank-1 array('D') with bounds (n_pts)";
+/* extern void F_FUNC_US(tmatrix_fields,TMATRIX_FIELDS)(int*,double*,complex_double*,int*,double*,double*,int*,complex_double*,complex_double*,complex_double*); */
+static PyObject *f2py_rout_mieangfuncs_tmatrix_fields(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,complex_double*,int*,double*,double*,int*,complex_double*,complex_double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n_pts = 0;
+  PyObject *n_pts_capi = Py_None;
+  double *calc_points = NULL;
+  npy_intp calc_points_Dims[2] = {-1, -1};
+  const int calc_points_Rank = 2;
+  PyArrayObject *capi_calc_points_tmp = NULL;
+  int capi_calc_points_intent = 0;
+  PyObject *calc_points_capi = Py_None;
+  complex_double *amn = NULL;
+  npy_intp amn_Dims[3] = {-1, -1, -1};
+  const int amn_Rank = 3;
+  PyArrayObject *capi_amn_tmp = NULL;
+  int capi_amn_intent = 0;
+  PyObject *amn_capi = Py_None;
+  int lmax = 0;
+  PyObject *lmax_capi = Py_None;
+  double euler_gamma = 0;
+  PyObject *euler_gamma_capi = Py_None;
+  double *inc_pol = NULL;
+  npy_intp inc_pol_Dims[1] = {-1};
+  const int inc_pol_Rank = 1;
+  PyArrayObject *capi_inc_pol_tmp = NULL;
+  int capi_inc_pol_intent = 0;
+  PyObject *inc_pol_capi = Py_None;
+  int rad = 0;
+  PyObject *rad_capi = Py_None;
+  complex_double *es_x = NULL;
+  npy_intp es_x_Dims[1] = {-1};
+  const int es_x_Rank = 1;
+  PyArrayObject *capi_es_x_tmp = NULL;
+  int capi_es_x_intent = 0;
+  complex_double *es_y = NULL;
+  npy_intp es_y_Dims[1] = {-1};
+  const int es_y_Rank = 1;
+  PyArrayObject *capi_es_y_tmp = NULL;
+  int capi_es_y_intent = 0;
+  complex_double *es_z = NULL;
+  npy_intp es_z_Dims[1] = {-1};
+  const int es_z_Rank = 1;
+  PyArrayObject *capi_es_z_tmp = NULL;
+  int capi_es_z_intent = 0;
+  static char *capi_kwlist[] = {"calc_points","amn","lmax","euler_gamma","inc_pol","rad","n_pts",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOO|O:mieangfuncs.tmatrix_fields",\
+    capi_kwlist,&calc_points_capi,&amn_capi,&lmax_capi,&euler_gamma_capi,&inc_pol_capi,&rad_capi,&n_pts_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable rad */
+    rad = (int)PyObject_IsTrue(rad_capi);
+    f2py_success = 1;
+  if (f2py_success) {
+  /* Processing variable calc_points */
+  calc_points_Dims[0]=3;
+  capi_calc_points_intent |= F2PY_INTENT_IN;
+  capi_calc_points_tmp = array_from_pyobj(NPY_DOUBLE,calc_points_Dims,calc_points_Rank,capi_calc_points_intent,calc_points_capi);
+  if (capi_calc_points_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 1st argument `calc_points' of mieangfuncs.tmatrix_fields to C/Fortran array" );
+  } else {
+    calc_points = (double *)(PyArray_DATA(capi_calc_points_tmp));
+
+  /* Processing variable lmax */
+    f2py_success = int_from_pyobj(&lmax,lmax_capi,"mieangfuncs.tmatrix_fields() 3rd argument (lmax) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable euler_gamma */
+    f2py_success = double_from_pyobj(&euler_gamma,euler_gamma_capi,"mieangfuncs.tmatrix_fields() 4th argument (euler_gamma) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable inc_pol */
+  inc_pol_Dims[0]=2;
+  capi_inc_pol_intent |= F2PY_INTENT_IN;
+  capi_inc_pol_tmp = array_from_pyobj(NPY_DOUBLE,inc_pol_Dims,inc_pol_Rank,capi_inc_pol_intent,inc_pol_capi);
+  if (capi_inc_pol_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 5th argument `inc_pol' of mieangfuncs.tmatrix_fields to C/Fortran array" );
+  } else {
+    inc_pol = (double *)(PyArray_DATA(capi_inc_pol_tmp));
+
+  /* Processing variable amn */
+  amn_Dims[0]=2,amn_Dims[1]=lmax*(lmax+2),amn_Dims[2]=2;
+  capi_amn_intent |= F2PY_INTENT_IN;
+  capi_amn_tmp = array_from_pyobj(NPY_CDOUBLE,amn_Dims,amn_Rank,capi_amn_intent,amn_capi);
+  if (capi_amn_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 2nd argument `amn' of mieangfuncs.tmatrix_fields to C/Fortran array" );
+  } else {
+    amn = (complex_double *)(PyArray_DATA(capi_amn_tmp));
+
+  /* Processing variable n_pts */
+  if (n_pts_capi == Py_None) n_pts = shape(calc_points,1); else
+    f2py_success = int_from_pyobj(&n_pts,n_pts_capi,"mieangfuncs.tmatrix_fields() 1st keyword (n_pts) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(shape(calc_points,1)==n_pts,"shape(calc_points,1)==n_pts","1st keyword n_pts","tmatrix_fields:n_pts=%d",n_pts) {
+  /* Processing variable es_y */
+  es_y_Dims[0]=n_pts;
+  capi_es_y_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_es_y_tmp = array_from_pyobj(NPY_CDOUBLE,es_y_Dims,es_y_Rank,capi_es_y_intent,Py_None);
+  if (capi_es_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `es_y' of mieangfuncs.tmatrix_fields to C/Fortran array" );
+  } else {
+    es_y = (complex_double *)(PyArray_DATA(capi_es_y_tmp));
+
+  /* Processing variable es_x */
+  es_x_Dims[0]=n_pts;
+  capi_es_x_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_es_x_tmp = array_from_pyobj(NPY_CDOUBLE,es_x_Dims,es_x_Rank,capi_es_x_intent,Py_None);
+  if (capi_es_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `es_x' of mieangfuncs.tmatrix_fields to C/Fortran array" );
+  } else {
+    es_x = (complex_double *)(PyArray_DATA(capi_es_x_tmp));
+
+  /* Processing variable es_z */
+  es_z_Dims[0]=n_pts;
+  capi_es_z_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_es_z_tmp = array_from_pyobj(NPY_CDOUBLE,es_z_Dims,es_z_Rank,capi_es_z_intent,Py_None);
+  if (capi_es_z_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `es_z' of mieangfuncs.tmatrix_fields to C/Fortran array" );
+  } else {
+    es_z = (complex_double *)(PyArray_DATA(capi_es_z_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+      Py_BEGIN_ALLOW_THREADS
+        (*f2py_func)(&n_pts,calc_points,amn,&lmax,&euler_gamma,inc_pol,&rad,es_x,es_y,es_z);
+      Py_END_ALLOW_THREADS
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNN",capi_es_x_tmp,capi_es_y_tmp,capi_es_z_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_es_z_tmp == NULL) ... else of es_z*/
+  /* End of cleaning variable es_z */
+  }  /*if (capi_es_x_tmp == NULL) ... else of es_x*/
+  /* End of cleaning variable es_x */
+  }  /*if (capi_es_y_tmp == NULL) ... else of es_y*/
+  /* End of cleaning variable es_y */
+  } /*CHECKSCALAR(shape(calc_points,1)==n_pts)*/
+  } /*if (f2py_success) of n_pts*/
+  /* End of cleaning variable n_pts */
+  if((PyObject *)capi_amn_tmp!=amn_capi) {
+    Py_XDECREF(capi_amn_tmp); }
+  }  /*if (capi_amn_tmp == NULL) ... else of amn*/
+  /* End of cleaning variable amn */
+  if((PyObject *)capi_inc_pol_tmp!=inc_pol_capi) {
+    Py_XDECREF(capi_inc_pol_tmp); }
+  }  /*if (capi_inc_pol_tmp == NULL) ... else of inc_pol*/
+  /* End of cleaning variable inc_pol */
+  } /*if (f2py_success) of euler_gamma*/
+  /* End of cleaning variable euler_gamma */
+  } /*if (f2py_success) of lmax*/
+  /* End of cleaning variable lmax */
+  if((PyObject *)capi_calc_points_tmp!=calc_points_capi) {
+    Py_XDECREF(capi_calc_points_tmp); }
+  }  /*if (capi_calc_points_tmp == NULL) ... else of calc_points*/
+  /* End of cleaning variable calc_points */
+  } /*if (f2py_success) of rad*/
+  /* End of cleaning variable rad */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/*************************** end of tmatrix_fields ***************************/
+
+/******************************* mie_int_point *******************************/
+static char doc_f2py_rout_mieangfuncs_mie_int_point[] = "\
+esph_out = mie_int_point(csds,mkr,theta,[nstop])\n\nWrapper for ``mie_int_point``.\
+\n\nParameters\n----------\n"
+"csds : input rank-2 array('D') with bounds (2,nstop)\n"
+"mkr : input complex\n"
+"theta : input float\n"
+"\nOther Parameters\n----------------\n"
+"nstop : input int, optional\n    Default: shape(csds,1)\n"
+"\nReturns\n-------\n"
+"esph_out : rank-1 array('D') with bounds (3)";
+/* extern void F_FUNC_US(mie_int_point,MIE_INT_POINT)(int*,complex_double*,complex_double*,double*,complex_double*); */
+static PyObject *f2py_rout_mieangfuncs_mie_int_point(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,complex_double*,double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int nstop = 0;
+  PyObject *nstop_capi = Py_None;
+  complex_double *csds = NULL;
+  npy_intp csds_Dims[2] = {-1, -1};
+  const int csds_Rank = 2;
+  PyArrayObject *capi_csds_tmp = NULL;
+  int capi_csds_intent = 0;
+  PyObject *csds_capi = Py_None;
+  complex_double mkr;
+  PyObject *mkr_capi = Py_None;
+  double theta = 0;
+  PyObject *theta_capi = Py_None;
+  complex_double *esph_out = NULL;
+  npy_intp esph_out_Dims[1] = {-1};
+  const int esph_out_Rank = 1;
+  PyArrayObject *capi_esph_out_tmp = NULL;
+  int capi_esph_out_intent = 0;
+  static char *capi_kwlist[] = {"csds","mkr","theta","nstop",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|O:mieangfuncs.mie_int_point",\
+    capi_kwlist,&csds_capi,&mkr_capi,&theta_capi,&nstop_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable csds */
+  csds_Dims[0]=2;
+  capi_csds_intent |= F2PY_INTENT_IN;
+  capi_csds_tmp = array_from_pyobj(NPY_CDOUBLE,csds_Dims,csds_Rank,capi_csds_intent,csds_capi);
+  if (capi_csds_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 1st argument `csds' of mieangfuncs.mie_int_point to C/Fortran array" );
+  } else {
+    csds = (complex_double *)(PyArray_DATA(capi_csds_tmp));
+
+  /* Processing variable esph_out */
+  esph_out_Dims[0]=3;
+  capi_esph_out_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_esph_out_tmp = array_from_pyobj(NPY_CDOUBLE,esph_out_Dims,esph_out_Rank,capi_esph_out_intent,Py_None);
+  if (capi_esph_out_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `esph_out' of mieangfuncs.mie_int_point to C/Fortran array" );
+  } else {
+    esph_out = (complex_double *)(PyArray_DATA(capi_esph_out_tmp));
+
+  /* Processing variable mkr */
+    f2py_success = complex_double_from_pyobj(&mkr,mkr_capi,"mieangfuncs.mie_int_point() 2nd argument (mkr) can't be converted to complex_double");
+  if (f2py_success) {
+  /* Processing variable theta */
+    f2py_success = double_from_pyobj(&theta,theta_capi,"mieangfuncs.mie_int_point() 3rd argument (theta) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable nstop */
+  if (nstop_capi == Py_None) nstop = shape(csds,1); else
+    f2py_success = int_from_pyobj(&nstop,nstop_capi,"mieangfuncs.mie_int_point() 1st keyword (nstop) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(shape(csds,1)==nstop,"shape(csds,1)==nstop","1st keyword nstop","mie_int_point:nstop=%d",nstop) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&nstop,csds,&mkr,&theta,esph_out);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_esph_out_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(shape(csds,1)==nstop)*/
+  } /*if (f2py_success) of nstop*/
+  /* End of cleaning variable nstop */
+  } /*if (f2py_success) of theta*/
+  /* End of cleaning variable theta */
+  }  /*if (f2py_success) of mkr frompyobj*/
+  /* End of cleaning variable mkr */
+  }  /*if (capi_esph_out_tmp == NULL) ... else of esph_out*/
+  /* End of cleaning variable esph_out */
+  if((PyObject *)capi_csds_tmp!=csds_capi) {
+    Py_XDECREF(capi_csds_tmp); }
+  }  /*if (capi_csds_tmp == NULL) ... else of csds*/
+  /* End of cleaning variable csds */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/**************************** end of mie_int_point ****************************/
+
+/***************************** asm_mie_fullradial *****************************/
+static char doc_f2py_rout_mieangfuncs_asm_mie_fullradial[] = "\
+asm_out = asm_mie_fullradial(asbs,sphcoords,[nstop])\n\nWrapper for ``asm_mie_fullradial``.\
+\n\nParameters\n----------\n"
+"asbs : input rank-2 array('D') with bounds (2,nstop)\n"
+"sphcoords : input rank-1 array('d') with bounds (3)\n"
+"\nOther Parameters\n----------------\n"
+"nstop : input int, optional\n    Default: shape(asbs,1)\n"
+"\nReturns\n-------\n"
+"asm_out : rank-2 array('D') with bounds (2,2)";
+/* extern void F_FUNC_US(asm_mie_fullradial,ASM_MIE_FULLRADIAL)(int*,complex_double*,double*,complex_double*); */
+static PyObject *f2py_rout_mieangfuncs_asm_mie_fullradial(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int nstop = 0;
+  PyObject *nstop_capi = Py_None;
+  complex_double *asbs = NULL;
+  npy_intp asbs_Dims[2] = {-1, -1};
+  const int asbs_Rank = 2;
+  PyArrayObject *capi_asbs_tmp = NULL;
+  int capi_asbs_intent = 0;
+  PyObject *asbs_capi = Py_None;
+  double *sphcoords = NULL;
+  npy_intp sphcoords_Dims[1] = {-1};
+  const int sphcoords_Rank = 1;
+  PyArrayObject *capi_sphcoords_tmp = NULL;
+  int capi_sphcoords_intent = 0;
+  PyObject *sphcoords_capi = Py_None;
+  complex_double *asm_out = NULL;
+  npy_intp asm_out_Dims[2] = {-1, -1};
+  const int asm_out_Rank = 2;
+  PyArrayObject *capi_asm_out_tmp = NULL;
+  int capi_asm_out_intent = 0;
+  static char *capi_kwlist[] = {"asbs","sphcoords","nstop",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|O:mieangfuncs.asm_mie_fullradial",\
+    capi_kwlist,&asbs_capi,&sphcoords_capi,&nstop_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable asbs */
+  asbs_Dims[0]=2;
+  capi_asbs_intent |= F2PY_INTENT_IN;
+  capi_asbs_tmp = array_from_pyobj(NPY_CDOUBLE,asbs_Dims,asbs_Rank,capi_asbs_intent,asbs_capi);
+  if (capi_asbs_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 1st argument `asbs' of mieangfuncs.asm_mie_fullradial to C/Fortran array" );
+  } else {
+    asbs = (complex_double *)(PyArray_DATA(capi_asbs_tmp));
+
+  /* Processing variable asm_out */
+  asm_out_Dims[0]=2,asm_out_Dims[1]=2;
+  capi_asm_out_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_asm_out_tmp = array_from_pyobj(NPY_CDOUBLE,asm_out_Dims,asm_out_Rank,capi_asm_out_intent,Py_None);
+  if (capi_asm_out_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `asm_out' of mieangfuncs.asm_mie_fullradial to C/Fortran array" );
+  } else {
+    asm_out = (complex_double *)(PyArray_DATA(capi_asm_out_tmp));
+
+  /* Processing variable sphcoords */
+  sphcoords_Dims[0]=3;
+  capi_sphcoords_intent |= F2PY_INTENT_IN;
+  capi_sphcoords_tmp = array_from_pyobj(NPY_DOUBLE,sphcoords_Dims,sphcoords_Rank,capi_sphcoords_intent,sphcoords_capi);
+  if (capi_sphcoords_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 2nd argument `sphcoords' of mieangfuncs.asm_mie_fullradial to C/Fortran array" );
+  } else {
+    sphcoords = (double *)(PyArray_DATA(capi_sphcoords_tmp));
+
+  /* Processing variable nstop */
+  if (nstop_capi == Py_None) nstop = shape(asbs,1); else
+    f2py_success = int_from_pyobj(&nstop,nstop_capi,"mieangfuncs.asm_mie_fullradial() 1st keyword (nstop) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(shape(asbs,1)==nstop,"shape(asbs,1)==nstop","1st keyword nstop","asm_mie_fullradial:nstop=%d",nstop) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&nstop,asbs,sphcoords,asm_out);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_asm_out_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(shape(asbs,1)==nstop)*/
+  } /*if (f2py_success) of nstop*/
+  /* End of cleaning variable nstop */
+  if((PyObject *)capi_sphcoords_tmp!=sphcoords_capi) {
+    Py_XDECREF(capi_sphcoords_tmp); }
+  }  /*if (capi_sphcoords_tmp == NULL) ... else of sphcoords*/
+  /* End of cleaning variable sphcoords */
+  }  /*if (capi_asm_out_tmp == NULL) ... else of asm_out*/
+  /* End of cleaning variable asm_out */
+  if((PyObject *)capi_asbs_tmp!=asbs_capi) {
+    Py_XDECREF(capi_asbs_tmp); }
+  }  /*if (capi_asbs_tmp == NULL) ... else of asbs*/
+  /* End of cleaning variable asbs */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/************************* end of asm_mie_fullradial *************************/
+
+/******************************** asm_mie_far ********************************/
+static char doc_f2py_rout_mieangfuncs_asm_mie_far[] = "\
+asm_out = asm_mie_far(asbs,theta,[nstop])\n\nWrapper for ``asm_mie_far``.\
+\n\nParameters\n----------\n"
+"asbs : input rank-2 array('D') with bounds (2,nstop)\n"
+"theta : input float\n"
+"\nOther Parameters\n----------------\n"
+"nstop : input int, optional\n    Default: shape(asbs,1)\n"
+"\nReturns\n-------\n"
+"asm_out : rank-2 array('D') with bounds (2,2)";
+/* extern void F_FUNC_US(asm_mie_far,ASM_MIE_FAR)(int*,complex_double*,double*,complex_double*); */
+static PyObject *f2py_rout_mieangfuncs_asm_mie_far(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int nstop = 0;
+  PyObject *nstop_capi = Py_None;
+  complex_double *asbs = NULL;
+  npy_intp asbs_Dims[2] = {-1, -1};
+  const int asbs_Rank = 2;
+  PyArrayObject *capi_asbs_tmp = NULL;
+  int capi_asbs_intent = 0;
+  PyObject *asbs_capi = Py_None;
+  double theta = 0;
+  PyObject *theta_capi = Py_None;
+  complex_double *asm_out = NULL;
+  npy_intp asm_out_Dims[2] = {-1, -1};
+  const int asm_out_Rank = 2;
+  PyArrayObject *capi_asm_out_tmp = NULL;
+  int capi_asm_out_intent = 0;
+  static char *capi_kwlist[] = {"asbs","theta","nstop",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|O:mieangfuncs.asm_mie_far",\
+    capi_kwlist,&asbs_capi,&theta_capi,&nstop_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable asbs */
+  asbs_Dims[0]=2;
+  capi_asbs_intent |= F2PY_INTENT_IN;
+  capi_asbs_tmp = array_from_pyobj(NPY_CDOUBLE,asbs_Dims,asbs_Rank,capi_asbs_intent,asbs_capi);
+  if (capi_asbs_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 1st argument `asbs' of mieangfuncs.asm_mie_far to C/Fortran array" );
+  } else {
+    asbs = (complex_double *)(PyArray_DATA(capi_asbs_tmp));
+
+  /* Processing variable asm_out */
+  asm_out_Dims[0]=2,asm_out_Dims[1]=2;
+  capi_asm_out_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_asm_out_tmp = array_from_pyobj(NPY_CDOUBLE,asm_out_Dims,asm_out_Rank,capi_asm_out_intent,Py_None);
+  if (capi_asm_out_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `asm_out' of mieangfuncs.asm_mie_far to C/Fortran array" );
+  } else {
+    asm_out = (complex_double *)(PyArray_DATA(capi_asm_out_tmp));
+
+  /* Processing variable theta */
+    f2py_success = double_from_pyobj(&theta,theta_capi,"mieangfuncs.asm_mie_far() 2nd argument (theta) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable nstop */
+  if (nstop_capi == Py_None) nstop = shape(asbs,1); else
+    f2py_success = int_from_pyobj(&nstop,nstop_capi,"mieangfuncs.asm_mie_far() 1st keyword (nstop) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(shape(asbs,1)==nstop,"shape(asbs,1)==nstop","1st keyword nstop","asm_mie_far:nstop=%d",nstop) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&nstop,asbs,&theta,asm_out);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_asm_out_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(shape(asbs,1)==nstop)*/
+  } /*if (f2py_success) of nstop*/
+  /* End of cleaning variable nstop */
+  } /*if (f2py_success) of theta*/
+  /* End of cleaning variable theta */
+  }  /*if (capi_asm_out_tmp == NULL) ... else of asm_out*/
+  /* End of cleaning variable asm_out */
+  if((PyObject *)capi_asbs_tmp!=asbs_capi) {
+    Py_XDECREF(capi_asbs_tmp); }
+  }  /*if (capi_asbs_tmp == NULL) ... else of asbs*/
+  /* End of cleaning variable asbs */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of asm_mie_far *****************************/
+
+/****************************** asm_mie_far_arr ******************************/
+static char doc_f2py_rout_mieangfuncs_asm_mie_far_arr[] = "\
+asm_out = asm_mie_far_arr(asbs,thetas,[nstop,n_pts])\n\nWrapper for ``asm_mie_far_arr``.\
+\n\nParameters\n----------\n"
+"asbs : input rank-2 array('D') with bounds (2,nstop)\n"
+"thetas : input rank-1 array('d') with bounds (n_pts)\n"
+"\nOther Parameters\n----------------\n"
+"nstop : input int, optional\n    Default: shape(asbs,1)\n"
+"n_pts : input int, optional\n    Default: len(thetas)\n"
+"\nReturns\n-------\n"
+"asm_out : rank-3 array('D') with bounds (2,2,n_pts)";
+/* extern void F_FUNC_US(asm_mie_far_arr,ASM_MIE_FAR_ARR)(int*,complex_double*,int*,double*,complex_double*); */
+static PyObject *f2py_rout_mieangfuncs_asm_mie_far_arr(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,int*,double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int nstop = 0;
+  PyObject *nstop_capi = Py_None;
+  complex_double *asbs = NULL;
+  npy_intp asbs_Dims[2] = {-1, -1};
+  const int asbs_Rank = 2;
+  PyArrayObject *capi_asbs_tmp = NULL;
+  int capi_asbs_intent = 0;
+  PyObject *asbs_capi = Py_None;
+  int n_pts = 0;
+  PyObject *n_pts_capi = Py_None;
+  double *thetas = NULL;
+  npy_intp thetas_Dims[1] = {-1};
+  const int thetas_Rank = 1;
+  PyArrayObject *capi_thetas_tmp = NULL;
+  int capi_thetas_intent = 0;
+  PyObject *thetas_capi = Py_None;
+  complex_double *asm_out = NULL;
+  npy_intp asm_out_Dims[3] = {-1, -1, -1};
+  const int asm_out_Rank = 3;
+  PyArrayObject *capi_asm_out_tmp = NULL;
+  int capi_asm_out_intent = 0;
+  static char *capi_kwlist[] = {"asbs","thetas","nstop","n_pts",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|OO:mieangfuncs.asm_mie_far_arr",\
+    capi_kwlist,&asbs_capi,&thetas_capi,&nstop_capi,&n_pts_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable thetas */
+  ;
+  capi_thetas_intent |= F2PY_INTENT_IN;
+  capi_thetas_tmp = array_from_pyobj(NPY_DOUBLE,thetas_Dims,thetas_Rank,capi_thetas_intent,thetas_capi);
+  if (capi_thetas_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 2nd argument `thetas' of mieangfuncs.asm_mie_far_arr to C/Fortran array" );
+  } else {
+    thetas = (double *)(PyArray_DATA(capi_thetas_tmp));
+
+  /* Processing variable asbs */
+  asbs_Dims[0]=2;
+  capi_asbs_intent |= F2PY_INTENT_IN;
+  capi_asbs_tmp = array_from_pyobj(NPY_CDOUBLE,asbs_Dims,asbs_Rank,capi_asbs_intent,asbs_capi);
+  if (capi_asbs_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 1st argument `asbs' of mieangfuncs.asm_mie_far_arr to C/Fortran array" );
+  } else {
+    asbs = (complex_double *)(PyArray_DATA(capi_asbs_tmp));
+
+  /* Processing variable nstop */
+  if (nstop_capi == Py_None) nstop = shape(asbs,1); else
+    f2py_success = int_from_pyobj(&nstop,nstop_capi,"mieangfuncs.asm_mie_far_arr() 1st keyword (nstop) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(shape(asbs,1)==nstop,"shape(asbs,1)==nstop","1st keyword nstop","asm_mie_far_arr:nstop=%d",nstop) {
+  /* Processing variable n_pts */
+  if (n_pts_capi == Py_None) n_pts = len(thetas); else
+    f2py_success = int_from_pyobj(&n_pts,n_pts_capi,"mieangfuncs.asm_mie_far_arr() 2nd keyword (n_pts) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(thetas)>=n_pts,"len(thetas)>=n_pts","2nd keyword n_pts","asm_mie_far_arr:n_pts=%d",n_pts) {
+  /* Processing variable asm_out */
+  asm_out_Dims[0]=2,asm_out_Dims[1]=2,asm_out_Dims[2]=n_pts;
+  capi_asm_out_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_asm_out_tmp = array_from_pyobj(NPY_CDOUBLE,asm_out_Dims,asm_out_Rank,capi_asm_out_intent,Py_None);
+  if (capi_asm_out_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `asm_out' of mieangfuncs.asm_mie_far_arr to C/Fortran array" );
+  } else {
+    asm_out = (complex_double *)(PyArray_DATA(capi_asm_out_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+      Py_BEGIN_ALLOW_THREADS
+        (*f2py_func)(&nstop,asbs,&n_pts,thetas,asm_out);
+      Py_END_ALLOW_THREADS
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_asm_out_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_asm_out_tmp == NULL) ... else of asm_out*/
+  /* End of cleaning variable asm_out */
+  } /*CHECKSCALAR(len(thetas)>=n_pts)*/
+  } /*if (f2py_success) of n_pts*/
+  /* End of cleaning variable n_pts */
+  } /*CHECKSCALAR(shape(asbs,1)==nstop)*/
+  } /*if (f2py_success) of nstop*/
+  /* End of cleaning variable nstop */
+  if((PyObject *)capi_asbs_tmp!=asbs_capi) {
+    Py_XDECREF(capi_asbs_tmp); }
+  }  /*if (capi_asbs_tmp == NULL) ... else of asbs*/
+  /* End of cleaning variable asbs */
+  if((PyObject *)capi_thetas_tmp!=thetas_capi) {
+    Py_XDECREF(capi_thetas_tmp); }
+  }  /*if (capi_thetas_tmp == NULL) ... else of thetas*/
+  /* End of cleaning variable thetas */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/*************************** end of asm_mie_far_arr ***************************/
+
+/****************************** radial_field_mie ******************************/
+static char doc_f2py_rout_mieangfuncs_radial_field_mie[] = "\
+erad_nd = radial_field_mie(as,kr,theta,[nstop])\n\nWrapper for ``radial_field_mie``.\
+\n\nParameters\n----------\n"
+"as : input rank-2 array('D') with bounds (1,nstop)\n"
+"kr : input float\n"
+"theta : input float\n"
+"\nOther Parameters\n----------------\n"
+"nstop : input int, optional\n    Default: shape(as,1)\n"
+"\nReturns\n-------\n"
+"erad_nd : complex";
+/* extern void F_FUNC_US(radial_field_mie,RADIAL_FIELD_MIE)(int*,complex_double*,double*,double*,complex_double*); */
+static PyObject *f2py_rout_mieangfuncs_radial_field_mie(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,double*,double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int nstop = 0;
+  PyObject *nstop_capi = Py_None;
+  complex_double *as = NULL;
+  npy_intp as_Dims[2] = {-1, -1};
+  const int as_Rank = 2;
+  PyArrayObject *capi_as_tmp = NULL;
+  int capi_as_intent = 0;
+  PyObject *as_capi = Py_None;
+  double kr = 0;
+  PyObject *kr_capi = Py_None;
+  double theta = 0;
+  PyObject *theta_capi = Py_None;
+  complex_double erad_nd;
+  PyObject *erad_nd_capi = Py_None;
+  static char *capi_kwlist[] = {"as","kr","theta","nstop",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO|O:mieangfuncs.radial_field_mie",\
+    capi_kwlist,&as_capi,&kr_capi,&theta_capi,&nstop_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable as */
+  as_Dims[0]=1;
+  capi_as_intent |= F2PY_INTENT_IN;
+  capi_as_tmp = array_from_pyobj(NPY_CDOUBLE,as_Dims,as_Rank,capi_as_intent,as_capi);
+  if (capi_as_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 1st argument `as' of mieangfuncs.radial_field_mie to C/Fortran array" );
+  } else {
+    as = (complex_double *)(PyArray_DATA(capi_as_tmp));
+
+  /* Processing variable kr */
+    f2py_success = double_from_pyobj(&kr,kr_capi,"mieangfuncs.radial_field_mie() 2nd argument (kr) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable erad_nd */
+  /* Processing variable theta */
+    f2py_success = double_from_pyobj(&theta,theta_capi,"mieangfuncs.radial_field_mie() 3rd argument (theta) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable nstop */
+  if (nstop_capi == Py_None) nstop = shape(as,1); else
+    f2py_success = int_from_pyobj(&nstop,nstop_capi,"mieangfuncs.radial_field_mie() 1st keyword (nstop) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(shape(as,1)==nstop,"shape(as,1)==nstop","1st keyword nstop","radial_field_mie:nstop=%d",nstop) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&nstop,as,&kr,&theta,&erad_nd);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  erad_nd_capi = pyobj_from_complex_double1(erad_nd);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",erad_nd_capi);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(shape(as,1)==nstop)*/
+  } /*if (f2py_success) of nstop*/
+  /* End of cleaning variable nstop */
+  } /*if (f2py_success) of theta*/
+  /* End of cleaning variable theta */
+  /* End of cleaning variable erad_nd */
+  } /*if (f2py_success) of kr*/
+  /* End of cleaning variable kr */
+  if((PyObject *)capi_as_tmp!=as_capi) {
+    Py_XDECREF(capi_as_tmp); }
+  }  /*if (capi_as_tmp == NULL) ... else of as*/
+  /* End of cleaning variable as */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/************************** end of radial_field_mie **************************/
+
+/******************************** fieldstocart ********************************/
+static char doc_f2py_rout_mieangfuncs_fieldstocart[] = "\
+acart = fieldstocart(asph,theta,phi)\n\nWrapper for ``fieldstocart``.\
+\n\nParameters\n----------\n"
+"asph : input rank-1 array('D') with bounds (2)\n"
+"theta : input float\n"
+"phi : input float\n"
+"\nReturns\n-------\n"
+"acart : rank-1 array('D') with bounds (3)";
+/* extern void F_FUNC(fieldstocart,FIELDSTOCART)(complex_double*,double*,double*,complex_double*); */
+static PyObject *f2py_rout_mieangfuncs_fieldstocart(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_double*,double*,double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_double *asph = NULL;
+  npy_intp asph_Dims[1] = {-1};
+  const int asph_Rank = 1;
+  PyArrayObject *capi_asph_tmp = NULL;
+  int capi_asph_intent = 0;
+  PyObject *asph_capi = Py_None;
+  double theta = 0;
+  PyObject *theta_capi = Py_None;
+  double phi = 0;
+  PyObject *phi_capi = Py_None;
+  complex_double *acart = NULL;
+  npy_intp acart_Dims[1] = {-1};
+  const int acart_Rank = 1;
+  PyArrayObject *capi_acart_tmp = NULL;
+  int capi_acart_intent = 0;
+  static char *capi_kwlist[] = {"asph","theta","phi",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO:mieangfuncs.fieldstocart",\
+    capi_kwlist,&asph_capi,&theta_capi,&phi_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable phi */
+    f2py_success = double_from_pyobj(&phi,phi_capi,"mieangfuncs.fieldstocart() 3rd argument (phi) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable asph */
+  asph_Dims[0]=2;
+  capi_asph_intent |= F2PY_INTENT_IN;
+  capi_asph_tmp = array_from_pyobj(NPY_CDOUBLE,asph_Dims,asph_Rank,capi_asph_intent,asph_capi);
+  if (capi_asph_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 1st argument `asph' of mieangfuncs.fieldstocart to C/Fortran array" );
+  } else {
+    asph = (complex_double *)(PyArray_DATA(capi_asph_tmp));
+
+  /* Processing variable acart */
+  acart_Dims[0]=3;
+  capi_acart_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_acart_tmp = array_from_pyobj(NPY_CDOUBLE,acart_Dims,acart_Rank,capi_acart_intent,Py_None);
+  if (capi_acart_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `acart' of mieangfuncs.fieldstocart to C/Fortran array" );
+  } else {
+    acart = (complex_double *)(PyArray_DATA(capi_acart_tmp));
+
+  /* Processing variable theta */
+    f2py_success = double_from_pyobj(&theta,theta_capi,"mieangfuncs.fieldstocart() 2nd argument (theta) can't be converted to double");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(asph,&theta,&phi,acart);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_acart_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of theta*/
+  /* End of cleaning variable theta */
+  }  /*if (capi_acart_tmp == NULL) ... else of acart*/
+  /* End of cleaning variable acart */
+  if((PyObject *)capi_asph_tmp!=asph_capi) {
+    Py_XDECREF(capi_asph_tmp); }
+  }  /*if (capi_asph_tmp == NULL) ... else of asph*/
+  /* End of cleaning variable asph */
+  } /*if (f2py_success) of phi*/
+  /* End of cleaning variable phi */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/**************************** end of fieldstocart ****************************/
+
+/**************************** radial_vect_to_cart ****************************/
+static char doc_f2py_rout_mieangfuncs_radial_vect_to_cart[] = "\
+acart = radial_vect_to_cart(a_r,theta,phi)\n\nWrapper for ``radial_vect_to_cart``.\
+\n\nParameters\n----------\n"
+"a_r : input complex\n"
+"theta : input float\n"
+"phi : input float\n"
+"\nReturns\n-------\n"
+"acart : rank-1 array('D') with bounds (3)";
+/* extern void F_FUNC_US(radial_vect_to_cart,RADIAL_VECT_TO_CART)(complex_double*,double*,double*,complex_double*); */
+static PyObject *f2py_rout_mieangfuncs_radial_vect_to_cart(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_double*,double*,double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_double a_r;
+  PyObject *a_r_capi = Py_None;
+  double theta = 0;
+  PyObject *theta_capi = Py_None;
+  double phi = 0;
+  PyObject *phi_capi = Py_None;
+  complex_double *acart = NULL;
+  npy_intp acart_Dims[1] = {-1};
+  const int acart_Rank = 1;
+  PyArrayObject *capi_acart_tmp = NULL;
+  int capi_acart_intent = 0;
+  static char *capi_kwlist[] = {"a_r","theta","phi",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO:mieangfuncs.radial_vect_to_cart",\
+    capi_kwlist,&a_r_capi,&theta_capi,&phi_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable phi */
+    f2py_success = double_from_pyobj(&phi,phi_capi,"mieangfuncs.radial_vect_to_cart() 3rd argument (phi) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable a_r */
+    f2py_success = complex_double_from_pyobj(&a_r,a_r_capi,"mieangfuncs.radial_vect_to_cart() 1st argument (a_r) can't be converted to complex_double");
+  if (f2py_success) {
+  /* Processing variable acart */
+  acart_Dims[0]=3;
+  capi_acart_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_acart_tmp = array_from_pyobj(NPY_CDOUBLE,acart_Dims,acart_Rank,capi_acart_intent,Py_None);
+  if (capi_acart_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `acart' of mieangfuncs.radial_vect_to_cart to C/Fortran array" );
+  } else {
+    acart = (complex_double *)(PyArray_DATA(capi_acart_tmp));
+
+  /* Processing variable theta */
+    f2py_success = double_from_pyobj(&theta,theta_capi,"mieangfuncs.radial_vect_to_cart() 2nd argument (theta) can't be converted to double");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&a_r,&theta,&phi,acart);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_acart_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of theta*/
+  /* End of cleaning variable theta */
+  }  /*if (capi_acart_tmp == NULL) ... else of acart*/
+  /* End of cleaning variable acart */
+  }  /*if (f2py_success) of a_r frompyobj*/
+  /* End of cleaning variable a_r */
+  } /*if (f2py_success) of phi*/
+  /* End of cleaning variable phi */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/************************* end of radial_vect_to_cart *************************/
+
+/******************************* getsphercoords *******************************/
+static char doc_f2py_rout_mieangfuncs_getsphercoords[] = "\
+sph = getsphercoords(x,y,z)\n\nWrapper for ``getsphercoords``.\
+\n\nParameters\n----------\n"
+"x : input float\n"
+"y : input float\n"
+"z : input float\n"
+"\nReturns\n-------\n"
+"sph : rank-1 array('d') with bounds (3)";
+/* extern void F_FUNC(getsphercoords,GETSPHERCOORDS)(double*,double*,double*,double*); */
+static PyObject *f2py_rout_mieangfuncs_getsphercoords(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,double*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double x = 0;
+  PyObject *x_capi = Py_None;
+  double y = 0;
+  PyObject *y_capi = Py_None;
+  double z = 0;
+  PyObject *z_capi = Py_None;
+  double *sph = NULL;
+  npy_intp sph_Dims[1] = {-1};
+  const int sph_Rank = 1;
+  PyArrayObject *capi_sph_tmp = NULL;
+  int capi_sph_intent = 0;
+  static char *capi_kwlist[] = {"x","y","z",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO:mieangfuncs.getsphercoords",\
+    capi_kwlist,&x_capi,&y_capi,&z_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable sph */
+  sph_Dims[0]=3;
+  capi_sph_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_sph_tmp = array_from_pyobj(NPY_DOUBLE,sph_Dims,sph_Rank,capi_sph_intent,Py_None);
+  if (capi_sph_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `sph' of mieangfuncs.getsphercoords to C/Fortran array" );
+  } else {
+    sph = (double *)(PyArray_DATA(capi_sph_tmp));
+
+  /* Processing variable z */
+    f2py_success = double_from_pyobj(&z,z_capi,"mieangfuncs.getsphercoords() 3rd argument (z) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable y */
+    f2py_success = double_from_pyobj(&y,y_capi,"mieangfuncs.getsphercoords() 2nd argument (y) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable x */
+    f2py_success = double_from_pyobj(&x,x_capi,"mieangfuncs.getsphercoords() 1st argument (x) can't be converted to double");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&x,&y,&z,sph);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_sph_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of x*/
+  /* End of cleaning variable x */
+  } /*if (f2py_success) of y*/
+  /* End of cleaning variable y */
+  } /*if (f2py_success) of z*/
+  /* End of cleaning variable z */
+  }  /*if (capi_sph_tmp == NULL) ... else of sph*/
+  /* End of cleaning variable sph */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/*************************** end of getsphercoords ***************************/
+
+/********************************** incfield **********************************/
+static char doc_f2py_rout_mieangfuncs_incfield[] = "\
+eincorigin = incfield(ex,ey,phi)\n\nWrapper for ``incfield``.\
+\n\nParameters\n----------\n"
+"ex : input float\n"
+"ey : input float\n"
+"phi : input float\n"
+"\nReturns\n-------\n"
+"eincorigin : rank-1 array('d') with bounds (2)";
+/* extern void F_FUNC(incfield,INCFIELD)(double*,double*,double*,double*); */
+static PyObject *f2py_rout_mieangfuncs_incfield(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,double*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double ex = 0;
+  PyObject *ex_capi = Py_None;
+  double ey = 0;
+  PyObject *ey_capi = Py_None;
+  double phi = 0;
+  PyObject *phi_capi = Py_None;
+  double *eincorigin = NULL;
+  npy_intp eincorigin_Dims[1] = {-1};
+  const int eincorigin_Rank = 1;
+  PyArrayObject *capi_eincorigin_tmp = NULL;
+  int capi_eincorigin_intent = 0;
+  static char *capi_kwlist[] = {"ex","ey","phi",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO:mieangfuncs.incfield",\
+    capi_kwlist,&ex_capi,&ey_capi,&phi_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable phi */
+    f2py_success = double_from_pyobj(&phi,phi_capi,"mieangfuncs.incfield() 3rd argument (phi) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable ey */
+    f2py_success = double_from_pyobj(&ey,ey_capi,"mieangfuncs.incfield() 2nd argument (ey) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable ex */
+    f2py_success = double_from_pyobj(&ex,ex_capi,"mieangfuncs.incfield() 1st argument (ex) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable eincorigin */
+  eincorigin_Dims[0]=2;
+  capi_eincorigin_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_eincorigin_tmp = array_from_pyobj(NPY_DOUBLE,eincorigin_Dims,eincorigin_Rank,capi_eincorigin_intent,Py_None);
+  if (capi_eincorigin_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `eincorigin' of mieangfuncs.incfield to C/Fortran array" );
+  } else {
+    eincorigin = (double *)(PyArray_DATA(capi_eincorigin_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&ex,&ey,&phi,eincorigin);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_eincorigin_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_eincorigin_tmp == NULL) ... else of eincorigin*/
+  /* End of cleaning variable eincorigin */
+  } /*if (f2py_success) of ex*/
+  /* End of cleaning variable ex */
+  } /*if (f2py_success) of ey*/
+  /* End of cleaning variable ey */
+  } /*if (f2py_success) of phi*/
+  /* End of cleaning variable phi */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/****************************** end of incfield ******************************/
+
+/********************************* pisandtaus *********************************/
+static char doc_f2py_rout_mieangfuncs_pisandtaus[] = "\
+pisout,taus = pisandtaus(n,theta)\n\nWrapper for ``pisandtaus``.\
+\n\nParameters\n----------\n"
+"n : input int\n"
+"theta : input float\n"
+"\nReturns\n-------\n"
+"pisout : rank-1 array('d') with bounds (n)\n"
+"taus : rank-1 array('d') with bounds (n)";
+/* extern void F_FUNC(pisandtaus,PISANDTAUS)(int*,double*,double*,double*); */
+static PyObject *f2py_rout_mieangfuncs_pisandtaus(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  double theta = 0;
+  PyObject *theta_capi = Py_None;
+  double *pisout = NULL;
+  npy_intp pisout_Dims[1] = {-1};
+  const int pisout_Rank = 1;
+  PyArrayObject *capi_pisout_tmp = NULL;
+  int capi_pisout_intent = 0;
+  double *taus = NULL;
+  npy_intp taus_Dims[1] = {-1};
+  const int taus_Rank = 1;
+  PyArrayObject *capi_taus_tmp = NULL;
+  int capi_taus_intent = 0;
+  static char *capi_kwlist[] = {"n","theta",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO:mieangfuncs.pisandtaus",\
+    capi_kwlist,&n_capi,&theta_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable theta */
+    f2py_success = double_from_pyobj(&theta,theta_capi,"mieangfuncs.pisandtaus() 2nd argument (theta) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"mieangfuncs.pisandtaus() 1st argument (n) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable taus */
+  taus_Dims[0]=n;
+  capi_taus_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_taus_tmp = array_from_pyobj(NPY_DOUBLE,taus_Dims,taus_Rank,capi_taus_intent,Py_None);
+  if (capi_taus_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `taus' of mieangfuncs.pisandtaus to C/Fortran array" );
+  } else {
+    taus = (double *)(PyArray_DATA(capi_taus_tmp));
+
+  /* Processing variable pisout */
+  pisout_Dims[0]=n;
+  capi_pisout_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_pisout_tmp = array_from_pyobj(NPY_DOUBLE,pisout_Dims,pisout_Rank,capi_pisout_intent,Py_None);
+  if (capi_pisout_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `pisout' of mieangfuncs.pisandtaus to C/Fortran array" );
+  } else {
+    pisout = (double *)(PyArray_DATA(capi_pisout_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,&theta,pisout,taus);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NN",capi_pisout_tmp,capi_taus_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_pisout_tmp == NULL) ... else of pisout*/
+  /* End of cleaning variable pisout */
+  }  /*if (capi_taus_tmp == NULL) ... else of taus*/
+  /* End of cleaning variable taus */
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of theta*/
+  /* End of cleaning variable theta */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of pisandtaus *****************************/
+
+/********************************* dn_1_down *********************************/
+static char doc_f2py_rout_mieangfuncs_dn_1_down[] = "\
+dn_out = dn_1_down(z,nmx,nstop,start_val)\n\nWrapper for ``dn_1_down``.\
+\n\nParameters\n----------\n"
+"z : input complex\n"
+"nmx : input int\n"
+"nstop : input int\n"
+"start_val : input complex\n"
+"\nReturns\n-------\n"
+"dn_out : rank-1 array('D') with bounds (nstop + 1)";
+/* extern void F_FUNC_US(dn_1_down,DN_1_DOWN)(complex_double*,int*,int*,complex_double*,complex_double*); */
+static PyObject *f2py_rout_mieangfuncs_dn_1_down(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_double*,int*,int*,complex_double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_double z;
+  PyObject *z_capi = Py_None;
+  int nmx = 0;
+  PyObject *nmx_capi = Py_None;
+  int nstop = 0;
+  PyObject *nstop_capi = Py_None;
+  complex_double start_val;
+  PyObject *start_val_capi = Py_None;
+  complex_double *dn_out = NULL;
+  npy_intp dn_out_Dims[1] = {-1};
+  const int dn_out_Rank = 1;
+  PyArrayObject *capi_dn_out_tmp = NULL;
+  int capi_dn_out_intent = 0;
+  static char *capi_kwlist[] = {"z","nmx","nstop","start_val",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO:mieangfuncs.dn_1_down",\
+    capi_kwlist,&z_capi,&nmx_capi,&nstop_capi,&start_val_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable start_val */
+    f2py_success = complex_double_from_pyobj(&start_val,start_val_capi,"mieangfuncs.dn_1_down() 4th argument (start_val) can't be converted to complex_double");
+  if (f2py_success) {
+  /* Processing variable nstop */
+    f2py_success = int_from_pyobj(&nstop,nstop_capi,"mieangfuncs.dn_1_down() 3rd argument (nstop) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable z */
+    f2py_success = complex_double_from_pyobj(&z,z_capi,"mieangfuncs.dn_1_down() 1st argument (z) can't be converted to complex_double");
+  if (f2py_success) {
+  /* Processing variable nmx */
+    f2py_success = int_from_pyobj(&nmx,nmx_capi,"mieangfuncs.dn_1_down() 2nd argument (nmx) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable dn_out */
+  dn_out_Dims[0]=nstop + 1;
+  capi_dn_out_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_dn_out_tmp = array_from_pyobj(NPY_CDOUBLE,dn_out_Dims,dn_out_Rank,capi_dn_out_intent,Py_None);
+  if (capi_dn_out_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `dn_out' of mieangfuncs.dn_1_down to C/Fortran array" );
+  } else {
+    dn_out = (complex_double *)(PyArray_DATA(capi_dn_out_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&z,&nmx,&nstop,&start_val,dn_out);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_dn_out_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_dn_out_tmp == NULL) ... else of dn_out*/
+  /* End of cleaning variable dn_out */
+  } /*if (f2py_success) of nmx*/
+  /* End of cleaning variable nmx */
+  }  /*if (f2py_success) of z frompyobj*/
+  /* End of cleaning variable z */
+  } /*if (f2py_success) of nstop*/
+  /* End of cleaning variable nstop */
+  }  /*if (f2py_success) of start_val frompyobj*/
+  /* End of cleaning variable start_val */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/****************************** end of dn_1_down ******************************/
+
+/********************************* lentz_dn1 *********************************/
+static char doc_f2py_rout_mieangfuncs_lentz_dn1[] = "\
+dn = lentz_dn1(z,n,eps1,eps2)\n\nWrapper for ``lentz_dn1``.\
+\n\nParameters\n----------\n"
+"z : input complex\n"
+"n : input int\n"
+"eps1 : input float\n"
+"eps2 : input float\n"
+"\nReturns\n-------\n"
+"dn : complex";
+/* extern void F_FUNC_US(lentz_dn1,LENTZ_DN1)(complex_double*,int*,double*,double*,complex_double*); */
+static PyObject *f2py_rout_mieangfuncs_lentz_dn1(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_double*,int*,double*,double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_double z;
+  PyObject *z_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  double eps1 = 0;
+  PyObject *eps1_capi = Py_None;
+  double eps2 = 0;
+  PyObject *eps2_capi = Py_None;
+  complex_double dn;
+  PyObject *dn_capi = Py_None;
+  static char *capi_kwlist[] = {"z","n","eps1","eps2",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO:mieangfuncs.lentz_dn1",\
+    capi_kwlist,&z_capi,&n_capi,&eps1_capi,&eps2_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable dn */
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"mieangfuncs.lentz_dn1() 2nd argument (n) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable z */
+    f2py_success = complex_double_from_pyobj(&z,z_capi,"mieangfuncs.lentz_dn1() 1st argument (z) can't be converted to complex_double");
+  if (f2py_success) {
+  /* Processing variable eps2 */
+    f2py_success = double_from_pyobj(&eps2,eps2_capi,"mieangfuncs.lentz_dn1() 4th argument (eps2) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable eps1 */
+    f2py_success = double_from_pyobj(&eps1,eps1_capi,"mieangfuncs.lentz_dn1() 3rd argument (eps1) can't be converted to double");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&z,&n,&eps1,&eps2,&dn);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+  dn_capi = pyobj_from_complex_double1(dn);
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",dn_capi);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of eps1*/
+  /* End of cleaning variable eps1 */
+  } /*if (f2py_success) of eps2*/
+  /* End of cleaning variable eps2 */
+  }  /*if (f2py_success) of z frompyobj*/
+  /* End of cleaning variable z */
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  /* End of cleaning variable dn */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/****************************** end of lentz_dn1 ******************************/
+
+/********************************** rotcoef **********************************/
+static char doc_f2py_rout_mieangfuncs_rotcoef[] = "\
+dc = rotcoef(cbe,kmax,nmax,ndim)\n\nWrapper for ``rotcoef``.\
+\n\nParameters\n----------\n"
+"cbe : input float\n"
+"kmax : input int\n"
+"nmax : input int\n"
+"ndim : input int\n"
+"\nReturns\n-------\n"
+"dc : rank-2 array('d') with bounds (2 * ndim + 1,nmax*(nmax+2)+1+1)";
+/* extern void F_FUNC(rotcoef,ROTCOEF)(double*,int*,int*,double*,int*); */
+static PyObject *f2py_rout_mieangfuncs_rotcoef(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,int*,int*,double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double cbe = 0;
+  PyObject *cbe_capi = Py_None;
+  int kmax = 0;
+  PyObject *kmax_capi = Py_None;
+  int nmax = 0;
+  PyObject *nmax_capi = Py_None;
+  double *dc = NULL;
+  npy_intp dc_Dims[2] = {-1, -1};
+  const int dc_Rank = 2;
+  PyArrayObject *capi_dc_tmp = NULL;
+  int capi_dc_intent = 0;
+  int ndim = 0;
+  PyObject *ndim_capi = Py_None;
+  static char *capi_kwlist[] = {"cbe","kmax","nmax","ndim",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO:mieangfuncs.rotcoef",\
+    capi_kwlist,&cbe_capi,&kmax_capi,&nmax_capi,&ndim_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable nmax */
+    f2py_success = int_from_pyobj(&nmax,nmax_capi,"mieangfuncs.rotcoef() 3rd argument (nmax) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndim */
+    f2py_success = int_from_pyobj(&ndim,ndim_capi,"mieangfuncs.rotcoef() 4th argument (ndim) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable cbe */
+    f2py_success = double_from_pyobj(&cbe,cbe_capi,"mieangfuncs.rotcoef() 1st argument (cbe) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable kmax */
+    f2py_success = int_from_pyobj(&kmax,kmax_capi,"mieangfuncs.rotcoef() 2nd argument (kmax) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable dc */
+  dc_Dims[0]=2 * ndim + 1,dc_Dims[1]=nmax*(nmax+2)+1+1;
+  capi_dc_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_dc_tmp = array_from_pyobj(NPY_DOUBLE,dc_Dims,dc_Rank,capi_dc_intent,Py_None);
+  if (capi_dc_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `dc' of mieangfuncs.rotcoef to C/Fortran array" );
+  } else {
+    dc = (double *)(PyArray_DATA(capi_dc_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&cbe,&kmax,&nmax,dc,&ndim);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_dc_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_dc_tmp == NULL) ... else of dc*/
+  /* End of cleaning variable dc */
+  } /*if (f2py_success) of kmax*/
+  /* End of cleaning variable kmax */
+  } /*if (f2py_success) of cbe*/
+  /* End of cleaning variable cbe */
+  } /*if (f2py_success) of ndim*/
+  /* End of cleaning variable ndim */
+  } /*if (f2py_success) of nmax*/
+  /* End of cleaning variable nmax */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of rotcoef *******************************/
+
+/*********************************** asmfr ***********************************/
+static char doc_f2py_rout_mieangfuncs_asmfr[] = "\
+sa = asmfr(amn0,nodrt,theta,phi,kr)\n\nWrapper for ``asmfr``.\
+\n\nParameters\n----------\n"
+"amn0 : input rank-3 array('D') with bounds (2,nodrt*(nodrt+2),2)\n"
+"nodrt : input int\n"
+"theta : input float\n"
+"phi : input float\n"
+"kr : input float\n"
+"\nReturns\n-------\n"
+"sa : rank-1 array('D') with bounds (4)";
+/* extern void F_FUNC(asmfr,ASMFR)(complex_double*,int*,double*,double*,double*,complex_double*); */
+static PyObject *f2py_rout_mieangfuncs_asmfr(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_double*,int*,double*,double*,double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_double *amn0 = NULL;
+  npy_intp amn0_Dims[3] = {-1, -1, -1};
+  const int amn0_Rank = 3;
+  PyArrayObject *capi_amn0_tmp = NULL;
+  int capi_amn0_intent = 0;
+  PyObject *amn0_capi = Py_None;
+  int nodrt = 0;
+  PyObject *nodrt_capi = Py_None;
+  double theta = 0;
+  PyObject *theta_capi = Py_None;
+  double phi = 0;
+  PyObject *phi_capi = Py_None;
+  double kr = 0;
+  PyObject *kr_capi = Py_None;
+  complex_double *sa = NULL;
+  npy_intp sa_Dims[1] = {-1};
+  const int sa_Rank = 1;
+  PyArrayObject *capi_sa_tmp = NULL;
+  int capi_sa_intent = 0;
+  static char *capi_kwlist[] = {"amn0","nodrt","theta","phi","kr",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOO:mieangfuncs.asmfr",\
+    capi_kwlist,&amn0_capi,&nodrt_capi,&theta_capi,&phi_capi,&kr_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable nodrt */
+    f2py_success = int_from_pyobj(&nodrt,nodrt_capi,"mieangfuncs.asmfr() 2nd argument (nodrt) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable phi */
+    f2py_success = double_from_pyobj(&phi,phi_capi,"mieangfuncs.asmfr() 4th argument (phi) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable kr */
+    f2py_success = double_from_pyobj(&kr,kr_capi,"mieangfuncs.asmfr() 5th argument (kr) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable theta */
+    f2py_success = double_from_pyobj(&theta,theta_capi,"mieangfuncs.asmfr() 3rd argument (theta) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable sa */
+  sa_Dims[0]=4;
+  capi_sa_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_sa_tmp = array_from_pyobj(NPY_CDOUBLE,sa_Dims,sa_Rank,capi_sa_intent,Py_None);
+  if (capi_sa_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `sa' of mieangfuncs.asmfr to C/Fortran array" );
+  } else {
+    sa = (complex_double *)(PyArray_DATA(capi_sa_tmp));
+
+  /* Processing variable amn0 */
+  amn0_Dims[0]=2,amn0_Dims[1]=nodrt*(nodrt+2),amn0_Dims[2]=2;
+  capi_amn0_intent |= F2PY_INTENT_IN;
+  capi_amn0_tmp = array_from_pyobj(NPY_CDOUBLE,amn0_Dims,amn0_Rank,capi_amn0_intent,amn0_capi);
+  if (capi_amn0_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 1st argument `amn0' of mieangfuncs.asmfr to C/Fortran array" );
+  } else {
+    amn0 = (complex_double *)(PyArray_DATA(capi_amn0_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(amn0,&nodrt,&theta,&phi,&kr,sa);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_sa_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_amn0_tmp!=amn0_capi) {
+    Py_XDECREF(capi_amn0_tmp); }
+  }  /*if (capi_amn0_tmp == NULL) ... else of amn0*/
+  /* End of cleaning variable amn0 */
+  }  /*if (capi_sa_tmp == NULL) ... else of sa*/
+  /* End of cleaning variable sa */
+  } /*if (f2py_success) of theta*/
+  /* End of cleaning variable theta */
+  } /*if (f2py_success) of kr*/
+  /* End of cleaning variable kr */
+  } /*if (f2py_success) of phi*/
+  /* End of cleaning variable phi */
+  } /*if (f2py_success) of nodrt*/
+  /* End of cleaning variable nodrt */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of asmfr ********************************/
+
+/****************************** ms_radial_fields ******************************/
+static char doc_f2py_rout_mieangfuncs_ms_radial_fields[] = "\
+as_rad = ms_radial_fields(amn0,nodrt,theta,phi,kr)\n\nWrapper for ``ms_radial_fields``.\
+\n\nParameters\n----------\n"
+"amn0 : input rank-3 array('D') with bounds (2,nodrt*(nodrt+2),2)\n"
+"nodrt : input int\n"
+"theta : input float\n"
+"phi : input float\n"
+"kr : input float\n"
+"\nReturns\n-------\n"
+"as_rad : rank-1 array('D') with bounds (2)";
+/* extern void F_FUNC_US(ms_radial_fields,MS_RADIAL_FIELDS)(complex_double*,int*,double*,double*,double*,complex_double*); */
+static PyObject *f2py_rout_mieangfuncs_ms_radial_fields(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_double*,int*,double*,double*,double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_double *amn0 = NULL;
+  npy_intp amn0_Dims[3] = {-1, -1, -1};
+  const int amn0_Rank = 3;
+  PyArrayObject *capi_amn0_tmp = NULL;
+  int capi_amn0_intent = 0;
+  PyObject *amn0_capi = Py_None;
+  int nodrt = 0;
+  PyObject *nodrt_capi = Py_None;
+  double theta = 0;
+  PyObject *theta_capi = Py_None;
+  double phi = 0;
+  PyObject *phi_capi = Py_None;
+  double kr = 0;
+  PyObject *kr_capi = Py_None;
+  complex_double *as_rad = NULL;
+  npy_intp as_rad_Dims[1] = {-1};
+  const int as_rad_Rank = 1;
+  PyArrayObject *capi_as_rad_tmp = NULL;
+  int capi_as_rad_intent = 0;
+  static char *capi_kwlist[] = {"amn0","nodrt","theta","phi","kr",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOO:mieangfuncs.ms_radial_fields",\
+    capi_kwlist,&amn0_capi,&nodrt_capi,&theta_capi,&phi_capi,&kr_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable nodrt */
+    f2py_success = int_from_pyobj(&nodrt,nodrt_capi,"mieangfuncs.ms_radial_fields() 2nd argument (nodrt) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable phi */
+    f2py_success = double_from_pyobj(&phi,phi_capi,"mieangfuncs.ms_radial_fields() 4th argument (phi) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable kr */
+    f2py_success = double_from_pyobj(&kr,kr_capi,"mieangfuncs.ms_radial_fields() 5th argument (kr) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable as_rad */
+  as_rad_Dims[0]=2;
+  capi_as_rad_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_as_rad_tmp = array_from_pyobj(NPY_CDOUBLE,as_rad_Dims,as_rad_Rank,capi_as_rad_intent,Py_None);
+  if (capi_as_rad_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `as_rad' of mieangfuncs.ms_radial_fields to C/Fortran array" );
+  } else {
+    as_rad = (complex_double *)(PyArray_DATA(capi_as_rad_tmp));
+
+  /* Processing variable theta */
+    f2py_success = double_from_pyobj(&theta,theta_capi,"mieangfuncs.ms_radial_fields() 3rd argument (theta) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable amn0 */
+  amn0_Dims[0]=2,amn0_Dims[1]=nodrt*(nodrt+2),amn0_Dims[2]=2;
+  capi_amn0_intent |= F2PY_INTENT_IN;
+  capi_amn0_tmp = array_from_pyobj(NPY_CDOUBLE,amn0_Dims,amn0_Rank,capi_amn0_intent,amn0_capi);
+  if (capi_amn0_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 1st argument `amn0' of mieangfuncs.ms_radial_fields to C/Fortran array" );
+  } else {
+    amn0 = (complex_double *)(PyArray_DATA(capi_amn0_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(amn0,&nodrt,&theta,&phi,&kr,as_rad);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_as_rad_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_amn0_tmp!=amn0_capi) {
+    Py_XDECREF(capi_amn0_tmp); }
+  }  /*if (capi_amn0_tmp == NULL) ... else of amn0*/
+  /* End of cleaning variable amn0 */
+  } /*if (f2py_success) of theta*/
+  /* End of cleaning variable theta */
+  }  /*if (capi_as_rad_tmp == NULL) ... else of as_rad*/
+  /* End of cleaning variable as_rad */
+  } /*if (f2py_success) of kr*/
+  /* End of cleaning variable kr */
+  } /*if (f2py_success) of phi*/
+  /* End of cleaning variable phi */
+  } /*if (f2py_success) of nodrt*/
+  /* End of cleaning variable nodrt */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/************************** end of ms_radial_fields **************************/
+
+/************************************ asm ************************************/
+static char doc_f2py_rout_mieangfuncs_asm[] = "\
+sa = asm(amn0,nodrt,theta,phi)\n\nWrapper for ``asm``.\
+\n\nParameters\n----------\n"
+"amn0 : input rank-3 array('D') with bounds (2,nodrt*(nodrt+2),2)\n"
+"nodrt : input int\n"
+"theta : input float\n"
+"phi : input float\n"
+"\nReturns\n-------\n"
+"sa : rank-1 array('D') with bounds (4)";
+/* extern void F_FUNC(asm,ASM)(complex_double*,int*,double*,double*,complex_double*); */
+static PyObject *f2py_rout_mieangfuncs_asm(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_double*,int*,double*,double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_double *amn0 = NULL;
+  npy_intp amn0_Dims[3] = {-1, -1, -1};
+  const int amn0_Rank = 3;
+  PyArrayObject *capi_amn0_tmp = NULL;
+  int capi_amn0_intent = 0;
+  PyObject *amn0_capi = Py_None;
+  int nodrt = 0;
+  PyObject *nodrt_capi = Py_None;
+  double theta = 0;
+  PyObject *theta_capi = Py_None;
+  double phi = 0;
+  PyObject *phi_capi = Py_None;
+  complex_double *sa = NULL;
+  npy_intp sa_Dims[1] = {-1};
+  const int sa_Rank = 1;
+  PyArrayObject *capi_sa_tmp = NULL;
+  int capi_sa_intent = 0;
+  static char *capi_kwlist[] = {"amn0","nodrt","theta","phi",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO:mieangfuncs.asm",\
+    capi_kwlist,&amn0_capi,&nodrt_capi,&theta_capi,&phi_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable phi */
+    f2py_success = double_from_pyobj(&phi,phi_capi,"mieangfuncs.asm() 4th argument (phi) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable nodrt */
+    f2py_success = int_from_pyobj(&nodrt,nodrt_capi,"mieangfuncs.asm() 2nd argument (nodrt) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable theta */
+    f2py_success = double_from_pyobj(&theta,theta_capi,"mieangfuncs.asm() 3rd argument (theta) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable sa */
+  sa_Dims[0]=4;
+  capi_sa_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_sa_tmp = array_from_pyobj(NPY_CDOUBLE,sa_Dims,sa_Rank,capi_sa_intent,Py_None);
+  if (capi_sa_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `sa' of mieangfuncs.asm to C/Fortran array" );
+  } else {
+    sa = (complex_double *)(PyArray_DATA(capi_sa_tmp));
+
+  /* Processing variable amn0 */
+  amn0_Dims[0]=2,amn0_Dims[1]=nodrt*(nodrt+2),amn0_Dims[2]=2;
+  capi_amn0_intent |= F2PY_INTENT_IN;
+  capi_amn0_tmp = array_from_pyobj(NPY_CDOUBLE,amn0_Dims,amn0_Rank,capi_amn0_intent,amn0_capi);
+  if (capi_amn0_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 1st argument `amn0' of mieangfuncs.asm to C/Fortran array" );
+  } else {
+    amn0 = (complex_double *)(PyArray_DATA(capi_amn0_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(amn0,&nodrt,&theta,&phi,sa);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_sa_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_amn0_tmp!=amn0_capi) {
+    Py_XDECREF(capi_amn0_tmp); }
+  }  /*if (capi_amn0_tmp == NULL) ... else of amn0*/
+  /* End of cleaning variable amn0 */
+  }  /*if (capi_sa_tmp == NULL) ... else of sa*/
+  /* End of cleaning variable sa */
+  } /*if (f2py_success) of theta*/
+  /* End of cleaning variable theta */
+  } /*if (f2py_success) of nodrt*/
+  /* End of cleaning variable nodrt */
+  } /*if (f2py_success) of phi*/
+  /* End of cleaning variable phi */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/********************************* end of asm *********************************/
+
+/********************************** asm_arr **********************************/
+static char doc_f2py_rout_mieangfuncs_asm_arr[] = "\
+sa = asm_arr(amn0,nodrt,theta,phi)\n\nWrapper for ``asm_arr``.\
+\n\nParameters\n----------\n"
+"amn0 : input rank-3 array('D') with bounds (2,nodrt*(nodrt+2),2)\n"
+"nodrt : input int\n"
+"theta : input rank-1 array('d') with bounds (npts)\n"
+"phi : input rank-1 array('d') with bounds (npts)\n"
+"\nReturns\n-------\n"
+"sa : rank-2 array('D') with bounds (4,npts)";
+/* extern void F_FUNC_US(asm_arr,ASM_ARR)(complex_double*,int*,int*,double*,double*,complex_double*); */
+static PyObject *f2py_rout_mieangfuncs_asm_arr(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_double*,int*,int*,double*,double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_double *amn0 = NULL;
+  npy_intp amn0_Dims[3] = {-1, -1, -1};
+  const int amn0_Rank = 3;
+  PyArrayObject *capi_amn0_tmp = NULL;
+  int capi_amn0_intent = 0;
+  PyObject *amn0_capi = Py_None;
+  int nodrt = 0;
+  PyObject *nodrt_capi = Py_None;
+  int npts = 0;
+  double *theta = NULL;
+  npy_intp theta_Dims[1] = {-1};
+  const int theta_Rank = 1;
+  PyArrayObject *capi_theta_tmp = NULL;
+  int capi_theta_intent = 0;
+  PyObject *theta_capi = Py_None;
+  double *phi = NULL;
+  npy_intp phi_Dims[1] = {-1};
+  const int phi_Rank = 1;
+  PyArrayObject *capi_phi_tmp = NULL;
+  int capi_phi_intent = 0;
+  PyObject *phi_capi = Py_None;
+  complex_double *sa = NULL;
+  npy_intp sa_Dims[2] = {-1, -1};
+  const int sa_Rank = 2;
+  PyArrayObject *capi_sa_tmp = NULL;
+  int capi_sa_intent = 0;
+  static char *capi_kwlist[] = {"amn0","nodrt","theta","phi",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO:mieangfuncs.asm_arr",\
+    capi_kwlist,&amn0_capi,&nodrt_capi,&theta_capi,&phi_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable theta */
+  ;
+  capi_theta_intent |= F2PY_INTENT_IN;
+  capi_theta_tmp = array_from_pyobj(NPY_DOUBLE,theta_Dims,theta_Rank,capi_theta_intent,theta_capi);
+  if (capi_theta_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 3rd argument `theta' of mieangfuncs.asm_arr to C/Fortran array" );
+  } else {
+    theta = (double *)(PyArray_DATA(capi_theta_tmp));
+
+  /* Processing variable nodrt */
+    f2py_success = int_from_pyobj(&nodrt,nodrt_capi,"mieangfuncs.asm_arr() 2nd argument (nodrt) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable amn0 */
+  amn0_Dims[0]=2,amn0_Dims[1]=nodrt*(nodrt+2),amn0_Dims[2]=2;
+  capi_amn0_intent |= F2PY_INTENT_IN;
+  capi_amn0_tmp = array_from_pyobj(NPY_CDOUBLE,amn0_Dims,amn0_Rank,capi_amn0_intent,amn0_capi);
+  if (capi_amn0_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 1st argument `amn0' of mieangfuncs.asm_arr to C/Fortran array" );
+  } else {
+    amn0 = (complex_double *)(PyArray_DATA(capi_amn0_tmp));
+
+  /* Processing variable npts */
+  npts = len(theta);
+  CHECKSCALAR(len(theta)>=npts,"len(theta)>=npts","hidden npts","asm_arr:npts=%d",npts) {
+  /* Processing variable sa */
+  sa_Dims[0]=4,sa_Dims[1]=npts;
+  capi_sa_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_sa_tmp = array_from_pyobj(NPY_CDOUBLE,sa_Dims,sa_Rank,capi_sa_intent,Py_None);
+  if (capi_sa_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `sa' of mieangfuncs.asm_arr to C/Fortran array" );
+  } else {
+    sa = (complex_double *)(PyArray_DATA(capi_sa_tmp));
+
+  /* Processing variable phi */
+  phi_Dims[0]=npts;
+  capi_phi_intent |= F2PY_INTENT_IN;
+  capi_phi_tmp = array_from_pyobj(NPY_DOUBLE,phi_Dims,phi_Rank,capi_phi_intent,phi_capi);
+  if (capi_phi_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 4th argument `phi' of mieangfuncs.asm_arr to C/Fortran array" );
+  } else {
+    phi = (double *)(PyArray_DATA(capi_phi_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(amn0,&nodrt,&npts,theta,phi,sa);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_sa_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_phi_tmp!=phi_capi) {
+    Py_XDECREF(capi_phi_tmp); }
+  }  /*if (capi_phi_tmp == NULL) ... else of phi*/
+  /* End of cleaning variable phi */
+  }  /*if (capi_sa_tmp == NULL) ... else of sa*/
+  /* End of cleaning variable sa */
+  } /*CHECKSCALAR(len(theta)>=npts)*/
+  /* End of cleaning variable npts */
+  if((PyObject *)capi_amn0_tmp!=amn0_capi) {
+    Py_XDECREF(capi_amn0_tmp); }
+  }  /*if (capi_amn0_tmp == NULL) ... else of amn0*/
+  /* End of cleaning variable amn0 */
+  } /*if (f2py_success) of nodrt*/
+  /* End of cleaning variable nodrt */
+  if((PyObject *)capi_theta_tmp!=theta_capi) {
+    Py_XDECREF(capi_theta_tmp); }
+  }  /*if (capi_theta_tmp == NULL) ... else of theta*/
+  /* End of cleaning variable theta */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of asm_arr *******************************/
+
+/*********************************** asmsum ***********************************/
+static char doc_f2py_rout_mieangfuncs_asmsum[] = "\
+asmsum(amn0,nodrt,drot,phi,sa)\n\nWrapper for ``asmsum``.\
+\n\nParameters\n----------\n"
+"amn0 : input rank-3 array('D') with bounds (2,nodrt*(nodrt+2),2)\n"
+"nodrt : input int\n"
+"drot : input rank-2 array('d') with bounds (3,nodrt*(nodrt+2)+1)\n"
+"phi : input float\n"
+"sa : input rank-1 array('D') with bounds (4)";
+/* extern void F_FUNC(asmsum,ASMSUM)(complex_double*,int*,double*,double*,complex_double*); */
+static PyObject *f2py_rout_mieangfuncs_asmsum(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_double*,int*,double*,double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_double *amn0 = NULL;
+  npy_intp amn0_Dims[3] = {-1, -1, -1};
+  const int amn0_Rank = 3;
+  PyArrayObject *capi_amn0_tmp = NULL;
+  int capi_amn0_intent = 0;
+  PyObject *amn0_capi = Py_None;
+  int nodrt = 0;
+  PyObject *nodrt_capi = Py_None;
+  double *drot = NULL;
+  npy_intp drot_Dims[2] = {-1, -1};
+  const int drot_Rank = 2;
+  PyArrayObject *capi_drot_tmp = NULL;
+  int capi_drot_intent = 0;
+  PyObject *drot_capi = Py_None;
+  double phi = 0;
+  PyObject *phi_capi = Py_None;
+  complex_double *sa = NULL;
+  npy_intp sa_Dims[1] = {-1};
+  const int sa_Rank = 1;
+  PyArrayObject *capi_sa_tmp = NULL;
+  int capi_sa_intent = 0;
+  PyObject *sa_capi = Py_None;
+  static char *capi_kwlist[] = {"amn0","nodrt","drot","phi","sa",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOO:mieangfuncs.asmsum",\
+    capi_kwlist,&amn0_capi,&nodrt_capi,&drot_capi,&phi_capi,&sa_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable phi */
+    f2py_success = double_from_pyobj(&phi,phi_capi,"mieangfuncs.asmsum() 4th argument (phi) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable nodrt */
+    f2py_success = int_from_pyobj(&nodrt,nodrt_capi,"mieangfuncs.asmsum() 2nd argument (nodrt) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable sa */
+  sa_Dims[0]=4;
+  capi_sa_intent |= F2PY_INTENT_IN;
+  capi_sa_tmp = array_from_pyobj(NPY_CDOUBLE,sa_Dims,sa_Rank,capi_sa_intent,sa_capi);
+  if (capi_sa_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 5th argument `sa' of mieangfuncs.asmsum to C/Fortran array" );
+  } else {
+    sa = (complex_double *)(PyArray_DATA(capi_sa_tmp));
+
+  /* Processing variable drot */
+  drot_Dims[0]=3,drot_Dims[1]=nodrt*(nodrt+2)+1;
+  capi_drot_intent |= F2PY_INTENT_IN;
+  capi_drot_tmp = array_from_pyobj(NPY_DOUBLE,drot_Dims,drot_Rank,capi_drot_intent,drot_capi);
+  if (capi_drot_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 3rd argument `drot' of mieangfuncs.asmsum to C/Fortran array" );
+  } else {
+    drot = (double *)(PyArray_DATA(capi_drot_tmp));
+
+  /* Processing variable amn0 */
+  amn0_Dims[0]=2,amn0_Dims[1]=nodrt*(nodrt+2),amn0_Dims[2]=2;
+  capi_amn0_intent |= F2PY_INTENT_IN;
+  capi_amn0_tmp = array_from_pyobj(NPY_CDOUBLE,amn0_Dims,amn0_Rank,capi_amn0_intent,amn0_capi);
+  if (capi_amn0_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 1st argument `amn0' of mieangfuncs.asmsum to C/Fortran array" );
+  } else {
+    amn0 = (complex_double *)(PyArray_DATA(capi_amn0_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(amn0,&nodrt,drot,&phi,sa);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_amn0_tmp!=amn0_capi) {
+    Py_XDECREF(capi_amn0_tmp); }
+  }  /*if (capi_amn0_tmp == NULL) ... else of amn0*/
+  /* End of cleaning variable amn0 */
+  if((PyObject *)capi_drot_tmp!=drot_capi) {
+    Py_XDECREF(capi_drot_tmp); }
+  }  /*if (capi_drot_tmp == NULL) ... else of drot*/
+  /* End of cleaning variable drot */
+  if((PyObject *)capi_sa_tmp!=sa_capi) {
+    Py_XDECREF(capi_sa_tmp); }
+  }  /*if (capi_sa_tmp == NULL) ... else of sa*/
+  /* End of cleaning variable sa */
+  } /*if (f2py_success) of nodrt*/
+  /* End of cleaning variable nodrt */
+  } /*if (f2py_success) of phi*/
+  /* End of cleaning variable phi */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of asmsum *******************************/
+
+/*********************************** sbesjy ***********************************/
+static char doc_f2py_rout_mieangfuncs_sbesjy[] = "\
+j,y,jp,yp,ifail = sbesjy(x,lmax)\n\nWrapper for ``sbesjy``.\
+\n\nParameters\n----------\n"
+"x : input float\n"
+"lmax : input int\n"
+"\nReturns\n-------\n"
+"j : rank-1 array('d') with bounds (lmax + 1)\n"
+"y : rank-1 array('d') with bounds (lmax + 1)\n"
+"jp : rank-1 array('d') with bounds (lmax + 1)\n"
+"yp : rank-1 array('d') with bounds (lmax + 1)\n"
+"ifail : int";
+/* extern void F_FUNC(sbesjy,SBESJY)(double*,int*,double*,double*,double*,double*,int*); */
+static PyObject *f2py_rout_mieangfuncs_sbesjy(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,int*,double*,double*,double*,double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double x = 0;
+  PyObject *x_capi = Py_None;
+  int lmax = 0;
+  PyObject *lmax_capi = Py_None;
+  double *j = NULL;
+  npy_intp j_Dims[1] = {-1};
+  const int j_Rank = 1;
+  PyArrayObject *capi_j_tmp = NULL;
+  int capi_j_intent = 0;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  double *jp = NULL;
+  npy_intp jp_Dims[1] = {-1};
+  const int jp_Rank = 1;
+  PyArrayObject *capi_jp_tmp = NULL;
+  int capi_jp_intent = 0;
+  double *yp = NULL;
+  npy_intp yp_Dims[1] = {-1};
+  const int yp_Rank = 1;
+  PyArrayObject *capi_yp_tmp = NULL;
+  int capi_yp_intent = 0;
+  int ifail = 0;
+  static char *capi_kwlist[] = {"x","lmax",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO:mieangfuncs.sbesjy",\
+    capi_kwlist,&x_capi,&lmax_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable ifail */
+  /* Processing variable lmax */
+    f2py_success = int_from_pyobj(&lmax,lmax_capi,"mieangfuncs.sbesjy() 2nd argument (lmax) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable x */
+    f2py_success = double_from_pyobj(&x,x_capi,"mieangfuncs.sbesjy() 1st argument (x) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable jp */
+  jp_Dims[0]=lmax + 1;
+  capi_jp_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_jp_tmp = array_from_pyobj(NPY_DOUBLE,jp_Dims,jp_Rank,capi_jp_intent,Py_None);
+  if (capi_jp_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `jp' of mieangfuncs.sbesjy to C/Fortran array" );
+  } else {
+    jp = (double *)(PyArray_DATA(capi_jp_tmp));
+
+  /* Processing variable yp */
+  yp_Dims[0]=lmax + 1;
+  capi_yp_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_yp_tmp = array_from_pyobj(NPY_DOUBLE,yp_Dims,yp_Rank,capi_yp_intent,Py_None);
+  if (capi_yp_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `yp' of mieangfuncs.sbesjy to C/Fortran array" );
+  } else {
+    yp = (double *)(PyArray_DATA(capi_yp_tmp));
+
+  /* Processing variable j */
+  j_Dims[0]=lmax + 1;
+  capi_j_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_j_tmp = array_from_pyobj(NPY_DOUBLE,j_Dims,j_Rank,capi_j_intent,Py_None);
+  if (capi_j_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `j' of mieangfuncs.sbesjy to C/Fortran array" );
+  } else {
+    j = (double *)(PyArray_DATA(capi_j_tmp));
+
+  /* Processing variable y */
+  y_Dims[0]=lmax + 1;
+  capi_y_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,Py_None);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting hidden `y' of mieangfuncs.sbesjy to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&x,&lmax,j,y,jp,yp,&ifail);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NNNNi",capi_j_tmp,capi_y_tmp,capi_jp_tmp,capi_yp_tmp,ifail);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  }  /*if (capi_j_tmp == NULL) ... else of j*/
+  /* End of cleaning variable j */
+  }  /*if (capi_yp_tmp == NULL) ... else of yp*/
+  /* End of cleaning variable yp */
+  }  /*if (capi_jp_tmp == NULL) ... else of jp*/
+  /* End of cleaning variable jp */
+  } /*if (f2py_success) of x*/
+  /* End of cleaning variable x */
+  } /*if (f2py_success) of lmax*/
+  /* End of cleaning variable lmax */
+  /* End of cleaning variable ifail */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of sbesjy *******************************/
+
+/*********************************** csphjy ***********************************/
+static char doc_f2py_rout_mieangfuncs_csphjy[] = "\
+csphjy(z,nm,csj,cdj,csy,cdy,[n])\n\nWrapper for ``csphjy``.\
+\n\nParameters\n----------\n"
+"z : input complex\n"
+"nm : input int\n"
+"csj : input rank-1 array('D') with bounds (n + 1)\n"
+"cdj : input rank-1 array('D') with bounds (n + 1)\n"
+"csy : input rank-1 array('D') with bounds (n + 1)\n"
+"cdy : input rank-1 array('D') with bounds (n + 1)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: (len(csj)-1)";
+/* extern void F_FUNC(csphjy,CSPHJY)(int*,complex_double*,int*,complex_double*,complex_double*,complex_double*,complex_double*); */
+static PyObject *f2py_rout_mieangfuncs_csphjy(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,int*,complex_double*,complex_double*,complex_double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_double z;
+  PyObject *z_capi = Py_None;
+  int nm = 0;
+  PyObject *nm_capi = Py_None;
+  complex_double *csj = NULL;
+  npy_intp csj_Dims[1] = {-1};
+  const int csj_Rank = 1;
+  PyArrayObject *capi_csj_tmp = NULL;
+  int capi_csj_intent = 0;
+  PyObject *csj_capi = Py_None;
+  complex_double *cdj = NULL;
+  npy_intp cdj_Dims[1] = {-1};
+  const int cdj_Rank = 1;
+  PyArrayObject *capi_cdj_tmp = NULL;
+  int capi_cdj_intent = 0;
+  PyObject *cdj_capi = Py_None;
+  complex_double *csy = NULL;
+  npy_intp csy_Dims[1] = {-1};
+  const int csy_Rank = 1;
+  PyArrayObject *capi_csy_tmp = NULL;
+  int capi_csy_intent = 0;
+  PyObject *csy_capi = Py_None;
+  complex_double *cdy = NULL;
+  npy_intp cdy_Dims[1] = {-1};
+  const int cdy_Rank = 1;
+  PyArrayObject *capi_cdy_tmp = NULL;
+  int capi_cdy_intent = 0;
+  PyObject *cdy_capi = Py_None;
+  static char *capi_kwlist[] = {"z","nm","csj","cdj","csy","cdy","n",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOO|O:mieangfuncs.csphjy",\
+    capi_kwlist,&z_capi,&nm_capi,&csj_capi,&cdj_capi,&csy_capi,&cdy_capi,&n_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable nm */
+    f2py_success = int_from_pyobj(&nm,nm_capi,"mieangfuncs.csphjy() 2nd argument (nm) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable csj */
+  ;
+  capi_csj_intent |= F2PY_INTENT_IN;
+  capi_csj_tmp = array_from_pyobj(NPY_CDOUBLE,csj_Dims,csj_Rank,capi_csj_intent,csj_capi);
+  if (capi_csj_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 3rd argument `csj' of mieangfuncs.csphjy to C/Fortran array" );
+  } else {
+    csj = (complex_double *)(PyArray_DATA(capi_csj_tmp));
+
+  /* Processing variable z */
+    f2py_success = complex_double_from_pyobj(&z,z_capi,"mieangfuncs.csphjy() 1st argument (z) can't be converted to complex_double");
+  if (f2py_success) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = (len(csj)-1); else
+    f2py_success = int_from_pyobj(&n,n_capi,"mieangfuncs.csphjy() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR((len(csj)-1)>=n,"(len(csj)-1)>=n","1st keyword n","csphjy:n=%d",n) {
+  /* Processing variable csy */
+  csy_Dims[0]=n + 1;
+  capi_csy_intent |= F2PY_INTENT_IN;
+  capi_csy_tmp = array_from_pyobj(NPY_CDOUBLE,csy_Dims,csy_Rank,capi_csy_intent,csy_capi);
+  if (capi_csy_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 5th argument `csy' of mieangfuncs.csphjy to C/Fortran array" );
+  } else {
+    csy = (complex_double *)(PyArray_DATA(capi_csy_tmp));
+
+  /* Processing variable cdy */
+  cdy_Dims[0]=n + 1;
+  capi_cdy_intent |= F2PY_INTENT_IN;
+  capi_cdy_tmp = array_from_pyobj(NPY_CDOUBLE,cdy_Dims,cdy_Rank,capi_cdy_intent,cdy_capi);
+  if (capi_cdy_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 6th argument `cdy' of mieangfuncs.csphjy to C/Fortran array" );
+  } else {
+    cdy = (complex_double *)(PyArray_DATA(capi_cdy_tmp));
+
+  /* Processing variable cdj */
+  cdj_Dims[0]=n + 1;
+  capi_cdj_intent |= F2PY_INTENT_IN;
+  capi_cdj_tmp = array_from_pyobj(NPY_CDOUBLE,cdj_Dims,cdj_Rank,capi_cdj_intent,cdj_capi);
+  if (capi_cdj_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(mieangfuncs_error,"failed in converting 4th argument `cdj' of mieangfuncs.csphjy to C/Fortran array" );
+  } else {
+    cdj = (complex_double *)(PyArray_DATA(capi_cdj_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,&z,&nm,csj,cdj,csy,cdy);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_cdj_tmp!=cdj_capi) {
+    Py_XDECREF(capi_cdj_tmp); }
+  }  /*if (capi_cdj_tmp == NULL) ... else of cdj*/
+  /* End of cleaning variable cdj */
+  if((PyObject *)capi_cdy_tmp!=cdy_capi) {
+    Py_XDECREF(capi_cdy_tmp); }
+  }  /*if (capi_cdy_tmp == NULL) ... else of cdy*/
+  /* End of cleaning variable cdy */
+  if((PyObject *)capi_csy_tmp!=csy_capi) {
+    Py_XDECREF(capi_csy_tmp); }
+  }  /*if (capi_csy_tmp == NULL) ... else of csy*/
+  /* End of cleaning variable csy */
+  } /*CHECKSCALAR((len(csj)-1)>=n)*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  }  /*if (f2py_success) of z frompyobj*/
+  /* End of cleaning variable z */
+  if((PyObject *)capi_csj_tmp!=csj_capi) {
+    Py_XDECREF(capi_csj_tmp); }
+  }  /*if (capi_csj_tmp == NULL) ... else of csj*/
+  /* End of cleaning variable csj */
+  } /*if (f2py_success) of nm*/
+  /* End of cleaning variable nm */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of csphjy *******************************/
+
+/*********************************** msta1 ***********************************/
+static char doc_f2py_rout_mieangfuncs_msta1[] = "\
+msta1 = msta1(x,mp)\n\nWrapper for ``msta1``.\
+\n\nParameters\n----------\n"
+"x : input float\n"
+"mp : input int\n"
+"\nReturns\n-------\n"
+"msta1 : int";
+/* extern void F_WRAPPEDFUNC(msta1,MSTA1)(int*,double*,int*); */
+static PyObject *f2py_rout_mieangfuncs_msta1(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int msta1 = 0;
+  double x = 0;
+  PyObject *x_capi = Py_None;
+  int mp = 0;
+  PyObject *mp_capi = Py_None;
+  static char *capi_kwlist[] = {"x","mp",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO:mieangfuncs.msta1",\
+    capi_kwlist,&x_capi,&mp_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+    f2py_success = double_from_pyobj(&x,x_capi,"mieangfuncs.msta1() 1st argument (x) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable mp */
+    f2py_success = int_from_pyobj(&mp,mp_capi,"mieangfuncs.msta1() 2nd argument (mp) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable msta1 */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  (*f2py_func)(&msta1,&x,&mp);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("i",msta1);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable msta1 */
+  } /*if (f2py_success) of mp*/
+  /* End of cleaning variable mp */
+  } /*if (f2py_success) of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of msta1 ********************************/
+
+/*********************************** msta2 ***********************************/
+static char doc_f2py_rout_mieangfuncs_msta2[] = "\
+msta2 = msta2(x,n,mp)\n\nWrapper for ``msta2``.\
+\n\nParameters\n----------\n"
+"x : input float\n"
+"n : input int\n"
+"mp : input int\n"
+"\nReturns\n-------\n"
+"msta2 : int";
+/* extern void F_WRAPPEDFUNC(msta2,MSTA2)(int*,double*,int*,int*); */
+static PyObject *f2py_rout_mieangfuncs_msta2(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int msta2 = 0;
+  double x = 0;
+  PyObject *x_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  int mp = 0;
+  PyObject *mp_capi = Py_None;
+  static char *capi_kwlist[] = {"x","n","mp",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO:mieangfuncs.msta2",\
+    capi_kwlist,&x_capi,&n_capi,&mp_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+    f2py_success = double_from_pyobj(&x,x_capi,"mieangfuncs.msta2() 1st argument (x) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable msta2 */
+  /* Processing variable mp */
+    f2py_success = int_from_pyobj(&mp,mp_capi,"mieangfuncs.msta2() 3rd argument (mp) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"mieangfuncs.msta2() 2nd argument (n) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  (*f2py_func)(&msta2,&x,&n,&mp);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("i",msta2);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of mp*/
+  /* End of cleaning variable mp */
+  /* End of cleaning variable msta2 */
+  } /*if (f2py_success) of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of msta2 ********************************/
+
+/************************************ envj ************************************/
+static char doc_f2py_rout_mieangfuncs_envj[] = "\
+envj = envj(n,x)\n\nWrapper for ``envj``.\
+\n\nParameters\n----------\n"
+"n : input int\n"
+"x : input float\n"
+"\nReturns\n-------\n"
+"envj : float";
+/* extern void F_WRAPPEDFUNC(envj,ENVJ)(double*,int*,double*); */
+static PyObject *f2py_rout_mieangfuncs_envj(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,int*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double envj = 0;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  double x = 0;
+  PyObject *x_capi = Py_None;
+  static char *capi_kwlist[] = {"n","x",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO:mieangfuncs.envj",\
+    capi_kwlist,&n_capi,&x_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable envj */
+  /* Processing variable x */
+    f2py_success = double_from_pyobj(&x,x_capi,"mieangfuncs.envj() 2nd argument (x) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"mieangfuncs.envj() 1st argument (n) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  (*f2py_func)(&envj,&n,&x);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("d",envj);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of x*/
+  /* End of cleaning variable x */
+  /* End of cleaning variable envj */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of envj ********************************/
+/*eof body*/
+
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
+/*need_f90modhooks*/
+
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+
+/******************* See f2py2e/common_rules.py: buildhooks *******************/
+
+/*need_commonhooks*/
+
+/**************************** See f2py2e/rules.py ****************************/
+
+static FortranDataDef f2py_routine_defs[] = {
+  {"calc_scat_field",-1,{{-1}},0,(char *)F_FUNC_US(calc_scat_field,CALC_SCAT_FIELD),(f2py_init_func)f2py_rout_mieangfuncs_calc_scat_field,doc_f2py_rout_mieangfuncs_calc_scat_field},
+  {"mie_fields",-1,{{-1}},0,(char *)F_FUNC_US(mie_fields,MIE_FIELDS),(f2py_init_func)f2py_rout_mieangfuncs_mie_fields,doc_f2py_rout_mieangfuncs_mie_fields},
+  {"mie_internal_fields",-1,{{-1}},0,(char *)F_FUNC_US(mie_internal_fields,MIE_INTERNAL_FIELDS),(f2py_init_func)f2py_rout_mieangfuncs_mie_internal_fields,doc_f2py_rout_mieangfuncs_mie_internal_fields},
+  {"tmatrix_fields",-1,{{-1}},0,(char *)F_FUNC_US(tmatrix_fields,TMATRIX_FIELDS),(f2py_init_func)f2py_rout_mieangfuncs_tmatrix_fields,doc_f2py_rout_mieangfuncs_tmatrix_fields},
+  {"mie_int_point",-1,{{-1}},0,(char *)F_FUNC_US(mie_int_point,MIE_INT_POINT),(f2py_init_func)f2py_rout_mieangfuncs_mie_int_point,doc_f2py_rout_mieangfuncs_mie_int_point},
+  {"asm_mie_fullradial",-1,{{-1}},0,(char *)F_FUNC_US(asm_mie_fullradial,ASM_MIE_FULLRADIAL),(f2py_init_func)f2py_rout_mieangfuncs_asm_mie_fullradial,doc_f2py_rout_mieangfuncs_asm_mie_fullradial},
+  {"asm_mie_far",-1,{{-1}},0,(char *)F_FUNC_US(asm_mie_far,ASM_MIE_FAR),(f2py_init_func)f2py_rout_mieangfuncs_asm_mie_far,doc_f2py_rout_mieangfuncs_asm_mie_far},
+  {"asm_mie_far_arr",-1,{{-1}},0,(char *)F_FUNC_US(asm_mie_far_arr,ASM_MIE_FAR_ARR),(f2py_init_func)f2py_rout_mieangfuncs_asm_mie_far_arr,doc_f2py_rout_mieangfuncs_asm_mie_far_arr},
+  {"radial_field_mie",-1,{{-1}},0,(char *)F_FUNC_US(radial_field_mie,RADIAL_FIELD_MIE),(f2py_init_func)f2py_rout_mieangfuncs_radial_field_mie,doc_f2py_rout_mieangfuncs_radial_field_mie},
+  {"fieldstocart",-1,{{-1}},0,(char *)F_FUNC(fieldstocart,FIELDSTOCART),(f2py_init_func)f2py_rout_mieangfuncs_fieldstocart,doc_f2py_rout_mieangfuncs_fieldstocart},
+  {"radial_vect_to_cart",-1,{{-1}},0,(char *)F_FUNC_US(radial_vect_to_cart,RADIAL_VECT_TO_CART),(f2py_init_func)f2py_rout_mieangfuncs_radial_vect_to_cart,doc_f2py_rout_mieangfuncs_radial_vect_to_cart},
+  {"getsphercoords",-1,{{-1}},0,(char *)F_FUNC(getsphercoords,GETSPHERCOORDS),(f2py_init_func)f2py_rout_mieangfuncs_getsphercoords,doc_f2py_rout_mieangfuncs_getsphercoords},
+  {"incfield",-1,{{-1}},0,(char *)F_FUNC(incfield,INCFIELD),(f2py_init_func)f2py_rout_mieangfuncs_incfield,doc_f2py_rout_mieangfuncs_incfield},
+  {"pisandtaus",-1,{{-1}},0,(char *)F_FUNC(pisandtaus,PISANDTAUS),(f2py_init_func)f2py_rout_mieangfuncs_pisandtaus,doc_f2py_rout_mieangfuncs_pisandtaus},
+  {"dn_1_down",-1,{{-1}},0,(char *)F_FUNC_US(dn_1_down,DN_1_DOWN),(f2py_init_func)f2py_rout_mieangfuncs_dn_1_down,doc_f2py_rout_mieangfuncs_dn_1_down},
+  {"lentz_dn1",-1,{{-1}},0,(char *)F_FUNC_US(lentz_dn1,LENTZ_DN1),(f2py_init_func)f2py_rout_mieangfuncs_lentz_dn1,doc_f2py_rout_mieangfuncs_lentz_dn1},
+  {"rotcoef",-1,{{-1}},0,(char *)F_FUNC(rotcoef,ROTCOEF),(f2py_init_func)f2py_rout_mieangfuncs_rotcoef,doc_f2py_rout_mieangfuncs_rotcoef},
+  {"asmfr",-1,{{-1}},0,(char *)F_FUNC(asmfr,ASMFR),(f2py_init_func)f2py_rout_mieangfuncs_asmfr,doc_f2py_rout_mieangfuncs_asmfr},
+  {"ms_radial_fields",-1,{{-1}},0,(char *)F_FUNC_US(ms_radial_fields,MS_RADIAL_FIELDS),(f2py_init_func)f2py_rout_mieangfuncs_ms_radial_fields,doc_f2py_rout_mieangfuncs_ms_radial_fields},
+  {"asm",-1,{{-1}},0,(char *)F_FUNC(asm,ASM),(f2py_init_func)f2py_rout_mieangfuncs_asm,doc_f2py_rout_mieangfuncs_asm},
+  {"asm_arr",-1,{{-1}},0,(char *)F_FUNC_US(asm_arr,ASM_ARR),(f2py_init_func)f2py_rout_mieangfuncs_asm_arr,doc_f2py_rout_mieangfuncs_asm_arr},
+  {"asmsum",-1,{{-1}},0,(char *)F_FUNC(asmsum,ASMSUM),(f2py_init_func)f2py_rout_mieangfuncs_asmsum,doc_f2py_rout_mieangfuncs_asmsum},
+  {"sbesjy",-1,{{-1}},0,(char *)F_FUNC(sbesjy,SBESJY),(f2py_init_func)f2py_rout_mieangfuncs_sbesjy,doc_f2py_rout_mieangfuncs_sbesjy},
+  {"csphjy",-1,{{-1}},0,(char *)F_FUNC(csphjy,CSPHJY),(f2py_init_func)f2py_rout_mieangfuncs_csphjy,doc_f2py_rout_mieangfuncs_csphjy},
+  {"msta1",-1,{{-1}},0,(char *)F_WRAPPEDFUNC(msta1,MSTA1),(f2py_init_func)f2py_rout_mieangfuncs_msta1,doc_f2py_rout_mieangfuncs_msta1},
+  {"msta2",-1,{{-1}},0,(char *)F_WRAPPEDFUNC(msta2,MSTA2),(f2py_init_func)f2py_rout_mieangfuncs_msta2,doc_f2py_rout_mieangfuncs_msta2},
+  {"envj",-1,{{-1}},0,(char *)F_WRAPPEDFUNC(envj,ENVJ),(f2py_init_func)f2py_rout_mieangfuncs_envj,doc_f2py_rout_mieangfuncs_envj},
+
+/*eof routine_defs*/
+  {NULL}
+};
+
+static PyMethodDef f2py_module_methods[] = {
+
+  {NULL,NULL}
+};
+
+#if PY_VERSION_HEX >= 0x03000000
+static struct PyModuleDef moduledef = {
+  PyModuleDef_HEAD_INIT,
+  "mieangfuncs",
+  NULL,
+  -1,
+  f2py_module_methods,
+  NULL,
+  NULL,
+  NULL,
+  NULL
+};
+#endif
+
+#if PY_VERSION_HEX >= 0x03000000
+#define RETVAL m
+PyMODINIT_FUNC PyInit_mieangfuncs(void) {
+#else
+#define RETVAL
+PyMODINIT_FUNC initmieangfuncs(void) {
+#endif
+  int i;
+  PyObject *m,*d, *s;
+#if PY_VERSION_HEX >= 0x03000000
+  m = mieangfuncs_module = PyModule_Create(&moduledef);
+#else
+  m = mieangfuncs_module = Py_InitModule("mieangfuncs", f2py_module_methods);
+#endif
+  Py_TYPE(&PyFortran_Type) = &PyType_Type;
+  import_array();
+  if (PyErr_Occurred())
+    {PyErr_SetString(PyExc_ImportError, "can't initialize module mieangfuncs (failed to import numpy)"); return RETVAL;}
+  d = PyModule_GetDict(m);
+  s = PyString_FromString("$Revision: $");
+  PyDict_SetItemString(d, "__version__", s);
+#if PY_VERSION_HEX >= 0x03000000
+  s = PyUnicode_FromString(
+#else
+  s = PyString_FromString(
+#endif
+    "This module 'mieangfuncs' is auto-generated with f2py (version:2).\nFunctions:\n"
+"  escat_sph = calc_scat_field(kr,phi,ascatm,einc)\n"
+"  es_x,es_y,es_z = mie_fields(calc_points,asbs,einc,rad,rad_dep,n_pts=shape(calc_points,1),nstop=shape(asbs,1))\n"
+"  eint_x,eint_y,eint_z = mie_internal_fields(calc_points,m,csds,einc,n_pts=shape(calc_points,1),nstop=shape(csds,1))\n"
+"  es_x,es_y,es_z = tmatrix_fields(calc_points,amn,lmax,euler_gamma,inc_pol,rad,n_pts=shape(calc_points,1))\n"
+"  esph_out = mie_int_point(csds,mkr,theta,nstop=shape(csds,1))\n"
+"  asm_out = asm_mie_fullradial(asbs,sphcoords,nstop=shape(asbs,1))\n"
+"  asm_out = asm_mie_far(asbs,theta,nstop=shape(asbs,1))\n"
+"  asm_out = asm_mie_far_arr(asbs,thetas,nstop=shape(asbs,1),n_pts=len(thetas))\n"
+"  erad_nd = radial_field_mie(as,kr,theta,nstop=shape(as,1))\n"
+"  acart = fieldstocart(asph,theta,phi)\n"
+"  acart = radial_vect_to_cart(a_r,theta,phi)\n"
+"  sph = getsphercoords(x,y,z)\n"
+"  eincorigin = incfield(ex,ey,phi)\n"
+"  pisout,taus = pisandtaus(n,theta)\n"
+"  dn_out = dn_1_down(z,nmx,nstop,start_val)\n"
+"  dn = lentz_dn1(z,n,eps1,eps2)\n"
+"  dc = rotcoef(cbe,kmax,nmax,ndim)\n"
+"  sa = asmfr(amn0,nodrt,theta,phi,kr)\n"
+"  as_rad = ms_radial_fields(amn0,nodrt,theta,phi,kr)\n"
+"  sa = asm(amn0,nodrt,theta,phi)\n"
+"  sa = asm_arr(amn0,nodrt,theta,phi)\n"
+"  asmsum(amn0,nodrt,drot,phi,sa)\n"
+"  j,y,jp,yp,ifail = sbesjy(x,lmax)\n"
+"  csphjy(z,nm,csj,cdj,csy,cdy,n=(len(csj)-1))\n"
+"  msta1 = msta1(x,mp)\n"
+"  msta2 = msta2(x,n,mp)\n"
+"  envj = envj(n,x)\n"
+".");
+  PyDict_SetItemString(d, "__doc__", s);
+  mieangfuncs_error = PyErr_NewException ("mieangfuncs.error", NULL, NULL);
+  Py_DECREF(s);
+  for(i=0;f2py_routine_defs[i].name!=NULL;i++)
+    PyDict_SetItemString(d, f2py_routine_defs[i].name,PyFortranObject_NewAsAttr(&f2py_routine_defs[i]));
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+    {
+      extern int F_FUNC(msta1,MSTA1)(void);
+      PyObject* o = PyDict_GetItemString(d,"msta1");
+      PyObject_SetAttrString(o,"_cpointer", F2PyCapsule_FromVoidPtr((void*)F_FUNC(msta1,MSTA1),NULL));
+#if PY_VERSION_HEX >= 0x03000000
+      PyObject_SetAttrString(o,"__name__", PyUnicode_FromString("msta1"));
+#else
+      PyObject_SetAttrString(o,"__name__", PyString_FromString("msta1"));
+#endif
+    }
+    
+
+    {
+      extern int F_FUNC(msta2,MSTA2)(void);
+      PyObject* o = PyDict_GetItemString(d,"msta2");
+      PyObject_SetAttrString(o,"_cpointer", F2PyCapsule_FromVoidPtr((void*)F_FUNC(msta2,MSTA2),NULL));
+#if PY_VERSION_HEX >= 0x03000000
+      PyObject_SetAttrString(o,"__name__", PyUnicode_FromString("msta2"));
+#else
+      PyObject_SetAttrString(o,"__name__", PyString_FromString("msta2"));
+#endif
+    }
+    
+
+    {
+      extern double F_FUNC(envj,ENVJ)(void);
+      PyObject* o = PyDict_GetItemString(d,"envj");
+      PyObject_SetAttrString(o,"_cpointer", F2PyCapsule_FromVoidPtr((void*)F_FUNC(envj,ENVJ),NULL));
+#if PY_VERSION_HEX >= 0x03000000
+      PyObject_SetAttrString(o,"__name__", PyUnicode_FromString("envj"));
+#else
+      PyObject_SetAttrString(o,"__name__", PyString_FromString("envj"));
+#endif
+    }
+    
+/*eof initf2pywraphooks*/
+/*eof initf90modhooks*/
+
+/*eof initcommonhooks*/
+
+
+#ifdef F2PY_REPORT_ATEXIT
+  if (! PyErr_Occurred())
+    on_exit(f2py_report_on_exit,(void*)"mieangfuncs");
+#endif
+
+  return RETVAL;
+}
+#ifdef __cplusplus
+}
+#endif
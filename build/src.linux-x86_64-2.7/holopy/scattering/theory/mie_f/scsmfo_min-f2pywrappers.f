@@ -0,0 +1,13 @@
+C     -*- fortran -*-
+C     This file is autogenerated with f2py (version:2)
+C     It contains Fortran 77 wrappers to fortran functions.
+
+      subroutine f2pyinitconsts(setupfunc)
+      external setupfunc
+      real*8 bcof(285,285)
+      real*8 fnr(569)
+      common /consts/ bcof,fnr
+      call setupfunc(bcof,fnr)
+      end
+
+
@@ -0,0 +1,2413 @@
+/* File: scsmfo_minmodule.c
+ * This file is auto-generated with f2py (version:2).
+ * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
+ * written by Pearu Peterson <pearu@cens.ioc.ee>.
+ * Generation date: Fri Oct 16 23:36:29 2026
+ * Do not edit this file directly unless you know what you are doing!!!
+ */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*********************** See f2py2e/cfuncs.py: includes ***********************/
+#include "Python.h"
+#include <stdarg.h>
+#include "fortranobject.h"
+#include <math.h>
+
+/**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
+static PyObject *scsmfo_min_error;
+static PyObject *scsmfo_min_module;
+
+/*********************** See f2py2e/cfuncs.py: typedefs ***********************/
+typedef struct {double r,i;} complex_double;
+
+/****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
+/*need_typedefs_generated*/
+
+/********************** See f2py2e/cfuncs.py: cppmacros **********************/
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F
+#else
+#define F_FUNC(f,F) _##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F##_
+#else
+#define F_FUNC(f,F) _##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F
+#else
+#define F_FUNC(f,F) f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F##_
+#else
+#define F_FUNC(f,F) f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_FUNC_US(f,F) F_FUNC(f##_,F##_)
+#else
+#define F_FUNC_US(f,F) F_FUNC(f,F)
+#endif
+
+#define rank(var) var ## _Rank
+#define shape(var,dim) var ## _Dims[dim]
+#define old_rank(var) (PyArray_NDIM((PyArrayObject *)(capi_ ## var ## _tmp)))
+#define old_shape(var,dim) PyArray_DIM(((PyArrayObject *)(capi_ ## var ## _tmp)),dim)
+#define fshape(var,dim) shape(var,rank(var)-dim-1)
+#define len(var) shape(var,0)
+#define flen(var) fshape(var,0)
+#define old_size(var) PyArray_SIZE((PyArrayObject *)(capi_ ## var ## _tmp))
+/* #define index(i) capi_i ## i */
+#define slen(var) capi_ ## var ## _len
+#define size(var, ...) f2py_size((PyArrayObject *)(capi_ ## var ## _tmp), ## __VA_ARGS__, -1)
+
+#define CHECKSCALAR(check,tcheck,name,show,var)\
+    if (!(check)) {\
+        char errstring[256];\
+        sprintf(errstring, "%s: "show, "("tcheck") failed for "name, var);\
+        PyErr_SetString(scsmfo_min_error,errstring);\
+        /*goto capi_fail;*/\
+    } else 
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
+#ifndef max
+#define max(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef min
+#define min(a,b) ((a < b) ? (a) : (b))
+#endif
+#ifndef MAX
+#define MAX(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef MIN
+#define MIN(a,b) ((a < b) ? (a) : (b))
+#endif
+
+#define pyobj_from_complex_double1(v) (PyComplex_FromDoubles(v.r,v.i))
+
+/************************ See f2py2e/cfuncs.py: cfuncs ************************/
+static int f2py_size(PyArrayObject* var, ...)
+{
+  npy_int sz = 0;
+  npy_int dim;
+  npy_int rank;
+  va_list argp;
+  va_start(argp, var);
+  dim = va_arg(argp, npy_int);
+  if (dim==-1)
+    {
+      sz = PyArray_SIZE(var);
+    }
+  else
+    {
+      rank = PyArray_NDIM(var);
+      if (dim>=1 && dim<=rank)
+        sz = PyArray_DIM(var, dim-1);
+      else
+        fprintf(stderr, "f2py_size: 2nd argument value=%d fails to satisfy 1<=value<=%d. Result will be 0.\n", dim, rank);
+    }
+  va_end(argp);
+  return sz;
+}
+
+static int double_from_pyobj(double* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyFloat_Check(obj)) {
+#ifdef __sgi
+        *v = PyFloat_AsDouble(obj);
+#else
+        *v = PyFloat_AS_DOUBLE(obj);
+#endif
+        return 1;
+    }
+    tmp = PyNumber_Float(obj);
+    if (tmp) {
+#ifdef __sgi
+        *v = PyFloat_AsDouble(tmp);
+#else
+        *v = PyFloat_AS_DOUBLE(tmp);
+#endif
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (double_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = scsmfo_min_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int int_from_pyobj(int* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyInt_Check(obj)) {
+        *v = (int)PyInt_AS_LONG(obj);
+        return 1;
+    }
+    tmp = PyNumber_Int(obj);
+    if (tmp) {
+        *v = PyInt_AS_LONG(tmp);
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (int_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = scsmfo_min_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int complex_double_from_pyobj(complex_double* v,PyObject *obj,const char *errmess) {
+    Py_complex c;
+    if (PyComplex_Check(obj)) {
+        c=PyComplex_AsCComplex(obj);
+        (*v).r=c.real, (*v).i=c.imag;
+        return 1;
+    }
+    if (PyArray_IsScalar(obj, ComplexFloating)) {
+        if (PyArray_IsScalar(obj, CFloat)) {
+            npy_cfloat new;
+            PyArray_ScalarAsCtype(obj, &new);
+            (*v).r = (double)new.real;
+            (*v).i = (double)new.imag;
+        }
+        else if (PyArray_IsScalar(obj, CLongDouble)) {
+            npy_clongdouble new;
+            PyArray_ScalarAsCtype(obj, &new);
+            (*v).r = (double)new.real;
+            (*v).i = (double)new.imag;
+        }
+        else { /* if (PyArray_IsScalar(obj, CDouble)) */
+            PyArray_ScalarAsCtype(obj, v);
+        }
+        return 1;
+    }
+    if (PyArray_CheckScalar(obj)) { /* 0-dim array or still array scalar */
+        PyObject *arr;
+        if (PyArray_Check(obj)) {
+            arr = PyArray_Cast((PyArrayObject *)obj, NPY_CDOUBLE);
+        }
+        else {
+            arr = PyArray_FromScalar(obj, PyArray_DescrFromType(NPY_CDOUBLE));
+        }
+        if (arr==NULL) return 0;
+        (*v).r = ((npy_cdouble *)PyArray_DATA(arr))->real;
+        (*v).i = ((npy_cdouble *)PyArray_DATA(arr))->imag;
+        return 1;
+    }
+    /* Python does not provide PyNumber_Complex function :-( */
+    (*v).i=0.0;
+    if (PyFloat_Check(obj)) {
+#ifdef __sgi
+        (*v).r = PyFloat_AsDouble(obj);
+#else
+        (*v).r = PyFloat_AS_DOUBLE(obj);
+#endif
+        return 1;
+    }
+    if (PyInt_Check(obj)) {
+        (*v).r = (double)PyInt_AS_LONG(obj);
+        return 1;
+    }
+    if (PyLong_Check(obj)) {
+        (*v).r = PyLong_AsDouble(obj);
+        return (!PyErr_Occurred());
+    }
+    if (PySequence_Check(obj) && !(PyString_Check(obj) || PyUnicode_Check(obj))) {
+        PyObject *tmp = PySequence_GetItem(obj,0);
+        if (tmp) {
+            if (complex_double_from_pyobj(v,tmp,errmess)) {
+                Py_DECREF(tmp);
+                return 1;
+            }
+            Py_DECREF(tmp);
+        }
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL)
+            err = PyExc_TypeError;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+
+/********************* See f2py2e/cfuncs.py: userincludes *********************/
+/*need_userincludes*/
+
+/********************* See f2py2e/capi_rules.py: usercode *********************/
+
+
+/* See f2py2e/rules.py */
+extern void F_FUNC(amncalc,AMNCALC)(int*,int*,double*,double*,double*,double*,double*,double*,int*,int*,int*,double*,double*,double*,int*,double*,int*,complex_double*,int*);
+extern void F_FUNC(itersoln,ITERSOLN)(int*,int*,int*,int*,double*,int*,int*,int*,complex_double*,double*,complex_double*,complex_double*,complex_double*,complex_double*,int*,double*);
+extern void F_FUNC(vctran,VCTRAN)(complex_double*,int*,int*,int*,complex_double*,double*,complex_double*,int*,int*);
+extern void F_FUNC(rotcoef,ROTCOEF)(double*,int*,int*,double*,int*);
+extern void F_FUNC(rotvec,ROTVEC)(double*,double*,int*,int*,complex_double*,int*);
+extern void F_FUNC(trancoef,TRANCOEF)(int*,double*,int*,int*,complex_double*,int*);
+extern void F_FUNC(tranvec,TRANVEC)(double*,int*,int*,complex_double*,double*,double*);
+extern void F_FUNC(vcfunc,VCFUNC)(int*,int*,int*,int*,int*,double*);
+extern void F_FUNC(hankel,HANKEL)(int*,double*,complex_double*);
+extern void F_FUNC(bessel,BESSEL)(int*,double*,int*,double*);
+extern void F_FUNC(mie1,MIE1)(double*,double*,double*,int*,double*,double*,double*,complex_double*);
+extern void F_FUNC(cbessel,CBESSEL)(int*,complex_double*,complex_double*);
+extern void F_FUNC(scatexp,SCATEXP)(complex_double*,int*,int*,complex_double*);
+/*eof externroutines*/
+
+/******************** See f2py2e/capi_rules.py: usercode1 ********************/
+
+
+/******************* See f2py2e/cb_rules.py: buildcallback *******************/
+/*need_callbacks*/
+
+/*********************** See f2py2e/rules.py: buildapi ***********************/
+
+/********************************** amncalc **********************************/
+static char doc_f2py_rout_scsmfo_min_amncalc[] = "\
+nodr,nodrtmax,amn0,status = amncalc(inew,xp,yp,zp,sni,ski,xi,niter,eps,qeps1,qeps2,meth,ea,[npart,nodrtd])\n\nWrapper for ``amncalc``.\
+\n\nParameters\n----------\n"
+"inew : input int\n"
+"xp : input rank-1 array('d') with bounds (npart)\n"
+"yp : input rank-1 array('d') with bounds (npart)\n"
+"zp : input rank-1 array('d') with bounds (npart)\n"
+"sni : input rank-1 array('d') with bounds (npart)\n"
+"ski : input rank-1 array('d') with bounds (npart)\n"
+"xi : input rank-1 array('d') with bounds (npart)\n"
+"niter : input int\n"
+"eps : input float\n"
+"qeps1 : input float\n"
+"qeps2 : input float\n"
+"meth : input int\n"
+"ea : input rank-1 array('d') with bounds (2)\n"
+"\nOther Parameters\n----------------\n"
+"npart : input int, optional\n    Default: len(xp)\n"
+"nodrtd : input int, optional\n    Default: 70\n"
+"\nReturns\n-------\n"
+"nodr : rank-1 array('i') with bounds (npart)\n"
+"nodrtmax : int\n"
+"amn0 : rank-3 array('D') with bounds (2,nodrtd*(nodrtd+2),2)\n"
+"status : int";
+/* extern void F_FUNC(amncalc,AMNCALC)(int*,int*,double*,double*,double*,double*,double*,double*,int*,int*,int*,double*,double*,double*,int*,double*,int*,complex_double*,int*); */
+static PyObject *f2py_rout_scsmfo_min_amncalc(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,double*,double*,double*,double*,double*,double*,int*,int*,int*,double*,double*,double*,int*,double*,int*,complex_double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int inew = 0;
+  PyObject *inew_capi = Py_None;
+  int npart = 0;
+  PyObject *npart_capi = Py_None;
+  double *xp = NULL;
+  npy_intp xp_Dims[1] = {-1};
+  const int xp_Rank = 1;
+  PyArrayObject *capi_xp_tmp = NULL;
+  int capi_xp_intent = 0;
+  PyObject *xp_capi = Py_None;
+  double *yp = NULL;
+  npy_intp yp_Dims[1] = {-1};
+  const int yp_Rank = 1;
+  PyArrayObject *capi_yp_tmp = NULL;
+  int capi_yp_intent = 0;
+  PyObject *yp_capi = Py_None;
+  double *zp = NULL;
+  npy_intp zp_Dims[1] = {-1};
+  const int zp_Rank = 1;
+  PyArrayObject *capi_zp_tmp = NULL;
+  int capi_zp_intent = 0;
+  PyObject *zp_capi = Py_None;
+  double *sni = NULL;
+  npy_intp sni_Dims[1] = {-1};
+  const int sni_Rank = 1;
+  PyArrayObject *capi_sni_tmp = NULL;
+  int capi_sni_intent = 0;
+  PyObject *sni_capi = Py_None;
+  double *ski = NULL;
+  npy_intp ski_Dims[1] = {-1};
+  const int ski_Rank = 1;
+  PyArrayObject *capi_ski_tmp = NULL;
+  int capi_ski_intent = 0;
+  PyObject *ski_capi = Py_None;
+  double *xi = NULL;
+  npy_intp xi_Dims[1] = {-1};
+  const int xi_Rank = 1;
+  PyArrayObject *capi_xi_tmp = NULL;
+  int capi_xi_intent = 0;
+  PyObject *xi_capi = Py_None;
+  int *nodr = NULL;
+  npy_intp nodr_Dims[1] = {-1};
+  const int nodr_Rank = 1;
+  PyArrayObject *capi_nodr_tmp = NULL;
+  int capi_nodr_intent = 0;
+  int nodrtmax = 0;
+  int niter = 0;
+  PyObject *niter_capi = Py_None;
+  double eps = 0;
+  PyObject *eps_capi = Py_None;
+  double qeps1 = 0;
+  PyObject *qeps1_capi = Py_None;
+  double qeps2 = 0;
+  PyObject *qeps2_capi = Py_None;
+  int meth = 0;
+  PyObject *meth_capi = Py_None;
+  double *ea = NULL;
+  npy_intp ea_Dims[1] = {-1};
+  const int ea_Rank = 1;
+  PyArrayObject *capi_ea_tmp = NULL;
+  int capi_ea_intent = 0;
+  PyObject *ea_capi = Py_None;
+  int nodrtd = 0;
+  PyObject *nodrtd_capi = Py_None;
+  complex_double *amn0 = NULL;
+  npy_intp amn0_Dims[3] = {-1, -1, -1};
+  const int amn0_Rank = 3;
+  PyArrayObject *capi_amn0_tmp = NULL;
+  int capi_amn0_intent = 0;
+  int status = 0;
+  static char *capi_kwlist[] = {"inew","xp","yp","zp","sni","ski","xi","niter","eps","qeps1","qeps2","meth","ea","npart","nodrtd",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOOOOOO|OO:scsmfo_min.amncalc",\
+    capi_kwlist,&inew_capi,&xp_capi,&yp_capi,&zp_capi,&sni_capi,&ski_capi,&xi_capi,&niter_capi,&eps_capi,&qeps1_capi,&qeps2_capi,&meth_capi,&ea_capi,&npart_capi,&nodrtd_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable ea */
+  ea_Dims[0]=2;
+  capi_ea_intent |= F2PY_INTENT_IN;
+  capi_ea_tmp = array_from_pyobj(NPY_DOUBLE,ea_Dims,ea_Rank,capi_ea_intent,ea_capi);
+  if (capi_ea_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 13rd argument `ea' of scsmfo_min.amncalc to C/Fortran array" );
+  } else {
+    ea = (double *)(PyArray_DATA(capi_ea_tmp));
+
+  /* Processing variable nodrtmax */
+  /* Processing variable xp */
+  ;
+  capi_xp_intent |= F2PY_INTENT_IN;
+  capi_xp_tmp = array_from_pyobj(NPY_DOUBLE,xp_Dims,xp_Rank,capi_xp_intent,xp_capi);
+  if (capi_xp_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 2nd argument `xp' of scsmfo_min.amncalc to C/Fortran array" );
+  } else {
+    xp = (double *)(PyArray_DATA(capi_xp_tmp));
+
+  /* Processing variable qeps2 */
+    f2py_success = double_from_pyobj(&qeps2,qeps2_capi,"scsmfo_min.amncalc() 11st argument (qeps2) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable qeps1 */
+    f2py_success = double_from_pyobj(&qeps1,qeps1_capi,"scsmfo_min.amncalc() 10th argument (qeps1) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable inew */
+    f2py_success = int_from_pyobj(&inew,inew_capi,"scsmfo_min.amncalc() 1st argument (inew) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable status */
+  /* Processing variable nodrtd */
+  if (nodrtd_capi == Py_None) nodrtd = 70; else
+    f2py_success = int_from_pyobj(&nodrtd,nodrtd_capi,"scsmfo_min.amncalc() 2nd keyword (nodrtd) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable niter */
+    f2py_success = int_from_pyobj(&niter,niter_capi,"scsmfo_min.amncalc() 8th argument (niter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable meth */
+    f2py_success = int_from_pyobj(&meth,meth_capi,"scsmfo_min.amncalc() 12nd argument (meth) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable eps */
+    f2py_success = double_from_pyobj(&eps,eps_capi,"scsmfo_min.amncalc() 9th argument (eps) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable npart */
+  if (npart_capi == Py_None) npart = len(xp); else
+    f2py_success = int_from_pyobj(&npart,npart_capi,"scsmfo_min.amncalc() 1st keyword (npart) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(xp)>=npart,"len(xp)>=npart","1st keyword npart","amncalc:npart=%d",npart) {
+  /* Processing variable ski */
+  ski_Dims[0]=npart;
+  capi_ski_intent |= F2PY_INTENT_IN;
+  capi_ski_tmp = array_from_pyobj(NPY_DOUBLE,ski_Dims,ski_Rank,capi_ski_intent,ski_capi);
+  if (capi_ski_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 6th argument `ski' of scsmfo_min.amncalc to C/Fortran array" );
+  } else {
+    ski = (double *)(PyArray_DATA(capi_ski_tmp));
+
+  /* Processing variable sni */
+  sni_Dims[0]=npart;
+  capi_sni_intent |= F2PY_INTENT_IN;
+  capi_sni_tmp = array_from_pyobj(NPY_DOUBLE,sni_Dims,sni_Rank,capi_sni_intent,sni_capi);
+  if (capi_sni_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 5th argument `sni' of scsmfo_min.amncalc to C/Fortran array" );
+  } else {
+    sni = (double *)(PyArray_DATA(capi_sni_tmp));
+
+  /* Processing variable nodr */
+  nodr_Dims[0]=npart;
+  capi_nodr_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_nodr_tmp = array_from_pyobj(NPY_INT,nodr_Dims,nodr_Rank,capi_nodr_intent,Py_None);
+  if (capi_nodr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting hidden `nodr' of scsmfo_min.amncalc to C/Fortran array" );
+  } else {
+    nodr = (int *)(PyArray_DATA(capi_nodr_tmp));
+
+  /* Processing variable yp */
+  yp_Dims[0]=npart;
+  capi_yp_intent |= F2PY_INTENT_IN;
+  capi_yp_tmp = array_from_pyobj(NPY_DOUBLE,yp_Dims,yp_Rank,capi_yp_intent,yp_capi);
+  if (capi_yp_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 3rd argument `yp' of scsmfo_min.amncalc to C/Fortran array" );
+  } else {
+    yp = (double *)(PyArray_DATA(capi_yp_tmp));
+
+  /* Processing variable amn0 */
+  amn0_Dims[0]=2,amn0_Dims[1]=nodrtd*(nodrtd+2),amn0_Dims[2]=2;
+  capi_amn0_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT;
+  capi_amn0_tmp = array_from_pyobj(NPY_CDOUBLE,amn0_Dims,amn0_Rank,capi_amn0_intent,Py_None);
+  if (capi_amn0_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting hidden `amn0' of scsmfo_min.amncalc to C/Fortran array" );
+  } else {
+    amn0 = (complex_double *)(PyArray_DATA(capi_amn0_tmp));
+
+  /* Processing variable xi */
+  xi_Dims[0]=npart;
+  capi_xi_intent |= F2PY_INTENT_IN;
+  capi_xi_tmp = array_from_pyobj(NPY_DOUBLE,xi_Dims,xi_Rank,capi_xi_intent,xi_capi);
+  if (capi_xi_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 7th argument `xi' of scsmfo_min.amncalc to C/Fortran array" );
+  } else {
+    xi = (double *)(PyArray_DATA(capi_xi_tmp));
+
+  /* Processing variable zp */
+  zp_Dims[0]=npart;
+  capi_zp_intent |= F2PY_INTENT_IN;
+  capi_zp_tmp = array_from_pyobj(NPY_DOUBLE,zp_Dims,zp_Rank,capi_zp_intent,zp_capi);
+  if (capi_zp_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 4th argument `zp' of scsmfo_min.amncalc to C/Fortran array" );
+  } else {
+    zp = (double *)(PyArray_DATA(capi_zp_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&inew,&npart,xp,yp,zp,sni,ski,xi,nodr,&nodrtmax,&niter,&eps,&qeps1,&qeps2,&meth,ea,&nodrtd,amn0,&status);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("NiNi",capi_nodr_tmp,nodrtmax,capi_amn0_tmp,status);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_zp_tmp!=zp_capi) {
+    Py_XDECREF(capi_zp_tmp); }
+  }  /*if (capi_zp_tmp == NULL) ... else of zp*/
+  /* End of cleaning variable zp */
+  if((PyObject *)capi_xi_tmp!=xi_capi) {
+    Py_XDECREF(capi_xi_tmp); }
+  }  /*if (capi_xi_tmp == NULL) ... else of xi*/
+  /* End of cleaning variable xi */
+  }  /*if (capi_amn0_tmp == NULL) ... else of amn0*/
+  /* End of cleaning variable amn0 */
+  if((PyObject *)capi_yp_tmp!=yp_capi) {
+    Py_XDECREF(capi_yp_tmp); }
+  }  /*if (capi_yp_tmp == NULL) ... else of yp*/
+  /* End of cleaning variable yp */
+  }  /*if (capi_nodr_tmp == NULL) ... else of nodr*/
+  /* End of cleaning variable nodr */
+  if((PyObject *)capi_sni_tmp!=sni_capi) {
+    Py_XDECREF(capi_sni_tmp); }
+  }  /*if (capi_sni_tmp == NULL) ... else of sni*/
+  /* End of cleaning variable sni */
+  if((PyObject *)capi_ski_tmp!=ski_capi) {
+    Py_XDECREF(capi_ski_tmp); }
+  }  /*if (capi_ski_tmp == NULL) ... else of ski*/
+  /* End of cleaning variable ski */
+  } /*CHECKSCALAR(len(xp)>=npart)*/
+  } /*if (f2py_success) of npart*/
+  /* End of cleaning variable npart */
+  } /*if (f2py_success) of eps*/
+  /* End of cleaning variable eps */
+  } /*if (f2py_success) of meth*/
+  /* End of cleaning variable meth */
+  } /*if (f2py_success) of niter*/
+  /* End of cleaning variable niter */
+  } /*if (f2py_success) of nodrtd*/
+  /* End of cleaning variable nodrtd */
+  /* End of cleaning variable status */
+  } /*if (f2py_success) of inew*/
+  /* End of cleaning variable inew */
+  } /*if (f2py_success) of qeps1*/
+  /* End of cleaning variable qeps1 */
+  } /*if (f2py_success) of qeps2*/
+  /* End of cleaning variable qeps2 */
+  if((PyObject *)capi_xp_tmp!=xp_capi) {
+    Py_XDECREF(capi_xp_tmp); }
+  }  /*if (capi_xp_tmp == NULL) ... else of xp*/
+  /* End of cleaning variable xp */
+  /* End of cleaning variable nodrtmax */
+  if((PyObject *)capi_ea_tmp!=ea_capi) {
+    Py_XDECREF(capi_ea_tmp); }
+  }  /*if (capi_ea_tmp == NULL) ... else of ea*/
+  /* End of cleaning variable ea */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of amncalc *******************************/
+
+/********************************** itersoln **********************************/
+static char doc_f2py_rout_scsmfo_min_itersoln[] = "\
+itersoln(nodr,nblk,eps,niter,meth,itest,ek,drot,amnl,an1,pnp,anp,iter,err,[npart,nodd])\n\nWrapper for ``itersoln``.\
+\n\nParameters\n----------\n"
+"nodr : input rank-1 array('i') with bounds (npart)\n"
+"nblk : input rank-1 array('i') with bounds (npart)\n"
+"eps : input float\n"
+"niter : input int\n"
+"meth : input int\n"
+"itest : input int\n"
+"ek : input rank-2 array('D') with bounds (nodd,*)\n"
+"drot : input rank-2 array('d') with bounds (nodd*(2*nodd*nodd+9*nodd+13)/6,*)\n"
+"amnl : input rank-3 array('D') with bounds (2,nodd*(nodd*nodd+6*nodd+5)/6,*)\n"
+"an1 : input rank-3 array('D') with bounds (2,32,npart)\n"
+"pnp : input rank-3 array('D') with bounds (2,nodd*(nodd+2),npart)\n"
+"anp : input rank-3 array('D') with bounds (2,nodd*(nodd+2),npart)\n"
+"iter : input int\n"
+"err : input float\n"
+"\nOther Parameters\n----------------\n"
+"npart : input int, optional\n    Default: len(nodr)\n"
+"nodd : input int, optional\n    Default: shape(ek,0)";
+/* extern void F_FUNC(itersoln,ITERSOLN)(int*,int*,int*,int*,double*,int*,int*,int*,complex_double*,double*,complex_double*,complex_double*,complex_double*,complex_double*,int*,double*); */
+static PyObject *f2py_rout_scsmfo_min_itersoln(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,int*,double*,int*,int*,int*,complex_double*,double*,complex_double*,complex_double*,complex_double*,complex_double*,int*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int npart = 0;
+  PyObject *npart_capi = Py_None;
+  int nodd = 0;
+  PyObject *nodd_capi = Py_None;
+  int *nodr = NULL;
+  npy_intp nodr_Dims[1] = {-1};
+  const int nodr_Rank = 1;
+  PyArrayObject *capi_nodr_tmp = NULL;
+  int capi_nodr_intent = 0;
+  PyObject *nodr_capi = Py_None;
+  int *nblk = NULL;
+  npy_intp nblk_Dims[1] = {-1};
+  const int nblk_Rank = 1;
+  PyArrayObject *capi_nblk_tmp = NULL;
+  int capi_nblk_intent = 0;
+  PyObject *nblk_capi = Py_None;
+  double eps = 0;
+  PyObject *eps_capi = Py_None;
+  int niter = 0;
+  PyObject *niter_capi = Py_None;
+  int meth = 0;
+  PyObject *meth_capi = Py_None;
+  int itest = 0;
+  PyObject *itest_capi = Py_None;
+  complex_double *ek = NULL;
+  npy_intp ek_Dims[2] = {-1, -1};
+  const int ek_Rank = 2;
+  PyArrayObject *capi_ek_tmp = NULL;
+  int capi_ek_intent = 0;
+  PyObject *ek_capi = Py_None;
+  double *drot = NULL;
+  npy_intp drot_Dims[2] = {-1, -1};
+  const int drot_Rank = 2;
+  PyArrayObject *capi_drot_tmp = NULL;
+  int capi_drot_intent = 0;
+  PyObject *drot_capi = Py_None;
+  complex_double *amnl = NULL;
+  npy_intp amnl_Dims[3] = {-1, -1, -1};
+  const int amnl_Rank = 3;
+  PyArrayObject *capi_amnl_tmp = NULL;
+  int capi_amnl_intent = 0;
+  PyObject *amnl_capi = Py_None;
+  complex_double *an1 = NULL;
+  npy_intp an1_Dims[3] = {-1, -1, -1};
+  const int an1_Rank = 3;
+  PyArrayObject *capi_an1_tmp = NULL;
+  int capi_an1_intent = 0;
+  PyObject *an1_capi = Py_None;
+  complex_double *pnp = NULL;
+  npy_intp pnp_Dims[3] = {-1, -1, -1};
+  const int pnp_Rank = 3;
+  PyArrayObject *capi_pnp_tmp = NULL;
+  int capi_pnp_intent = 0;
+  PyObject *pnp_capi = Py_None;
+  complex_double *anp = NULL;
+  npy_intp anp_Dims[3] = {-1, -1, -1};
+  const int anp_Rank = 3;
+  PyArrayObject *capi_anp_tmp = NULL;
+  int capi_anp_intent = 0;
+  PyObject *anp_capi = Py_None;
+  int iter = 0;
+  PyObject *iter_capi = Py_None;
+  double err = 0;
+  PyObject *err_capi = Py_None;
+  static char *capi_kwlist[] = {"nodr","nblk","eps","niter","meth","itest","ek","drot","amnl","an1","pnp","anp","iter","err","npart","nodd",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOOOOOOO|OO:scsmfo_min.itersoln",\
+    capi_kwlist,&nodr_capi,&nblk_capi,&eps_capi,&niter_capi,&meth_capi,&itest_capi,&ek_capi,&drot_capi,&amnl_capi,&an1_capi,&pnp_capi,&anp_capi,&iter_capi,&err_capi,&npart_capi,&nodd_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable ek */
+  ;
+  capi_ek_intent |= F2PY_INTENT_IN;
+  capi_ek_tmp = array_from_pyobj(NPY_CDOUBLE,ek_Dims,ek_Rank,capi_ek_intent,ek_capi);
+  if (capi_ek_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 7th argument `ek' of scsmfo_min.itersoln to C/Fortran array" );
+  } else {
+    ek = (complex_double *)(PyArray_DATA(capi_ek_tmp));
+
+  /* Processing variable nodr */
+  ;
+  capi_nodr_intent |= F2PY_INTENT_IN;
+  capi_nodr_tmp = array_from_pyobj(NPY_INT,nodr_Dims,nodr_Rank,capi_nodr_intent,nodr_capi);
+  if (capi_nodr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 1st argument `nodr' of scsmfo_min.itersoln to C/Fortran array" );
+  } else {
+    nodr = (int *)(PyArray_DATA(capi_nodr_tmp));
+
+  /* Processing variable meth */
+    f2py_success = int_from_pyobj(&meth,meth_capi,"scsmfo_min.itersoln() 5th argument (meth) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable niter */
+    f2py_success = int_from_pyobj(&niter,niter_capi,"scsmfo_min.itersoln() 4th argument (niter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable err */
+    f2py_success = double_from_pyobj(&err,err_capi,"scsmfo_min.itersoln() 14th argument (err) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable eps */
+    f2py_success = double_from_pyobj(&eps,eps_capi,"scsmfo_min.itersoln() 3rd argument (eps) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable iter */
+    f2py_success = int_from_pyobj(&iter,iter_capi,"scsmfo_min.itersoln() 13rd argument (iter) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable itest */
+    f2py_success = int_from_pyobj(&itest,itest_capi,"scsmfo_min.itersoln() 6th argument (itest) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable nodd */
+  if (nodd_capi == Py_None) nodd = shape(ek,0); else
+    f2py_success = int_from_pyobj(&nodd,nodd_capi,"scsmfo_min.itersoln() 2nd keyword (nodd) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(shape(ek,0)==nodd,"shape(ek,0)==nodd","2nd keyword nodd","itersoln:nodd=%d",nodd) {
+  /* Processing variable amnl */
+  amnl_Dims[0]=2,amnl_Dims[1]=nodd*(nodd*nodd+6*nodd+5)/6;
+  capi_amnl_intent |= F2PY_INTENT_IN;
+  capi_amnl_tmp = array_from_pyobj(NPY_CDOUBLE,amnl_Dims,amnl_Rank,capi_amnl_intent,amnl_capi);
+  if (capi_amnl_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 9th argument `amnl' of scsmfo_min.itersoln to C/Fortran array" );
+  } else {
+    amnl = (complex_double *)(PyArray_DATA(capi_amnl_tmp));
+
+  /* Processing variable npart */
+  if (npart_capi == Py_None) npart = len(nodr); else
+    f2py_success = int_from_pyobj(&npart,npart_capi,"scsmfo_min.itersoln() 1st keyword (npart) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(nodr)>=npart,"len(nodr)>=npart","1st keyword npart","itersoln:npart=%d",npart) {
+  /* Processing variable drot */
+  drot_Dims[0]=nodd*(2*nodd*nodd+9*nodd+13)/6;
+  capi_drot_intent |= F2PY_INTENT_IN;
+  capi_drot_tmp = array_from_pyobj(NPY_DOUBLE,drot_Dims,drot_Rank,capi_drot_intent,drot_capi);
+  if (capi_drot_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 8th argument `drot' of scsmfo_min.itersoln to C/Fortran array" );
+  } else {
+    drot = (double *)(PyArray_DATA(capi_drot_tmp));
+
+  /* Processing variable pnp */
+  pnp_Dims[0]=2,pnp_Dims[1]=nodd*(nodd+2),pnp_Dims[2]=npart;
+  capi_pnp_intent |= F2PY_INTENT_IN;
+  capi_pnp_tmp = array_from_pyobj(NPY_CDOUBLE,pnp_Dims,pnp_Rank,capi_pnp_intent,pnp_capi);
+  if (capi_pnp_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 11st argument `pnp' of scsmfo_min.itersoln to C/Fortran array" );
+  } else {
+    pnp = (complex_double *)(PyArray_DATA(capi_pnp_tmp));
+
+  /* Processing variable nblk */
+  nblk_Dims[0]=npart;
+  capi_nblk_intent |= F2PY_INTENT_IN;
+  capi_nblk_tmp = array_from_pyobj(NPY_INT,nblk_Dims,nblk_Rank,capi_nblk_intent,nblk_capi);
+  if (capi_nblk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 2nd argument `nblk' of scsmfo_min.itersoln to C/Fortran array" );
+  } else {
+    nblk = (int *)(PyArray_DATA(capi_nblk_tmp));
+
+  /* Processing variable anp */
+  anp_Dims[0]=2,anp_Dims[1]=nodd*(nodd+2),anp_Dims[2]=npart;
+  capi_anp_intent |= F2PY_INTENT_IN;
+  capi_anp_tmp = array_from_pyobj(NPY_CDOUBLE,anp_Dims,anp_Rank,capi_anp_intent,anp_capi);
+  if (capi_anp_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 12nd argument `anp' of scsmfo_min.itersoln to C/Fortran array" );
+  } else {
+    anp = (complex_double *)(PyArray_DATA(capi_anp_tmp));
+
+  /* Processing variable an1 */
+  an1_Dims[0]=2,an1_Dims[1]=32,an1_Dims[2]=npart;
+  capi_an1_intent |= F2PY_INTENT_IN;
+  capi_an1_tmp = array_from_pyobj(NPY_CDOUBLE,an1_Dims,an1_Rank,capi_an1_intent,an1_capi);
+  if (capi_an1_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 10th argument `an1' of scsmfo_min.itersoln to C/Fortran array" );
+  } else {
+    an1 = (complex_double *)(PyArray_DATA(capi_an1_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&npart,&nodd,nodr,nblk,&eps,&niter,&meth,&itest,ek,drot,amnl,an1,pnp,anp,&iter,&err);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_an1_tmp!=an1_capi) {
+    Py_XDECREF(capi_an1_tmp); }
+  }  /*if (capi_an1_tmp == NULL) ... else of an1*/
+  /* End of cleaning variable an1 */
+  if((PyObject *)capi_anp_tmp!=anp_capi) {
+    Py_XDECREF(capi_anp_tmp); }
+  }  /*if (capi_anp_tmp == NULL) ... else of anp*/
+  /* End of cleaning variable anp */
+  if((PyObject *)capi_nblk_tmp!=nblk_capi) {
+    Py_XDECREF(capi_nblk_tmp); }
+  }  /*if (capi_nblk_tmp == NULL) ... else of nblk*/
+  /* End of cleaning variable nblk */
+  if((PyObject *)capi_pnp_tmp!=pnp_capi) {
+    Py_XDECREF(capi_pnp_tmp); }
+  }  /*if (capi_pnp_tmp == NULL) ... else of pnp*/
+  /* End of cleaning variable pnp */
+  if((PyObject *)capi_drot_tmp!=drot_capi) {
+    Py_XDECREF(capi_drot_tmp); }
+  }  /*if (capi_drot_tmp == NULL) ... else of drot*/
+  /* End of cleaning variable drot */
+  } /*CHECKSCALAR(len(nodr)>=npart)*/
+  } /*if (f2py_success) of npart*/
+  /* End of cleaning variable npart */
+  if((PyObject *)capi_amnl_tmp!=amnl_capi) {
+    Py_XDECREF(capi_amnl_tmp); }
+  }  /*if (capi_amnl_tmp == NULL) ... else of amnl*/
+  /* End of cleaning variable amnl */
+  } /*CHECKSCALAR(shape(ek,0)==nodd)*/
+  } /*if (f2py_success) of nodd*/
+  /* End of cleaning variable nodd */
+  } /*if (f2py_success) of itest*/
+  /* End of cleaning variable itest */
+  } /*if (f2py_success) of iter*/
+  /* End of cleaning variable iter */
+  } /*if (f2py_success) of eps*/
+  /* End of cleaning variable eps */
+  } /*if (f2py_success) of err*/
+  /* End of cleaning variable err */
+  } /*if (f2py_success) of niter*/
+  /* End of cleaning variable niter */
+  } /*if (f2py_success) of meth*/
+  /* End of cleaning variable meth */
+  if((PyObject *)capi_nodr_tmp!=nodr_capi) {
+    Py_XDECREF(capi_nodr_tmp); }
+  }  /*if (capi_nodr_tmp == NULL) ... else of nodr*/
+  /* End of cleaning variable nodr */
+  if((PyObject *)capi_ek_tmp!=ek_capi) {
+    Py_XDECREF(capi_ek_tmp); }
+  }  /*if (capi_ek_tmp == NULL) ... else of ek*/
+  /* End of cleaning variable ek */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/****************************** end of itersoln ******************************/
+
+/*********************************** vctran ***********************************/
+static char doc_f2py_rout_scsmfo_min_vctran[] = "\
+vctran(anpt,idir,nodrj,nodri,ekt,drott,amnlt,ndd,nda)\n\nWrapper for ``vctran``.\
+\n\nParameters\n----------\n"
+"anpt : input rank-2 array('D') with bounds (2,*)\n"
+"idir : input int\n"
+"nodrj : input int\n"
+"nodri : input int\n"
+"ekt : input rank-1 array('D') with bounds (*)\n"
+"drott : input rank-1 array('d') with bounds (*)\n"
+"amnlt : input rank-2 array('D') with bounds (2,*)\n"
+"ndd : input int\n"
+"nda : input int";
+/* extern void F_FUNC(vctran,VCTRAN)(complex_double*,int*,int*,int*,complex_double*,double*,complex_double*,int*,int*); */
+static PyObject *f2py_rout_scsmfo_min_vctran(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_double*,int*,int*,int*,complex_double*,double*,complex_double*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_double *anpt = NULL;
+  npy_intp anpt_Dims[2] = {-1, -1};
+  const int anpt_Rank = 2;
+  PyArrayObject *capi_anpt_tmp = NULL;
+  int capi_anpt_intent = 0;
+  PyObject *anpt_capi = Py_None;
+  int idir = 0;
+  PyObject *idir_capi = Py_None;
+  int nodrj = 0;
+  PyObject *nodrj_capi = Py_None;
+  int nodri = 0;
+  PyObject *nodri_capi = Py_None;
+  complex_double *ekt = NULL;
+  npy_intp ekt_Dims[1] = {-1};
+  const int ekt_Rank = 1;
+  PyArrayObject *capi_ekt_tmp = NULL;
+  int capi_ekt_intent = 0;
+  PyObject *ekt_capi = Py_None;
+  double *drott = NULL;
+  npy_intp drott_Dims[1] = {-1};
+  const int drott_Rank = 1;
+  PyArrayObject *capi_drott_tmp = NULL;
+  int capi_drott_intent = 0;
+  PyObject *drott_capi = Py_None;
+  complex_double *amnlt = NULL;
+  npy_intp amnlt_Dims[2] = {-1, -1};
+  const int amnlt_Rank = 2;
+  PyArrayObject *capi_amnlt_tmp = NULL;
+  int capi_amnlt_intent = 0;
+  PyObject *amnlt_capi = Py_None;
+  int ndd = 0;
+  PyObject *ndd_capi = Py_None;
+  int nda = 0;
+  PyObject *nda_capi = Py_None;
+  static char *capi_kwlist[] = {"anpt","idir","nodrj","nodri","ekt","drott","amnlt","ndd","nda",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOO:scsmfo_min.vctran",\
+    capi_kwlist,&anpt_capi,&idir_capi,&nodrj_capi,&nodri_capi,&ekt_capi,&drott_capi,&amnlt_capi,&ndd_capi,&nda_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable amnlt */
+  amnlt_Dims[0]=2;
+  capi_amnlt_intent |= F2PY_INTENT_IN;
+  capi_amnlt_tmp = array_from_pyobj(NPY_CDOUBLE,amnlt_Dims,amnlt_Rank,capi_amnlt_intent,amnlt_capi);
+  if (capi_amnlt_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 7th argument `amnlt' of scsmfo_min.vctran to C/Fortran array" );
+  } else {
+    amnlt = (complex_double *)(PyArray_DATA(capi_amnlt_tmp));
+
+  /* Processing variable nodri */
+    f2py_success = int_from_pyobj(&nodri,nodri_capi,"scsmfo_min.vctran() 4th argument (nodri) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable nodrj */
+    f2py_success = int_from_pyobj(&nodrj,nodrj_capi,"scsmfo_min.vctran() 3rd argument (nodrj) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable nda */
+    f2py_success = int_from_pyobj(&nda,nda_capi,"scsmfo_min.vctran() 9th argument (nda) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable idir */
+    f2py_success = int_from_pyobj(&idir,idir_capi,"scsmfo_min.vctran() 2nd argument (idir) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndd */
+    f2py_success = int_from_pyobj(&ndd,ndd_capi,"scsmfo_min.vctran() 8th argument (ndd) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable drott */
+  ;
+  capi_drott_intent |= F2PY_INTENT_IN;
+  capi_drott_tmp = array_from_pyobj(NPY_DOUBLE,drott_Dims,drott_Rank,capi_drott_intent,drott_capi);
+  if (capi_drott_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 6th argument `drott' of scsmfo_min.vctran to C/Fortran array" );
+  } else {
+    drott = (double *)(PyArray_DATA(capi_drott_tmp));
+
+  /* Processing variable anpt */
+  anpt_Dims[0]=2;
+  capi_anpt_intent |= F2PY_INTENT_IN;
+  capi_anpt_tmp = array_from_pyobj(NPY_CDOUBLE,anpt_Dims,anpt_Rank,capi_anpt_intent,anpt_capi);
+  if (capi_anpt_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 1st argument `anpt' of scsmfo_min.vctran to C/Fortran array" );
+  } else {
+    anpt = (complex_double *)(PyArray_DATA(capi_anpt_tmp));
+
+  /* Processing variable ekt */
+  ;
+  capi_ekt_intent |= F2PY_INTENT_IN;
+  capi_ekt_tmp = array_from_pyobj(NPY_CDOUBLE,ekt_Dims,ekt_Rank,capi_ekt_intent,ekt_capi);
+  if (capi_ekt_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 5th argument `ekt' of scsmfo_min.vctran to C/Fortran array" );
+  } else {
+    ekt = (complex_double *)(PyArray_DATA(capi_ekt_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(anpt,&idir,&nodrj,&nodri,ekt,drott,amnlt,&ndd,&nda);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_ekt_tmp!=ekt_capi) {
+    Py_XDECREF(capi_ekt_tmp); }
+  }  /*if (capi_ekt_tmp == NULL) ... else of ekt*/
+  /* End of cleaning variable ekt */
+  if((PyObject *)capi_anpt_tmp!=anpt_capi) {
+    Py_XDECREF(capi_anpt_tmp); }
+  }  /*if (capi_anpt_tmp == NULL) ... else of anpt*/
+  /* End of cleaning variable anpt */
+  if((PyObject *)capi_drott_tmp!=drott_capi) {
+    Py_XDECREF(capi_drott_tmp); }
+  }  /*if (capi_drott_tmp == NULL) ... else of drott*/
+  /* End of cleaning variable drott */
+  } /*if (f2py_success) of ndd*/
+  /* End of cleaning variable ndd */
+  } /*if (f2py_success) of idir*/
+  /* End of cleaning variable idir */
+  } /*if (f2py_success) of nda*/
+  /* End of cleaning variable nda */
+  } /*if (f2py_success) of nodrj*/
+  /* End of cleaning variable nodrj */
+  } /*if (f2py_success) of nodri*/
+  /* End of cleaning variable nodri */
+  if((PyObject *)capi_amnlt_tmp!=amnlt_capi) {
+    Py_XDECREF(capi_amnlt_tmp); }
+  }  /*if (capi_amnlt_tmp == NULL) ... else of amnlt*/
+  /* End of cleaning variable amnlt */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of vctran *******************************/
+
+/********************************** rotcoef **********************************/
+static char doc_f2py_rout_scsmfo_min_rotcoef[] = "\
+rotcoef(cbe,kmax,nmax,dc,[ndim])\n\nWrapper for ``rotcoef``.\
+\n\nParameters\n----------\n"
+"cbe : input float\n"
+"kmax : input int\n"
+"nmax : input int\n"
+"dc : input rank-2 array('d') with bounds (2 * ndim + 1,*)\n"
+"\nOther Parameters\n----------------\n"
+"ndim : input int, optional\n    Default: (shape(dc,0)-1)/(2)";
+/* extern void F_FUNC(rotcoef,ROTCOEF)(double*,int*,int*,double*,int*); */
+static PyObject *f2py_rout_scsmfo_min_rotcoef(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,int*,int*,double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double cbe = 0;
+  PyObject *cbe_capi = Py_None;
+  int kmax = 0;
+  PyObject *kmax_capi = Py_None;
+  int nmax = 0;
+  PyObject *nmax_capi = Py_None;
+  double *dc = NULL;
+  npy_intp dc_Dims[2] = {-1, -1};
+  const int dc_Rank = 2;
+  PyArrayObject *capi_dc_tmp = NULL;
+  int capi_dc_intent = 0;
+  PyObject *dc_capi = Py_None;
+  int ndim = 0;
+  PyObject *ndim_capi = Py_None;
+  static char *capi_kwlist[] = {"cbe","kmax","nmax","dc","ndim",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO|O:scsmfo_min.rotcoef",\
+    capi_kwlist,&cbe_capi,&kmax_capi,&nmax_capi,&dc_capi,&ndim_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable nmax */
+    f2py_success = int_from_pyobj(&nmax,nmax_capi,"scsmfo_min.rotcoef() 3rd argument (nmax) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable cbe */
+    f2py_success = double_from_pyobj(&cbe,cbe_capi,"scsmfo_min.rotcoef() 1st argument (cbe) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable dc */
+  ;
+  capi_dc_intent |= F2PY_INTENT_IN;
+  capi_dc_tmp = array_from_pyobj(NPY_DOUBLE,dc_Dims,dc_Rank,capi_dc_intent,dc_capi);
+  if (capi_dc_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 4th argument `dc' of scsmfo_min.rotcoef to C/Fortran array" );
+  } else {
+    dc = (double *)(PyArray_DATA(capi_dc_tmp));
+
+  /* Processing variable kmax */
+    f2py_success = int_from_pyobj(&kmax,kmax_capi,"scsmfo_min.rotcoef() 2nd argument (kmax) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ndim */
+  if (ndim_capi == Py_None) ndim = (shape(dc,0)-1)/(2); else
+    f2py_success = int_from_pyobj(&ndim,ndim_capi,"scsmfo_min.rotcoef() 1st keyword (ndim) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR((shape(dc,0)-1)/(2)==ndim,"(shape(dc,0)-1)/(2)==ndim","1st keyword ndim","rotcoef:ndim=%d",ndim) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&cbe,&kmax,&nmax,dc,&ndim);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR((shape(dc,0)-1)/(2)==ndim)*/
+  } /*if (f2py_success) of ndim*/
+  /* End of cleaning variable ndim */
+  } /*if (f2py_success) of kmax*/
+  /* End of cleaning variable kmax */
+  if((PyObject *)capi_dc_tmp!=dc_capi) {
+    Py_XDECREF(capi_dc_tmp); }
+  }  /*if (capi_dc_tmp == NULL) ... else of dc*/
+  /* End of cleaning variable dc */
+  } /*if (f2py_success) of cbe*/
+  /* End of cleaning variable cbe */
+  } /*if (f2py_success) of nmax*/
+  /* End of cleaning variable nmax */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of rotcoef *******************************/
+
+/*********************************** rotvec ***********************************/
+static char doc_f2py_rout_scsmfo_min_rotvec[] = "\
+rotvec(alpha,cbe,nmax,mmax,amn,idir)\n\nWrapper for ``rotvec``.\
+\n\nParameters\n----------\n"
+"alpha : input float\n"
+"cbe : input float\n"
+"nmax : input int\n"
+"mmax : input int\n"
+"amn : input rank-2 array('D') with bounds (2,*)\n"
+"idir : input int";
+/* extern void F_FUNC(rotvec,ROTVEC)(double*,double*,int*,int*,complex_double*,int*); */
+static PyObject *f2py_rout_scsmfo_min_rotvec(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,int*,int*,complex_double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double alpha = 0;
+  PyObject *alpha_capi = Py_None;
+  double cbe = 0;
+  PyObject *cbe_capi = Py_None;
+  int nmax = 0;
+  PyObject *nmax_capi = Py_None;
+  int mmax = 0;
+  PyObject *mmax_capi = Py_None;
+  complex_double *amn = NULL;
+  npy_intp amn_Dims[2] = {-1, -1};
+  const int amn_Rank = 2;
+  PyArrayObject *capi_amn_tmp = NULL;
+  int capi_amn_intent = 0;
+  PyObject *amn_capi = Py_None;
+  int idir = 0;
+  PyObject *idir_capi = Py_None;
+  static char *capi_kwlist[] = {"alpha","cbe","nmax","mmax","amn","idir",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOO:scsmfo_min.rotvec",\
+    capi_kwlist,&alpha_capi,&cbe_capi,&nmax_capi,&mmax_capi,&amn_capi,&idir_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable nmax */
+    f2py_success = int_from_pyobj(&nmax,nmax_capi,"scsmfo_min.rotvec() 3rd argument (nmax) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable amn */
+  amn_Dims[0]=2;
+  capi_amn_intent |= F2PY_INTENT_IN;
+  capi_amn_tmp = array_from_pyobj(NPY_CDOUBLE,amn_Dims,amn_Rank,capi_amn_intent,amn_capi);
+  if (capi_amn_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 5th argument `amn' of scsmfo_min.rotvec to C/Fortran array" );
+  } else {
+    amn = (complex_double *)(PyArray_DATA(capi_amn_tmp));
+
+  /* Processing variable alpha */
+    f2py_success = double_from_pyobj(&alpha,alpha_capi,"scsmfo_min.rotvec() 1st argument (alpha) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable mmax */
+    f2py_success = int_from_pyobj(&mmax,mmax_capi,"scsmfo_min.rotvec() 4th argument (mmax) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable idir */
+    f2py_success = int_from_pyobj(&idir,idir_capi,"scsmfo_min.rotvec() 6th argument (idir) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable cbe */
+    f2py_success = double_from_pyobj(&cbe,cbe_capi,"scsmfo_min.rotvec() 2nd argument (cbe) can't be converted to double");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&alpha,&cbe,&nmax,&mmax,amn,&idir);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of cbe*/
+  /* End of cleaning variable cbe */
+  } /*if (f2py_success) of idir*/
+  /* End of cleaning variable idir */
+  } /*if (f2py_success) of mmax*/
+  /* End of cleaning variable mmax */
+  } /*if (f2py_success) of alpha*/
+  /* End of cleaning variable alpha */
+  if((PyObject *)capi_amn_tmp!=amn_capi) {
+    Py_XDECREF(capi_amn_tmp); }
+  }  /*if (capi_amn_tmp == NULL) ... else of amn*/
+  /* End of cleaning variable amn */
+  } /*if (f2py_success) of nmax*/
+  /* End of cleaning variable nmax */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of rotvec *******************************/
+
+/********************************** trancoef **********************************/
+static char doc_f2py_rout_scsmfo_min_trancoef[] = "\
+trancoef(itype,r,nmax,lmax,ac,[nd])\n\nWrapper for ``trancoef``.\
+\n\nParameters\n----------\n"
+"itype : input int\n"
+"r : input float\n"
+"nmax : input int\n"
+"lmax : input int\n"
+"ac : input rank-3 array('D') with bounds (2,nd,*)\n"
+"\nOther Parameters\n----------------\n"
+"nd : input int, optional\n    Default: shape(ac,1)";
+/* extern void F_FUNC(trancoef,TRANCOEF)(int*,double*,int*,int*,complex_double*,int*); */
+static PyObject *f2py_rout_scsmfo_min_trancoef(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,int*,int*,complex_double*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int itype = 0;
+  PyObject *itype_capi = Py_None;
+  double r = 0;
+  PyObject *r_capi = Py_None;
+  int nmax = 0;
+  PyObject *nmax_capi = Py_None;
+  int lmax = 0;
+  PyObject *lmax_capi = Py_None;
+  complex_double *ac = NULL;
+  npy_intp ac_Dims[3] = {-1, -1, -1};
+  const int ac_Rank = 3;
+  PyArrayObject *capi_ac_tmp = NULL;
+  int capi_ac_intent = 0;
+  PyObject *ac_capi = Py_None;
+  int nd = 0;
+  PyObject *nd_capi = Py_None;
+  static char *capi_kwlist[] = {"itype","r","nmax","lmax","ac","nd",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOO|O:scsmfo_min.trancoef",\
+    capi_kwlist,&itype_capi,&r_capi,&nmax_capi,&lmax_capi,&ac_capi,&nd_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable nmax */
+    f2py_success = int_from_pyobj(&nmax,nmax_capi,"scsmfo_min.trancoef() 3rd argument (nmax) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable itype */
+    f2py_success = int_from_pyobj(&itype,itype_capi,"scsmfo_min.trancoef() 1st argument (itype) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ac */
+  ac_Dims[0]=2;
+  capi_ac_intent |= F2PY_INTENT_IN;
+  capi_ac_tmp = array_from_pyobj(NPY_CDOUBLE,ac_Dims,ac_Rank,capi_ac_intent,ac_capi);
+  if (capi_ac_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 5th argument `ac' of scsmfo_min.trancoef to C/Fortran array" );
+  } else {
+    ac = (complex_double *)(PyArray_DATA(capi_ac_tmp));
+
+  /* Processing variable r */
+    f2py_success = double_from_pyobj(&r,r_capi,"scsmfo_min.trancoef() 2nd argument (r) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable lmax */
+    f2py_success = int_from_pyobj(&lmax,lmax_capi,"scsmfo_min.trancoef() 4th argument (lmax) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable nd */
+  if (nd_capi == Py_None) nd = shape(ac,1); else
+    f2py_success = int_from_pyobj(&nd,nd_capi,"scsmfo_min.trancoef() 1st keyword (nd) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(shape(ac,1)==nd,"shape(ac,1)==nd","1st keyword nd","trancoef:nd=%d",nd) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&itype,&r,&nmax,&lmax,ac,&nd);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(shape(ac,1)==nd)*/
+  } /*if (f2py_success) of nd*/
+  /* End of cleaning variable nd */
+  } /*if (f2py_success) of lmax*/
+  /* End of cleaning variable lmax */
+  } /*if (f2py_success) of r*/
+  /* End of cleaning variable r */
+  if((PyObject *)capi_ac_tmp!=ac_capi) {
+    Py_XDECREF(capi_ac_tmp); }
+  }  /*if (capi_ac_tmp == NULL) ... else of ac*/
+  /* End of cleaning variable ac */
+  } /*if (f2py_success) of itype*/
+  /* End of cleaning variable itype */
+  } /*if (f2py_success) of nmax*/
+  /* End of cleaning variable nmax */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/****************************** end of trancoef ******************************/
+
+/********************************** tranvec **********************************/
+static char doc_f2py_rout_scsmfo_min_tranvec[] = "\
+tranvec(r,lmax,nmax,amn,eps,err)\n\nWrapper for ``tranvec``.\
+\n\nParameters\n----------\n"
+"r : input float\n"
+"lmax : input int\n"
+"nmax : input int\n"
+"amn : input rank-2 array('D') with bounds (2,*)\n"
+"eps : input float\n"
+"err : input float";
+/* extern void F_FUNC(tranvec,TRANVEC)(double*,int*,int*,complex_double*,double*,double*); */
+static PyObject *f2py_rout_scsmfo_min_tranvec(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,int*,int*,complex_double*,double*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double r = 0;
+  PyObject *r_capi = Py_None;
+  int lmax = 0;
+  PyObject *lmax_capi = Py_None;
+  int nmax = 0;
+  PyObject *nmax_capi = Py_None;
+  complex_double *amn = NULL;
+  npy_intp amn_Dims[2] = {-1, -1};
+  const int amn_Rank = 2;
+  PyArrayObject *capi_amn_tmp = NULL;
+  int capi_amn_intent = 0;
+  PyObject *amn_capi = Py_None;
+  double eps = 0;
+  PyObject *eps_capi = Py_None;
+  double err = 0;
+  PyObject *err_capi = Py_None;
+  static char *capi_kwlist[] = {"r","lmax","nmax","amn","eps","err",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOO:scsmfo_min.tranvec",\
+    capi_kwlist,&r_capi,&lmax_capi,&nmax_capi,&amn_capi,&eps_capi,&err_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable nmax */
+    f2py_success = int_from_pyobj(&nmax,nmax_capi,"scsmfo_min.tranvec() 3rd argument (nmax) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable amn */
+  amn_Dims[0]=2;
+  capi_amn_intent |= F2PY_INTENT_IN;
+  capi_amn_tmp = array_from_pyobj(NPY_CDOUBLE,amn_Dims,amn_Rank,capi_amn_intent,amn_capi);
+  if (capi_amn_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 4th argument `amn' of scsmfo_min.tranvec to C/Fortran array" );
+  } else {
+    amn = (complex_double *)(PyArray_DATA(capi_amn_tmp));
+
+  /* Processing variable err */
+    f2py_success = double_from_pyobj(&err,err_capi,"scsmfo_min.tranvec() 6th argument (err) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable eps */
+    f2py_success = double_from_pyobj(&eps,eps_capi,"scsmfo_min.tranvec() 5th argument (eps) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable lmax */
+    f2py_success = int_from_pyobj(&lmax,lmax_capi,"scsmfo_min.tranvec() 2nd argument (lmax) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable r */
+    f2py_success = double_from_pyobj(&r,r_capi,"scsmfo_min.tranvec() 1st argument (r) can't be converted to double");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&r,&lmax,&nmax,amn,&eps,&err);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of r*/
+  /* End of cleaning variable r */
+  } /*if (f2py_success) of lmax*/
+  /* End of cleaning variable lmax */
+  } /*if (f2py_success) of eps*/
+  /* End of cleaning variable eps */
+  } /*if (f2py_success) of err*/
+  /* End of cleaning variable err */
+  if((PyObject *)capi_amn_tmp!=amn_capi) {
+    Py_XDECREF(capi_amn_tmp); }
+  }  /*if (capi_amn_tmp == NULL) ... else of amn*/
+  /* End of cleaning variable amn */
+  } /*if (f2py_success) of nmax*/
+  /* End of cleaning variable nmax */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of tranvec *******************************/
+
+/*********************************** vcfunc ***********************************/
+static char doc_f2py_rout_scsmfo_min_vcfunc[] = "\
+vcfunc(m,n,k,l,wmax,vcn)\n\nWrapper for ``vcfunc``.\
+\n\nParameters\n----------\n"
+"m : input int\n"
+"n : input int\n"
+"k : input int\n"
+"l : input int\n"
+"wmax : input int\n"
+"vcn : input rank-1 array('d') with bounds (*)";
+/* extern void F_FUNC(vcfunc,VCFUNC)(int*,int*,int*,int*,int*,double*); */
+static PyObject *f2py_rout_scsmfo_min_vcfunc(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,int*,int*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int m = 0;
+  PyObject *m_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  int k = 0;
+  PyObject *k_capi = Py_None;
+  int l = 0;
+  PyObject *l_capi = Py_None;
+  int wmax = 0;
+  PyObject *wmax_capi = Py_None;
+  double *vcn = NULL;
+  npy_intp vcn_Dims[1] = {-1};
+  const int vcn_Rank = 1;
+  PyArrayObject *capi_vcn_tmp = NULL;
+  int capi_vcn_intent = 0;
+  PyObject *vcn_capi = Py_None;
+  static char *capi_kwlist[] = {"m","n","k","l","wmax","vcn",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOO:scsmfo_min.vcfunc",\
+    capi_kwlist,&m_capi,&n_capi,&k_capi,&l_capi,&wmax_capi,&vcn_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable k */
+    f2py_success = int_from_pyobj(&k,k_capi,"scsmfo_min.vcfunc() 3rd argument (k) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable m */
+    f2py_success = int_from_pyobj(&m,m_capi,"scsmfo_min.vcfunc() 1st argument (m) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable l */
+    f2py_success = int_from_pyobj(&l,l_capi,"scsmfo_min.vcfunc() 4th argument (l) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable vcn */
+  ;
+  capi_vcn_intent |= F2PY_INTENT_IN;
+  capi_vcn_tmp = array_from_pyobj(NPY_DOUBLE,vcn_Dims,vcn_Rank,capi_vcn_intent,vcn_capi);
+  if (capi_vcn_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 6th argument `vcn' of scsmfo_min.vcfunc to C/Fortran array" );
+  } else {
+    vcn = (double *)(PyArray_DATA(capi_vcn_tmp));
+
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"scsmfo_min.vcfunc() 2nd argument (n) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable wmax */
+    f2py_success = int_from_pyobj(&wmax,wmax_capi,"scsmfo_min.vcfunc() 5th argument (wmax) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&m,&n,&k,&l,&wmax,vcn);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of wmax*/
+  /* End of cleaning variable wmax */
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  if((PyObject *)capi_vcn_tmp!=vcn_capi) {
+    Py_XDECREF(capi_vcn_tmp); }
+  }  /*if (capi_vcn_tmp == NULL) ... else of vcn*/
+  /* End of cleaning variable vcn */
+  } /*if (f2py_success) of l*/
+  /* End of cleaning variable l */
+  } /*if (f2py_success) of m*/
+  /* End of cleaning variable m */
+  } /*if (f2py_success) of k*/
+  /* End of cleaning variable k */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of vcfunc *******************************/
+
+/*********************************** hankel ***********************************/
+static char doc_f2py_rout_scsmfo_min_hankel[] = "\
+hankel(n,ds,xi)\n\nWrapper for ``hankel``.\
+\n\nParameters\n----------\n"
+"n : input int\n"
+"ds : input float\n"
+"xi : input rank-1 array('D') with bounds (*)";
+/* extern void F_FUNC(hankel,HANKEL)(int*,double*,complex_double*); */
+static PyObject *f2py_rout_scsmfo_min_hankel(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  double ds = 0;
+  PyObject *ds_capi = Py_None;
+  complex_double *xi = NULL;
+  npy_intp xi_Dims[1] = {-1};
+  const int xi_Rank = 1;
+  PyArrayObject *capi_xi_tmp = NULL;
+  int capi_xi_intent = 0;
+  PyObject *xi_capi = Py_None;
+  static char *capi_kwlist[] = {"n","ds","xi",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO:scsmfo_min.hankel",\
+    capi_kwlist,&n_capi,&ds_capi,&xi_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable xi */
+  ;
+  capi_xi_intent |= F2PY_INTENT_IN;
+  capi_xi_tmp = array_from_pyobj(NPY_CDOUBLE,xi_Dims,xi_Rank,capi_xi_intent,xi_capi);
+  if (capi_xi_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 3rd argument `xi' of scsmfo_min.hankel to C/Fortran array" );
+  } else {
+    xi = (complex_double *)(PyArray_DATA(capi_xi_tmp));
+
+  /* Processing variable ds */
+    f2py_success = double_from_pyobj(&ds,ds_capi,"scsmfo_min.hankel() 2nd argument (ds) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"scsmfo_min.hankel() 1st argument (n) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,&ds,xi);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of ds*/
+  /* End of cleaning variable ds */
+  if((PyObject *)capi_xi_tmp!=xi_capi) {
+    Py_XDECREF(capi_xi_tmp); }
+  }  /*if (capi_xi_tmp == NULL) ... else of xi*/
+  /* End of cleaning variable xi */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of hankel *******************************/
+
+/*********************************** bessel ***********************************/
+static char doc_f2py_rout_scsmfo_min_bessel[] = "\
+bessel(n,ds,nmax,psi)\n\nWrapper for ``bessel``.\
+\n\nParameters\n----------\n"
+"n : input int\n"
+"ds : input float\n"
+"nmax : input int\n"
+"psi : input rank-1 array('d') with bounds (*)";
+/* extern void F_FUNC(bessel,BESSEL)(int*,double*,int*,double*); */
+static PyObject *f2py_rout_scsmfo_min_bessel(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,int*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  double ds = 0;
+  PyObject *ds_capi = Py_None;
+  int nmax = 0;
+  PyObject *nmax_capi = Py_None;
+  double *psi = NULL;
+  npy_intp psi_Dims[1] = {-1};
+  const int psi_Rank = 1;
+  PyArrayObject *capi_psi_tmp = NULL;
+  int capi_psi_intent = 0;
+  PyObject *psi_capi = Py_None;
+  static char *capi_kwlist[] = {"n","ds","nmax","psi",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO:scsmfo_min.bessel",\
+    capi_kwlist,&n_capi,&ds_capi,&nmax_capi,&psi_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable nmax */
+    f2py_success = int_from_pyobj(&nmax,nmax_capi,"scsmfo_min.bessel() 3rd argument (nmax) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable psi */
+  ;
+  capi_psi_intent |= F2PY_INTENT_IN;
+  capi_psi_tmp = array_from_pyobj(NPY_DOUBLE,psi_Dims,psi_Rank,capi_psi_intent,psi_capi);
+  if (capi_psi_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 4th argument `psi' of scsmfo_min.bessel to C/Fortran array" );
+  } else {
+    psi = (double *)(PyArray_DATA(capi_psi_tmp));
+
+  /* Processing variable ds */
+    f2py_success = double_from_pyobj(&ds,ds_capi,"scsmfo_min.bessel() 2nd argument (ds) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"scsmfo_min.bessel() 1st argument (n) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,&ds,&nmax,psi);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of ds*/
+  /* End of cleaning variable ds */
+  if((PyObject *)capi_psi_tmp!=psi_capi) {
+    Py_XDECREF(capi_psi_tmp); }
+  }  /*if (capi_psi_tmp == NULL) ... else of psi*/
+  /* End of cleaning variable psi */
+  } /*if (f2py_success) of nmax*/
+  /* End of cleaning variable nmax */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of bessel *******************************/
+
+/************************************ mie1 ************************************/
+static char doc_f2py_rout_scsmfo_min_mie1[] = "\
+mie1(x,sn,sk,nstop,qeps,qext,qsca,an)\n\nWrapper for ``mie1``.\
+\n\nParameters\n----------\n"
+"x : input float\n"
+"sn : input float\n"
+"sk : input float\n"
+"nstop : input int\n"
+"qeps : input float\n"
+"qext : input float\n"
+"qsca : input float\n"
+"an : input rank-2 array('D') with bounds (2,32)";
+/* extern void F_FUNC(mie1,MIE1)(double*,double*,double*,int*,double*,double*,double*,complex_double*); */
+static PyObject *f2py_rout_scsmfo_min_mie1(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,double*,int*,double*,double*,double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double x = 0;
+  PyObject *x_capi = Py_None;
+  double sn = 0;
+  PyObject *sn_capi = Py_None;
+  double sk = 0;
+  PyObject *sk_capi = Py_None;
+  int nstop = 0;
+  PyObject *nstop_capi = Py_None;
+  double qeps = 0;
+  PyObject *qeps_capi = Py_None;
+  double qext = 0;
+  PyObject *qext_capi = Py_None;
+  double qsca = 0;
+  PyObject *qsca_capi = Py_None;
+  complex_double *an = NULL;
+  npy_intp an_Dims[2] = {-1, -1};
+  const int an_Rank = 2;
+  PyArrayObject *capi_an_tmp = NULL;
+  int capi_an_intent = 0;
+  PyObject *an_capi = Py_None;
+  static char *capi_kwlist[] = {"x","sn","sk","nstop","qeps","qext","qsca","an",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOO:scsmfo_min.mie1",\
+    capi_kwlist,&x_capi,&sn_capi,&sk_capi,&nstop_capi,&qeps_capi,&qext_capi,&qsca_capi,&an_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable qeps */
+    f2py_success = double_from_pyobj(&qeps,qeps_capi,"scsmfo_min.mie1() 5th argument (qeps) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable an */
+  an_Dims[0]=2,an_Dims[1]=32;
+  capi_an_intent |= F2PY_INTENT_IN;
+  capi_an_tmp = array_from_pyobj(NPY_CDOUBLE,an_Dims,an_Rank,capi_an_intent,an_capi);
+  if (capi_an_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 8th argument `an' of scsmfo_min.mie1 to C/Fortran array" );
+  } else {
+    an = (complex_double *)(PyArray_DATA(capi_an_tmp));
+
+  /* Processing variable nstop */
+    f2py_success = int_from_pyobj(&nstop,nstop_capi,"scsmfo_min.mie1() 4th argument (nstop) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable qsca */
+    f2py_success = double_from_pyobj(&qsca,qsca_capi,"scsmfo_min.mie1() 7th argument (qsca) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable sk */
+    f2py_success = double_from_pyobj(&sk,sk_capi,"scsmfo_min.mie1() 3rd argument (sk) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable sn */
+    f2py_success = double_from_pyobj(&sn,sn_capi,"scsmfo_min.mie1() 2nd argument (sn) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable x */
+    f2py_success = double_from_pyobj(&x,x_capi,"scsmfo_min.mie1() 1st argument (x) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable qext */
+    f2py_success = double_from_pyobj(&qext,qext_capi,"scsmfo_min.mie1() 6th argument (qext) can't be converted to double");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&x,&sn,&sk,&nstop,&qeps,&qext,&qsca,an);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of qext*/
+  /* End of cleaning variable qext */
+  } /*if (f2py_success) of x*/
+  /* End of cleaning variable x */
+  } /*if (f2py_success) of sn*/
+  /* End of cleaning variable sn */
+  } /*if (f2py_success) of sk*/
+  /* End of cleaning variable sk */
+  } /*if (f2py_success) of qsca*/
+  /* End of cleaning variable qsca */
+  } /*if (f2py_success) of nstop*/
+  /* End of cleaning variable nstop */
+  if((PyObject *)capi_an_tmp!=an_capi) {
+    Py_XDECREF(capi_an_tmp); }
+  }  /*if (capi_an_tmp == NULL) ... else of an*/
+  /* End of cleaning variable an */
+  } /*if (f2py_success) of qeps*/
+  /* End of cleaning variable qeps */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************** end of mie1 ********************************/
+
+/********************************** cbessel **********************************/
+static char doc_f2py_rout_scsmfo_min_cbessel[] = "\
+cbessel(n,ds,psi)\n\nWrapper for ``cbessel``.\
+\n\nParameters\n----------\n"
+"n : input int\n"
+"ds : input complex\n"
+"psi : input rank-1 array('D') with bounds (*)";
+/* extern void F_FUNC(cbessel,CBESSEL)(int*,complex_double*,complex_double*); */
+static PyObject *f2py_rout_scsmfo_min_cbessel(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,complex_double*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  complex_double ds;
+  PyObject *ds_capi = Py_None;
+  complex_double *psi = NULL;
+  npy_intp psi_Dims[1] = {-1};
+  const int psi_Rank = 1;
+  PyArrayObject *capi_psi_tmp = NULL;
+  int capi_psi_intent = 0;
+  PyObject *psi_capi = Py_None;
+  static char *capi_kwlist[] = {"n","ds","psi",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO:scsmfo_min.cbessel",\
+    capi_kwlist,&n_capi,&ds_capi,&psi_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable psi */
+  ;
+  capi_psi_intent |= F2PY_INTENT_IN;
+  capi_psi_tmp = array_from_pyobj(NPY_CDOUBLE,psi_Dims,psi_Rank,capi_psi_intent,psi_capi);
+  if (capi_psi_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 3rd argument `psi' of scsmfo_min.cbessel to C/Fortran array" );
+  } else {
+    psi = (complex_double *)(PyArray_DATA(capi_psi_tmp));
+
+  /* Processing variable ds */
+    f2py_success = complex_double_from_pyobj(&ds,ds_capi,"scsmfo_min.cbessel() 2nd argument (ds) can't be converted to complex_double");
+  if (f2py_success) {
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"scsmfo_min.cbessel() 1st argument (n) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&n,&ds,psi);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  }  /*if (f2py_success) of ds frompyobj*/
+  /* End of cleaning variable ds */
+  if((PyObject *)capi_psi_tmp!=psi_capi) {
+    Py_XDECREF(capi_psi_tmp); }
+  }  /*if (capi_psi_tmp == NULL) ... else of psi*/
+  /* End of cleaning variable psi */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of cbessel *******************************/
+
+/********************************** scatexp **********************************/
+static char doc_f2py_rout_scsmfo_min_scatexp[] = "\
+scatexp(amn0,nodrt,nodrg,gmn)\n\nWrapper for ``scatexp``.\
+\n\nParameters\n----------\n"
+"amn0 : input rank-3 array('D') with bounds (2,5040,2)\n"
+"nodrt : input int\n"
+"nodrg : input int\n"
+"gmn : input rank-1 array('D') with bounds (nodrg*(nodrg+3)/2+1)";
+/* extern void F_FUNC(scatexp,SCATEXP)(complex_double*,int*,int*,complex_double*); */
+static PyObject *f2py_rout_scsmfo_min_scatexp(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_double*,int*,int*,complex_double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  complex_double *amn0 = NULL;
+  npy_intp amn0_Dims[3] = {-1, -1, -1};
+  const int amn0_Rank = 3;
+  PyArrayObject *capi_amn0_tmp = NULL;
+  int capi_amn0_intent = 0;
+  PyObject *amn0_capi = Py_None;
+  int nodrt = 0;
+  PyObject *nodrt_capi = Py_None;
+  int nodrg = 0;
+  PyObject *nodrg_capi = Py_None;
+  complex_double *gmn = NULL;
+  npy_intp gmn_Dims[1] = {-1};
+  const int gmn_Rank = 1;
+  PyArrayObject *capi_gmn_tmp = NULL;
+  int capi_gmn_intent = 0;
+  PyObject *gmn_capi = Py_None;
+  static char *capi_kwlist[] = {"amn0","nodrt","nodrg","gmn",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOO:scsmfo_min.scatexp",\
+    capi_kwlist,&amn0_capi,&nodrt_capi,&nodrg_capi,&gmn_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable nodrt */
+    f2py_success = int_from_pyobj(&nodrt,nodrt_capi,"scsmfo_min.scatexp() 2nd argument (nodrt) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable nodrg */
+    f2py_success = int_from_pyobj(&nodrg,nodrg_capi,"scsmfo_min.scatexp() 3rd argument (nodrg) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable amn0 */
+  amn0_Dims[0]=2,amn0_Dims[1]=5040,amn0_Dims[2]=2;
+  capi_amn0_intent |= F2PY_INTENT_IN;
+  capi_amn0_tmp = array_from_pyobj(NPY_CDOUBLE,amn0_Dims,amn0_Rank,capi_amn0_intent,amn0_capi);
+  if (capi_amn0_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 1st argument `amn0' of scsmfo_min.scatexp to C/Fortran array" );
+  } else {
+    amn0 = (complex_double *)(PyArray_DATA(capi_amn0_tmp));
+
+  /* Processing variable gmn */
+  gmn_Dims[0]=nodrg*(nodrg+3)/2+1;
+  capi_gmn_intent |= F2PY_INTENT_IN;
+  capi_gmn_tmp = array_from_pyobj(NPY_CDOUBLE,gmn_Dims,gmn_Rank,capi_gmn_intent,gmn_capi);
+  if (capi_gmn_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(scsmfo_min_error,"failed in converting 4th argument `gmn' of scsmfo_min.scatexp to C/Fortran array" );
+  } else {
+    gmn = (complex_double *)(PyArray_DATA(capi_gmn_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(amn0,&nodrt,&nodrg,gmn);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_gmn_tmp!=gmn_capi) {
+    Py_XDECREF(capi_gmn_tmp); }
+  }  /*if (capi_gmn_tmp == NULL) ... else of gmn*/
+  /* End of cleaning variable gmn */
+  if((PyObject *)capi_amn0_tmp!=amn0_capi) {
+    Py_XDECREF(capi_amn0_tmp); }
+  }  /*if (capi_amn0_tmp == NULL) ... else of amn0*/
+  /* End of cleaning variable amn0 */
+  } /*if (f2py_success) of nodrg*/
+  /* End of cleaning variable nodrg */
+  } /*if (f2py_success) of nodrt*/
+  /* End of cleaning variable nodrt */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************************* end of scatexp *******************************/
+/*eof body*/
+
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
+/*need_f90modhooks*/
+
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+
+/******************* See f2py2e/common_rules.py: buildhooks *******************/
+
+static FortranDataDef f2py_consts_def[] = {
+  {"bcof",2,{{285,285}},NPY_DOUBLE},
+  {"fnr",1,{{569}},NPY_DOUBLE},
+  {NULL}
+};
+static void f2py_setup_consts(char *bcof,char *fnr) {
+  int i_f2py=0;
+  f2py_consts_def[i_f2py++].data = bcof;
+  f2py_consts_def[i_f2py++].data = fnr;
+}
+extern void F_FUNC(f2pyinitconsts,F2PYINITCONSTS)(void(*)(char*,char*));
+static void f2py_init_consts(void) {
+  F_FUNC(f2pyinitconsts,F2PYINITCONSTS)(f2py_setup_consts);
+}
+
+/*need_commonhooks*/
+
+/**************************** See f2py2e/rules.py ****************************/
+
+static FortranDataDef f2py_routine_defs[] = {
+  {"amncalc",-1,{{-1}},0,(char *)F_FUNC(amncalc,AMNCALC),(f2py_init_func)f2py_rout_scsmfo_min_amncalc,doc_f2py_rout_scsmfo_min_amncalc},
+  {"itersoln",-1,{{-1}},0,(char *)F_FUNC(itersoln,ITERSOLN),(f2py_init_func)f2py_rout_scsmfo_min_itersoln,doc_f2py_rout_scsmfo_min_itersoln},
+  {"vctran",-1,{{-1}},0,(char *)F_FUNC(vctran,VCTRAN),(f2py_init_func)f2py_rout_scsmfo_min_vctran,doc_f2py_rout_scsmfo_min_vctran},
+  {"rotcoef",-1,{{-1}},0,(char *)F_FUNC(rotcoef,ROTCOEF),(f2py_init_func)f2py_rout_scsmfo_min_rotcoef,doc_f2py_rout_scsmfo_min_rotcoef},
+  {"rotvec",-1,{{-1}},0,(char *)F_FUNC(rotvec,ROTVEC),(f2py_init_func)f2py_rout_scsmfo_min_rotvec,doc_f2py_rout_scsmfo_min_rotvec},
+  {"trancoef",-1,{{-1}},0,(char *)F_FUNC(trancoef,TRANCOEF),(f2py_init_func)f2py_rout_scsmfo_min_trancoef,doc_f2py_rout_scsmfo_min_trancoef},
+  {"tranvec",-1,{{-1}},0,(char *)F_FUNC(tranvec,TRANVEC),(f2py_init_func)f2py_rout_scsmfo_min_tranvec,doc_f2py_rout_scsmfo_min_tranvec},
+  {"vcfunc",-1,{{-1}},0,(char *)F_FUNC(vcfunc,VCFUNC),(f2py_init_func)f2py_rout_scsmfo_min_vcfunc,doc_f2py_rout_scsmfo_min_vcfunc},
+  {"hankel",-1,{{-1}},0,(char *)F_FUNC(hankel,HANKEL),(f2py_init_func)f2py_rout_scsmfo_min_hankel,doc_f2py_rout_scsmfo_min_hankel},
+  {"bessel",-1,{{-1}},0,(char *)F_FUNC(bessel,BESSEL),(f2py_init_func)f2py_rout_scsmfo_min_bessel,doc_f2py_rout_scsmfo_min_bessel},
+  {"mie1",-1,{{-1}},0,(char *)F_FUNC(mie1,MIE1),(f2py_init_func)f2py_rout_scsmfo_min_mie1,doc_f2py_rout_scsmfo_min_mie1},
+  {"cbessel",-1,{{-1}},0,(char *)F_FUNC(cbessel,CBESSEL),(f2py_init_func)f2py_rout_scsmfo_min_cbessel,doc_f2py_rout_scsmfo_min_cbessel},
+  {"scatexp",-1,{{-1}},0,(char *)F_FUNC(scatexp,SCATEXP),(f2py_init_func)f2py_rout_scsmfo_min_scatexp,doc_f2py_rout_scsmfo_min_scatexp},
+
+/*eof routine_defs*/
+  {NULL}
+};
+
+static PyMethodDef f2py_module_methods[] = {
+
+  {NULL,NULL}
+};
+
+#if PY_VERSION_HEX >= 0x03000000
+static struct PyModuleDef moduledef = {
+  PyModuleDef_HEAD_INIT,
+  "scsmfo_min",
+  NULL,
+  -1,
+  f2py_module_methods,
+  NULL,
+  NULL,
+  NULL,
+  NULL
+};
+#endif
+
+#if PY_VERSION_HEX >= 0x03000000
+#define RETVAL m
+PyMODINIT_FUNC PyInit_scsmfo_min(void) {
+#else
+#define RETVAL
+PyMODINIT_FUNC initscsmfo_min(void) {
+#endif
+  int i;
+  PyObject *m,*d, *s;
+#if PY_VERSION_HEX >= 0x03000000
+  m = scsmfo_min_module = PyModule_Create(&moduledef);
+#else
+  m = scsmfo_min_module = Py_InitModule("scsmfo_min", f2py_module_methods);
+#endif
+  Py_TYPE(&PyFortran_Type) = &PyType_Type;
+  import_array();
+  if (PyErr_Occurred())
+    {PyErr_SetString(PyExc_ImportError, "can't initialize module scsmfo_min (failed to import numpy)"); return RETVAL;}
+  d = PyModule_GetDict(m);
+  s = PyString_FromString("$Revision: $");
+  PyDict_SetItemString(d, "__version__", s);
+#if PY_VERSION_HEX >= 0x03000000
+  s = PyUnicode_FromString(
+#else
+  s = PyString_FromString(
+#endif
+    "This module 'scsmfo_min' is auto-generated with f2py (version:2).\nFunctions:\n"
+"  nodr,nodrtmax,amn0,status = amncalc(inew,xp,yp,zp,sni,ski,xi,niter,eps,qeps1,qeps2,meth,ea,npart=len(xp),nodrtd=70)\n"
+"  itersoln(nodr,nblk,eps,niter,meth,itest,ek,drot,amnl,an1,pnp,anp,iter,err,npart=len(nodr),nodd=shape(ek,0))\n"
+"  vctran(anpt,idir,nodrj,nodri,ekt,drott,amnlt,ndd,nda)\n"
+"  rotcoef(cbe,kmax,nmax,dc,ndim=(shape(dc,0)-1)/(2))\n"
+"  rotvec(alpha,cbe,nmax,mmax,amn,idir)\n"
+"  trancoef(itype,r,nmax,lmax,ac,nd=shape(ac,1))\n"
+"  tranvec(r,lmax,nmax,amn,eps,err)\n"
+"  vcfunc(m,n,k,l,wmax,vcn)\n"
+"  hankel(n,ds,xi)\n"
+"  bessel(n,ds,nmax,psi)\n"
+"  mie1(x,sn,sk,nstop,qeps,qext,qsca,an)\n"
+"  cbessel(n,ds,psi)\n"
+"  scatexp(amn0,nodrt,nodrg,gmn)\n"
+"COMMON blocks:\n""  /consts/ bcof(285,285),fnr(569)\n"".");
+  PyDict_SetItemString(d, "__doc__", s);
+  scsmfo_min_error = PyErr_NewException ("scsmfo_min.error", NULL, NULL);
+  Py_DECREF(s);
+  for(i=0;f2py_routine_defs[i].name!=NULL;i++)
+    PyDict_SetItemString(d, f2py_routine_defs[i].name,PyFortranObject_NewAsAttr(&f2py_routine_defs[i]));
+
+
+
+
+
+
+
+
+
+
+
+
+
+/*eof initf2pywraphooks*/
+/*eof initf90modhooks*/
+
+  F2PyDict_SetItemString(d, "consts", PyFortranObject_New(f2py_consts_def,f2py_init_consts));
+/*eof initcommonhooks*/
+
+
+#ifdef F2PY_REPORT_ATEXIT
+  if (! PyErr_Occurred())
+    on_exit(f2py_report_on_exit,(void*)"scsmfo_min");
+#endif
+
+  return RETVAL;
+}
+#ifdef __cplusplus
+}
+#endif
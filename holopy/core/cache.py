@@ -0,0 +1,177 @@
+# Copyright 2011-2013, Vinothan N. Manoharan, Thomas G. Dimiduk,
+# Rebecca W. Perry, Jerome Fung, and Ryan McGorty, Anna Wang
+#
+# This file is part of HoloPy.
+#
+# HoloPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# HoloPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with HoloPy.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Bounded caches for reusing expensive intermediate results.
+"""
+from __future__ import division
+
+import threading
+from collections import OrderedDict, namedtuple
+
+# private sentinel so that None can be a cached value or an argument
+_missing = object()
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+class LRUCache(object):
+    """
+    Size bounded, thread safe, least recently used cache.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of entries to keep. When the cache is full, the least
+        recently used entry is discarded to make room for a new one. A maxsize
+        of 0 disables the cache (nothing is stored).
+    maxbytes : int or None
+        Maximum total size of the numpy arrays held in the cache (counting
+        arrays stored directly or inside tuples and lists). Least recently used
+        entries are discarded to stay under it, and values larger than maxbytes
+        are not stored at all. None (default) means no limit.
+
+    Notes
+    -----
+    Keys must be hashable. Values are returned as stored, so callers should
+    not modify them in place (store read-only arrays if in doubt).
+
+    Cached values are not pickled; a cache comes back empty (but with the same
+    limits) after a pickle or deepcopy round trip.
+    """
+    def __init__(self, maxsize=128, maxbytes=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        """
+        Look up key, counting a hit or a miss
+        """
+        with self._lock:
+            try:
+                entry = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            # reinsert to mark as most recently used
+            self._data[key] = entry
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        """
+        Store value under key, evicting the least recently used entries if
+        needed
+        """
+        with self._lock:
+            self._discard(key)
+            size = _nbytes(value)
+            if self.maxsize <= 0 or (self.maxbytes is not None and
+                                     size > self.maxbytes):
+                return
+            self._data[key] = (value, size)
+            self.nbytes += size
+            self._evict()
+
+    def get_or_compute(self, key, compute):
+        """
+        Return the cached value for key, calling compute() and storing its
+        result on a miss.
+
+        compute is called without holding the cache lock, so two threads
+        missing on the same key may both compute it.
+        """
+        value = self.get(key, _missing)
+        if value is _missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def resize(self, maxsize, maxbytes=_missing):
+        """
+        Change the maximum size of the cache (and, if given, the limit on its
+        memory use), discarding least recently used entries if it shrinks
+        """
+        with self._lock:
+            self.maxsize = maxsize
+            if maxbytes is not _missing:
+                self.maxbytes = maxbytes
+            self._evict()
+
+    def clear(self):
+        """
+        Remove all entries and reset the hit/miss statistics
+        """
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """
+        Hit/miss statistics
+
+        Returns
+        -------
+        info : CacheInfo
+            namedtuple of (hits, misses, maxsize, currsize).  The memory held
+            by the cache is in the nbytes attribute.
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize,
+                             len(self._data))
+
+    def _discard(self, key):
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[1]
+
+    def _evict(self):
+        # call with the lock held
+        while self._data and (len(self._data) > max(self.maxsize, 0) or
+                              (self.maxbytes is not None and
+                               self.nbytes > self.maxbytes)):
+            _, (_, size) = self._data.popitem(last=False)
+            self.nbytes -= size
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __getstate__(self):
+        return {'maxsize': self.maxsize, 'maxbytes': self.maxbytes}
+
+    def __setstate__(self, state):
+        self.__init__(state['maxsize'], state.get('maxbytes'))
+
+    def __repr__(self):
+        return "{0}(maxsize={1}, maxbytes={2})".format(
+            self.__class__.__name__, self.maxsize, self.maxbytes)
+
+def _nbytes(value):
+    # memory held by the arrays in a cached value
+    if isinstance(value, (tuple, list)):
+        return sum(_nbytes(v) for v in value)
+    return getattr(value, 'nbytes', 0)
+
@@ -33,6 +33,7 @@ import scipy.signal
 from errors import UnspecifiedPosition
 from .holopy_object import HoloPyObject
 from .metadata import Angles, Positions
+from .cache import LRUCache
 from .helpers import _ensure_pair, _ensure_array, dict_without, ensure_3d, is_none
 
 def zeros_like(obj, dtype=None):
@@ -329,16 +330,25 @@ class RegularGridSchema(Schema):
 
             self._spacing = spacing
 
-    # This could be cached, it only changes when the shape, spacing or
-    # origin is changed, which is less common than we call
-    # positions. However, that is only a minor optimization, (doing
-    # something with the positions almost always takes much longer
-    # than computing them) so I am not bothering with it at the moment
-    # -tgd 2013-12-09
     @property
     def positions(self):
+        """
+        Positions of each point in the grid
+
+        Positions only change when the shape, spacing or origin is changed, so
+        they are cached (keyed on those values, so changing any of them gets
+        you new positions) and shared between all grids with the same
+        geometry.  The returned array is read only since it may be shared,
+        copy it if you need to modify it.  See grid_positions_cache to control
+        how many geometries are remembered.
+        """
         if self.shape is None:
             return Positions()
+        key = (tuple(self.shape), tuple(np.ravel(self.spacing)),
+               tuple(np.ravel(self.origin)))
+        return grid_positions_cache.get_or_compute(key, self._grid_positions)
+
+    def _grid_positions(self):
         # Compute the coordinates of each point in the grid
 
         # make it 3d even if the image is 2d
@@ -353,7 +363,9 @@ class RegularGridSchema(Schema):
         pos = np.zeros(np.append(shape, 3))
         for i, s in enumerate(spacing):
             pos[..., i] = xyz[i, ...] * s
-        return Positions(pos + self.origin)
+        pos = Positions(pos + self.origin)
+        pos.setflags(write=False)
+        return pos
 
     @positions.setter
     def positions(self, val):
@@ -384,6 +396,12 @@ class RegularGridSchema(Schema):
     def ndim(self):
         return len(self.shape)
 
+# Positions of recently used grid geometries, shared between all
+# RegularGridSchemas.  Each entry is as big as a vector field over the grid, so
+# keep only a few; grid_positions_cache.resize(0) turns off the caching.
+grid_positions_cache = LRUCache(4)
+
+
 class VectorSchema(Schema):
     def __init__(self, shape=None, positions=None,
                  components=('x', 'y', 'z'), optics=None,
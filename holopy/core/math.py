@@ -117,9 +117,7 @@ def ifft(a, overwrite=False, shift=True):
 def rotate_points(points, theta, phi, psi):
     points = np.array(points)
     rot = rotation_matrix(theta, phi, psi)
-    if points.ndim == 1:
-        return np.dot(rot, points)
-    return np.array([np.dot(rot, c) for c in points])
+    return np.dot(points, rot.T)
 
 def rotation_matrix(alpha, beta, gamma, radians = True):
     """
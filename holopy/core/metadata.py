@@ -157,7 +157,15 @@ class Positions(np.ndarray, HoloPyObject):
         return np.ndarray.__array_wrap__(self, out_arr, context)
 
     def xyz(self):
-        return Positions(self.reshape(-1, 3))
+        # read only positions (like the ones grids cache) can't change under
+        # us, so remember their flattened view rather than making a new one
+        # every time
+        xyz = getattr(self, '_xyz', None)
+        if xyz is None:
+            xyz = Positions(self.reshape(-1, 3))
+            if not self.flags.writeable:
+                self._xyz = xyz
+        return xyz
 
     def r_theta_phi(self, origin):
         xg, yg, zg = self.xyz().T
@@ -226,8 +234,7 @@ class Angles(PositionSpecification):
         self.shape = len(self.theta), len(self.phi)
 
     def positions_theta_phi(self):
-        pos = np.zeros((self.shape[0]*self.shape[1], 2))
-        for i, theta in enumerate(self.theta):
-            for j, phi in enumerate(self.phi):
-                pos[i*self.shape[1]+j] = theta, phi
-        return pos
+        # theta varies slowest, as in the shape of the grid
+        theta = np.repeat(np.asarray(self.theta, dtype='float'), self.shape[1])
+        phi = np.tile(np.asarray(self.phi, dtype='float'), self.shape[0])
+        return np.column_stack((theta, phi))
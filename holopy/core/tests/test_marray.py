@@ -134,6 +134,23 @@ def test_positions_shape():
     pos = schema.positions.r_theta_phi([0,0,0])
     assert_equal(pos.shape[0], schema.shape[0]**2)
 
+def test_positions_cached():
+    s = ImageSchema((4, 5), .1)
+    pos = s.positions
+    # same geometry shares the same (read only) positions
+    assert s.positions is pos
+    assert ImageSchema((4, 5), .1).positions is pos
+    assert not pos.flags.writeable
+    assert_raises(ValueError, pos.__setitem__, 0, 1)
+    assert s.positions.xyz() is pos.xyz()
+
+    # changing geometry gets new positions
+    s.origin = np.array([1., 0, 0])
+    assert_allclose(s.positions, pos + [1, 0, 0])
+    s.spacing = .2
+    assert_allclose(s.positions[1, 1, 0], [1.2, .2, 0])
+    assert_equal(ImageSchema((6, 5), .1).positions.shape, (6, 5, 1, 3))
+
 def test_squeeze():
     v = Volume(np.ones((10, 1, 10)), spacing = (1, 2, 3),
                        optics = Optics(.66, 1, (1, 0)))
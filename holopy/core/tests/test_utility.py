@@ -23,7 +23,9 @@ from nose.plugins.attrib import attr
 import tempfile
 import os
 import shutil
+import pickle
 
+from holopy.core.cache import LRUCache
 from holopy.core.helpers import (_ensure_array, coord_grid, ensure_listlike,
                                  mkdir_p, ensure_3d)
 
@@ -60,3 +62,52 @@ def test_mkdir_p():
     mkdir_p(os.path.join(tempdir, 'a', 'b'))
     mkdir_p(os.path.join(tempdir, 'a', 'b'))
     shutil.rmtree(tempdir)
+
+@attr('fast')
+def test_lru_cache():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert_equal(cache.get('a'), 1)
+    # 'b' is now least recently used, so it is the one evicted
+    cache.put('c', 3)
+    assert 'b' not in cache
+    assert_equal(cache.get('b', 'gone'), 'gone')
+    assert_equal(cache.get_or_compute('c', lambda: 4), 3)
+    assert_equal(cache.info(), (2, 1, 2, 2))
+
+    cache.resize(1)
+    assert_equal(len(cache), 1)
+    assert 'c' in cache
+
+    disabled = LRUCache(0)
+    assert_equal(disabled.get_or_compute('a', lambda: 1), 1)
+    assert_equal(len(disabled), 0)
+
+    unpickled = pickle.loads(pickle.dumps(cache))
+    assert_equal(unpickled.maxsize, 1)
+    assert_equal(len(unpickled), 0)
+
+@attr('fast')
+def test_lru_cache_maxbytes():
+    cache = LRUCache(10, maxbytes=200)
+    cache.put('a', np.zeros(10))
+    cache.put('b', (np.zeros(10), 3))
+    assert_equal(cache.nbytes, 160)
+    # going over the memory limit evicts the least recently used entry
+    cache.put('c', np.zeros(6))
+    assert 'a' not in cache
+    assert_equal(cache.nbytes, 128)
+    # values bigger than the limit are not stored at all
+    cache.put('b', np.zeros(100))
+    assert 'b' not in cache
+    assert_equal(cache.nbytes, 48)
+
+    cache.resize(10, maxbytes=None)
+    cache.put('d', np.zeros(100))
+    assert_equal(cache.nbytes, 848)
+    cache.resize(1)
+    assert_equal(cache.maxbytes, None)
+    assert_equal(cache.nbytes, 800)
+    cache.clear()
+    assert_equal(cache.nbytes, 0)
@@ -37,4 +37,4 @@ from fit import fit, rsq, chisq, FitResult
 from model import Model, Parametrization
 from parameter import Parameter, par, ComplexParameter
 from fit_series import fit_series
-from minimizer import Nmpfit
+from minimizer import Nmpfit, LeastSquares
@@ -27,11 +27,16 @@ from __future__ import division
 
 import warnings
 import time
+import inspect
+import weakref
 
 from ..core.holopy_object import HoloPyObject
+from ..core.cache import LRUCache
 from .errors import MinimizerConvergenceFailed, InvalidMinimizer
-from holopy.scattering.errors import MultisphereFieldNaN
+from holopy.scattering.errors import (MultisphereFieldNaN,
+                                     TheoryNotCompatibleError)
 from .minimizer import Minimizer, Nmpfit
+from .model import ParameterizedObject
 import numpy as np
 from ..core.marray import Schema
 
@@ -68,9 +73,14 @@ def fit(model, data, minimizer=Nmpfit, random_subset=None):
                                    "interpreted as a minimizer")
 
     coster = CostComputer(data, model, random_subset)
+    minimize_kwargs = {}
+    if ('jacobian' in inspect.getargspec(minimizer.minimize).args and
+        coster.jacobian_available):
+        minimize_kwargs['jacobian'] = coster.jacobian
     try:
         fitted_pars, minimizer_info = minimizer.minimize(model.parameters,
-                                                         coster.flattened_difference)
+                                                         coster.flattened_difference,
+                                                         **minimize_kwargs)
         converged = True
     except MinimizerConvergenceFailed as cf:
         warnings.warn("Minimizer Convergence Failed, your results may not be "
@@ -85,9 +95,18 @@ def fit(model, data, minimizer=Nmpfit, random_subset=None):
 
     time_stop = time.time()
 
-    return FitResult(fitted_pars, fitted_scatterer, coster.chisq(fitted_pars),
-                     coster.rsq(fitted_pars), converged, time_stop - time_start,
-                     model, minimizer, minimizer_info)
+    # the minimizer has almost always just computed the hologram at the best
+    # fit, so these come out of coster's cache
+    result = FitResult(fitted_pars, fitted_scatterer, coster.chisq(fitted_pars),
+                       coster.rsq(fitted_pars), converged,
+                       time_stop - time_start, model, minimizer, minimizer_info)
+    # keep the best fit hologram for fitted_holo on the data we fit, but not
+    # the data itself
+    fitted_holo = coster._calc(fitted_pars)
+    if np.isfinite(fitted_holo).all():
+        result._fitted_holo = (weakref.ref(coster.schema), fitted_scatterer,
+                               result.alpha, fitted_holo)
+    return result
 
 
 class FitResult(HoloPyObject):
@@ -133,8 +152,20 @@ class FitResult(HoloPyObject):
         return self.model.get_alpha(self.parameters)
 
     def fitted_holo(self, schema):
+        # fit leaves the hologram it computed for the data it was given
+        computed = getattr(self, '_fitted_holo', None)
+        if (computed is not None and computed[0]() is schema and
+            computed[1] is self.scatterer and computed[2] == self.alpha):
+            return computed[3].copy()
         return self.model.theory(self.scatterer, schema, self.alpha)
 
+    def __getstate__(self):
+        # the hologram from fit is only a shortcut (and holds a weakref, which
+        # cannot be pickled), so leave it out of copies
+        state = self.__dict__.copy()
+        state.pop('_fitted_holo', None)
+        return state
+
     def summary(self):
         """
         Put just the essential components of a fit result in a dictionary
@@ -193,8 +224,26 @@ def rsq(fit, data):
     return float(1 - ((data - fit)**2).sum()/((data - data.mean())**2).sum())
 
 class CostComputer(HoloPyObject):
-    def __init__(self, data, model, random_subset=None):
+    """
+    Residuals and goodness of fit of a model to some data
+
+    Parameters
+    ----------
+    data : :class:`~holopy.core.marray.Marray` object
+        The data to fit
+    model : :class:`~holopy.fitting.model.Model` object
+        The model to compare to the data
+    random_subset : float (optional)
+        Compare only a randomly selected fraction of the data points in data
+    cache_size : int (optional)
+        Number of recently computed holograms to keep, so that evaluating the
+        model again at exactly the same parameters (as fit does for chisq and
+        rsq at the best fit) does not recompute them.  0 disables caching.
+    """
+    def __init__(self, data, model, random_subset=None, cache_size=4):
         self.model = model
+        self.cache_size = cache_size
+        self._calc_cache = LRUCache(cache_size)
 
         schema = data
 
@@ -217,6 +266,15 @@ class CostComputer(HoloPyObject):
 
 
     def _calc(self, pars):
+        try:
+            key = tuple(sorted(pars.items()))
+            hash(key)
+        except TypeError:
+            return self._compute(pars)
+        return self._calc_cache.get_or_compute(key,
+                                               lambda: self._compute(pars))
+
+    def _compute(self, pars):
         s = self.model.scatterer.make_from(pars)
 
         valid = True
@@ -233,6 +291,60 @@ class CostComputer(HoloPyObject):
     def flattened_difference(self, pars):
         return (self._calc(pars) -  self.data).ravel()
 
+    @property
+    def jacobian_available(self):
+        """
+        True if the model's theory can compute derivatives of its holograms
+        with respect to all of the fit parameters (see :meth:`jacobian`)
+        """
+        if getattr(self, '_jacobian_available', None) is None:
+            self._jacobian_available = self._check_jacobian()
+        return self._jacobian_available
+
+    def jacobian(self, pars):
+        """
+        Derivatives of flattened_difference with respect to each of the model's
+        parameters
+
+        Returns
+        -------
+        jacobian : ndarray (n_parameters, n_points)
+        """
+        derivatives = self._theory_jacobian(pars)
+        return np.vstack([np.ravel(derivatives[self._jacobian_key(par)])
+                          for par in self.model.parameters])
+
+    def _theory_jacobian(self, pars):
+        theory = self.model.theory
+        s = self.model.scatterer.make_from(pars)
+        holo, derivatives = theory.im_self.calc_holo_jacobian(
+            s, self.schema, scaling=self.model.get_alpha(pars))
+        return derivatives
+
+    def _jacobian_key(self, par):
+        if par is getattr(self.model, 'alpha', None):
+            return 'scaling'
+        return par.name
+
+    def _check_jacobian(self):
+        # Analytical derivatives are available if the model computes holograms
+        # with a theory that can also compute their derivatives, and fit
+        # parameters map directly onto the scatterer's parameters
+        theory = self.model.theory
+        if (getattr(theory, '__name__', None) != 'calc_holo' or
+            not hasattr(getattr(theory, 'im_self', None),
+                        'calc_holo_jacobian')):
+            return False
+        scatterer = self.model.scatterer
+        if not isinstance(scatterer, ParameterizedObject) or scatterer.ties:
+            return False
+        try:
+            derivatives = self._theory_jacobian(self.model.guess_dict)
+        except TheoryNotCompatibleError:
+            return False
+        return all(self._jacobian_key(par) in derivatives
+                   for par in self.model.parameters)
+
     def rsq(self, pars):
         return rsq(self._calc(pars), self.data)
 
@@ -24,18 +24,27 @@ of third party minimizers.
 
 from __future__ import division
 
+import os
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
 import numpy as np
 from ..core.holopy_object import HoloPyObject
 from .errors import ParameterSpecificationError, MinimizerConvergenceFailed
 from ..scattering.errors import ScattererDefinitionError
 from .third_party import nmpfit
+try:
+    from scipy.optimize import least_squares
+except ImportError:
+    # least_squares is new in scipy 0.17
+    least_squares = None
 
 
 class Minimizer(HoloPyObject):
     """
     Common interface to all minimizers holopy supports
     """
-    def minimize(self, parameters, cost_func):
+    def minimize(self, parameters, cost_func, jacobian=None):
         """
         Find the best solution to an optimization problem
 
@@ -46,6 +55,13 @@ class Minimizer(HoloPyObject):
         cost_func : function
             A function taking parameters as arguments that returns the residual
             for the minimization problem
+        jacobian : function (optional)
+            A function taking parameters as arguments that returns the
+            derivatives of the residual with respect to each parameter (in the
+            order of parameters, unscaled) as an array of shape
+            (len(parameters), len(residual)).  Minimizers that can use
+            derivatives will use it instead of finite differences, others
+            ignore it.
         """
         raise NotImplementedError() # pragma: nocover
 
@@ -84,27 +100,49 @@ class Nmpfit(Minimizer):
         nmpfit documentation.
     maxiter: int
         Maximum number of Levenberg-Marquardt iterations to be performed.
+    use_jacobian: Boolean
+        If True, use analytical derivatives of the residuals when they are
+        available (see :meth:`minimize`) instead of finite differences.
+    executor: None, 'threads', 'processes', or pool
+        How to evaluate the residuals for the columns of a finite difference
+        jacobian, which are independent of each other.  None evaluates them
+        one after another. 'threads' evaluates them concurrently in a thread
+        pool, which helps for theories that release the GIL while they
+        compute. 'processes' evaluates them in a pool of worker processes
+        started for each fit, each of which keeps its own copy of the data and
+        model, so only parameters and residuals are passed back and forth.
+        Anything else with a map method (such as a
+        :class:`multiprocessing.pool.ThreadPool`) is used as is.
+    n_workers: int
+        Number of threads or processes to use for a 'threads' or 'processes'
+        executor.  If None, the HOLOPY_NUM_THREADS environment variable is
+        used if set, otherwise the number of cpus.
 
     Notes
     -----
 
     See nmpfit documentation for further details. Not all functionalities of
-    nmpfit are implemented here: in particular, we do not allow analytical
-    derivatives of the residual function, which is impractical and/or
-    impossible to calculate for holograms. If you want to weight the residuals,
-    you need to supply a custom residual function.
+    nmpfit are implemented here. Analytical derivatives are used only when the
+    model can supply them (currently single spheres with Mie theory fit to
+    images), otherwise nmpfit computes derivatives by finite differences. If
+    you want to weight the residuals, you need to supply a custom residual
+    function.
 
     """
     def __init__(self, quiet = False, ftol = 1e-10, xtol = 1e-10, gtol = 1e-10,
-                 damp = 0, maxiter = 100):
+                 damp = 0, maxiter = 100, use_jacobian = True, executor = None,
+                 n_workers = None):
         self.ftol = ftol
         self.xtol = xtol
         self.gtol = gtol
         self.damp = 0
         self.maxiter = maxiter
         self.quiet = quiet
+        self.use_jacobian = use_jacobian
+        self.executor = executor
+        self.n_workers = n_workers
 
-    def minimize(self, parameters, cost_func, debug = False):
+    def minimize(self, parameters, cost_func, debug = False, jacobian = None):
         # marshall the paramters into a dict of the form nmpfit wants
         nmp_pars = []
         for par in parameters:
@@ -135,14 +173,47 @@ class Nmpfit(Minimizer):
                                                       " nmpfit")
             nmp_pars.append(d)
 
+        use_jacobian = (self.use_jacobian and jacobian is not None and
+                        self.damp == 0)
+        # nmpfit asks for derivatives at the point it last evaluated the
+        # residual at, so hang on to that rather than recomputing it
+        last = {}
+
         def resid_wrapper(p, fjac=None):
             status = 0
-            return [status, cost_func(self.pars_from_minimizer(parameters, p))]
+            pars = self.pars_from_minimizer(parameters, p)
+            if fjac is None or not np.array_equal(last.get('p'), p):
+                last['p'] = np.array(p)
+                last['resid'] = cost_func(pars)
+            if fjac is None:
+                return [status, last['resid']]
+            # nmpfit wants derivatives of the model (minus our residual)
+            # with respect to the scaled parameters
+            scales = np.array([par.unscale(1.) for par in parameters])
+            pderiv = -jacobian(pars) * scales[:, np.newaxis]
+            return [status, last['resid'], pderiv.T]
+
+        mapfunct = None
+        if self.executor is not None and not use_jacobian:
+            pool, evaluate = _evaluation_pool(self.executor, self.n_workers,
+                                              cost_func)
+
+            def mapfunct(ps):
+                pars = [self.pars_from_minimizer(parameters, p) for p in ps]
+                return [[0, resid] for resid in pool.map(evaluate, pars)]
 
         # now fit it
-        fitresult = nmpfit.mpfit(resid_wrapper, parinfo=nmp_pars, ftol = self.ftol,
-                                 xtol = self.xtol, gtol = self.gtol, damp = self.damp,
-                                 maxiter = self.maxiter, quiet = self.quiet)
+        try:
+            fitresult = nmpfit.mpfit(resid_wrapper, parinfo=nmp_pars,
+                                     ftol = self.ftol, xtol = self.xtol,
+                                     gtol = self.gtol, damp = self.damp,
+                                     maxiter = self.maxiter, quiet = self.quiet,
+                                     autoderivative = int(not use_jacobian),
+                                     mapfunct = mapfunct)
+        finally:
+            if mapfunct is not None and self.executor in ('threads',
+                                                          'processes'):
+                pool.terminate()
 
         result_pars = self.pars_from_minimizer(parameters, fitresult.params)
 
@@ -156,6 +227,183 @@ class Nmpfit(Minimizer):
 
     minimize.__doc__ = Minimizer.minimize.__doc__
 
+
+def _evaluation_pool(executor, n_workers, cost_func):
+    # Something with a map method, and the function to map over parameter
+    # dicts with it to get residuals.  'threads' gets a pool of its own rather
+    # than one of the theories' shared pools: a theory splitting its points
+    # across threads maps into its pool from inside our workers, which would
+    # deadlock if they were the same pool.
+    if executor in ('threads', 'processes'):
+        if n_workers is None:
+            n_workers = os.environ.get('HOLOPY_NUM_THREADS',
+                                       multiprocessing.cpu_count())
+        n_workers = max(int(n_workers), 1)
+    if executor == 'threads':
+        return ThreadPool(n_workers), cost_func
+    if executor == 'processes':
+        pool = multiprocessing.Pool(n_workers, _set_worker_cost, (cost_func, ))
+        return pool, _worker_cost
+    return executor, cost_func
+
+# cost function of a worker process in a 'processes' pool
+_worker_cost_func = None
+
+def _set_worker_cost(cost_func):
+    global _worker_cost_func
+    _worker_cost_func = cost_func
+
+def _worker_cost(pars):
+    return _worker_cost_func(pars)
+
+class LeastSquares(Minimizer):
+    """
+    Trust region least squares minimizer, using
+    :func:`scipy.optimize.least_squares`.
+
+    Parameters are varied in units of their scale_factor, and their limits are
+    enforced as bounds by the minimizer rather than by clipping steps.
+
+    Parameters
+    ----------
+    method: 'trf' or 'dogbox'
+        Algorithm to use, see :func:`scipy.optimize.least_squares`.
+    ftol: float
+        Converges if the relative reduction in the cost in a step is <= ftol
+    xtol: float
+        Converges if the relative size of a step is <= xtol
+    gtol: float
+        Converges if the (scaled, projected) gradient is <= gtol
+    max_nfev: int
+        Maximum number of residual evaluations by the minimizer, not counting
+        those for finite difference jacobians.  If None, scipy's default is
+        used.
+    x_scale: float, array, or 'jac'
+        Characteristic scale of each parameter in units of its scale_factor,
+        so the default of 1 uses the scale_factors themselves.  'jac' scales
+        by the inverse norms of the jacobian columns instead.
+    quiet: Boolean
+        If True, suppress output on minimizer convergence.
+    use_jacobian: Boolean
+        If True, use analytical derivatives of the residuals when they are
+        available (see :meth:`minimize`) instead of finite differences.
+    executor: None, 'threads', 'processes', or pool
+        How to evaluate the residuals for the columns of a finite difference
+        jacobian, as for :class:`Nmpfit`.
+    n_workers: int
+        Number of threads or processes to use for a 'threads' or 'processes'
+        executor, as for :class:`Nmpfit`.
+
+    Notes
+    -----
+    The details returned by :meth:`minimize` are scipy's
+    :class:`~scipy.optimize.OptimizeResult`, with an additional
+    cost_evaluations attribute counting every evaluation of the residual,
+    including those used for finite difference jacobians (which nfev does
+    not count).
+    """
+    def __init__(self, method = 'trf', ftol = 1e-8, xtol = 1e-8, gtol = 1e-8,
+                 max_nfev = None, x_scale = 1., quiet = False,
+                 use_jacobian = True, executor = None, n_workers = None):
+        self.method = method
+        self.ftol = ftol
+        self.xtol = xtol
+        self.gtol = gtol
+        self.max_nfev = max_nfev
+        self.x_scale = x_scale
+        self.quiet = quiet
+        self.use_jacobian = use_jacobian
+        self.executor = executor
+        self.n_workers = n_workers
+        if least_squares is None:
+            raise ImportError("LeastSquares requires scipy 0.17 or newer")
+
+    def minimize(self, parameters, cost_func, jacobian = None):
+        guess = []
+        lb = []
+        ub = []
+        for par in parameters:
+            if par.guess is None:
+                raise ParameterSpecificationError("least_squares requires an "
+                                                  "initial guess for all "
+                                                  "parameters")
+            guess.append(par.scale(par.guess))
+            limit = par.limit
+            if limit is None:
+                limit = [None, None]
+            lb.append(-np.inf if limit[0] is None else par.scale(limit[0]))
+            ub.append(np.inf if limit[1] is None else par.scale(limit[1]))
+        lb = np.array(lb, dtype=float)
+        ub = np.array(ub, dtype=float)
+        scales = np.array([par.unscale(1.) for par in parameters])
+
+        # least_squares asks for derivatives at the point it last evaluated
+        # the residual at, so hang on to that rather than recomputing it
+        last = {'evaluations': 0}
+
+        def resid_wrapper(p):
+            if not np.array_equal(last.get('p'), p):
+                last['evaluations'] += 1
+                last['p'] = np.array(p)
+                last['resid'] = cost_func(self.pars_from_minimizer(parameters,
+                                                                   p))
+            return last['resid']
+
+        pool = None
+        if self.use_jacobian and jacobian is not None:
+            def jac(p):
+                pars = self.pars_from_minimizer(parameters, p)
+                return (jacobian(pars) * scales[:, np.newaxis]).T
+        elif self.executor is not None:
+            pool, evaluate = _evaluation_pool(self.executor, self.n_workers,
+                                              cost_func)
+
+            def jac(p):
+                resid = resid_wrapper(p)
+                steps = _forward_steps(p, lb, ub)
+                points = [p + step for step in np.diag(steps)]
+                pars = [self.pars_from_minimizer(parameters, x)
+                        for x in points]
+                resids = pool.map(evaluate, pars)
+                last['evaluations'] += len(resids)
+                return np.column_stack([(r - resid) / step
+                                        for r, step in zip(resids, steps)])
+        else:
+            jac = '2-point'
+
+        try:
+            details = least_squares(resid_wrapper, guess, jac = jac,
+                                    bounds = (lb, ub), method = self.method,
+                                    ftol = self.ftol, xtol = self.xtol,
+                                    gtol = self.gtol, x_scale = self.x_scale,
+                                    max_nfev = self.max_nfev,
+                                    verbose = int(not self.quiet))
+        finally:
+            if pool is not None and self.executor in ('threads',
+                                                      'processes'):
+                pool.terminate()
+        details.cost_evaluations = last['evaluations']
+
+        result_pars = self.pars_from_minimizer(parameters, details.x)
+
+        if details.status == 0:
+            raise MinimizerConvergenceFailed(result_pars, details)
+
+        return result_pars, details
+
+    minimize.__doc__ = Minimizer.minimize.__doc__
+
+def _forward_steps(p, lb, ub):
+    # forward difference steps of the size least_squares uses for '2-point'
+    # derivatives, backwards where a forward step would leave the bounds
+    steps = (np.sqrt(np.finfo(float).eps) * np.where(p >= 0, 1., -1.) *
+             np.maximum(1., np.abs(p)))
+    backward = (p + steps > ub) | (p + steps < lb)
+    steps = np.where(backward & (p - steps >= lb) & (p - steps <= ub),
+                     -steps, steps)
+    # make the steps exactly representable
+    return (p + steps) - p
+
 class OpenOpt(Minimizer):
     def __init__(self, algorithm = 'ralg', quiet = False, plot = False):
         self.algorithm = algorithm
@@ -173,7 +421,8 @@ class OpenOpt(Minimizer):
         elif algorithm in openopt_nllsq:
             self.problem_type = openopt.NLLSP
 
-    def minimize(self, parameters, cost_func):
+    def minimize(self, parameters, cost_func, jacobian=None):
+        # openopt estimates its own derivatives, so jacobian is not used
         lb = []
         ub = []
         for p in parameters:
@@ -65,22 +65,48 @@ class Parametrization(HoloPyObject):
 
     def make_from(self, parameters):
         # parameters is an ordered dictionary
-        for_schema = {}
-        for arg in inspect.getargspec(self.make_scatterer).args:
-            if (arg + '.real') in parameters and (arg + '.imag') in parameters:
-                for_schema[arg] = (parameters[arg + '.real'] + 1.j *
-                                   parameters[arg + '.imag'])
-            elif (arg + '.real') in self._fixed_params and \
-                    (arg + '.imag') in parameters:
-                for_schema[arg] = (self._fixed_params[arg + '.real'] + 1.j *
-                                   parameters[arg + '.imag'])
-            elif (arg + '.real') in parameters and (arg + '.imag') in \
-                    self._fixed_params:
-                for_schema[arg] = (parameters[arg + '.real'] + 1.j *
-                                   self._fixed_params[arg + '.imag'])
-            else:
-                for_schema[arg] = parameters[arg]
-        return self.make_scatterer(**for_schema)
+        getters, make_scatterer = self._compiled
+        return make_scatterer([get(parameters) for get in getters])
+
+    def __getstate__(self):
+        # the compiled mapping is made of closures, which cannot be pickled
+        # (or usefully copied), it is rebuilt on first use
+        state = self.__dict__.copy()
+        state.pop('_compiled_from', None)
+        return state
+
+    def _compiled_for(self):
+        # what the compiled mapping depends on, to notice if it changes
+        return (self.make_scatterer, [par.name for par in self.parameters],
+                sorted(self._fixed_params.items()))
+
+    @property
+    def _compiled(self):
+        # Work out once where make_scatterer's arguments come from, so making
+        # a scatterer for each step of a fit is just a few lookups
+        source = self._compiled_for()
+        compiled = getattr(self, '_compiled_from', None)
+        if compiled is None or compiled[0] != source:
+            free = set(par.name for par in self.parameters)
+            fixed = self._fixed_params
+            args = inspect.getargspec(self.make_scatterer).args
+            getters = []
+            for arg in args:
+                real, imag = arg + '.real', arg + '.imag'
+                if real in free and imag in free:
+                    get = _complex(_lookup(real), _lookup(imag))
+                elif real in fixed and imag in free:
+                    get = _complex(_constant(fixed[real]), _lookup(imag))
+                elif real in free and imag in fixed:
+                    get = _complex(_lookup(real), _constant(fixed[imag]))
+                else:
+                    get = _lookup(arg)
+                getters.append(get)
+
+            def make_scatterer(values):
+                return self.make_scatterer(**dict(zip(args, values)))
+            self._compiled_from = source, (getters, make_scatterer)
+        return self._compiled_from[1]
 
     @property
     def guess(self):
@@ -160,39 +186,77 @@ class ParameterizedObject(Parametrization):
         return self.make_from(pars)
 
     def make_from(self, parameters):
-        obj_pars = {}
-
-        for name, par in self.obj.parameters.iteritems():
-            # if this par is in a tie group, we need to work with its tie group
-            # name since that will be what is in parameters
-            for groupname, group in self.ties.iteritems():
-                if name in group:
-                    name = groupname
-
-            def get_val(par, name):
-                if par.fixed:
-                    return par.limit
+        getters, build = self._compiled
+        return build([get(parameters) for get in getters])
+
+    def _compiled_for(self):
+        return (_Identity(self.obj),
+                sorted((name, list(group))
+                       for name, group in self.ties.iteritems()))
+
+    @property
+    def _compiled(self):
+        # Work out once where each of the object's parameters comes from and
+        # how to build the object from them, so making a scatterer for each
+        # step of a fit does not need to look at parameter names
+        source = self._compiled_for()
+        compiled = getattr(self, '_compiled_from', None)
+        if compiled is None or compiled[0] != source:
+            obj_pars = self.obj.parameters
+            keys = sorted(obj_pars.keys())
+            getters = []
+            for name in keys:
+                par = obj_pars[name]
+                # if this par is in a tie group, we need to work with its tie
+                # group name since that will be what is in parameters
+                for groupname, group in self.ties.iteritems():
+                    if name in group:
+                        name = groupname
+
+                def get_val(par, name):
+                    if par.fixed:
+                        return _constant(par.limit)
+                    else:
+                        return _lookup(name)
+
+                if isinstance(par, ComplexParameter):
+                    get = _complex(get_val(par.real, name+'.real'),
+                                   get_val(par.imag, name+'.imag'))
+                elif isinstance(par, Parameter):
+                    get = get_val(par, name)
                 else:
-                    return parameters[name]
+                    get = _constant(par)
+                getters.append(get)
 
-            if isinstance(par, ComplexParameter):
-                par_val = (get_val(par.real, name+'.real') +
-                           1j * get_val(par.imag, name+'.imag'))
-            elif isinstance(par, Parameter):
-                par_val = get_val(par, name)
+            build = getattr(self.obj, '_parameter_builder', None)
+            if build is None:
+                def build(values):
+                    return self.obj.from_parameters(dict(zip(keys, values)))
             else:
-                par_val = par
+                build = build(keys)
+            self._compiled_from = source, (getters, build)
+        return self._compiled_from[1]
 
+class _Identity(object):
+    # compares equal only to a wrapper of the same object, for objects whose
+    # own equality is expensive or too loose
+    def __init__(self, obj):
+        self.obj = obj
 
-            if name in self.ties:
-                for tied_name in self.ties[name]:
-                    obj_pars[tied_name] = par_val
-            else:
-                obj_pars[name] = par_val
+    def __eq__(self, other):
+        return isinstance(other, _Identity) and other.obj is self.obj
+
+    def __ne__(self, other):
+        return not self == other
 
+def _lookup(name):
+    return lambda parameters: parameters[name]
 
+def _constant(value):
+    return lambda parameters: value
 
-        return self.obj.from_parameters(obj_pars)
+def _complex(real, imag):
+    return lambda parameters: real(parameters) + 1j * imag(parameters)
 
 def limit_overlaps(fraction=.1):
     """
@@ -431,3 +431,60 @@ def test_layered():
     model = Model(guess, Mie.calc_holo)
     res = fit(model, hs)
     assert_allclose(res.scatterer.t, (1, 1), rtol = 1e-12)
+
+@attr('fast')
+def test_cost_cache():
+    sch = ImageSchema(30, .1, Optics(.66, 1.33, (1, 0)))
+    holo = Mie.calc_holo(Sphere(n=1.59, r=.5, center=(1.5, 1.5, 10)),
+                         sch, scaling=.7)
+    s = Sphere(center=(par(1.55, [1, 2]), par(1.45, [1, 2]), 10), r=.5,
+               n=1.59)
+    model = Model(s, Mie.calc_holo, alpha=par(.6, [.1, 1]))
+    guess = model.guess_dict
+
+    coster = CostComputer(holo, model)
+    uncached = CostComputer(holo, model, cache_size=0)
+    assert_equal(coster.flattened_difference(guess),
+                 uncached.flattened_difference(guess))
+    assert_equal(coster.chisq(guess), uncached.chisq(guess))
+    assert_equal(coster.rsq(guess), uncached.rsq(guess))
+    assert_equal(coster._calc_cache.info().hits, 2)
+    assert_equal(uncached._calc_cache.info().currsize, 0)
+
+    result = fit(model, holo)
+    fitted = result.fitted_holo(holo)
+    assert_allclose(fitted, Mie.calc_holo(result.scatterer, holo,
+                                          result.alpha))
+    assert fitted is not result.fitted_holo(holo)
+
+@attr('fast')
+def test_fit_analytic_jacobian():
+    sch = ImageSchema(30, .1, Optics(.66, 1.33, (1, 0)))
+    holo = Mie.calc_holo(Sphere(n=1.59+1e-4j, r=.5, center=(1.5, 1.5, 10)),
+                         sch, scaling=.7)
+
+    s = Sphere(center=(par(1.55, [1, 2]), par(1.45, [1, 2]), par(10.3, [5, 15])),
+               r=par(.52, [.1, 1]), n=ComplexParameter(par(1.57, [1.4, 1.7]), 1e-4))
+    model = Model(s, Mie.calc_holo, alpha=par(.6, [.1, 1]))
+    coster = CostComputer(holo, model)
+    assert coster.jacobian_available
+
+    # compare to forward differences of the residuals
+    guess = model.guess_dict
+    jacobian = coster.jacobian(guess)
+    base = coster.flattened_difference(guess)
+    for par_, derivative in zip(model.parameters, jacobian):
+        step = 1e-6 * guess[par_.name]
+        shifted = dict(guess)
+        shifted[par_.name] += step
+        fd = (coster.flattened_difference(shifted) - base) / step
+        assert_allclose(derivative, fd, atol=1e-4*abs(fd).max())
+
+    result = fit(model, holo)
+    assert_allclose(result.scatterer.center, (1.5, 1.5, 10), rtol=1e-6)
+    assert_allclose(result.scatterer.r, .5, rtol=1e-6)
+    assert_allclose(result.parameters['alpha'], .7, rtol=1e-6)
+
+    # theories without analytical derivatives fall back to finite differences
+    model = Model(s, Multisphere.calc_holo, alpha=par(.6, [.1, 1]))
+    assert not CostComputer(holo, model).jacobian_available
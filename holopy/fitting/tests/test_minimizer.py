@@ -18,6 +18,7 @@
 from __future__ import division
 
 import warnings
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
 
@@ -27,7 +28,7 @@ from ...scattering.scatterer import Sphere, Spheres
 from ...scattering.theory.mie import Mie
 from ...core import Optics, ImageSchema
 from .. import fit, Parameter, par, Model
-from ..minimizer import Nmpfit, OpenOpt
+from ..minimizer import Nmpfit, OpenOpt, LeastSquares
 from ..errors import ParameterSpecificationError, MinimizerConvergenceFailed
 from ...core.tests.common import assert_obj_close
 
@@ -81,6 +82,92 @@ def test_minimizer():
     assert_equal(parinfo[2]['limited'], [True, True])
     assert_obj_close(gold_dict, result2, context = 'minimized_parameters_with_parinfo')
 
+def test_minimizer_executor():
+    x = np.arange(-10, 10, .1)
+    y = 5.3*x**2 - 1.8*x + 3.4
+
+    def cost_func(pars):
+        return pars['a']*x**2 + pars['b']*x + pars['c'] - y
+
+    parameters = [Parameter(name='a', guess = 5, mpside = 2),
+                  Parameter(name='b', guess = -2, limit = [-4, 4.]),
+                  Parameter(name='c', guess = 3, limit = [0., 12.])]
+    gold, gold_details = Nmpfit().minimize(parameters, cost_func)
+
+    # evaluating the jacobian columns concurrently should not change anything
+    for executor in ['threads', 'processes', ThreadPool(2)]:
+        result, details = Nmpfit(executor=executor,
+                                 n_workers=2).minimize(parameters, cost_func)
+        assert_equal(result, gold)
+        assert_equal(details.nfev, gold_details.nfev)
+
+def test_threaded_fit_threaded_theory():
+    # the theory splits its points across threads inside the minimizer's
+    # worker threads, which must not share a pool with it
+    schema = ImageSchema(shape = 32, spacing = .1,
+                         optics = Optics(wavelen = .66, index = 1.33,
+                                         polarization = (1, 0)))
+    holo = Mie.calc_holo(Sphere(n = 1.59, r = .5, center = (1.6, 1.6, 10)),
+                         schema)
+    sphere = Sphere(n = 1.59, r = .5,
+                    center = (par(1.55, [1, 2]), par(1.65, [1, 2]), 10))
+    model = Model(sphere, Mie(n_threads = 2).calc_holo)
+    result = fit(model, holo, Nmpfit(executor = 'threads', n_workers = 2,
+                                     use_jacobian = False))
+    assert_allclose(result.scatterer.center, (1.6, 1.6, 10), rtol = 1e-6)
+
+    try:
+        minimizer = LeastSquares(quiet = True, executor = 'threads',
+                                 n_workers = 2, use_jacobian = False)
+    except ImportError:
+        raise SkipTest
+    result = fit(model, holo, minimizer)
+    assert_allclose(result.scatterer.center, (1.6, 1.6, 10), rtol = 1e-6)
+
+def test_least_squares():
+    x = np.arange(-10, 10, .1)
+    gold_dict = dict((('a', 5.3), ('b', -1.8), ('c', 3.4)))
+    y = 5.3*x**2 - 1.8*x + 3.4
+
+    def cost_func(pars):
+        return pars['a']*x**2 + pars['b']*x + pars['c'] - y
+
+    def jacobian(pars):
+        return np.array([x**2, x, np.ones_like(x)])
+
+    parameters = [Parameter(name='a', guess = 5),
+                  Parameter(name='b', guess = -2, limit = [-4, 4.]),
+                  Parameter(name='c', guess = 3, limit = [0., 12.])]
+    try:
+        minimizer = LeastSquares(quiet = True)
+    except ImportError:
+        raise SkipTest
+    gold, gold_details = minimizer.minimize(parameters, cost_func)
+    assert_obj_close(gold_dict, gold, context = 'least_squares_parameters')
+    assert_equal(gold_details.cost_evaluations,
+                 gold_details.nfev + 3 * gold_details.njev)
+
+    result, details = minimizer.minimize(parameters, cost_func,
+                                         jacobian = jacobian)
+    assert_obj_close(gold_dict, result, context = 'least_squares_jacobian')
+    assert_equal(details.cost_evaluations, details.nfev)
+
+    # parallel finite differences should find the same solution
+    for executor in ['threads', 'processes', ThreadPool(2)]:
+        result, details = LeastSquares(quiet = True, executor = executor,
+                                       n_workers = 2).minimize(parameters,
+                                                               cost_func)
+        assert_obj_close(gold, result, context = 'least_squares_executor')
+        assert_equal(details.cost_evaluations,
+                     details.nfev + 3 * details.njev)
+
+    with assert_raises(ParameterSpecificationError):
+        minimizer.minimize([Parameter(name = 'a')], cost_func)
+
+    with assert_raises(MinimizerConvergenceFailed):
+        LeastSquares(quiet = True, max_nfev = 1).minimize(parameters,
+                                                          cost_func)
+
 def test_basic_openopt():
     x = np.arange(-10, 10, .1)
     a = 5.3
@@ -18,13 +18,14 @@
 from __future__ import division
 
 import tempfile
+import pickle
 
 import numpy as np
 
 from nose.plugins.attrib import attr
 from numpy.testing import assert_equal
 from holopy.scattering.theory import Mie
-from holopy.scattering.scatterer import Sphere, Spheres, Scatterer
+from holopy.scattering.scatterer import Sphere, Spheres, SphereArray, Scatterer
 from holopy.fitting import fit, par, Model, ComplexParameter, Parametrization
 from holopy.core.tests.common import assert_obj_close, get_example_data
 from holopy.core.tests.common import assert_read_matches_write
@@ -111,6 +112,42 @@ def test_pullingoutguess():
     assert_equal(s.r, model.scatterer.guess.r)
     assert_equal(s.center, model.scatterer.guess.center)
 
+@attr('fast')
+def test_make_from():
+    r = par(.5e-6)
+    n = ComplexParameter(par(1.59), 1e-4)
+    clusters = [Spheres([Sphere(n = n, r = r, center = [10e-6, 10e-6, par(20e-6)]),
+                         Sphere(n = 1.58, r = r, center = [9e-6, 11e-6, 21e-6])]),
+                SphereArray([n, 1.58], r, [[10e-6, 10e-6, par(20e-6)],
+                                           [9e-6, 11e-6, 21e-6]])]
+    for cluster in clusters:
+        model = Model(cluster, Mie.calc_holo)
+        assert_equal(sorted(p.name for p in model.parameters),
+                     ['0:Sphere.center[2]', '0:Sphere.n.real', 'Sphere.r'])
+        # the compiled mapping is reused, so make several scatterers
+        for scale in [1, 1.1]:
+            s = model.scatterer.make_from({'0:Sphere.n.real': 1.6 * scale,
+                                           'Sphere.r': 1e-6 * scale,
+                                           '0:Sphere.center[2]': 19e-6})
+            assert isinstance(s, cluster.__class__)
+            assert_equal(s.n, [1.6 * scale + 1e-4j, 1.58])
+            assert_equal(s.r, [1e-6 * scale, 1e-6 * scale])
+            assert_equal(s.centers, [[10e-6, 10e-6, 19e-6], [9e-6, 11e-6, 21e-6]])
+
+    # the compiled mapping is not pickled, but rebuilt when it is next needed
+    model = pickle.loads(pickle.dumps(model))
+    s = model.scatterer.make_from({'0:Sphere.n.real': 1.6, 'Sphere.r': 1e-6,
+                                   '0:Sphere.center[2]': 19e-6})
+    assert_equal(s.r, [1e-6, 1e-6])
+
+    # and rebuilt if the parametrization changes
+    model = Model(Sphere(n = par(1.59), r = par(.5e-6), center = [0, 0, 1e-5]),
+                  Mie.calc_holo)
+    model.scatterer.make_from({'n': 1.6, 'r': 1e-6})
+    model.scatterer.ties['n'] = ['n', 'r']
+    s = model.scatterer.make_from({'n': 1.6})
+    assert_equal((s.n, s.r), (1.6, 1.6))
+
 def test_io():
     model = Model(Sphere(par(1)), Mie.calc_holo)
     assert_read_matches_write(model)
@@ -21,6 +21,8 @@ Test fitting a hologram using nmpfit without any wrapping
 from __future__ import division
 
 import numpy as np
+from nose.plugins.attrib import attr
+from numpy.testing import assert_allclose
 
 from ...scattering.theory import Mie
 from ...scattering.scatterer import Sphere
@@ -109,3 +111,101 @@ def test_nmpfit():
 
     assert_obj_close(fitresult.params,
                                gold_single[np.array([0,2,3,4,5,6])], rtol=1e-3)
+
+# A problem with a known answer that does not need a scattering calculation.
+# The gold values are the results of the MINPACK-style loop implementations of
+# qrfac, qrsolv and lmpar that nmpfit used before it called LAPACK.
+np.random.seed(0)
+x_synthetic = np.linspace(0, 5, 400)
+y_synthetic = (3*np.exp(-x_synthetic/1.3) + .5*np.sin(2.1*x_synthetic + .3) +
+               .2 + np.random.normal(0, .01, 400))
+guess_synthetic = [1., 1., .3, 2., 0., 0.]
+limits_synthetic = [(0, 2.5), (.1, 5), (0, 1), (1, 3), (-1, 1), (-1, 1)]
+gold_synthetic = np.array([3.0098525954, 1.2847193648, 0.4979225841,
+                           2.107038945, 0.2799231364, 0.2062973558])
+gold_synthetic_fnorm = 0.0378687405
+gold_synthetic_limited = np.array([2.5, 1.4959467999, 0.5729562448,
+                                   2.0575682284, 0.453553577, 0.2326687866])
+gold_synthetic_limited_fnorm = 5.3151865099
+
+def residfunct_synthetic(p, fjac = None):
+    x = x_synthetic
+    model = p[0]*np.exp(-x/p[1]) + p[2]*np.sin(p[3]*x + p[4]) + p[5]
+    return([0, y_synthetic - model])
+
+@attr('fast')
+def test_nmpfit_synthetic():
+    fitresult = nmpfit.mpfit(residfunct_synthetic, guess_synthetic, quiet=1)
+    assert_allclose(fitresult.params, gold_synthetic, rtol=1e-6)
+    assert_allclose(fitresult.fnorm, gold_synthetic_fnorm, rtol=1e-6)
+
+    parinfo = [{'value': v, 'limited': [1, 1], 'limits': l}
+               for v, l in zip(guess_synthetic, limits_synthetic)]
+    fitresult = nmpfit.mpfit(residfunct_synthetic, parinfo=parinfo, quiet=1)
+    assert_allclose(fitresult.params, gold_synthetic_limited, rtol=1e-5)
+    assert_allclose(fitresult.fnorm, gold_synthetic_limited_fnorm, rtol=1e-6)
+
+def _fitter():
+    # an mpfit with no function, for calling its linear algebra routines
+    return nmpfit.mpfit(None, quiet=1)
+
+@attr('fast')
+def test_qrfac():
+    np.random.seed(1)
+    a = np.random.normal(size=(30, 5)) * np.logspace(0, 3, 5)
+    fvec = np.random.normal(size=30)
+    n = a.shape[1]
+    packed, ipvt, rdiag, acnorm = _fitter().qrfac(a.copy(), pivot=1)
+
+    assert_allclose(acnorm, np.sqrt((a**2).sum(0)))
+    # apply the householder transformations to a and fvec the way mpfit does,
+    # this should reduce a to r
+    qta = a[:, ipvt].copy()
+    qtf = fvec.copy()
+    for j in range(n):
+        u = packed[j:, ipvt[j]]
+        qta[j:] -= np.outer(u, np.dot(u, qta[j:])) / u[0]
+        qtf[j:] -= u * np.dot(u, qtf[j:]) / u[0]
+    r = np.triu(packed[:n, :n][:, ipvt], 1) + np.diag(rdiag)
+    assert_allclose(qta[:n], r, atol=1e-10*abs(a).max())
+    assert_allclose(qta[n:], 0, atol=1e-10*abs(a).max())
+    # q is orthogonal, so the least squares solution is unchanged
+    x = np.linalg.solve(r, qtf[:n])
+    assert_allclose(x, np.linalg.lstsq(a[:, ipvt], fvec, rcond=None)[0])
+    # columns are pivoted to make the diagonal decrease
+    assert np.all(np.diff(abs(rdiag)) <= 0)
+
+@attr('fast')
+def test_qrsolv_lmpar():
+    np.random.seed(2)
+    a = np.random.normal(size=(30, 5))
+    fvec = np.random.normal(size=30)
+    diag = np.random.uniform(.5, 2, 5)
+    n = a.shape[1]
+    fitter = _fitter()
+    packed, ipvt, rdiag, acnorm = fitter.qrfac(a.copy(), pivot=1)
+    q, r = np.linalg.qr(a[:, ipvt])
+    # match the signs of the rows of r to mpfit's
+    signs = np.sign(np.diag(r)) * np.sign(rdiag)
+    r = r * signs[:, np.newaxis]
+    qtb = np.dot(q.T, fvec) * signs
+
+    # qrsolv solves a*x = b, d*x = 0 in the least squares sense
+    r_out, x, sdiag = fitter.qrsolv(r.copy(), ipvt, diag, qtb, np.zeros(n))
+    stacked = np.vstack((a, np.diag(diag)))
+    assert_allclose(x, np.linalg.lstsq(stacked,
+                                       np.concatenate((fvec, np.zeros(n))),
+                                       rcond=None)[0])
+    assert_allclose(np.triu(r_out), r)
+    s = np.tril(r_out, -1) + np.diag(sdiag)
+    assert_allclose(np.dot(s, s.T), np.dot(stacked[:, ipvt].T, stacked[:, ipvt]))
+
+    # lmpar finds a step within the trust region of size delta
+    for delta in [1e-2, 1e-1]:
+        r_out, par, x, sdiag = fitter.lmpar(r.copy(), ipvt, diag, qtb, delta,
+                                            np.zeros(n), np.zeros(n), par=0.)
+        assert par > 0
+        assert abs(np.sqrt(((diag*x)**2).sum()) - delta) <= .1*delta
+        stacked = np.vstack((a, np.sqrt(par)*np.diag(diag)))
+        assert_allclose(x, np.linalg.lstsq(
+            stacked, np.concatenate((fvec, np.zeros(n))), rcond=None)[0])
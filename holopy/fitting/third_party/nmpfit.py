@@ -470,6 +470,7 @@ Perform Levenberg-Marquardt least-squares minimization, based on MINPACK-1.
 #numerixenv.check()
 
 import numpy
+import scipy.linalg
 import types
 
 
@@ -664,7 +665,8 @@ class mpfit(Serializable):
                                             damp=0., maxiter=200, factor=100., nprint=1,
                                             iterfunct='default', iterkw={}, nocovar=0,
                                             fastnorm=0, rescale=0, autoderivative=1, quiet=0,
-                                            diag=None, epsfcn=None, debug=0):
+                                            diag=None, epsfcn=None, debug=0,
+                                            mapfunct=None):
         """
 Inputs:
 fcn:
@@ -768,6 +770,18 @@ iterfunct:
         Set iterfunct=None if there is no user-defined routine and you don't
         want the internal default routine be called.
 
+mapfunct:
+        A function which evaluates the user-supplied function at several
+        parameter sets at once, for example in parallel.  It is used to
+        compute the finite difference derivatives, where each parameter
+        needs its own function evaluation.  It should be declared in the
+        following way:
+                def mapfunct(ps, [functkw keywords here])
+                # return a list of [status, f] for each p in ps
+
+        Default: None  The user-supplied function is called for each
+                                                parameter set in turn.
+
 maxiter:
         The maximum number of iterations to perform.  If the number is exceeded,
         then the status value is set to 5 and MPFIT returns.
@@ -919,6 +933,7 @@ e.g. mpfit.status, mpfit.errmsg, mpfit.params, npfit.niter, mpfit.covar.
         self.fastnorm = fastnorm
         self.nfev = 0
         self.damp = damp
+        self.mapfunct = mapfunct
         self.machar = machar(double=1)
         machep = self.machar.machep
 
@@ -1492,7 +1507,7 @@ e.g. mpfit.status, mpfit.errmsg, mpfit.params, npfit.niter, mpfit.covar.
         if (self.debug): print 'Entering call...'
         if (self.qanytied): x = self.tie(x, self.ptied)
         self.nfev = self.nfev + 1
-        if (fjac == None):
+        if is_none(fjac):
             [status, f] = fcn(x, fjac=fjac, **functkw)
 
             if (self.damp > 0):
@@ -1504,6 +1519,22 @@ e.g. mpfit.status, mpfit.errmsg, mpfit.params, npfit.niter, mpfit.covar.
         else:
             return(fcn(x, fjac=fjac, **functkw))
 
+    def call_many(self, fcn, xs, functkw):
+        ## Evaluate the function at each of xs, returning an iterator over
+        ## the [status, f] for each.  Without mapfunct the evaluations happen
+        ## one at a time as the iterator is consumed, as they would with call.
+        if is_none(self.mapfunct):
+            return (self.call(fcn, x, functkw) for x in xs)
+
+        if (self.debug): print 'Entering call_many...'
+        if (self.qanytied): xs = [self.tie(x, self.ptied) for x in xs]
+        self.nfev = self.nfev + len(xs)
+        results = self.mapfunct(xs, **functkw)
+        if (self.damp > 0):
+            results = [[status, numpy.tanh(f/self.damp)]
+                       for [status, f] in results]
+        return iter(results)
+
 
     def enorm(self, vec):
 
@@ -1524,9 +1555,7 @@ e.g. mpfit.status, mpfit.errmsg, mpfit.params, npfit.niter, mpfit.covar.
 
             ## This is hopefully a compromise between speed and robustness.
             ## Need to do this because of the possibility of over- or underflow.
-            mx = max(vec)
-            mn = min(vec)
-            mx = max(abs(mx), abs(mn))
+            mx = numpy.max(numpy.abs(vec))
             if mx == 0: return(vec[0]*0.)
             if mx > agiant or mx < adwarf:
                 ans = mx * numpy.sqrt(numpy.sum((vec/mx)*(vec/mx)))
@@ -1557,22 +1586,24 @@ e.g. mpfit.status, mpfit.errmsg, mpfit.params, npfit.niter, mpfit.covar.
             mperr = 0
             fjac = numpy.zeros(nall, numpy.float)
             numpy.put(fjac, ifree, 1.0)  ## Specify which parameters need derivatives
-            [status, fp] = self.call(fcn, xall, functkw, fjac=fjac)
+            ## The user function returns the derivatives as a third element
+            ## (python can't fill in fjac in place the way IDL does)
+            [status, fp, pderiv] = self.call(fcn, xall, functkw, fjac=fjac)
 
-            if len(fjac) != m*nall:
+            fjac = numpy.asarray(pderiv, dtype=numpy.float)
+            if fjac.size != m*nall:
                 print 'ERROR: Derivative matrix was not computed properly.'
                 return(None)
 
             ## This definition is c1onsistent with CURVEFIT
             ## Sign error found (thanks Jesus Fernandez <fernande@irm.chu-caen.fr>)
-            fjac.shape = [m,nall]
-            fjac = -fjac
+            fjac = -fjac.reshape(m, nall)
 
             ## Select only the free parameters
             if len(ifree) < nall:
                 fjac = fjac[:,ifree]
                 fjac.shape = [m, n]
-                return(fjac)
+            return(fjac)
 
         fjac = numpy.zeros([m, n], numpy.float)
 
@@ -1604,11 +1635,23 @@ e.g. mpfit.status, mpfit.errmsg, mpfit.params, npfit.niter, mpfit.covar.
             wh = (numpy.nonzero(mask))[0]
 
             if len(wh) > 0: numpy.put(h, wh, -numpy.take(h, wh))
-        ## Loop through parameters, computing the derivative for each
+        ## Find all of the points the function is needed at, one step (or
+        ## two, for two-sided derivatives) for each parameter.  The columns
+        ## are independent, so they can be evaluated together
+        xps = []
         for j in range(n):
             xp = xall.copy()
             xp[ifree[j]] = xp[ifree[j]] + h[j]
-            [status, fp] = self.call(fcn, xp, functkw)
+            xps.append(xp)
+            if abs(dside[j]) > 1:
+                xp = xp.copy()
+                xp[ifree[j]] = xall[ifree[j]] - h[j]
+                xps.append(xp)
+        results = self.call_many(fcn, xps, functkw)
+
+        ## Loop through parameters, computing the derivative for each
+        for j in range(n):
+            [status, fp] = next(results)
             if (status < 0): return(None)
 
             if abs(dside[j]) <= 1:
@@ -1618,10 +1661,8 @@ e.g. mpfit.status, mpfit.errmsg, mpfit.params, npfit.niter, mpfit.covar.
 
             else:
                 ## COMPUTE THE TWO-SIDED DERIVATIVE
-                xp[ifree[j]] = xall[ifree[j]] - h[j]
-
                 mperr = 0
-                [status, fm] = self.call(fcn, xp, functkw)
+                [status, fm] = next(results)
                 if (status < 0): return(None)
 
                 ## Note optimization fjac(0:*,j)
@@ -1756,77 +1797,48 @@ e.g. mpfit.status, mpfit.errmsg, mpfit.params, npfit.niter, mpfit.covar.
     def qrfac(self, a, pivot=0):
 
         if (self.debug): print 'Entering qrfac...'
-        machep = self.machar.machep
         sz = numpy.shape(a)
         m = sz[0]
         n = sz[1]
 
-        ## Compute the initial column norms and initialize arrays
-        acnorm = numpy.zeros(n, numpy.float)
-        for j in range(n):
-            acnorm[j] = self.enorm(a[:,j])
-        rdiag = acnorm.copy()
-        wa = rdiag.copy()
-        ipvt = numpy.arange(n)
+        ## Compute the initial column norms
+        acnorm = self.column_norms(a)
 
-        ## Reduce a to r with householder transformations
+        ## Reduce a to r with householder transformations, using LAPACK
+        ## (xGEQP3 with column pivoting, xGEQRF without)
+        if (pivot != 0):
+            [[h, tau], r, ipvt] = scipy.linalg.qr(a, mode='raw', pivoting=True,
+                                                  check_finite=False)
+        else:
+            [[h, tau], r] = scipy.linalg.qr(a, mode='raw', check_finite=False)
+            ipvt = numpy.arange(n)
+
+        ## Repack the result the way MPFIT expects it.  LAPACK stores the
+        ## jth reflector as (I - tau v vT) with v(j) = 1 in the strict lower
+        ## triangle of column j; MINPACK stores it as (I - u uT / u(j)) in
+        ## column ipvt(j) from row j down, which is the same reflector when
+        ## u = tau v.  The strict upper triangle holds r in both cases.
         minmn = min([m,n])
-        for j in range(minmn):
-            if (pivot != 0):
-                ## Bring the column of largest norm into the pivot position
-                rmax = max(rdiag[j:])
-                kmax = (numpy.nonzero(rdiag[j:] == rmax) )[0]
-                ct = len(kmax)
-                kmax = kmax + j
-                if ct > 0:
-                    kmax = kmax[0]
-
-                    ## Exchange rows via the pivot only.  Avoid actually exchanging
-                    ## the rows, in case there is lots of memory transfer.  The
-                    ## exchange occurs later, within the body of MPFIT, after the
-                    ## extraneous columns of the matrix have been shed.
-                    if kmax != j:
-                        temp = ipvt[j] ; ipvt[j] = ipvt[kmax] ; ipvt[kmax] = temp
-                        rdiag[kmax] = rdiag[j]
-                        wa[kmax] = wa[j]
-
-            ## Compute the householder transformation to reduce the jth
-            ## column of A to a multiple of the jth unit vector
-            lj = ipvt[j]
-            ajj = a[j:,lj]
-            ajnorm = self.enorm(ajj)
-            if ajnorm == 0: break
-            if a[j,j] < 0: ajnorm = -ajnorm
-
-            ajj = ajj / ajnorm
-            ajj[0] = ajj[0] + 1
-            ## *** Note optimization a(j:*,j)
-            a[j:,lj] = ajj
-
-            ## Apply the transformation to the remaining columns
-            ## and update the norms
-
-            ## NOTE to SELF: tried to optimize this by removing the loop,
-            ## but it actually got slower.  Reverted to "for" loop to keep
-            ## it simple.
-            if (j+1 < n):
-                for k in range(j+1, n):
-                    lk = ipvt[k]
-                    ajk = a[j:,lk]
-                    ## *** Note optimization a(j:*,lk)
-                    ## (corrected 20 Jul 2000)
-                    if a[j,lj] != 0:
-                        a[j:,lk] = ajk - ajj * numpy.sum(ajk*ajj)/a[j,lj]
-                        if ((pivot != 0) and (rdiag[k] != 0)):
-                            temp = a[j,lk]/rdiag[k]
-                            rdiag[k] = rdiag[k] * numpy.sqrt(max((1.-temp**2), 0.))
-                            temp = rdiag[k]/wa[k]
-                            if ((0.05*temp*temp) <= machep):
-                                rdiag[k] = self.enorm(a[j+1:,lk])
-                                wa[k] = rdiag[k]
-            rdiag[j] = -ajnorm
+        packed = numpy.triu(h)
+        packed[:,0:minmn] = packed[:,0:minmn] + (numpy.tril(h[:,0:minmn], -1) *
+                                                 tau[0:minmn])
+        rdiag = numpy.zeros(n, float)
+        rdiag[0:minmn] = numpy.diagonal(h)[0:minmn]
+        packed[numpy.arange(minmn), numpy.arange(minmn)] = tau[0:minmn]
+
+        ## Leave the columns where they were, ipvt says where they went
+        a = numpy.empty_like(packed)
+        a[:,ipvt] = packed
         return([a, ipvt, rdiag, acnorm])
 
+    def column_norms(self, a):
+        ## Euclidean norm of each column of a, as enorm would compute it
+        if (self.fastnorm):
+            return(numpy.sqrt(numpy.sum(a*a, 0)))
+        mx = numpy.max(numpy.abs(a), 0)
+        mx[mx == 0] = 1.
+        return(mx * numpy.sqrt(numpy.sum((a/mx)*(a/mx), 0)))
+
 
     #     Original FORTRAN documentation
     #     **********
@@ -1912,51 +1924,19 @@ e.g. mpfit.status, mpfit.errmsg, mpfit.params, npfit.niter, mpfit.covar.
         m = sz[0]
         n = sz[1]
 
-        ## copy r and (q transpose)*b to preserve input and initialize s.
-        ## in particular, save the diagonal elements of r in x.
+        ## Eliminate the diagonal matrix d by a QR factorization of r
+        ## stacked on top of (p transpose)*d*p.  The transformations
+        ## modify ((q transpose)*b,0), and what is left above the diagonal
+        ## is s.  This does with one LAPACK call what MINPACK does with a
+        ## givens rotation per element.
+        stacked = numpy.vstack((numpy.triu(r), numpy.diag(numpy.take(diag, ipvt))))
+        [q, s] = scipy.linalg.qr(stacked, mode='economic', check_finite=False)
+        wa = numpy.dot(numpy.transpose(q[0:n,:]), qtb)
+        sdiag = numpy.diagonal(s).copy()
 
-        for j in range(n):
-            r[j:n,j] = r[j,j:n]
-        x = numpy.diagonal(r)
-        wa = qtb.copy()
-
-        ## Eliminate the diagonal matrix d using a givens rotation
-        for j in range(n):
-            l = ipvt[j]
-            if (diag[l] == 0): break
-            sdiag[j:] = 0
-            sdiag[j] = diag[l]
-
-            ## The transformations to eliminate the row of d modify only a
-            ## single element of (q transpose)*b beyond the first n, which
-            ## is initially zero.
-
-            qtbpj = 0.
-            for k in range(j,n):
-                if (sdiag[k] == 0): break
-                if (abs(r[k,k]) < abs(sdiag[k])):
-                    cotan  = r[k,k]/sdiag[k]
-                    sine   = 0.5/numpy.sqrt(.25 + .25*cotan*cotan)
-                    cosine = sine*cotan
-                else:
-                    tang   = sdiag[k]/r[k,k]
-                    cosine = 0.5/numpy.sqrt(.25 + .25*tang*tang)
-                    sine   = cosine*tang
-
-                ## Compute the modified diagonal element of r and the
-                ## modified element of ((q transpose)*b,0).
-                r[k,k] = cosine*r[k,k] + sine*sdiag[k]
-                temp = cosine*wa[k] + sine*qtbpj
-                qtbpj = -sine*wa[k] + cosine*qtbpj
-                wa[k] = temp
-
-                ## Accumulate the transformation in the row of s
-                if (n > k+1):
-                    temp = cosine*r[k+1:n,k] + sine*sdiag[k+1:n]
-                    sdiag[k+1:n] = -sine*r[k+1:n,k] + cosine*sdiag[k+1:n]
-                    r[k+1:n,k] = temp
-            sdiag[j] = r[j,j]
-            r[j,j] = x[j]
+        ## Keep the full upper triangle of r and store the strict upper
+        ## triangle of s (transposed) in its strict lower triangle
+        r = numpy.triu(r) + numpy.tril(numpy.transpose(s), -1)
 
         ## Solve the triangular system for z.  If the system is singular
         ## then obtain a least squares solution
@@ -1967,15 +1947,11 @@ e.g. mpfit.status, mpfit.errmsg, mpfit.params, npfit.niter, mpfit.covar.
             wa[nsing:] = 0
 
         if (nsing >= 1):
-            wa[nsing-1] = wa[nsing-1]/sdiag[nsing-1] ## Degenerate case
-            ## *** Reverse loop ***
-            for j in range(nsing-2,-1,-1):
-                sum = numpy.sum(r[j+1:nsing,j]*wa[j+1:nsing])
-                wa[j] = (wa[j]-sum)/sdiag[j]
+            wa[0:nsing] = scipy.linalg.solve_triangular(
+                s[0:nsing,0:nsing], wa[0:nsing], check_finite=False)
 
         ## Permute the components of z back to components of x
-        from copy import copy
-        x = copy(x)
+        x = numpy.zeros(n, float)
         numpy.put(x, ipvt, wa)
         return(r, x, sdiag)
 
@@ -2092,12 +2068,9 @@ e.g. mpfit.status, mpfit.errmsg, mpfit.params, npfit.niter, mpfit.covar.
         if len(wh) > 0:
             nsing = wh[0]
             wa1[wh[0]:] = 0
-        if nsing > 1:
-            ## *** Reverse loop ***
-            for j in range(nsing-1,-1,-1):
-                wa1[j] = wa1[j]/r[j,j]
-                if (j-1 >= 0):
-                    wa1[0:j] = wa1[0:j] - r[0:j,j]*wa1[j]
+        if nsing >= 1:
+            wa1[0:nsing] = scipy.linalg.solve_triangular(
+                r[0:nsing,0:nsing], wa1[0:nsing], check_finite=False)
 
         ## Note: ipvt here is a permutation array
         numpy.put(x, ipvt, wa1)
@@ -2118,18 +2091,14 @@ e.g. mpfit.status, mpfit.errmsg, mpfit.params, npfit.niter, mpfit.covar.
         parl = 0.
         if nsing >= n:
             wa1 = numpy.take(diag, ipvt)*numpy.take(wa2, ipvt)/dxnorm
-            wa1[0] = wa1[0] / r[0,0] ## Degenerate case
-            for j in range(1,n):   ## Note "1" here, not zero
-                sum = numpy.sum(r[0:j,j]*wa1[0:j])
-                wa1[j] = (wa1[j] - sum)/r[j,j]
+            wa1 = scipy.linalg.solve_triangular(r, wa1, trans='T',
+                                                check_finite=False)
 
             temp = self.enorm(wa1)
             parl = ((fp/delta)/temp)/temp
 
         ## Calculate an upper bound, paru, for the zero of the function
-        for j in range(n):
-            sum = numpy.sum(r[0:j+1,j]*qtb[0:j+1])
-            wa1[j] = sum/diag[ipvt[j]]
+        wa1 = numpy.dot(numpy.transpose(numpy.triu(r)), qtb)/numpy.take(diag, ipvt)
         gnorm = self.enorm(wa1)
         paru = gnorm/delta
         if paru == 0: paru = dwarf/min([delta,0.1])
@@ -2162,10 +2131,11 @@ e.g. mpfit.status, mpfit.errmsg, mpfit.params, npfit.niter, mpfit.covar.
             ## Compute the newton correction
             wa1 = numpy.take(diag, ipvt)*numpy.take(wa2, ipvt)/dxnorm
 
-            for j in range(n-1):
-                wa1[j] = wa1[j]/sdiag[j]
-                wa1[j+1:n] = wa1[j+1:n] - r[j+1:n,j]*wa1[j]
-            wa1[n-1] = wa1[n-1]/sdiag[n-1] ## Degenerate case
+            ## Forward substitution with (s transpose), which qrsolv left
+            ## in the lower triangle of r and in sdiag
+            wa1 = scipy.linalg.solve_triangular(
+                numpy.tril(r, -1) + numpy.diag(sdiag), wa1, lower=True,
+                check_finite=False)
 
             temp = self.enorm(wa1)
             parc = ((fp/delta)/temp)/temp
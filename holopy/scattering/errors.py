@@ -98,3 +98,17 @@ class ConvergenceFailureMultisphere(Exception):
     def __str__(self):
         return ("Multisphere calculations failed to converge, this probably means "
                 "your scatterer is unphysical, or possibly just huge")
+
+class BatchCalculationError(Exception):
+    """
+    Raised when some of the calculations in a batch fail.  failures maps the
+    index of each failed calculation to the exception it raised.
+    """
+    def __init__(self, failures):
+        self.failures = failures
+        super(BatchCalculationError, self).__init__(failures)
+
+    def __str__(self):
+        return "{0} calculations failed:\n".format(len(self.failures)) + \
+            "\n".join("{0}: {1!r}".format(i, e) for i, e in
+                      sorted(self.failures.items()))
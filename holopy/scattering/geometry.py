@@ -28,7 +28,6 @@ from __future__ import division
 
 import numpy as np
 from numpy import sqrt
-from holopy.core.math import cartesian_distance
 from .scatterer import Sphere, Spheres
 
 def distances(cluster, gaponly=False):
@@ -52,15 +51,16 @@ def distances(cluster, gaponly=False):
     distances starting from any sphere of interest.
 
     """
-    num = len(cluster.centers)
-    dist = np.zeros([num,num])
-    for i in np.arange(0,num):
-        for j in np.arange(0,num):
-            dist[i,j] = cartesian_distance(cluster.centers[i,:],cluster.centers[j,:])
-            #modification to change center to center distances
-            #to gap distances if asked for
-            if gaponly==True and i!=j:
-                dist[i,j] = dist[i,j]-cluster.r[i]-cluster.r[j]
+    centers = cluster.centers
+    dist = np.sqrt(((centers[:, np.newaxis, :] -
+                     centers[np.newaxis, :, :])**2).sum(-1))
+    if gaponly==True:
+        #modification to change center to center distances
+        #to gap distances if asked for
+        r = np.asarray(cluster.r)
+        diagonal = np.diag(dist).copy()
+        dist = dist - r[:, np.newaxis] - r[np.newaxis, :]
+        dist[np.diag_indices_from(dist)] = diagonal
     return dist
 
 def angles(cluster, degrees=True):
@@ -82,17 +82,15 @@ def angles(cluster, degrees=True):
     for angles aba, and NAN's for "angles" aab.
 
     """
-    num = len(cluster.centers)
-    ang = np.zeros([num,num,num])
     dist = distances(cluster)
-    for i in np.arange(0,num):
-        for j in np.arange(0,num): #this particle is the center of the angle
-            for k in np.arange(0,num):
-                Adjacent1=dist[i,j]
-                Adjacent2=dist[j,k]
-                Opposite=dist[i,k]
-                #use the law of cosines to determine the angles from the distances
-                ang[i,j,k] = np.arccos((Adjacent1**2+Adjacent2**2-Opposite**2)/(2*Adjacent1*Adjacent2))
+    # ang[i,j,k] has particle j at the center of the angle
+    Adjacent1 = dist[:, :, np.newaxis]
+    Adjacent2 = dist[np.newaxis, :, :]
+    Opposite = dist[:, np.newaxis, :]
+    #use the law of cosines to determine the angles from the distances
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ang = np.arccos((Adjacent1**2+Adjacent2**2-Opposite**2) /
+                        (2*Adjacent1*Adjacent2))
     if degrees==True:
         ang=ang/np.pi*180.0
     return ang #ang[a,b,c] is the acute angle abc as used in geometry (be in the middle)
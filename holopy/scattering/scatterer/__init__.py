@@ -31,7 +31,7 @@ import scatterer
 
 from .sphere import Sphere
 from .composite import Scatterers
-from .spherecluster import Spheres
+from .spherecluster import Spheres, SphereArray
 from .janus import JanusSphere
 from .ellipsoid import Ellipsoid
 from .capsule import Capsule
@@ -84,32 +84,40 @@ class Scatterers(Scatterer):
 
     @classmethod
     def from_parameters(cls, parameters):
-        n_scatterers = len(set([p.split(':')[0] for p in parameters.keys()]))
-        collected = [{} for i in range(n_scatterers)]
+        keys = list(parameters.keys())
+        return cls._parameter_builder(keys)([parameters[key] for key in keys])
+
+    @classmethod
+    def _parameter_builder(cls, keys):
+        n_scatterers = len(set([p.split(':')[0] for p in keys]))
+        collected = [([], []) for i in range(n_scatterers)]
         types = [None] * n_scatterers
-        for key, val in parameters.iteritems():
+        for i, key in enumerate(keys):
             n, spec = key.split(':', 1)
             n = int(n)
             scat_type, par = spec.split('.', 1)
 
-            collected[n][par] = val
+            collected[n][0].append(i)
+            collected[n][1].append(par)
             if types[n]:
                 assert types[n] == scat_type
             else:
                 types[n] = scat_type
 
-        scatterers = []
         # pull in the scatterer package, this lets us grab scatterers by class
         # name
         # we have to do it here rather than at the top of the file because we
         # cannot import scatterer until it is done importing, which will not
         # happen until import of composite finishes.
         from .. import scatterer
-        for i, scat_type in enumerate(types):
-            scatterers.append(getattr(scatterer,
-                              scat_type).from_parameters(collected[i]))
+        builders = [(getattr(scatterer, scat_type)._parameter_builder(pars),
+                     indices)
+                    for scat_type, (indices, pars) in zip(types, collected)]
 
-        return cls(scatterers)
+        def build(values):
+            return cls([build_component([values[i] for i in indices])
+                        for build_component, indices in builders])
+        return build
 
     def _prettystr(self, level, indent="  "):
         '''
@@ -155,11 +163,33 @@ class Scatterers(Scatterer):
         return new
 
     def in_domain(self, points):
-        ind = self.scatterers[0].contains(points).astype('int')
-        for i, s in enumerate(self.scatterers[1:]):
-            contained = s.contains(points)
-            nz = np.nonzero(contained)
-            ind[nz] = i+1
+        points = np.asarray(points)
+        if points.ndim == 1:
+            points = points.reshape((1, 3))
+        ind = np.zeros(points.shape[:-1], dtype='int')
+        flat_points = points.reshape((-1, 3))
+        flat_ind = ind.reshape(-1)
+        # Sort the points along x so that the points in each component's
+        # bounding box can be found by bisection, and only those are tested
+        # against the component
+        order = np.argsort(flat_points[:, 0], kind='mergesort')
+        xs = flat_points[order, 0]
+        for i, s in enumerate(self.scatterers):
+            bounds = _bounds(s)
+            if bounds is None:
+                candidates = np.arange(len(flat_points))
+            else:
+                start, stop = (np.searchsorted(xs, bounds[0][0], 'left'),
+                               np.searchsorted(xs, bounds[0][1], 'right'))
+                candidates = order[start:stop]
+                yz = flat_points[candidates, 1:]
+                candidates = candidates[(yz[:, 0] >= bounds[1][0]) &
+                                        (yz[:, 0] <= bounds[1][1]) &
+                                        (yz[:, 1] >= bounds[2][0]) &
+                                        (yz[:, 1] <= bounds[2][1])]
+            contained = candidates[s.contains(flat_points[candidates])]
+            # the first two components both get domain 1
+            flat_ind[contained] = max(i, 1)
         return ind
 
     def index_at(self, point):
@@ -171,3 +201,10 @@ class Scatterers(Scatterer):
             return self.scatterers[self.in_domain(point)[0]].index_at(point)
         except TypeError:
             return None
+
+def _bounds(scatterer):
+    # bounding box of a scatterer, or None if it does not know one
+    try:
+        return scatterer.bounds
+    except (AttributeError, TypeError):
+        return None
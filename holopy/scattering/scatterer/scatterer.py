@@ -24,10 +24,11 @@ The abstract base class for all scattering objects
 from __future__ import division
 from collections import defaultdict
 
-from itertools import chain
+from itertools import chain, product
 from copy import copy
 
 import numpy as np
+from scipy import ndimage
 
 from ...core.holopy_object  import HoloPyObject
 from ...core.helpers import _ensure_array
@@ -80,7 +81,9 @@ class Scatterer(HoloPyObject):
         return self.in_domain(points) > 0
 
     def index_at(self, points, background = 0):
-        domains = self.in_domain(points)
+        return self._domains_to_index(self.in_domain(points), background)
+
+    def _domains_to_index(self, domains, background = 0):
         ns = _ensure_array(self.n)
         if np.iscomplex(np.append(self.n, background)).any():
             dtype = np.complex
@@ -105,13 +108,20 @@ class Scatterer(HoloPyObject):
         domain : np.ndarray (N)
            The domain of each point. Domain 0 means not in the particle
         """
-        points = np.array(points)
+        points = np.asarray(points)
         if points.ndim==1:
             points = points.reshape((1, 3))
         domains = np.zeros(points.shape[:-1], dtype='int')
-        # Indicators earlier in the list have priority
-        for i, ind in reversed(list(enumerate(self.indicators(points-self.location)))):
-            domains[np.nonzero(ind)] = i+1
+        # work through the points in chunks so that the temporary arrays the
+        # indicators make stay small however many points there are
+        flat_points = points.reshape((-1, 3))
+        flat_domains = domains.reshape(-1)
+        for start in range(0, len(flat_points), _chunk_points):
+            chunk = flat_points[start:start+_chunk_points] - self.location
+            block = flat_domains[start:start+_chunk_points]
+            # Indicators earlier in the list have priority
+            for i, ind in reversed(list(enumerate(self.indicators(chunk)))):
+                block[np.nonzero(ind)] = i+1
         return domains
 
     @property
@@ -145,13 +155,13 @@ class Scatterer(HoloPyObject):
         return [(c+b[0], c+b[1]) for c, b in zip(self.location,
                                                  self.indicators.bound)]
 
-    def _voxel_coords(self, spacing):
+    def _voxel_axes(self, spacing):
+        # coordinates of the voxel centers along x, y and z
         if np.isscalar(spacing) or len(spacing) == 1:
             spacing = np.ones(3) * spacing
 
-        grid = np.mgrid[[slice(b[0], b[1], s) for b, s in
-                            zip(self.bounds, spacing)]]
-        return np.concatenate([g[...,np.newaxis] for g in grid], 3)
+        return [np.mgrid[slice(b[0], b[1], s)] for b, s in
+                zip(self.bounds, spacing)]
 
     def voxelate(self, spacing, medium_index=0):
         """
@@ -170,10 +180,33 @@ class Scatterer(HoloPyObject):
         voxelation : np.ndarray
             An array with refractive index at every pixel
         """
-        return self.index_at(self._voxel_coords(spacing))
+        return self._domains_to_index(self.voxelate_domains(spacing),
+                                      medium_index)
 
     def voxelate_domains(self, spacing):
-        return self.in_domain(self._voxel_coords(spacing))
+        """
+        Represent a scatterer by the domain of each voxel
+
+        Parameters
+        ----------
+        spacing : float
+            The spacing between voxels in the returned voxelation
+
+        Returns
+        -------
+        voxelation : np.ndarray
+            The domain of every voxel (0 outside the scatterer)
+
+        Notes
+        -----
+        Only part of the voxels are tested against the scatterer's
+        indicators: the grid is split into cells two voxels across, cells whose
+        corners and center are all in the same domain (as are those of their
+        neighbors) are filled with that domain, and only the voxels in the
+        remaining cells, which are the ones near a surface, are tested
+        individually.  This finds any feature at least two voxels thick.
+        """
+        return _voxel_domains(self.in_domain, self._voxel_axes(spacing))
 
 
 class CenteredScatterer(Scatterer):
@@ -241,12 +274,33 @@ class CenteredScatterer(Scatterer):
         scatterer: Scatterer class
             A scatterer with the given parameter values
         """
+        keys = list(parameters.keys())
+        return cls._parameter_builder(keys)([parameters[key] for key in keys])
+
+    @classmethod
+    def _parameter_builder(cls, keys):
+        """
+        Compile a function making scatterers of this class from parameter values
+
+        Parameters
+        ----------
+        keys: list
+            Names of parameters, of the form used by Scatterer.parameters
+
+        Returns
+        -------
+        build: function (list -> Scatterer)
+            Makes a scatterer from a list of values, one for each of keys.  The
+            keys are only interpreted here, so build is cheap to call many
+            times (as a fit does).
+        """
         # This will need to be overriden for subclasses that do anything
         # complicated with parameters
 
         collected = defaultdict(dict)
 
-        for key, val in parameters.iteritems():
+        for i, key in enumerate(keys):
+            val = _Slot(i)
             tok = key.split('.', 1)
             if len(tok) > 1:
                 collected[tok[0]][tok[1]] = val
@@ -277,7 +331,9 @@ class CenteredScatterer(Scatterer):
         for key, val in collected_arrays.iteritems():
             built[key] = build(val)
 
-        return cls(**built)
+        def build_scatterer(values):
+            return cls(**_fill_slots(built, values))
+        return build_scatterer
 
 
 
@@ -315,6 +371,71 @@ class SingleScatterer(Scatterer):
     def z(self):
         return self.center[2]
 
+# Number of points to test against indicators at once
+_chunk_points = 2**16
+
+def _mesh_domains(in_domain, axes):
+    """
+    Domains of all the points of the grid with coordinates axes (along x, y
+    and z), computed a few planes of the grid at a time
+    """
+    shape = tuple(len(a) for a in axes)
+    domains = np.empty(shape, dtype='int')
+    slab = max(_chunk_points // max(shape[1]*shape[2], 1), 1)
+    for start in range(0, shape[0], slab):
+        x = axes[0][start:start+slab]
+        points = np.empty((len(x),) + shape[1:] + (3,))
+        points[..., 0] = x[:, np.newaxis, np.newaxis]
+        points[..., 1] = axes[1][:, np.newaxis]
+        points[..., 2] = axes[2]
+        domains[start:start+slab] = in_domain(points)
+    return domains
+
+def _voxel_domains(in_domain, axes):
+    """
+    Domains of all the points of the grid with coordinates axes (along x, y
+    and z), testing individual points only near surfaces
+
+    See Scatterer.voxelate_domains
+    """
+    shape = tuple(len(a) for a in axes)
+    if min(shape) < 3:
+        return _mesh_domains(in_domain, axes)
+
+    # corners and centers of cells two voxels across (the last cell along an
+    # axis is one voxel across if the axis has an even number of voxels)
+    corners = [np.append(np.arange(0, n-1, 2), n-1) for n in shape]
+    centers = [c[:-1] + np.diff(c)//2 for c in corners]
+    corner_domains = _mesh_domains(in_domain, [a[c] for a, c in
+                                               zip(axes, corners)])
+    cells = _mesh_domains(in_domain, [a[c] for a, c in zip(axes, centers)])
+    n = cells.shape
+    for dx, dy, dz in product((0, 1), repeat=3):
+        corner = corner_domains[dx:dx+n[0], dy:dy+n[1], dz:dz+n[2]]
+        cells[corner != cells] = -1
+    # A surface can bulge into a cell between its sample points, but then it
+    # crosses one of the neighboring cells, so only trust cells whose
+    # neighbors agree with them
+    lo = ndimage.minimum_filter(cells, size=3, mode='nearest')
+    hi = ndimage.maximum_filter(cells, size=3, mode='nearest')
+    cells[lo != hi] = -1
+
+    # the cell each voxel is in, with the last corner in the last cell
+    cell_of = [np.minimum(np.searchsorted(c, np.arange(m), side='right') - 1,
+                          len(c) - 2) for c, m in zip(corners, shape)]
+    domains = cells[np.ix_(*cell_of)]
+
+    # test the voxels of the remaining cells individually
+    slab = max(_chunk_points // (shape[1]*shape[2]), 1)
+    for start in range(0, shape[0], slab):
+        block = domains[start:start+slab]
+        ix, iy, iz = np.nonzero(block < 0)
+        if len(ix):
+            points = np.column_stack((axes[0][ix+start], axes[1][iy],
+                                      axes[2][iz]))
+            block[ix, iy, iz] = in_domain(points)
+    return domains
+
 def find_bounds(indicator):
     """
     Finds the bounds needed to contain an indicator function
@@ -381,3 +502,19 @@ class Indicators(HoloPyObject):
 
     def __call__(self, points):
         return [test(points) for test in self.functions]
+
+class _Slot(object):
+    # placeholder for the i'th value in a compiled parameter template
+    __slots__ = ['index']
+    def __init__(self, index):
+        self.index = index
+
+def _fill_slots(template, values):
+    if isinstance(template, _Slot):
+        return values[template.index]
+    if isinstance(template, dict):
+        return dict((key, _fill_slots(t, values))
+                    for key, t in template.iteritems())
+    if isinstance(template, list):
+        return [_fill_slots(t, values) for t in template]
+    return template
@@ -27,11 +27,13 @@ from __future__ import division
 
 import numpy as np
 import warnings
+from copy import copy
+from scipy.spatial import cKDTree
 
 from .sphere import Sphere
 from .composite import Scatterers
 from ..errors import OverlapWarning, ScattererDefinitionError
-from ...core.math import cartesian_distance, rotate_points
+from ...core.math import rotate_points
 
 # default to always warning the user about overlaps.  This can be overriden by
 # calling this function again with a different action.
@@ -63,31 +65,48 @@ class Spheres(Scatterers):
         if self.overlaps:
             warnings.warn(OverlapWarning(self, self.overlaps))
 
+    def _neighbors(self):
+        """
+        Pairs of spheres close enough that they might overlap
+
+        Returns
+        -------
+        pairs : ndarray (int) (N, 2)
+            Indices (i, j), i < j, of the spheres in each pair, in order
+        gaps : ndarray (N)
+            Distance between the surfaces of the spheres in each pair
+            (negative for overlapping spheres)
+        """
+        centers = np.asarray(self.centers, dtype='float').reshape((-1, 3))
+        r = self._outer_radii()
+        if len(r) < 2:
+            return np.zeros((0, 2), dtype='int'), np.zeros(0)
+        # A KD-tree of the centers finds the spheres near each other without
+        # comparing every pair.  Two spheres can only overlap if their centers
+        # are closer than the largest diameter.
+        pairs = cKDTree(centers).query_pairs(2*r.max())
+        pairs = np.array(sorted(pairs), dtype='int').reshape((-1, 2))
+        distances = np.sqrt(((centers[pairs[:, 0]] -
+                              centers[pairs[:, 1]])**2).sum(-1))
+        return pairs, distances - r[pairs].sum(-1)
+
+    def _outer_radii(self):
+        return np.array([np.max(s.r) for s in self.scatterers], dtype='float')
+
     @property
     def overlaps(self):
-        overlaps = []
-        for i, s1 in enumerate(self.scatterers):
-            for j in range(i+1, len(self.scatterers)):
-                s2= self.scatterers[j]
-                try:
-                    if cartesian_distance(s1.center, s2.center) < (np.max(s1.r) + np.max(s2.r)):
-                        overlaps.append((i, j))
-                except:
-                    # if the coordinates are not something that we can do
-                    # arithmatic on, just pass for now, hopefully the overlap
-                    # will be caught later.
-                    pass
-        return overlaps
+        try:
+            pairs, gaps = self._neighbors()
+        except (TypeError, ValueError):
+            # if the coordinates are not something that we can do
+            # arithmatic on, just pass for now, hopefully the overlap
+            # will be caught later.
+            return []
+        return [(int(i), int(j)) for i, j in pairs[gaps < 0]]
 
     def largest_overlap(self):
-        largest = 0
-        for i, s1 in enumerate(self.scatterers):
-            for j in range(i+1, len(self.scatterers)):
-                s2= self.scatterers[j]
-                largest = max(largest, (np.max(s1.r) + np.max(s2.r)) -
-                                       cartesian_distance(s1.center, s2.center))
-
-        return largest
+        pairs, gaps = self._neighbors()
+        return max(0, -gaps.min()) if len(gaps) else 0
 
     def add(self, scatterer):
         if not isinstance(scatterer, Sphere):
@@ -126,6 +145,170 @@ class Spheres(Scatterers):
     def center(self):
         return self.centers.mean(0)
 
+
+class SphereArray(Spheres):
+    '''
+    A cluster of uniform spheres stored as arrays
+
+    Behaves as a :class:`Spheres`, but keeps the index, radius, and center of
+    each sphere in contiguous arrays instead of a list of :class:`.Sphere`
+    objects, so large clusters are cheap to build, move, and hand to a
+    theory.  The Sphere objects in `scatterers` are only made when asked for.
+
+    Attributes
+    ----------
+    n : array(complex) (N) or complex
+        index of refraction of each sphere (or of all of them)
+    r : array(float) (N) or float
+        radius of each sphere (or of all of them)
+    centers : array(float) (N, 3)
+        coordinates of the center of each sphere
+    '''
+    def __init__(self, n, r, centers, warn=True):
+        centers = _as_array(centers, 'float')
+        if centers.ndim != 2 or centers.shape[1] != 3:
+            raise ScattererDefinitionError(
+                "centers specified as {0}, centers should be specified as "
+                "[(x, y, z), ...]".format(centers), self)
+        self._centers = centers
+        self._n = self._per_sphere(_as_array(n, 'float'), 'n')
+        self._r = self._per_sphere(_as_array(r, 'float'), 'r')
+        if self._r.dtype != object and np.any(self._r < 0):
+            raise ScattererDefinitionError("radius is negative", self)
+
+        if warn and self.overlaps:
+            warnings.warn(OverlapWarning(self, self.overlaps))
+
+    def _per_sphere(self, val, name):
+        if val.dtype == object and any(np.ndim(v) for v in val.flat):
+            raise ScattererDefinitionError(
+                "SphereArray can only hold uniform spheres, {0} specified "
+                "as {1}".format(name, val), self)
+        if val.ndim == 0:
+            return np.repeat(val, len(self._centers))
+        if val.shape != (len(self._centers), ):
+            raise ScattererDefinitionError(
+                "{0} should be a single value or one value per sphere, "
+                "got {1}".format(name, val), self)
+        return val
+
+    @classmethod
+    def from_spheres(cls, spheres, warn=True):
+        """
+        Make a SphereArray holding the same spheres as a Spheres
+        """
+        spheres = getattr(spheres, 'scatterers', spheres)
+        return cls([s.n for s in spheres], [s.r for s in spheres],
+                   np.array([s.center for s in spheres]).reshape((-1, 3)),
+                   warn)
+
+    @property
+    def scatterers(self):
+        return [Sphere(n=n, r=r, center=c) for n, r, c in
+                zip(self._n, self._r, self._centers.copy())]
+
+    def add(self, scatterer):
+        if not isinstance(scatterer, Sphere) or not np.isscalar(scatterer.r):
+            raise ScattererDefinitionError(
+                "SphereArray expects uniform Spheres.\n" +
+                repr(scatterer) + " is not a uniform Sphere", self)
+        self._centers = np.vstack((self._centers, [scatterer.center]))
+        self._n = np.append(self._n, scatterer.n)
+        self._r = np.append(self._r, scatterer.r)
+
+    @property
+    def n(self):
+        return self._n
+    @property
+    def n_real(self):
+        return self._n.real
+    @property
+    def n_imag(self):
+        return self._n.imag
+    @property
+    def r(self):
+        return self._r
+    @property
+    def x(self):
+        return self._centers[:, 0]
+    @property
+    def y(self):
+        return self._centers[:, 1]
+    @property
+    def z(self):
+        return self._centers[:, 2]
+    @property
+    def centers(self):
+        return self._centers
+
+    def _outer_radii(self):
+        return np.asarray(self._r, dtype='float')
+
+    @property
+    def parameters(self):
+        # same names as a Spheres of the same spheres would use, so the two
+        # are interchangable in a fit
+        columns = [self._n, self._r] + list(self._centers.T)
+        d = {}
+        for i in range(len(self._centers)):
+            for key, column in zip(_sphere_parameters, columns):
+                d['{0}:Sphere.{1}'.format(i, key)] = column[i]
+        return d
+
+    @classmethod
+    def _parameter_builder(cls, keys):
+        index, column = [], []
+        for key in keys:
+            i, spec = key.split(':', 1)
+            scat_type, par = spec.split('.', 1)
+            if scat_type != 'Sphere' or par not in _sphere_parameters:
+                break
+            index.append(int(i))
+            column.append(_sphere_parameters.index(par))
+        else:
+            shape = (max(index) + 1 if index else 0, len(_sphere_parameters))
+            if keys and len(set(zip(index, column))) == shape[0] * shape[1]:
+                def build(values):
+                    values = np.array(values)
+                    table = np.empty(shape, dtype=values.dtype)
+                    table[index, column] = values
+                    geometry = table[:, 1:]
+                    if np.iscomplexobj(geometry) and not geometry.imag.any():
+                        geometry = geometry.real
+                    return cls(table[:, 0], geometry[:, 0], geometry[:, 1:])
+                return build
+
+        # anything other than a table of uniform spheres goes the long way
+        build_spheres = Spheres._parameter_builder(keys)
+        def build(values):
+            return cls.from_spheres(build_spheres(values))
+        return build
+
+    def translated(self, x, y, z):
+        new = copy(self)
+        new._centers = self._centers + np.array((x, y, z))
+        return new
+
+    def rotated(self, alpha, beta, gamma):
+        com = self._centers.mean(0)
+        new = copy(self)
+        new._centers = com + rotate_points(self._centers - com, alpha, beta,
+                                           gamma)
+        return new
+
+_sphere_parameters = ['n', 'r', 'center[0]', 'center[1]', 'center[2]']
+
+def _as_array(val, dtype):
+    # numbers become an array of dtype (or complex, for complex numbers),
+    # anything else (such as fit Parameters) is kept as objects
+    if isinstance(val, np.ndarray) and val.dtype != object:
+        arr = val
+    else:
+        arr = np.array(np.array(val, dtype=object).tolist())
+    if arr.dtype == object or np.iscomplexobj(arr):
+        return arr
+    return arr.astype(dtype)
+
 # TODO: Move this code out of scatterer? It sort of has more to do with how
 # clusters move than pure geometry
 
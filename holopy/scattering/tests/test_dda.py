@@ -28,15 +28,22 @@ from numpy.testing import assert_almost_equal, assert_equal
 import numpy as np
 from nose.tools import with_setup
 from nose.plugins.attrib import attr
-from ...scattering.errors import ScattererDefinitionError
-from ..scatterer import Sphere, Ellipsoid, Scatterer, JanusSphere
+from ...scattering.errors import (ScattererDefinitionError,
+                                  BatchCalculationError)
+from ..scatterer import (Sphere, Ellipsoid, Scatterer, JanusSphere,
+                         SphereArray)
 
-from ...core import ImageSchema, Optics
+from ...core import ImageSchema, Optics, Schema, Angles
 from ..theory import Mie, DDA
+from ..theory.dda import (_scat_matr_fields, _interpolate_scat_matrix,
+                          _geometry_rows, _write_geometry, _exact_key,
+                          _has_object_ids, _map_concurrent)
+from ..theory.mie_f import mieangfuncs
 from .common import assert_allclose, verify
 
 
 import os.path
+from StringIO import StringIO
 
 # nose setup/teardown methods
 def setup_optics():
@@ -147,3 +154,115 @@ def test_janus():
     assert_almost_equal(s.index_at([5,5,5]),1.34)
     holo = DDA.calc_holo(s, schema)
     verify(holo, 'janus_dda')
+
+@attr('fast')
+def test_scat_matr_fields():
+    # should match converting the fields one point at a time
+    np.random.seed(0)
+    points = np.column_stack((np.random.uniform(10, 100, 20),
+                              np.random.uniform(0, np.pi, 20),
+                              np.random.uniform(0, 2*np.pi, 20)))
+    scat_matr = (np.random.normal(size=(20, 2, 2)) +
+                 1.0j*np.random.normal(size=(20, 2, 2)))
+    pol = np.array([.6, .8])
+    fields = [mieangfuncs.fieldstocart(
+        mieangfuncs.calc_scat_field(kr, phi, scat_matr[i], pol), theta, phi)
+              for i, (kr, theta, phi) in enumerate(points)]
+    assert_allclose(_scat_matr_fields(points, scat_matr, pol), fields)
+
+@attr('fast')
+def test_interpolate_scat_matrix():
+    o = Optics(wavelen=.66, index=1.33, polarization = (1, 0))
+    s = Sphere(n = 1.59, r = .5, center = (0, 0, 0))
+    thetas = np.linspace(0, np.pi, 181)
+    phis = np.arange(36) * 2*np.pi/36
+    grid = Mie.calc_scat_matrix(s, Schema(positions = Angles(thetas, phis),
+                                          optics = o))
+    grid = np.asarray(grid).reshape((181, 36, 2, 2))
+
+    theta = np.linspace(.01, 3.1, 7)
+    # including phis outside [0, 2pi)
+    phi = np.linspace(-1, 7, 7)
+    direct = Mie.calc_scat_matrix(s, Schema(positions = Angles(theta),
+                                            optics = o))
+    assert_allclose(_interpolate_scat_matrix(thetas, phis, grid, theta, phi),
+                    direct, rtol=1e-5, atol=1e-5*np.abs(direct).max())
+
+@attr('medium')
+@with_setup(setup=setup_optics, teardown=teardown_optics)
+def test_DDA_angular_grid():
+    e = Ellipsoid(1.5, r = (.5, .1, .1), center = (1, -1, 10))
+    dda = DDA(angular_grid=(721, 72), scat_matr_cache_size=1)
+    h = dda.calc_holo(e, schema)
+    assert_allclose(h, DDA.calc_holo(e, schema), rtol=1e-3)
+
+    # a translated copy reuses the gridded scattering matrix
+    dda.calc_holo(e.translated(.5, .5, 1), schema)
+    assert_equal(dda.scat_matr_cache.info().hits, 1)
+
+@attr('fast')
+def test_write_geometry():
+    s = Sphere(n = [1.5, 1.6], r = [.5, 1], center = (0, 0, 0))
+    vox = s.voxelate_domains(.1)
+    occupied = np.nonzero(vox)
+    for n_domains, columns in ((1, occupied), (2, occupied + (vox[occupied],))):
+        outf = StringIO()
+        if n_domains > 1:
+            outf.write("Nmat=2\n")
+        np.savetxt(outf, np.column_stack(columns), fmt='%d')
+        written = StringIO()
+        _write_geometry(_geometry_rows(vox, n_domains), n_domains, written)
+        assert_equal(written.getvalue(), outf.getvalue())
+
+@attr('fast')
+def test_exact_key():
+    s = Sphere(n = 1.59, r = .5, center = (0, 0, 0))
+    assert_equal(_exact_key(s), _exact_key(Sphere(n = 1.59, r = .5,
+                                                  center = (0, 0, 0))))
+    # differences the repr rounds away still give a different key
+    centers = np.array([[0, 0, 0], [1., 0, 0]])
+    moved = centers.copy()
+    moved[1, 0] += 1e-10
+    sa = SphereArray(1.59, .4, centers)
+    assert repr(sa) == repr(SphereArray(1.59, .4, moved))
+    assert _exact_key(sa) != _exact_key(SphereArray(1.59, .4, moved))
+    assert_equal(_exact_key(sa), _exact_key(SphereArray(1.59, .4,
+                                                        centers.copy())))
+    # functions are keyed by identity
+    def inside(point):
+        return (point**2).sum(-1) < .25
+    s = Scatterer(inside, 1.59, (0, 0, 0))
+    assert_equal(_exact_key(s), _exact_key(Scatterer(inside, 1.59, (0, 0, 0))))
+    assert _exact_key(s) != _exact_key(Scatterer(lambda point: inside(point),
+                                                 1.59, (0, 0, 0)))
+    hash(_exact_key(s))
+    # so they are not saved for later sessions
+    assert _has_object_ids(_exact_key(s))
+    assert not _has_object_ids(_exact_key(sa))
+
+@attr('fast')
+def test_map_concurrent():
+    def func(i):
+        if i % 3 == 1:
+            raise ValueError(i)
+        return i**2
+    results = {}
+    try:
+        for i, result in _map_concurrent(func, 7, 3):
+            results[i] = result
+    except BatchCalculationError as e:
+        assert_equal(sorted(e.failures.keys()), [1, 4])
+        assert isinstance(e.failures[4], ValueError)
+    else:
+        assert False, "failures should have been raised"
+    # the other calls still finish
+    assert_equal(results, {0: 0, 2: 4, 3: 9, 5: 25, 6: 36})
+
+@attr('medium')
+@with_setup(setup=setup_optics, teardown=teardown_optics)
+def test_DDA_batch():
+    es = [Ellipsoid(1.5, r = (.5, .1, .1), center = (1, -1, 10),
+                    rotation = (0, beta, 0)) for beta in (0, .5, 1)]
+    holos = DDA(n_processes=3).calc_holo_batch(es, schema)
+    for e, holo in zip(es, holos):
+        assert_allclose(holo, DDA.calc_holo(e, schema))
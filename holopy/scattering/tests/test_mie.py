@@ -259,6 +259,19 @@ def test_farfield_matr():
     matr = Mie.calc_scat_matrix(sphere, schema)
     verify(matr, 'farfield_matricies', rtol = 1e-6)
 
+@attr('fast')
+def test_farfield_matr_phi():
+    # the scattering matrix of a sphere only depends on theta
+    optics = Optics(wavelen=.66, index = 1.33, polarization = (1, 0))
+    theta = np.linspace(0, np.pi, 7)
+    sphere = Sphere(r = .5, n = 1.59+0.1j)
+    schema = Schema(positions = Angles(theta, phi = np.linspace(0, np.pi, 3)),
+                    optics = optics)
+    matr = Mie.calc_scat_matrix(sphere, schema)
+    single = Mie.calc_scat_matrix(sphere, Schema(positions = Angles(theta),
+                                                 optics = optics))
+    assert_allclose(matr, np.repeat(single, 3, axis=0))
+
 @attr('medium')
 def test_radialEscat():
     thry_1 = Mie()
@@ -378,3 +391,103 @@ def test_raw_fields():
   (0.003816460764514863-0.0015982360934887314j),
   (0.0012772696647997395-0.0039342215472070105j),
   (-0.0021320123934202356-0.0035427449839031066j)]])
+
+def test_coeff_cache():
+    o = Optics(wavelen=.66, index=1.33, polarization=(0, 1))
+    sch = ImageSchema(10, .1, o)
+    thry = Mie(coeff_cache_size=4)
+    s1 = Sphere(r=.5, n=1.59, center=(.5, .5, 5))
+    s2 = Sphere(r=.5, n=1.59, center=(.7, .3, 5))
+
+    h1 = thry.calc_holo(s1, sch)
+    h2 = thry.calc_holo(s2, sch)
+    # moving the sphere should reuse the coefficients
+    assert_equal(thry.coeff_cache.info()[:2], (1, 1))
+    thry.calc_cross_sections(s1, o)
+    assert_equal(thry.coeff_cache.info()[:2], (2, 1))
+
+    uncached = Mie(coeff_cache_size=0)
+    assert_equal(uncached.calc_holo(s2, sch), h2)
+    assert_equal(len(uncached.coeff_cache), 0)
+
+    # changing the tolerances must not reuse coefficients
+    thry.eps1 = 1e-3
+    thry.calc_holo(s1, sch)
+    assert_equal(thry.coeff_cache.info()[:2], (2, 2))
+
+    # class level calls all share one cache
+    assert Mie().coeff_cache is Mie().coeff_cache
+
+def test_calc_holo_batch():
+    o = Optics(wavelen=.66, index=1.33, polarization=(1, 0))
+    sch = ImageSchema((12, 10), .1, o)
+    spheres = [Sphere(r=.5, n=1.59, center=(.5, .5, 5)),
+               Sphere(r=.4, n=1.59+.01j, center=(.7, .3, 4)),
+               Spheres([Sphere(r=.5, n=1.59, center=(.2, .5, 5)),
+                        Sphere(r=.5, n=1.59, center=(1.5, .5, 5))])]
+    scalings = [.6, .8, 1.]
+
+    holos = Mie.calc_holo_batch(spheres, sch, scalings)
+    assert_equal(holos.shape, (3, 12, 10))
+    for holo, s, alpha in zip(holos, spheres, scalings):
+        assert_allclose(holo, Mie.calc_holo(s, sch, alpha))
+
+    out = np.zeros((3, 12, 10))
+    result = Mie.calc_holo_batch(spheres, sch, .7, out=out)
+    assert result is out
+    assert_allclose(out[1], Mie.calc_holo(spheres[1], sch, .7))
+
+    assert_raises(ValueError, Mie.calc_holo_batch, spheres, sch, [.6, .8])
+    assert_raises(ValueError, Mie.calc_holo_batch, spheres, sch, 1,
+                  np.zeros((3, 10, 12)))
+
+def test_threaded_fields():
+    o = Optics(wavelen=.66, index=1.33, polarization=(1, 0))
+    sch = ImageSchema(64, .1, o)
+    s = Sphere(r=.5, n=1.59, center=(3, 3, 5))
+    serial = Mie(n_threads=1).calc_field(s, sch)
+    # results should be bit for bit identical however the work is split up
+    for n_threads in [2, 3, 7]:
+        assert_equal(Mie(n_threads=n_threads).calc_field(s, sch), serial)
+
+def test_radial_interpolation():
+    o = Optics(wavelen=.66, index=1.33, polarization=(.6, .8))
+    sch = ImageSchema(100, .1, o)
+    s = Sphere(r=.8, n=1.59, center=(4, 6, 7))
+    exact = Mie.calc_field(s, sch)
+    for tol in [1e-4, 1e-6]:
+        approx = Mie(radial_interpolation=True,
+                     interpolation_tol=tol).calc_field(s, sch)
+        assert abs(approx - exact).max() < 5 * tol * abs(exact).max()
+
+    # off a plane (or for too few points) we just do the exact calculation
+    vol = VolumeSchema((8, 8, 8), .2, optics=o)
+    assert_equal(Mie(radial_interpolation=True).calc_field(s, vol),
+                 Mie.calc_field(s, vol))
+    small = ImageSchema(10, .1, o)
+    assert_equal(Mie(radial_interpolation=True).calc_field(s, small),
+                 Mie.calc_field(s, small))
+
+@attr('fast')
+def test_superposition_field():
+    o = Optics(wavelen=.66, index=1.33, polarization=(1, 0))
+    sch = ImageSchema(32, .1, o)
+    spheres = [Sphere(r=.5, n=1.59, center=(1, 1, 5)),
+               Sphere(r=.3, n=1.59, center=(2, .5, 7)),
+               Sphere(r=.4, n=1.45, center=(.5, 2.5, 6))]
+    total = Mie.calc_field(Spheres(spheres), sch)
+    assert_allclose(total, sum(Mie.calc_field(s, sch) for s in spheres))
+    assert_equal(total.shape, (32, 32, 3))
+
+@attr('fast')
+def test_single_precision():
+    o = Optics(wavelen=.66, index=1.33, polarization=(1, 0))
+    sch = ImageSchema(32, .1, o)
+    s = Sphere(r=.5, n=1.59, center=(1.6, 1.6, 5))
+    single = Mie(precision='single')
+    holo = single.calc_holo(s, sch)
+    assert_equal(holo.dtype, np.float32)
+    assert_equal(single.calc_field(s, sch).dtype, np.complex64)
+    assert_equal(single.calc_holo_batch([s], sch).dtype, np.float32)
+    assert_allclose(holo, Mie.calc_holo(s, sch), rtol=1e-6)
+    assert_raises(ValueError, Mie, precision='half')
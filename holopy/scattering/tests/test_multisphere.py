@@ -94,6 +94,20 @@ def test_2_sph():
     assert_almost_equal(holo.std(), 0.09558537595025796)
 
 
+def test_calc_holo_batch():
+    s1 = Sphere(n = 1.59, r = 5e-7, center = (1e-6, -1e-6, 10e-6))
+    s2 = Sphere(n = 1.59, r = 1e-6, center=[8e-6,5e-6,5e-6])
+    clusters = [Spheres([s1, s2]), Spheres([s1.translated(1e-6, 0, 0), s2])]
+    holos = Multisphere.calc_holo_batch(clusters, schema, [.6, .8])
+    for holo, sc, alpha in zip(holos, clusters, [.6, .8]):
+        assert_allclose(holo, Multisphere.calc_holo(sc, schema, alpha))
+
+def test_threaded_fields():
+    sc = Spheres([Sphere(n = 1.59, r = 5e-7, center = (1e-6, -1e-6, 10e-6)),
+                  Sphere(n = 1.59, r = 1e-6, center=[8e-6,5e-6,5e-6])])
+    serial = Multisphere(n_threads=1).calc_field(sc, schema)
+    assert_equal(Multisphere(n_threads=4).calc_field(sc, schema), serial)
+
 def test_radial_holos():
     # Check that holograms computed with and w/o radial part of E_scat differ
     sc = Spheres(scatterers=[Sphere(center=[7.1e-6, 7e-6, 10e-6],
@@ -174,6 +188,65 @@ def test_overlap():
     verify(holo, '2_sphere_allow_overlap')
 
 
+@attr('fast')
+def test_amn_cache():
+    def dimer(x, z=10e-6):
+        return Spheres([Sphere(center=[x, 7e-6, z], n=1.5811+1e-4j, r=5e-07),
+                        Sphere(center=[x+1.1e-6, 7e-6, z], n=1.5811+1e-4j,
+                               r=5e-07)])
+    thry = Multisphere(amn_cache_size=4)
+    thry.calc_holo(dimer(6e-6), schema)
+    # translating the cluster reuses its expansion
+    moved = thry.calc_holo(dimer(6.1234e-6, 10.3e-6), schema)
+    assert_equal(thry.amn_cache.info()[:2], (1, 1))
+    assert thry.amn_cache.nbytes > 0
+
+    uncached = Multisphere(amn_cache_size=0)
+    assert_equal(uncached.calc_holo(dimer(6.1234e-6, 10.3e-6), schema), moved)
+    assert_equal(len(uncached.amn_cache), 0)
+
+    # changing the solver tolerances must not reuse expansions
+    thry.qeps2 = 1e-9
+    thry.calc_holo(dimer(6e-6), schema)
+    assert_equal(thry.amn_cache.info()[:2], (1, 2))
+
+    # nor may T-matrix and direct solutions stand in for each other
+    small = Spheres([Sphere(center=[6e-6, 7e-6, 10e-6], n=1.59, r=1e-7),
+                     Sphere(center=[6.3e-6, 7e-6, 10e-6], n=1.59, r=1e-7)])
+    thry.calc_holo(small, schema)
+    thry.cluster_tmatrix = True
+    thry.calc_holo(small, schema)
+    assert_equal(thry.amn_cache.info()[:2], (1, 4))
+
+    # class level calls all share one cache
+    assert Multisphere().amn_cache is Multisphere().amn_cache
+
+def test_large_cluster():
+    # more spheres than the 20 the fortran code used to be compiled for
+    grid = Spheres([Sphere(center=[5e-6 + 3e-7*i, 5e-6 + 3e-7*j, 10e-6],
+                           n=1.59, r=1e-7) for i in range(4) for j in range(6)])
+    holo = Multisphere.calc_holo(grid, schema)
+    assert not np.isnan(holo).any()
+    assert holo.std() > 0
+
+@attr('slow')
+def test_cluster_tmatrix():
+    dimer = Spheres([Sphere(center=[6e-6, 7e-6, 10e-6], n=1.59, r=3e-7),
+                     Sphere(center=[6.66e-6, 7e-6, 10.15e-6], n=1.59, r=3e-7)])
+    # At the default solver tolerances the direct solutions are themselves
+    # only good to about 1e-4, so tighten them to compare the two paths
+    tols = dict(eps=1e-10, qeps1=1e-10, qeps2=1e-10, amn_cache_size=0)
+    thry = Multisphere(cluster_tmatrix=True, **tols)
+    thry.calc_holo(dimer, schema)
+    hits = thry.tmatrix_cache.info().hits
+    # rotations of the cluster reuse its T-matrix
+    for angles in [(0.3, 1.2, -0.7), (2., np.pi, 0.5)]:
+        tumbled = dimer.rotated(*angles)
+        assert_allclose(thry.calc_holo(tumbled, schema),
+                        Multisphere(**tols).calc_holo(tumbled, schema),
+                        rtol=1e-6)
+    assert_equal(thry.tmatrix_cache.info().hits, hits + 2)
+
 @attr('fast')
 def test_niter():
     sc = Spheres(scatterers=[Sphere(center=[7.1e-6, 7e-6, 10e-6],
@@ -202,6 +275,24 @@ def test_cross_sections():
     # in funny way by SCSMFO, based on "volume mean radius".
     assert_allclose(xsects[:3], gold_xsects, rtol = 1e-3)
 
+def test_cross_section_quadrature():
+    opt = Optics(wavelen = 1., index = 1., polarization = [1., 0])
+    a = 1./(2 * np.pi)
+    n = 1.5 + 0.1j
+    sc = Spheres([Sphere(n = n, r = a, center = [0., 0., a]),
+                  Sphere(n = n, r = a, center = [0., 0., -a])])
+    thry = Multisphere()
+    amn, lmax = thry._scsmfo_setup(sc, opt)
+    # quadrature should reproduce the analytic sum over the coefficients
+    assert_allclose(thry._calc_cscat_quad(sc, opt, amn, lmax),
+                    thry._calc_cscat(sc, opt, amn, lmax), rtol=1e-8)
+
+    # and warn when the grid is too coarse
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        Multisphere(quad_order=2)._calc_cscat_quad(sc, opt, amn, lmax)
+        assert len(w) > 0
+
 def test_farfield():
     schema = Schema(positions = Angles(np.linspace(0, np.pi/2),
                                        phi = np.zeros(50)),
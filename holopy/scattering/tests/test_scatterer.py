@@ -32,7 +32,7 @@ from warnings import warn
 from ...core import ImageSchema, Optics
 
 from ..scatterer import (Sphere, Scatterer, Ellipsoid,
-                         Scatterers)
+                         Scatterers, JanusSphere, Difference)
 
 from ..scatterer.ellipsoid import isnumber
 from ..scatterer.scatterer import find_bounds
@@ -188,3 +188,18 @@ def test_ellipsoid():
          [[0., 0., 0., 0., 0., 0., 0., 0.],
           [0., 0., 0., 0., 0., 0., 0., 0.],
           [0., 0., 0., 0., 0., 0., 0., 0.]]]))
+
+@attr('fast')
+def test_voxelate_domains():
+    # should match testing every voxel, including for a shell much thinner
+    # than the voxels and a sphere with a bite taken out of it
+    janus = JanusSphere(n = [1.34, 2.0], r = [.5, .51], rotation = (-1, .3),
+                        center = (5, 5, 5))
+    s = Sphere(n = 1.6, r = .5, center = (0, 0, 0))
+    bitten = Difference(s, s.translated(.3, .2, 0))
+    for scatterer, spacing in ((janus, .03), (bitten, .02)):
+        vox = scatterer.voxelate_domains(spacing)
+        axes = scatterer._voxel_axes(spacing)
+        grid = np.concatenate([g[..., np.newaxis] for g in
+                               np.meshgrid(*axes, indexing='ij')], 3)
+        assert_equal(vox, scatterer.in_domain(grid))
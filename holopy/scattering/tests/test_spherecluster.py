@@ -28,7 +28,7 @@ from numpy.testing import assert_equal, assert_almost_equal
 from nose.plugins.attrib import attr
 
 from ..scatterer import Sphere, Ellipsoid
-from ..scatterer import Spheres
+from ..scatterer import Spheres, SphereArray
 from ..errors import ScattererDefinitionError, OverlapWarning
 
 import warnings
@@ -125,3 +125,64 @@ def test_Spheres_rotation():
     assert_equal(sc.scatterers[1].n, sc2.scatterers[1].n)
     assert_almost_equal([0, -1, 0], sc2.scatterers[0].center)
     assert_almost_equal([0, 1, 1], sc2.scatterers[1].center)
+
+@attr('fast')
+def test_Spheres_overlaps():
+    np.random.seed(0)
+    centers = np.random.uniform(0, 10, (100, 3))
+    rs = np.random.uniform(.3, .6, 100)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', OverlapWarning)
+        sc = Spheres([Sphere(n = 1.59, r = r, center = c)
+                      for r, c in zip(rs, centers)])
+
+    overlaps = []
+    largest = 0
+    for i in range(100):
+        for j in range(i+1, 100):
+            d = np.sqrt(((centers[i] - centers[j])**2).sum())
+            if d < rs[i] + rs[j]:
+                overlaps.append((i, j))
+            largest = max(largest, rs[i] + rs[j] - d)
+    assert len(overlaps) > 0
+    assert_equal(sc.overlaps, overlaps)
+    assert_almost_equal(sc.largest_overlap(), largest)
+
+@attr('fast')
+def test_SphereArray():
+    np.random.seed(0)
+    centers = np.random.uniform(0, 10, (20, 3))
+    rs = np.random.uniform(.3, .6, 20)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', OverlapWarning)
+        sa = SphereArray(1.59, rs, centers)
+        sc = Spheres([Sphere(n = 1.59, r = r, center = c)
+                      for r, c in zip(rs, centers)])
+
+    assert_equal(sa.r, sc.r)
+    assert_equal(sa.n, sc.n)
+    assert_equal(sa.centers, sc.centers)
+    assert_equal(sa.overlaps, sc.overlaps)
+    assert_equal(sa.parameters, sc.parameters)
+    assert_equal(sa.scatterers[3].center, sc.scatterers[3].center)
+
+    sa2 = SphereArray.from_parameters(sc.parameters)
+    assert_equal(sa2.r, rs)
+    assert_equal(sa2.centers, centers)
+
+    assert_almost_equal(sa.translated(1, 2, 3).centers,
+                        sc.translated(1, 2, 3).centers)
+    assert_almost_equal(sa.rotated(.1, .2, .3).centers,
+                        sc.rotated(.1, .2, .3).centers)
+    # moving a SphereArray leaves the original alone
+    assert_equal(sa.centers, centers)
+
+    # only the constructor arguments are serialized
+    assert_equal(sorted(sa._dict.keys()), ['centers', 'n', 'r'])
+    assert_equal(sa.like_me(warn=False).centers, centers)
+
+@attr('fast')
+@raises(ScattererDefinitionError)
+def test_SphereArray_layered():
+    SphereArray([[1.59, 1.5], [1.59, 1.5]], [[.5, 1], [.5, 1]],
+                [[0, 0, 0], [5, 5, 5]])
@@ -29,22 +29,30 @@ ADDA (http://code.google.com/p/a-dda/) to do DDA calculations.
 from __future__ import division
 
 import numpy as np
+from scipy.interpolate import RectBivariateSpline
 import subprocess
 import tempfile
-import glob
 import os
 import shutil
 import time
+import hashlib
+import atexit
+import itertools
+import threading
+import multiprocessing
+import numbers
 from ..binding_method import binding, finish_binding
 import warnings
 
 from nose.plugins.skip import SkipTest
 
-from .scatteringtheory import ScatteringTheory
-from .mie_f import mieangfuncs
+from .scatteringtheory import ScatteringTheory, _thread_pool
 from ..scatterer import Sphere, Ellipsoid, Spheres, Capsule, Cylinder, Bisphere, Sphere_builtin
 from ...core.marray import VectorGridSchema
 from ...core.helpers import _ensure_array
+from ...core.cache import LRUCache
+from ...core.holopy_object import HoloPyObject
+from ..errors import BatchCalculationError
 
 class DependencyMissing(SkipTest, Exception):
     def __init__(self, dep):
@@ -74,17 +82,64 @@ class DDA(ScatteringTheory):
         necessary to resolve features in an object. This may make dda
         calculations take much longer.
     keep_raw_calculations : bool
-        If true, do not delete the temporary file we run ADDA in, instead print
-        its path so you can inspect its raw results
+        If true, do not delete the files ADDA reads and writes, instead print
+        the path of its output directory so you can inspect its raw results
+    angular_grid : (int, int) or None (optional)
+        If given as (n_theta, n_phi), compute the scattering matrix once on a
+        grid of n_theta polar angles from 0 to 180 degrees and n_phi azimuthal
+        angles around the full circle, and interpolate it to the angles
+        actually needed (see notes).  None (default) runs ADDA at exactly the
+        needed angles for every calculation.
+    scat_matr_cache_size : int or None (optional)
+        Number of gridded scattering matrices to keep in memory.  None
+        (default) uses a cache shared by all DDA theories (see
+        :attr:`scat_matr_cache`), 0 disables caching, and any other number
+        gives this theory a private cache of that size.
+    cache_dir : string or None (optional)
+        Directory to also save gridded scattering matrices in, so they can be
+        reused by later sessions.  None (default) only keeps them in memory.
+    n_processes : int or None (optional)
+        Number of ADDA processes to run at once for calc_holo_batch.  If None,
+        the HOLOPY_NUM_THREADS environment variable is used if set, otherwise
+        the number of CPUs.  Each process uses n_cpu MPI processes of its own.
+
     Notes
     -----
     Does not handle near fields.  This introduces ~5% error at 10 microns.
 
+    The far field scattering matrix depends on the scatterer's shape,
+    orientation and index and on the wavelength, but not on where the
+    scatterer is.  With angular_grid set, the matrix is computed with the
+    scatterer at the origin and cached under the exact values of everything
+    ADDA is given (the command line and the scatterer's parameters), so
+    holograms of translated copies of a scatterer, as in the position steps of
+    a fit, are interpolated from the cached grid without running ADDA or
+    voxelizing the scatterer again.  Matrices of scatterers defined by python
+    functions are not saved in cache_dir, since they cannot be recognized in a
+    later session.  The interpolation error depends
+    on how finely the grid resolves the angular structure of the scattering;
+    a grid spacing of a fraction of a degree is usually needed for particles
+    several wavelengths across.
+
+    Scatterers without an ADDA builtin shape are voxelized and handed to ADDA
+    as a geometry file.  The voxelizations are cached (see
+    :attr:`voxel_cache`) for each geometry and dipole spacing; since the
+    voxelization does not depend on where the scatterer is, translated copies
+    share it.  ADDA runs happen in a working directory shared by all DDA
+    theories, each in a subdirectory of its own that is removed when the run
+    finishes; the working directory itself is removed when Python exits.
+
+    calc_holo_batch runs separate ADDA processes for the scatterers
+    concurrently, which uses several cores without needing MPI.  If some of
+    them fail, the others still finish and a :class:`.BatchCalculationError`
+    listing the failures is raised at the end.
+
     This can in principle handle any scatterer, but in practice it will need
     excessive memory or computation time for particularly large scatterers.
     """
     def __init__(self, n_cpu = 1, max_dpl_size=None, keep_raw_calculations=False,
-            addacmd=[]):
+            addacmd=[], angular_grid=None, scat_matr_cache_size=None,
+            cache_dir=None, n_processes=None):
 
         # Check that adda is present and able to run
         try:
@@ -96,9 +151,78 @@ class DDA(ScatteringTheory):
         self.max_dpl_size = max_dpl_size
         self.keep_raw_calculations = keep_raw_calculations
         self.addacmd = addacmd
+        self.angular_grid = angular_grid
+        self.scat_matr_cache_size = scat_matr_cache_size
+        if scat_matr_cache_size is not None:
+            self._scat_matr_cache = LRUCache(scat_matr_cache_size)
+        self.cache_dir = cache_dir
+        self.n_processes = n_processes
         super(DDA, self).__init__()
 
-    def _run_adda(self, scatterer, optics, temp_dir):
+    @property
+    def scat_matr_cache(self):
+        """
+        The :class:`.LRUCache` holding this theory's gridded scattering
+        matrices (used when angular_grid is set).
+        """
+        return getattr(self, '_scat_matr_cache', _shared_scat_matr_cache)
+
+    @property
+    def voxel_cache(self):
+        """
+        The :class:`.LRUCache` holding the occupied voxels of voxelized
+        scatterers.  It is shared by all DDA theories.
+        """
+        return _shared_voxel_cache
+
+    @property
+    def _n_processes(self):
+        n_processes = self.n_processes
+        if n_processes is None:
+            n_processes = os.environ.get('HOLOPY_NUM_THREADS',
+                                         multiprocessing.cpu_count())
+        return max(int(n_processes), 1)
+
+    def _run_adda(self, cmd, angles):
+        """
+        Run ADDA and read the amplitude scattering matrices it computes
+
+        Parameters
+        ----------
+        cmd : list of strings
+            ADDA command line, from _adda_cmd and _scatterer_args
+        angles : ndarray (N, 2)
+            theta, phi (degrees) to compute the scattering matrix at
+
+        Returns
+        -------
+        scat_matr : ndarray (N, 2, 2)
+        """
+        # each run gets a directory of its own, so that several can go at once
+        if self.keep_raw_calculations:
+            # somewhere that is not cleaned up at exit
+            run_dir = tempfile.mkdtemp(prefix='holopy_dda')
+        else:
+            run_dir = os.path.join(_work_dir(),
+                                   'run{0}'.format(next(_run_ids)))
+            os.mkdir(run_dir)
+        result_dir = os.path.join(run_dir, 'output')
+        try:
+            self._write_angles(angles, os.path.join(run_dir, 'scat_params.dat'))
+            subprocess.check_call(cmd + ['-dir', 'output'], cwd=run_dir)
+            return self._read_scat_matrix(result_dir)
+        finally:
+            if self.keep_raw_calculations:
+                self._last_result_dir = result_dir
+                print("Raw calculations are in: {0}".format(run_dir))
+            else:
+                geometry_file = _geometry_file(cmd)
+                if geometry_file is not None and os.path.exists(geometry_file):
+                    os.remove(geometry_file)
+                shutil.rmtree(run_dir, True)
+
+    def _adda_cmd(self, optics):
+        # the part of the command line that does not depend on the scatterer
         if self.n_cpu == 1:
             cmd = ['adda']
         if self.n_cpu > 1:
@@ -108,7 +232,9 @@ class DDA(ScatteringTheory):
         cmd.extend(['-lambda', str(optics.med_wavelen)])
         cmd.extend(['-save_geom'])
         cmd.extend(self.addacmd)
+        return cmd
 
+    def _scatterer_args(self, scatterer, optics, temp_dir):
         if isinstance(scatterer, Ellipsoid):
             scat_args = self._adda_ellipsoid(scatterer, optics, temp_dir)
         elif isinstance(scatterer, Capsule):
@@ -122,9 +248,7 @@ class DDA(ScatteringTheory):
         else:
             scat_args = self._adda_scatterer(scatterer, optics, temp_dir)
 
-        cmd.extend(scat_args)
-
-        subprocess.check_call(cmd, cwd=temp_dir)
+        return scat_args
 
     # TODO: figure out why our discritzation gives a different result
     # and fix so that we can use that and eliminate this.
@@ -186,21 +310,11 @@ class DDA(ScatteringTheory):
 
     def _adda_scatterer(self, scatterer, optics, temp_dir):
         spacing = self.required_spacing(optics, scatterer.n)
-        outf = tempfile.NamedTemporaryFile(dir = temp_dir, delete=False)
-
-        vox = scatterer.voxelate_domains(spacing)
-        idx = np.concatenate([g[..., np.newaxis] for g in
-                              np.mgrid[[slice(0,d) for d in vox.shape]]],
-                             3).reshape((-1, 3))
-        vox = vox.flatten()
         ns = _ensure_array(scatterer.n)
-        n_domains = len(ns)
-        if n_domains > 1:
-            out = np.hstack((idx, vox[...,np.newaxis]))
-            outf.write("Nmat={0}\n".format(n_domains))
-        else:
-            out = idx
-        np.savetxt(outf, out[np.nonzero(vox)], fmt='%d')
+        outf = tempfile.NamedTemporaryFile(dir = temp_dir, prefix='geometry',
+                                           suffix='.dat', delete=False)
+        _write_geometry(self._geometry(scatterer, spacing, len(ns)), len(ns),
+                        outf)
         outf.close()
 
         cmd = []
@@ -216,7 +330,26 @@ class DDA(ScatteringTheory):
 
         return cmd
 
-
+    def _geometry(self, scatterer, spacing, n_domains):
+        """
+        Occupied voxels of a scatterer voxelized at spacing, as the rows of
+        its ADDA geometry file (see _write_geometry)
+        """
+        # the voxelization does not depend on where the scatterer is, so
+        # compute it (and key the cache) with the scatterer at the origin
+        location = np.asarray(scatterer.location, dtype='float')
+        scatterer = scatterer.translated(*(-location))
+
+        def compute():
+            rows = _geometry_rows(scatterer.voxelate_domains(spacing),
+                                  n_domains)
+            rows.setflags(write=False)
+            # keep the scatterer alive along with its geometry so that the
+            # functions named in the key (by id) cannot be reused by others
+            return scatterer, rows
+
+        key = (_exact_key(scatterer), float(spacing), n_domains)
+        return self.voxel_cache.get_or_compute(key, compute)[1]
 
     @classmethod
     @binding
@@ -239,14 +372,23 @@ class DDA(ScatteringTheory):
         return optics.med_wavelen / cls_self._dpl(optics, n)
 
     def _calc_scat_matrix(self, scatterer, schema, calc_points=None):
-        temp_dir = tempfile.mkdtemp()
-
-        if not calc_points is None:
+        if calc_points is None:
             calc_points = schema.positions.kr_theta_phi(scatterer.location, schema.optics)
 
-        angles = calc_points[:,1:] * 180/np.pi
+        if self.angular_grid is not None:
+            thetas, phis, grid_matr = self._grid_scat_matrix(scatterer,
+                                                             schema.optics)
+            return _interpolate_scat_matrix(thetas, phis, grid_matr,
+                                            calc_points[:, 1],
+                                            calc_points[:, 2])
 
-        outf = file(os.path.join(temp_dir, 'scat_params.dat'), 'w')
+        cmd = self._adda_cmd(schema.optics)
+        cmd.extend(self._scatterer_args(scatterer, schema.optics,
+                                        _work_dir()))
+        return self._run_adda(cmd, calc_points[:,1:] * 180/np.pi)
+
+    def _write_angles(self, angles, filename):
+        outf = file(filename, 'w')
 
         # write the header on the scattering angles file
         header = ["global_type=pairs", "N={0}".format(len(angles)), "pairs="]
@@ -255,13 +397,7 @@ class DDA(ScatteringTheory):
         np.savetxt(outf, angles)
         outf.close()
 
-        self._run_adda(scatterer, schema.optics, temp_dir)
-
-        # Go into the results directory, there should only be one run
-        result_dir = glob.glob(os.path.join(temp_dir, 'run000*'))[0]
-        if self.keep_raw_calculations:
-            self._last_result_dir = result_dir
- 
+    def _read_scat_matrix(self, result_dir):
         adda_result = np.loadtxt(os.path.join(result_dir, 'ampl_scatgrid'),
                                  skiprows=1)
         # columns in result are
@@ -275,23 +411,336 @@ class DDA(ScatteringTheory):
         # eq 3.12
         scat_matr = np.array([[s[:,1], s[:,2]], [s[:,3], s[:,0]]]).transpose()
 
-        if self.keep_raw_calculations:
-            print("Raw calculations are in: {0}".format(temp_dir))
-        else:
-            shutil.rmtree(temp_dir)
-
         return scat_matr
 
+    def _grid_scat_matrix(self, scatterer, optics):
+        """
+        Scattering matrix of a scatterer on the angular grid, from the cache
+        if it has been computed before
+
+        Returns
+        -------
+        thetas, phis : ndarray
+            Grid angles (radians)
+        scat_matr : ndarray (n_theta, n_phi, 2, 2)
+            Scattering matrix at each grid point
+        """
+        n_theta, n_phi = self.angular_grid
+        thetas = np.linspace(0, np.pi, n_theta)
+        phis = np.arange(n_phi) * 2*np.pi/n_phi
+
+        # ADDA puts the particle at the origin of its own coordinates, but our
+        # voxelizations start from the scatterer's bounds, so move it to the
+        # origin first to make them the same for any translation
+        location = np.asarray(scatterer.location, dtype='float')
+        scatterer = scatterer.translated(*(-location))
+
+        # key on what ADDA would be given, but from the parameters themselves
+        # so that a cache hit needs no voxelization or geometry file
+        key = (tuple(self._adda_cmd(optics)), optics.med_wavelen,
+               optics.index, self.max_dpl_size, _exact_key(scatterer),
+               (n_theta, n_phi))
+
+        def compute():
+            scat_matr = self._load_cached(key)
+            if scat_matr is None:
+                cmd = self._adda_cmd(optics)
+                cmd.extend(self._scatterer_args(scatterer, optics,
+                                                _work_dir()))
+                angles = np.column_stack((np.repeat(thetas, n_phi),
+                                          np.tile(phis, n_theta))) * 180/np.pi
+                scat_matr = self._run_adda(cmd, angles).reshape(
+                    (n_theta, n_phi, 2, 2))
+                self._save_cached(key, scat_matr)
+            # the cached array is shared between calls
+            scat_matr.setflags(write=False)
+            # keep the scatterer alive so that the functions named in the key
+            # (by id) cannot be reused by others
+            return scatterer, scat_matr
+
+        return thetas, phis, self.scat_matr_cache.get_or_compute(key,
+                                                                 compute)[1]
+
+    def _cache_file(self, key):
+        # name of the file a scattering matrix is saved under in cache_dir,
+        # or None if it should not be saved
+        if self.cache_dir is None or _has_object_ids(key):
+            # identities mean nothing to a later session
+            return None
+        name = hashlib.sha1(repr(key)).hexdigest()
+        return os.path.join(self.cache_dir, name + '.npy')
+
+    def _load_cached(self, key):
+        filename = self._cache_file(key)
+        if filename is None:
+            return None
+        try:
+            return np.load(filename)
+        except IOError:
+            return None
+
+    def _save_cached(self, key, scat_matr):
+        filename = self._cache_file(key)
+        if filename is None:
+            return
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        # write under a temporary name and rename so that a concurrent reader
+        # never sees a partial file
+        outf = tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix='.npy',
+                                           delete=False)
+        np.save(outf, scat_matr)
+        outf.close()
+        os.rename(outf.name, filename)
+
     def _calc_field(self, scatterer, schema):
         calc_points = schema.positions.kr_theta_phi(scatterer.location, schema.optics)
         scat_matr = self._calc_scat_matrix(scatterer, schema, calc_points)
-        fields = np.zeros_like(calc_points, dtype = scat_matr.dtype)
+        fields = _scat_matr_fields(calc_points, scat_matr,
+                                   schema.optics.polarization)
+
+        return self._finalize_fields(scatterer.z, fields, schema)
 
-        for i, point in enumerate(calc_points):
-            kr, theta, phi = point
-            escat_sph = mieangfuncs.calc_scat_field(kr, phi, scat_matr[i],
-                                                    schema.optics.polarization)
-            fields[i] = mieangfuncs.fieldstocart(escat_sph, theta, phi)
+    def _calc_holo_batch(self, scatterers, schema, scalings, out):
+        # each hologram is one ADDA run, so run several of them at once and
+        # fill in the holograms as they finish
+        def holo(i):
+            return self.calc_holo(scatterers[i], schema, scalings[i]).ravel()
 
+        for i, result in _map_concurrent(holo, len(scatterers),
+                                         self._n_processes):
+            out[i] = result
 
-        return self._finalize_fields(scatterer.z, fields, schema)
+
+def _scat_matr_fields(calc_points, scat_matr, polarization):
+    """
+    Cartesian scattered fields from amplitude scattering matrices
+
+    Does the same as calling mieangfuncs.calc_scat_field and
+    mieangfuncs.fieldstocart at each point, for all the points at once.
+
+    Parameters
+    ----------
+    calc_points : ndarray (N, 3)
+        kr, theta, phi of each point
+    scat_matr : ndarray (N, 2, 2)
+        Amplitude scattering matrix at each point
+    polarization : array (2)
+        Incident polarization
+
+    Returns
+    -------
+    fields : ndarray (N, 3)
+        x, y, z components of the scattered field at each point
+    """
+    kr, theta, phi = np.asarray(calc_points, dtype='float').T
+    ex, ey = np.asarray(polarization, dtype='float')[:2]
+    cp, sp = np.cos(phi), np.sin(phi)
+    ct, st = np.cos(theta), np.sin(theta)
+
+    # incident polarization relative to the scattering plane
+    einc_sph = np.column_stack((ex*cp + ey*sp, ex*sp - ey*cp))
+    # Bohren & Huffman formalism, with escatperp = -escatphi
+    prefactor = 1.0j / kr * np.exp(1.0j * kr)
+    escat = np.einsum('...ij,...j->...i', scat_matr, einc_sph)
+    escat_th = prefactor * escat[:, 0]
+    escat_ph = -prefactor * escat[:, 1]
+
+    return np.column_stack((ct*cp*escat_th - sp*escat_ph,
+                            ct*sp*escat_th + cp*escat_ph,
+                            -st*escat_th))
+
+
+# Default cache used by all DDA theories that do not ask for a private one.  A
+# fine grid over the whole sphere takes a few MB.
+_shared_scat_matr_cache = LRUCache(16, maxbytes=256*2**20)
+
+# Voxelizations take 6 to 16 bytes per dipole, so this holds a few scatterers
+# of millions of dipoles.
+_shared_voxel_cache = LRUCache(8, maxbytes=256*2**20)
+
+# names for ADDA run directories, unique within this process
+_run_ids = itertools.count()
+_work_dir_lock = threading.Lock()
+_adda_dir = None
+
+def _work_dir():
+    """
+    Directory all ADDA runs and geometry files go in, made on first use and
+    removed when Python exits
+    """
+    # shared by all DDA theories, since binding makes a new theory for every
+    # call on the class and a directory each would pile up until exit
+    global _adda_dir
+    with _work_dir_lock:
+        if _adda_dir is None:
+            _adda_dir = tempfile.mkdtemp(prefix='holopy_dda')
+            atexit.register(shutil.rmtree, _adda_dir, True)
+    return _adda_dir
+
+def _map_concurrent(func, n_items, n_workers):
+    """
+    Call func(i) for i in range(n_items) from up to n_workers threads
+
+    func is expected to spend most of its time waiting for a subprocess, so
+    threads are enough to keep that many processes going.
+
+    Yields
+    ------
+    i, result
+        Index and result of each call that succeeds, in the order they finish
+
+    Raises
+    ------
+    BatchCalculationError
+        After all the calls have finished, if any of them raised
+    """
+    def call(i):
+        try:
+            return i, func(i), None
+        except Exception as e:
+            return i, None, e
+
+    failures = {}
+    for i, result, error in _thread_pool(n_workers).imap_unordered(
+            call, range(n_items)):
+        if error is None:
+            yield i, result
+        else:
+            failures[i] = error
+    if failures:
+        raise BatchCalculationError(failures)
+
+# number of voxels to format at once when writing geometry files
+_geometry_chunk = 65536
+
+def _geometry_rows(vox, n_domains):
+    """
+    Occupied voxels of a voxelization
+
+    Parameters
+    ----------
+    vox : ndarray (int)
+        Domain of each voxel, 0 for voxels outside the scatterer
+    n_domains : int
+        Number of domains (materials).  If more than one, the domain of each
+        voxel is given after its indices.
+
+    Returns
+    -------
+    rows : ndarray (N, 3) or (N, 4)
+        Indices (and domain) of each occupied voxel, in the smallest integer
+        type that holds them
+    """
+    occupied = np.nonzero(vox)
+    columns = list(occupied)
+    if n_domains > 1:
+        columns.append(vox[occupied])
+    rows = np.column_stack(columns)
+    dtype = np.min_scalar_type(rows.max() if rows.size else 0)
+    return rows.astype(np.promote_types(dtype, np.int16))
+
+def _write_geometry(rows, n_domains, outf):
+    """
+    Write an ADDA geometry file listing the voxels from _geometry_rows
+    """
+    if n_domains > 1:
+        outf.write("Nmat={0}\n".format(n_domains))
+    # format many lines with one string operation, rather than one per line as
+    # np.savetxt does, and write them as we go so the whole file is never in
+    # memory at once
+    line = ' '.join(['%d'] * rows.shape[1]) + '\n'
+    for start in range(0, len(rows), _geometry_chunk):
+        block = rows[start:start+_geometry_chunk]
+        outf.write((line * len(block)) % tuple(block.ravel().tolist()))
+
+class _ObjectId(object):
+    """
+    Stands in for an object with no value we can compare (such as a function)
+    in an _exact_key, by its identity
+    """
+    def __init__(self, obj):
+        self.id = id(obj)
+    def __eq__(self, other):
+        return isinstance(other, _ObjectId) and other.id == self.id
+    def __ne__(self, other):
+        return not self == other
+    def __hash__(self):
+        return hash(self.id)
+    def __repr__(self):
+        return '_ObjectId({0})'.format(self.id)
+
+def _exact_key(obj):
+    """
+    Hashable key made of the exact values of a scatterer's parameters
+
+    Unlike the repr of a scatterer, which rounds numbers and summarizes large
+    arrays, two keys are equal only if every number in the two scatterers is.
+    Anything without a value to compare (indicator functions) is keyed by its
+    identity, so the caller must keep it alive as long as the key is in use.
+    """
+    if isinstance(obj, HoloPyObject):
+        return (type(obj), tuple((name, _exact_key(value)) for name, value
+                                 in sorted(obj._dict.items())))
+    if isinstance(obj, (list, tuple)):
+        return tuple(_exact_key(item) for item in obj)
+    if isinstance(obj, np.ndarray):
+        return (obj.dtype.str, obj.shape, np.ascontiguousarray(obj).tostring())
+    if obj is None or isinstance(obj, (numbers.Number, basestring)):
+        return obj
+    return _ObjectId(obj)
+
+def _has_object_ids(key):
+    # whether an _exact_key names anything by identity
+    if isinstance(key, _ObjectId):
+        return True
+    if isinstance(key, tuple):
+        return any(_has_object_ids(item) for item in key)
+    return False
+
+def _geometry_file(cmd):
+    # the geometry file an ADDA command line reads, if any
+    for i, arg in enumerate(cmd[:-1]):
+        if arg == 'read' and i > 0 and cmd[i-1] == '-shape':
+            return cmd[i+1]
+    return None
+
+def _interpolate_scat_matrix(thetas, phis, scat_matr, theta, phi):
+    """
+    Interpolate a scattering matrix computed on a grid of angles
+
+    Parameters
+    ----------
+    thetas : ndarray (n_theta)
+        Polar angles of the grid, increasing from 0 to pi
+    phis : ndarray (n_phi)
+        Evenly spaced azimuthal angles of the grid, starting at 0
+    scat_matr : ndarray (n_theta, n_phi, 2, 2)
+        Scattering matrix at the grid points
+    theta, phi : ndarray (N)
+        Angles to interpolate to
+
+    Returns
+    -------
+    scat_matr : ndarray (N, 2, 2)
+        Interpolated scattering matrices, by bicubic splines in each element
+    """
+    # wrap the grid around in phi so the splines see it as periodic
+    pad = 3
+    n_phi = len(phis)
+    dphi = 2*np.pi/n_phi
+    wrapped_phis = np.arange(-pad, n_phi+pad) * dphi
+    wrapped = scat_matr[:, np.arange(-pad, n_phi+pad) % n_phi]
+
+    theta = np.asarray(theta, dtype='float')
+    phi = np.asarray(phi, dtype='float') % (2*np.pi)
+    out = np.empty(theta.shape + (2, 2), dtype='complex')
+    for i in range(2):
+        for j in range(2):
+            re = RectBivariateSpline(thetas, wrapped_phis,
+                                     wrapped[..., i, j].real)
+            im = RectBivariateSpline(thetas, wrapped_phis,
+                                     wrapped[..., i, j].imag)
+            out[..., i, j] = (re(theta, phi, grid=False) +
+                              1.0j * im(theta, phi, grid=False))
+    return out
@@ -28,9 +28,13 @@ scattered field.
 from __future__ import division
 import numpy as np
 from ...core.helpers import _ensure_array
+from ...core.cache import LRUCache
 from ..errors import TheoryNotCompatibleError, UnrealizableScatterer
 from ..scatterer import Sphere, Scatterers
-from .scatteringtheory import FortranTheory
+from ...core.marray import make_vector_schema
+from ..binding_method import binding
+from .scatteringtheory import (FortranTheory, scattered_field_to_hologram,
+                               _kr_theta_phi)
 from holopy.scattering.theory.mie_f import mieangfuncs, miescatlib
 from .mie_f.multilayer_sphere_lib import scatcoeffs_multi
 import copy
@@ -53,14 +57,49 @@ class Mie(FortranTheory):
 
     By default, calculates radial component of scattered electric fields,
     which is nonradiative.
-    """
 
-    # don't need to define __init__() because we'll use the base class
-    # constructor
+    Scattering coefficients depend only on the size parameter and relative
+    index of each layer, not on where the sphere is, so they are kept in a
+    bounded cache and reused when only the center (or scaling) of a sphere
+    changes, as is the case for most steps of a fit.
+
+    Attributes
+    ----------
+    coeff_cache_size : int or None (optional)
+        Number of sets of scattering coefficients to cache.  None (default)
+        uses a cache shared by all Mie theories (see :attr:`coeff_cache`),
+        0 disables caching, and any other number gives this theory a private
+        cache of that size.
+    n_threads : int or None (optional)
+        Number of threads to split field calculations across.  If None, the
+        HOLOPY_NUM_THREADS environment variable is used if set, otherwise
+        calculations run in a single thread.  Results do not depend on the
+        number of threads.
+    radial_interpolation : bool (optional)
+        If True, compute fields on a detector plane (all points at the same
+        z) by evaluating the scattering solution on a 1D grid of distances
+        from the sphere's axis and interpolating onto the detector points.
+        The azimuthal dependence is applied analytically.  This is much
+        faster for large images, but approximate.  Calculations that are not
+        on a plane (or have too few points to benefit) are done exactly.
+    interpolation_tol : float (optional)
+        Relative accuracy the radial interpolation is refined to, measured
+        against the largest field amplitude on the detector.
+    precision : 'double' or 'single' (optional)
+        Precision of the returned fields and holograms.  'single' stores them
+        as complex64/float32, halving the memory they take up.  Only the
+        output is affected: the scattering solution, the coordinates of the
+        points and the intermediate fields are always double precision (so
+        the peak memory of a calculation drops by less than half), and the
+        result is rounded when it is stored, costing about 1e-7 relative
+        accuracy.
+    """
 
     def __init__(self, compute_escat_radial = True,
                  full_radial_dependence = True,
-                 eps1 = 1e-2, eps2 = 1e-16):
+                 eps1 = 1e-2, eps2 = 1e-16, coeff_cache_size = None,
+                 n_threads = None, radial_interpolation = False,
+                 interpolation_tol = 1e-5, precision = 'double'):
         #compute_escat_radial determines if radial components will be calculated
         #full_radial dependence deermines if the full spherical Hankel function
         # will be used, or if it will be approximated to be in the far field.
@@ -68,9 +107,114 @@ class Mie(FortranTheory):
         self.full_radial_dependence = full_radial_dependence
         self.eps1 = eps1
         self.eps2 = eps2
+        self.coeff_cache_size = coeff_cache_size
+        self.n_threads = n_threads
+        self.radial_interpolation = radial_interpolation
+        self.interpolation_tol = interpolation_tol
+        self.precision = precision
+        if coeff_cache_size is not None:
+            self._coeff_cache = LRUCache(coeff_cache_size)
         # call base class constructor
         super(Mie, self).__init__()
 
+    @property
+    def coeff_cache(self):
+        """
+        The :class:`.LRUCache` holding this theory's scattering coefficients.
+
+        Use coeff_cache.info() for hit/miss statistics, coeff_cache.resize(n)
+        to change its capacity and coeff_cache.clear() to empty it.
+        """
+        return getattr(self, '_coeff_cache', _shared_coeff_cache)
+
+    @classmethod
+    @binding
+    def calc_field_jacobian(cls_self, scatterer, schema, scaling=1.0):
+        """
+        Calculate the scattered field of a sphere and its derivatives with
+        respect to the sphere's parameters
+
+        Parameters
+        ----------
+        scatterer : :class:`.Sphere`
+            Single layer sphere to compute scattering from
+        schema : :class:`.Schema`
+            Where to compute the field.  All points must lie in a plane of
+            constant z, as they do for an image
+        scaling : float
+            Scaling value (alpha) to multiply the field by
+
+        Returns
+        -------
+        e_field : :class:`.VectorGrid`
+            Scattered electric field
+        jacobian : dict of :class:`.VectorGrid`
+            Derivatives of e_field with respect to 'center[0]', 'center[1]',
+            'center[2]', 'r', 'n' and 'scaling'.  The field is an analytic
+            function of the index, so the derivative with respect to the
+            imaginary part of n is 1j times jacobian['n']
+
+        Notes
+        -----
+        The field and its derivatives are computed from a 1D radial solution
+        as with radial_interpolation (whatever that is set to), accurate to
+        about interpolation_tol.  This costs much less than the
+        finite differences a minimizer would otherwise need.
+        """
+        field, derivatives = cls_self._field_jacobian(
+            scatterer, schema, schema.positions.xyz())
+        vector_schema = make_vector_schema(schema)
+        jacobian = {'scaling': vector_schema.interpret_1d(field)}
+        for key, value in derivatives.iteritems():
+            jacobian[key] = vector_schema.interpret_1d(value * scaling)
+        return vector_schema.interpret_1d(field * scaling), jacobian
+
+    @classmethod
+    @binding
+    def calc_holo_jacobian(cls_self, scatterer, schema, scaling=1.0):
+        """
+        Calculate the hologram of a sphere and its derivatives with respect
+        to the sphere's parameters and the scaling
+
+        Parameters
+        ----------
+        scatterer : :class:`.Sphere`
+            Single layer sphere to compute scattering from
+        schema : :class:`.Schema`
+            Where to compute the hologram.  All points must lie in a plane of
+            constant z, as they do for an image
+        scaling : float
+            Scaling value (alpha) for intensity of reference wave
+
+        Returns
+        -------
+        holo : :class:`.Image`
+            Hologram, computed as for calc_field_jacobian
+        jacobian : dict of ndarray
+            Derivatives of holo with respect to 'center[0]', 'center[1]',
+            'center[2]', 'r', 'n.real', 'n.imag' and 'scaling', each the
+            same shape as holo.  'n' is the same as 'n.real' (for fits with
+            a real index).
+        """
+        field, derivatives = cls_self._field_jacobian(
+            scatterer, schema, schema.positions.xyz())
+        # only x and y components reach the detector (see
+        # scattered_field_to_hologram)
+        total = field[:, :2] * scaling + schema.optics.polarization
+        holo = scattered_field_to_hologram(
+            make_vector_schema(schema).interpret_1d(field * scaling),
+            schema.optics)
+
+        def derivative(d_field):
+            d_holo = 2 * (total.conj() * d_field[:, :2]).real.sum(-1)
+            return d_holo.reshape(holo.shape)
+        jacobian = {'scaling': derivative(field),
+                    'n.imag': derivative(1j * scaling * derivatives['n'])}
+        for key, value in derivatives.iteritems():
+            jacobian[key] = derivative(value * scaling)
+        jacobian['n.real'] = jacobian['n']
+        return holo, jacobian
+
     def _can_handle(self, scatterer):
         return isinstance(scatterer, Sphere)
 
@@ -78,25 +222,244 @@ class Mie(FortranTheory):
         if isinstance(scatterer, Sphere):
             scat_coeffs = self._scat_coeffs(scatterer, schema.optics)
 
-            # TODO: actually use (rather than ignore) the phi
-            scat_matrs = [mieangfuncs.asm_mie_far(scat_coeffs, theta) for
-                          theta, phi in schema.positions_theta_phi()]
-            return np.array(scat_matrs)
+            # The scattering matrix of a sphere does not depend on phi, so
+            # only compute it once for each distinct theta
+            theta = schema.positions_theta_phi()[:, 0]
+            thetas, inverse = np.unique(theta, return_inverse=True)
+            scat_matrs = mieangfuncs.asm_mie_far_arr(scat_coeffs, thetas)
+            return np.rollaxis(scat_matrs, 2)[inverse]
         else:
             raise TheoryNotCompatibleError(self, scatterer)
 
     def _raw_fields(self, positions, scatterer, optics):
         scat_coeffs = self._scat_coeffs(scatterer, optics)
-        return mieangfuncs.mie_fields(positions, scat_coeffs, optics.polarization,
-                                      self.compute_escat_radial,
-                                      self.full_radial_dependence)
+        if self.radial_interpolation:
+            fields = self._radial_interpolated_fields(positions, scat_coeffs,
+                                                      optics)
+            if fields is not None:
+                return fields
+        return self._map_points(mieangfuncs.mie_fields, positions,
+                                scat_coeffs, optics.polarization,
+                                self.compute_escat_radial,
+                                self.full_radial_dependence)
+
+    def _radial_interpolated_fields(self, positions, scat_coeffs, optics):
+        """
+        Fields on a detector plane from a 1D radial solution
+
+        On a plane of constant z, the field scattered by a sphere is set by
+        its values along a single line out from the sphere's axis: the field
+        at azimuth phi is the field at phi = 0 for the incident polarization
+        rotated by -phi, rotated back by phi.  We compute the field at phi = 0
+        for x and y polarized light on a 1D grid of rho (refined until cubic
+        interpolation is accurate to interpolation_tol), interpolate its
+        slowly varying envelope (with the outgoing wave exp(ikr)/kr divided
+        out) to each point, and rotate it into place analytically.
+
+        Returns None if the points are not on a plane or there are too few of
+        them for this to be worthwhile, in which case the caller should do the
+        exact calculation.
+        """
+        n_pts = positions.shape[1]
+        if n_pts < 4*_min_radial_samples:
+            return None
+        # Each sample costs four kernel evaluations (two polarizations, plus
+        # the midpoints we check against), give up if that would no longer be
+        # much cheaper than the exact calculation
+        radial = self._radial_envelopes(positions, scat_coeffs, n_pts // 32)
+        if radial is None:
+            return None
+        kz, grid, env = radial
+
+        kr, theta, phi = positions
+        abc = _interp_cubic(kr * np.sin(theta), grid, env) * np.exp(1j*kr) / kr
+        return _rotate_radial_fields(abc, phi, optics.polarization)
+
+    def _radial_envelopes(self, positions, scat_coeffs, max_samples):
+        """
+        Sample the envelope of the scattered field on a 1D radial grid
+
+        Parameters
+        ----------
+        positions : ndarray (3, N)
+            kr, theta, phi of the points the grid needs to cover
+        scat_coeffs : ndarray
+            Scattering coefficients of the sphere
+        max_samples : int
+            Give up if the grid would need more samples than this
+
+        Returns
+        -------
+        kz : float
+            Nondimensional height of the sphere above the plane of points
+        grid : ndarray (M)
+            Uniformly spaced values of k*rho covering the points
+        envelopes : ndarray(complex) (3, M)
+            Envelopes (see _envelopes) at grid
+
+        or None if the points do not lie in a plane of constant z or more than
+        max_samples samples would be needed.
+        """
+        kr, theta, phi = positions
+        kz = kr * np.cos(theta)
+        if np.ptp(kz) > 1e-9 * abs(kz).max():
+            return None
+        kz = kz.mean()
+        krho = kr * np.sin(theta)
+        lo = krho.min()
+        # if all the points are at the same distance from the axis, any grid
+        # that contains that distance will do
+        hi = max(krho.max(), lo + 1)
+
+        n_samples = _min_radial_samples
+        while True:
+            if n_samples > max_samples:
+                return None
+            grid = np.linspace(lo, hi, n_samples)
+            mid = (grid[1:] + grid[:-1]) / 2
+            env = self._envelopes(grid, kz, scat_coeffs)
+            err = (abs(_interp_cubic(mid, grid, env) -
+                       self._envelopes(mid, kz, scat_coeffs)).max() /
+                   abs(env).max())
+            if err < self.interpolation_tol:
+                return kz, grid, env
+            # cubic interpolation error falls as the fourth power of the
+            # sample spacing, so jump straight to a grid that should be fine
+            # enough
+            n_samples = int(n_samples * (err/self.interpolation_tol)**.25
+                            * 1.1) + 1
+
+    def _envelopes(self, krho, kz, scat_coeffs):
+        # At phi = 0, x polarized light only scatters into x and z and y
+        # polarized light only into y.  Return those three components with the
+        # outgoing spherical wave divided out, which leaves functions of krho
+        # that are smooth enough to interpolate
+        kr = np.sqrt(krho**2 + kz**2)
+        points = np.vstack((kr, np.arctan2(krho, kz), np.zeros_like(kr)))
+        ex, _, ez = self._map_points(mieangfuncs.mie_fields, points,
+                                     scat_coeffs, (1., 0.),
+                                     self.compute_escat_radial,
+                                     self.full_radial_dependence)
+        _, ey, _ = self._map_points(mieangfuncs.mie_fields, points,
+                                    scat_coeffs, (0., 1.),
+                                    self.compute_escat_radial,
+                                    self.full_radial_dependence)
+        return np.vstack((ex, ey, ez)) * kr * np.exp(-1j*kr)
+
+    def _field_jacobian(self, s, schema, positions):
+        """
+        Scattered field of a sphere and its derivatives on a plane of points
+
+        Center derivatives are derivatives of the radial solution used for
+        radial_interpolation: x and y follow analytically from the
+        interpolated envelopes, z from envelopes on neighbouring planes.  The
+        field is linear in the scattering coefficients, so r and n
+        derivatives are the fields of the derivatives of the coefficients.
+
+        Returns
+        -------
+        field : ndarray(complex) (N, 3)
+        derivatives : dict of ndarray(complex) (N, 3)
+            derivatives of field with respect to center[0], center[1],
+            center[2], r and n (the complex derivative, the field is an
+            analytic function of n)
+        """
+        if not (isinstance(s, Sphere) and np.isscalar(s.r) and
+                np.isscalar(s.n)):
+            raise TheoryNotCompatibleError(
+                self, s, "derivatives are only available for single layer "
+                "spheres")
+        optics = schema.optics
+        k = optics.wavevec
+        coords = np.empty((len(positions), 3))
+        _kr_theta_phi(positions, s.center, optics, coords,
+                      np.empty((3, len(positions))))
+        kr, theta, phi = coords.T
+
+        coeffs = self._scat_coeffs(s, optics)
+        radial = self._radial_envelopes(coords.T, coeffs,
+                                        max(len(kr), 64*_min_radial_samples))
+        if radial is None:
+            raise TheoryNotCompatibleError(
+                self, s, "derivatives can only be computed at points in a "
+                "plane of constant z")
+        kz, grid, env = radial
+
+        dkz = 1e-4 * max(abs(kz), 1)
+        env_kz = (self._envelopes(grid, kz + dkz, coeffs) -
+                  self._envelopes(grid, kz - dkz, coeffs)) / (2*dkz)
+        dcoeffs_dr, dcoeffs_dn = self._scat_coeffs_derivatives(s, optics)
+        env_r = self._envelopes(grid, kz, dcoeffs_dr)
+        env_n = self._envelopes(grid, kz, dcoeffs_dn)
+
+        krho = kr * np.sin(theta)
+        outgoing = np.exp(1j*kr) / kr
+        # d(outgoing)/d(kr) / kr, multiply by krho or kz for the derivative
+        # along that direction
+        d_outgoing = outgoing * (1j - 1/kr) / kr
+        abc, abc_kz, abc_r, abc_n = (
+            _interp_cubic(krho, grid, np.vstack((env, env_kz, env_r, env_n)))
+            .reshape(4, 3, -1))
+        abc_rho = (_interp_cubic(krho, grid, env, derivative=True) *
+                   outgoing + abc * d_outgoing * krho)
+        abc_kz = abc_kz * outgoing + abc * d_outgoing * kz
+        abc, abc_r, abc_n = abc * outgoing, abc_r * outgoing, abc_n * outgoing
+
+        # The phi derivative divided by rho.  The field is smooth through the
+        # axis, so a - b and c vanish there; use their limits on it
+        a, b, c = abc
+        a_rho, b_rho, c_rho = abc_rho
+        on_axis = krho < 1e-9 * (grid[-1] - grid[0])
+        krho = np.where(on_axis, 1, krho)
+        ab_over_rho = np.where(on_axis, a_rho - b_rho, (a - b) / krho)
+        c_over_rho = np.where(on_axis, c_rho, c / krho)
+        cp, sp = np.cos(phi), np.sin(phi)
+        pol_x, pol_y = optics.polarization
+        e_par = pol_x*cp + pol_y*sp
+        e_perp = pol_y*cp - pol_x*sp
+        field_phi = np.vstack((ab_over_rho * (cp*e_perp - sp*e_par),
+                               ab_over_rho * (cp*e_par + sp*e_perp),
+                               c_over_rho * e_perp))
+
+        def rotated(abc):
+            return np.vstack(_rotate_radial_fields(abc, phi,
+                                                   optics.polarization))
+        field = rotated(abc)
+        field_rho = rotated(abc_rho)
+        phase = np.exp(-1j*k*s.center[2])
+        derivatives = {
+            # moving the sphere moves the field the other way
+            'center[0]': -k * (cp*field_rho - sp*field_phi),
+            'center[1]': -k * (sp*field_rho + cp*field_phi),
+            # kz is measured from the plane up to the sphere
+            'center[2]': k * rotated(abc_kz) - 1j*k * field,
+            'r': rotated(abc_r),
+            'n': rotated(abc_n)}
+        for key, value in derivatives.iteritems():
+            derivatives[key] = (value * phase).T
+        return (field * phase).T, derivatives
+
+    def _scat_coeffs_derivatives(self, s, optics):
+        # Derivatives of a single layer sphere's scattering coefficients with
+        # respect to r and n, by central differences.  Coefficients are cheap
+        # to compute, it is the field sums that are expensive
+        x = optics.wavevec * s.r
+        m = s.n / optics.index
+        lmax = miescatlib.nstop(x)
+        def coeffs(m, x):
+            return miescatlib.scatcoeffs(m, x, lmax, self.eps1, self.eps2)
+        dx = 1e-6 * x
+        dm = 1e-6 * abs(m)
+        d_dx = (coeffs(m, x + dx) - coeffs(m, x - dx)) / (2*dx)
+        d_dm = (coeffs(m + dm, x) - coeffs(m - dm, x)) / (2*dm)
+        return d_dx * optics.wavevec, d_dm / optics.index
 
     def _raw_internal_fields(self, positions, scatterer, optics):
         scat_coeffs = self._scat_coeffs(scatterer, optics)
         # TODO BUG: this isn't right for layered spheres (and will
         # probably crash)
-        return mieangfuncs.mie_internal_fields(positions, scatterer.n,
-                                               scat_coeffs, optics.polarization)
+        return self._map_points(mieangfuncs.mie_internal_fields, positions,
+                                scatterer.n, scat_coeffs, optics.polarization)
 
 
     def _calc_cross_sections(self, scatterer, optics):
@@ -154,14 +517,22 @@ class Mie(FortranTheory):
             raise UnrealizableScatterer(self, s, "radius too large, field "+
                                         "calculation would take forever")
 
-        if len(x_arr) == 1 and len(m_arr) == 1:
-            # Could just use scatcoeffs_multi here, but jerome is in favor of
-            # keeping the simpler single layer code here
-            lmax = miescatlib.nstop(x_arr[0])
-            return  miescatlib.scatcoeffs(m_arr[0], x_arr[0], lmax, self.eps1,
-                                          self.eps2)
-        else:
-            return scatcoeffs_multi(m_arr, x_arr, self.eps1, self.eps2)
+        def compute():
+            if len(x_arr) == 1 and len(m_arr) == 1:
+                # Could just use scatcoeffs_multi here, but jerome is in favor
+                # of keeping the simpler single layer code here
+                lmax = miescatlib.nstop(x_arr[0])
+                coeffs = miescatlib.scatcoeffs(m_arr[0], x_arr[0], lmax,
+                                               self.eps1, self.eps2)
+            else:
+                coeffs = scatcoeffs_multi(m_arr, x_arr, self.eps1, self.eps2)
+            # the cached array is shared between calls, so make sure no one
+            # can modify it out from under us
+            coeffs.setflags(write=False)
+            return coeffs
+
+        key = (tuple(m_arr), tuple(x_arr), self.eps1, self.eps2)
+        return self.coeff_cache.get_or_compute(key, compute)
 
 
     def _scat_coeffs_internal(self, s, optics):
@@ -180,3 +551,57 @@ class Mie(FortranTheory):
             return  miescatlib.internal_coeffs(m_arr[0], x_arr[0], lmax)
         # else:
 #             return scatcoeffs_multi(m_arr, x_arr)
+
+# Number of samples the radial interpolation starts with
+_min_radial_samples = 64
+
+def _interp_cubic(x, grid, values, derivative=False):
+    """
+    Local cubic (4 point Lagrange) interpolation from a uniform grid
+
+    Parameters
+    ----------
+    x : ndarray (N)
+        Points to interpolate to, within [grid[0], grid[-1]]
+    grid : ndarray (M)
+        Uniformly spaced sample locations, M >= 4
+    values : ndarray (..., M)
+        Values (real or complex) at grid, interpolated along the last axis
+    derivative : bool
+        If True, return the derivative of the interpolant instead of its value
+
+    Returns
+    -------
+    interpolated : ndarray (..., N)
+    """
+    h = grid[1] - grid[0]
+    t = (x - grid[0]) / h
+    # use the nodes i-1, i, i+1, i+2 around each point, shifting the stencil
+    # inwards at the ends of the grid
+    i = np.clip(np.floor(t).astype('int'), 1, len(grid) - 3)
+    u = t - i
+    if derivative:
+        weights = (-(3*u**2 - 6*u + 2)/6/h, (3*u**2 - 4*u - 1)/2/h,
+                   -(3*u**2 - 2*u - 2)/2/h, (3*u**2 - 1)/6/h)
+    else:
+        weights = (-u*(u-1)*(u-2)/6, (u+1)*(u-1)*(u-2)/2,
+                   -(u+1)*u*(u-2)/2, (u+1)*u*(u-1)/6)
+    return sum(w * values[..., i+offset] for w, offset in
+               zip(weights, (-1, 0, 1, 2)))
+
+def _rotate_radial_fields(abc, phi, polarization):
+    # Field at azimuth phi from the x, y and z components a, b, c at phi = 0
+    # of the fields scattered from x (a, c) and y (b) polarized light (see
+    # Mie._envelopes): split the polarization into components parallel and
+    # perpendicular to the scattering plane and rotate by phi
+    a, b, c = abc
+    cp, sp = np.cos(phi), np.sin(phi)
+    pol_x, pol_y = polarization
+    e_par = pol_x*cp + pol_y*sp
+    e_perp = pol_y*cp - pol_x*sp
+    return [cp*a*e_par - sp*b*e_perp, sp*a*e_par + cp*b*e_perp, c*e_par]
+
+# Default cache used by all Mie theories that do not ask for a private one.
+# This means the Mie.calc_* class level calls (which construct a new theory
+# each time) still get to reuse coefficients.
+_shared_coeff_cache = LRUCache(256)
@@ -25,6 +25,12 @@
 !
 ! At compile this must be linked with uts_scsmfo.for
 ! Functions are designed to be compiled with f2py and called from Python.
+!
+! The routines that loop over field points (mie_fields, mie_internal_fields,
+! tmatrix_fields) are marked threadsafe, so f2py releases the GIL while they
+! run and Python can evaluate blocks of points on several threads at once.
+! They, and everything they call, must therefore not keep any state between
+! calls (no SAVE variables or common blocks).
 
       subroutine calc_scat_field(kr, phi, ascatm, einc, escat_sph)
         ! Do the matrix multiplication to calculate scattered field
@@ -93,6 +99,7 @@
         ! es_x, es_y, es_z: complex array (n_pts)
         !     The three electric field components at points in calc_points
         implicit none
+!f2py threadsafe
         integer, intent(in) :: n_pts, nstop
         real (kind = 8), intent(in), dimension(3, n_pts) :: calc_points
         logical, intent(in) :: rad, rad_dep
@@ -175,6 +182,7 @@
         ! eint_x, eint_y, eint_z: complex array (n_pts)
         !     The three electric field components at points in calc_points
         implicit none
+!f2py threadsafe
         integer, intent(in) :: n_pts, nstop
         complex (kind = 8), intent(in) :: m
         real (kind = 8), intent(in), dimension(3, n_pts) :: calc_points
@@ -248,6 +256,7 @@
         !     The three electric field components at points in calc_points
 
         implicit none
+!f2py threadsafe
         integer, intent(in) :: n_pts, lmax
         real (kind = 8), intent(in), dimension(3, n_pts) :: calc_points
         complex (kind = 8), intent(in), dimension(2,lmax*(lmax+2),2) :: amn
@@ -446,6 +455,40 @@
         return
         end
 
+
+      subroutine asm_mie_far_arr(nstop, asbs, n_pts, thetas, asm_out)
+        ! Calculate far field amplitude scattering matrices for a spherically
+        ! symmetric scatterer at an array of angles; the same as calling
+        ! asm_mie_far for each of them.
+        !
+        ! Inputs:
+        ! =======
+        ! nstop (int):
+        !     Maximum order of vector spherical harmonic expansion
+        ! asbs (complex, (2, nstop)
+        !     Scattering coefficients
+        ! thetas (real, (n_pts))
+        !     Spherical coordinate theta (radians) of each point.
+        !
+        ! Outputs:
+        ! ========
+        ! asm_out (complex, (2, 2, n_pts))
+        !     Amplitude scattering matrices in standard (Bohren & Huffman) form
+        implicit none
+!f2py threadsafe
+        integer, intent(in) :: nstop, n_pts
+        real (kind = 8), dimension(n_pts), intent(in) :: thetas
+        complex (kind = 8), dimension(2, nstop), intent(in) :: asbs
+        complex (kind = 8), dimension(2, 2, n_pts), intent(out) :: asm_out
+        integer :: i
+
+        do i = 1, n_pts
+           call asm_mie_far(nstop, asbs, thetas(i), asm_out(:, :, i))
+        end do
+
+        return
+        end
+
      
       subroutine radial_field_mie(nstop, as, kr, theta, erad_nd)
         ! Calculate non-dimensional radial component of the scattered 
@@ -30,11 +30,11 @@ from __future__ import division
 import numpy as np
 from numpy import arctan2, sin, cos
 from warnings import warn
-from scipy.integrate import dblquad
+from ...core.cache import LRUCache
 from .mie_f import mieangfuncs
 from .mie_f import scsmfo_min
 from .mie_f import uts_scsmfo
-from ..scatterer import Spheres
+from ..scatterer import Spheres, SphereArray
 from ..errors import (TheoryNotCompatibleError, UnrealizableScatterer,
                       MultisphereFieldNaN,
                       ConvergenceFailureMultisphere,
@@ -68,6 +68,34 @@ class Multisphere(FortranTheory):
     qeps2 : float (optional)
         error tolerance used to determine at what order the cluster
         spherical harmonic expansion should be truncated
+    n_threads : int or None (optional)
+        Number of threads to split field calculations across.  If None, the
+        HOLOPY_NUM_THREADS environment variable is used if set, otherwise
+        calculations run in a single thread.  Results do not depend on the
+        number of threads.
+    precision : 'double' or 'single' (optional)
+        Precision of the returned fields and holograms.  'single' stores them
+        as complex64/float32, halving the memory they take up.  Only the
+        output is affected: the scattering solution, the coordinates of the
+        points and the intermediate fields are always double precision (so
+        the peak memory of a calculation drops by less than half), and the
+        result is rounded when it is stored, costing about 1e-7 relative
+        accuracy.
+    amn_cache_size : int or None (optional)
+        Number of cluster expansions to cache.  None (default) uses a cache
+        shared by all Multisphere theories (see :attr:`amn_cache`), 0
+        disables caching, and any other number gives this theory a private
+        cache of that size.
+    cluster_tmatrix : bool (optional)
+        If True, compute the T-matrix of each rigid cluster geometry once and
+        get the expansions for all of its orientations from it (see notes).
+        This pays off when the same cluster is computed at many orientations,
+        for example when following a tumbling cluster through a video.
+    quad_order : int or None (optional)
+        Number of Gauss-Legendre points in cos(theta) for the quadratures
+        over solid angle in cross section calculations (the phi grid has
+        twice as many points).  None (default) uses lmax + 4 for a cluster
+        expansion of order lmax, which integrates its far field exactly.
 
     Notes
     -----
@@ -81,12 +109,32 @@ class Multisphere(FortranTheory):
     useful for getting fits to converge.  The results to be sensible for small
     overlaps even though mathemtically speaking they are not xstrictly valid.
 
+    The cluster expansion coefficients are computed about the cluster's
+    centroid, so they depend only on the relative positions of the spheres,
+    their sizes and indices, and the solver tolerances.  They are cached and
+    reused when a cluster is only translated, as happens for many of the
+    steps in a fit.
+
+    With cluster_tmatrix, the interaction equations are instead solved for
+    incident light from enough directions to determine the cluster's
+    T-matrix, which is cached (see :attr:`tmatrix_cache`) under the distances
+    between the spheres.  Any later rotation of that cluster is recognized
+    and its expansion found by rotating the incident field into the cluster
+    frame, applying the T-matrix and rotating the result back, without
+    solving the interaction equations again.  Building the T-matrix costs a
+    few hundred solutions.  Both paths are only as accurate as the solver
+    tolerances allow: with the default tolerances holograms from either are
+    about 1e-4 (relative) from fully converged ones, and the two differ by up
+    to a few 1e-5.  With eps, qeps1 and qeps2 all 1e-10 they agree to about
+    1e-6.
+
     Currently, Multisphere does not calculate the radial component of
     scattered electric fields. This is a good approximation for large kr,
     since the radial component falls off as 1/kr^2.
 
-    scfodim.for contains three parameters, all integers:
-     * nod: Maximum number of spheres
+    The number of spheres is only limited by memory: the Fortran code sizes
+    its arrays for the spheres and expansion orders of each cluster.
+    scfodim.for contains two parameters, both integers:
      * nod: Maximum order of individual sphere expansions. Will depend on
             size of largest sphere in cluster.
      * notd: Maximum order of cluster-centered expansion. Will depend on
@@ -109,17 +157,44 @@ class Multisphere(FortranTheory):
     """
 
     def __init__(self, niter=200, eps=1e-6, meth=1, qeps1=1e-5, qeps2=1e-8,
-                 compute_escat_radial = False):
+                 compute_escat_radial = False, n_threads = None,
+                 precision = 'double', amn_cache_size = None,
+                 cluster_tmatrix = False, quad_order = None):
         self.niter = niter
         self.eps = eps
         self.meth = meth
         self.qeps1 = qeps1
         self.qeps2 = qeps2
         self.compute_escat_radial = compute_escat_radial
+        self.n_threads = n_threads
+        self.precision = precision
+        self.amn_cache_size = amn_cache_size
+        if amn_cache_size is not None:
+            self._amn_cache = LRUCache(amn_cache_size)
+        self.cluster_tmatrix = cluster_tmatrix
+        self.quad_order = quad_order
 
         # call base class constructor
         super(Multisphere, self).__init__()
 
+    @property
+    def amn_cache(self):
+        """
+        The :class:`.LRUCache` holding this theory's cluster expansions.
+
+        Use amn_cache.info() for hit/miss statistics, amn_cache.nbytes for the
+        memory it holds and amn_cache.resize(n, maxbytes) to change its limits.
+        """
+        return getattr(self, '_amn_cache', _shared_amn_cache)
+
+    @property
+    def tmatrix_cache(self):
+        """
+        The :class:`.LRUCache` holding the cluster T-matrices used with
+        cluster_tmatrix.  It is shared by all Multisphere theories.
+        """
+        return _shared_tmatrix_cache
+
     def _can_handle(self, scatterer):
         return isinstance(scatterer, Spheres)
 
@@ -142,61 +217,168 @@ class Multisphere(FortranTheory):
         """
         if not isinstance(scatterer, Spheres):
             raise TheoryNotCompatibleError(self, scatterer)
-        # check for spheres being uniform
-        for sph in scatterer.scatterers:
-            if not np.isscalar(sph.n):
-                raise TheoryNotCompatibleError(self, scatterer, "Multisphere" +
-                                               " cannot compute scattering" +
-                                               " from layered particles.")
-
-        # check that the parameters are in a range where the multisphere
-        # expansion will work
-        for s in scatterer.scatterers:
-            if s.r * optics.wavevec > 1e3:
-                raise UnrealizableScatterer(self, s, "radius too large, field "+
-                                            "calculation would take forever")
+        # check for spheres being uniform (a SphereArray can only hold
+        # uniform spheres, so there is no need to look at each one)
+        if not isinstance(scatterer, SphereArray):
+            for sph in scatterer.scatterers:
+                if not np.isscalar(sph.n):
+                    raise TheoryNotCompatibleError(self, scatterer,
+                                                   "Multisphere cannot " +
+                                                   "compute scattering from " +
+                                                   "layered particles.")
 
         # switch to centroid weighted coordinate system tmatrix code expects
-        # and nondimensionalize
-        centers = (scatterer.centers - scatterer.centers.mean(0)) * optics.wavevec
+        # and nondimensionalize.  Round off the last few bits so that
+        # translating a cluster gives exactly the same relative coordinates
+        # (and so can reuse a cached expansion); this is far below the
+        # solver's tolerance.
+        centers = np.asarray(scatterer.centers)
+        centers = np.round((centers - centers.mean(0)) * optics.wavevec, 10)
+
+        m = np.asarray(scatterer.n) / optics.index
+        x = np.asarray(scatterer.r) * optics.wavevec
 
-        m = scatterer.n / optics.index
+        # check that the parameters are in a range where the multisphere
+        # expansion will work
+        if (x > 1e3).any():
+            raise UnrealizableScatterer(self, scatterer, "radius too large, "
+                                        "field calculation would take forever")
 
         if (centers > 1e4).any():
             raise UnrealizableScatterer(self, scatterer, "Particle separation "
                                         "too large, calculation would take forever")
 
+        def compute():
+            if self.cluster_tmatrix:
+                amn, lmax = self._amn_from_tmatrix(centers, m, x)
+            else:
+                amn, lmax = self._amncalc(centers, m, x)
+
+            if np.isnan(amn).any():
+                raise MultisphereExpansionNaN()
+
+            # the cached array is shared between calls, so make sure no one
+            # can modify it out from under us
+            amn.setflags(write=False)
+            return amn, lmax
+
+        # the T-matrix and direct solutions differ within the solver
+        # tolerances, so don't let one stand in for the other
+        key = (tuple(centers.ravel()), tuple(m), tuple(x), self.niter,
+               self.eps, self.qeps1, self.qeps2, self.meth,
+               bool(self.cluster_tmatrix))
+        return self.amn_cache.get_or_compute(key, compute)
+
+    def _amncalc(self, centers, m, x, ea=(0, 0)):
+        """
+        Solve the interaction equations with SCSMFO.
+
+        centers are the nondimensional sphere positions relative to the
+        centroid, and ea the Euler angles alpha and beta (in degrees) of the
+        incident light in the cluster frame.  Returns the (truncated) amn
+        coefficients and the order lmax of the cluster expansion.
+        """
         _, lmax, amn0, converged = scsmfo_min.amncalc(
             1, centers[:,0],  centers[:,1],
-            # The fortran code uses oppositely directed z axis (they have laser
-            # propagation as positive, we have it negative), so we multiply the
-            # z coordinate by -1 to correct for that.
+            # The fortran code uses oppositely directed z axis (they have
+            # laser propagation as positive, we have it negative), so we
+            # multiply the z coordinate by -1 to correct for that.
             -1.0 * centers[:,2],  m.real, m.imag,
-            scatterer.r * optics.wavevec, self.niter, self.eps,
-            self.qeps1, self.qeps2,  self.meth, (0,0))
+            x, self.niter, self.eps,
+            self.qeps1, self.qeps2,  self.meth, ea,
+            nodrtd=_cluster_order_bound(centers, x))
 
         # converged == 1 if the SCSMFO iterative solver converged
         # f2py converts F77 LOGICAL to int
         if not converged:
             raise ConvergenceFailureMultisphere()
 
-        # chop off unused parts of amn0, the fortran code currently has a hard
-        # coded number of parameters so it will return too many coefficients.
-        # We truncate here to reduce the length of stuff we have to compute with
-        # later.
+        # amn0 is sized by an upper bound on lmax, chop off any unused part
+        # so we don't carry it through later calculations (and the cache)
         limit = lmax**2 + 2*lmax
-        amn = amn0[:, 0:limit, :]
+        if amn0.shape[1] > limit:
+            amn0 = amn0[:, 0:limit, :].copy()
+        return amn0, lmax
 
-        if np.isnan(amn).any():
-            raise MultisphereExpansionNaN()
+    def _cluster_tmatrix(self, centers, m, x):
+        """
+        Compute the T-matrix of a cluster from solutions for plane waves
+        incident from many directions.
 
-        return amn, lmax
+        Returns the T-matrix, which maps the incident field coefficients
+        from :func:`_plane_wave_coeffs` (flattened) to the flattened amn
+        coefficients, both in the frame of the cluster as given by centers,
+        and the order lmax of the cluster expansion.
+        """
+        amn, lmax = self._amncalc(centers, m, x)
+        # The incident field must be expanded to a few orders more than the
+        # scattered field to represent it over the whole cluster; with four
+        # more the T-matrix reproduces direct solutions to within their own
+        # truncation error.
+        linc = lmax + 4
+        # Spread the incident directions evenly over the sphere on a
+        # Fibonacci lattice.  Each solution gives two incident states, and we
+        # take 50% more of them than there are unknowns.
+        ndir = 3 * linc * (linc + 2) // 2
+        i = np.arange(ndir) + 0.5
+        betas = np.arccos(1 - 2 * i / ndir)
+        alphas = (np.pi * (1 + np.sqrt(5)) * i) % (2 * np.pi)
+
+        scat = [amn]
+        inc = [_plane_wave_coeffs(0., 0., linc).reshape(-1, 2)]
+        for alpha, beta in zip(alphas, betas):
+            amn, lmax_dir = self._amncalc(centers, m, x,
+                                          np.degrees([alpha, beta]))
+            # amncalc returns the expansion in the frame of the incident
+            # light, turn it back into the cluster frame
+            scat.append(_rotate_amn(amn, alpha, beta, lmax_dir, inverse=True))
+            lmax = max(lmax, lmax_dir)
+            inc.append(_plane_wave_coeffs(alpha, beta, linc).reshape(-1, 2))
+
+        # amncalc picks the cluster order separately for each direction, so
+        # pad the expansions with zeros up to the largest order it chose
+        nmax = lmax * (lmax + 2)
+        scat = [np.pad(a, ((0, 0), (0, nmax - a.shape[1]), (0, 0)),
+                       'constant').reshape(-1, 2) for a in scat]
+
+        # least squares solution of tmatrix . inc = scat
+        tmatrix = np.linalg.lstsq(np.hstack(inc).T, np.hstack(scat).T,
+                                  rcond=None)[0].T
+        return tmatrix, lmax
+
+    def _amn_from_tmatrix(self, centers, m, x):
+        """
+        Find the amn coefficients of a cluster by rotating the expansion
+        given by the T-matrix of a previously seen orientation of it.
+        """
+        # the distances between the spheres identify a rigid cluster
+        # independent of its orientation
+        dists = np.round(np.sqrt(((centers[:, np.newaxis] -
+                                   centers)**2).sum(-1)), 8)
+        key = (tuple(dists.ravel()), tuple(m), tuple(x), self.niter,
+               self.eps, self.qeps1, self.qeps2, self.meth)
+        cached = self.tmatrix_cache.get(key)
+        if cached is None:
+            tmatrix, lmax = self._cluster_tmatrix(centers, m, x)
+            self.tmatrix_cache.put(key, (centers, tmatrix, lmax))
+            rot = np.identity(3)
+        else:
+            ref, tmatrix, lmax = cached
+            rot = _rotation_between(ref, centers)
+            if rot is None:
+                # a mirror image of the cached cluster, which no rotation
+                # can produce
+                return self._amncalc(centers, m, x)
+
+        # express the rotation in the fortran code's flipped z coordinates
+        flip = np.array([1., 1., -1.])
+        return _tmatrix_amn(tmatrix, lmax, rot * np.outer(flip, flip)), lmax
 
     def _raw_fields(self, positions, scatterer, optics):
         amn, lmax = self._scsmfo_setup(scatterer, optics)
-        fields = mieangfuncs.tmatrix_fields(positions, amn, lmax, 0,
-                                            optics.polarization,
-                                            self.compute_escat_radial)
+        fields = self._map_points(mieangfuncs.tmatrix_fields, positions, amn,
+                                  lmax, 0, optics.polarization,
+                                  self.compute_escat_radial)
         if np.isnan(fields[0][0]):
             raise MultisphereFieldNaN(self, scatterer, '')
 
@@ -235,9 +417,8 @@ class Multisphere(FortranTheory):
 
     def _calc_scat_matrix(self, scatterer, schema):
         amn, lmax = self._scsmfo_setup(scatterer, schema.optics)
-        scat_matrs = [_asm_far(theta, phi, amn, lmax) for
-                      theta, phi in schema.positions_theta_phi()]
-        return np.array(scat_matrs)
+        theta, phi = schema.positions_theta_phi().T
+        return _asm_far(theta, phi, amn, lmax)
 
     def _calc_cscat(self, scatterer, optics, amn = None, lmax = None):
         '''
@@ -295,15 +476,11 @@ class Multisphere(FortranTheory):
         if amn is None:
             amn, lmax = self._scsmfo_setup(scatterer, optics)
 
-        # define integrand: A^2 sin theta (vector scattering amplitude A)
+        # integrand: A^2 (vector scattering amplitude A)
         def ampsq(theta, phi):
-            einc = mieangfuncs.incfield(*pol, phi = phi)
-            asm = _asm_far(theta, phi, amn, lmax)
-            ascat_sph = np.dot(asm, einc) # in par/perp basis
-            ascatsq = (np.abs(ascat_sph)**2).sum()
-            return ascatsq * np.sin(theta)
+            return _scattered_ampsq(pol, theta, phi, amn, lmax)
 
-        integral = _integrate4pi(ampsq)
+        integral = self._integrate4pi(ampsq, lmax)
 
         cscat = integral / optics.wavevec**2
         return cscat
@@ -316,19 +493,34 @@ class Multisphere(FortranTheory):
         # normalize the polarization
         pol = optics.polarization / np.sqrt((optics.polarization**2).sum())
 
-        # define integrand: A^2 sin theta cos theta
+        # integrand: A^2 cos theta
         def costhetawt(theta, phi):
-            einc = mieangfuncs.incfield(*pol, phi = phi)
-            asm = _asm_far(theta, phi, amn, lmax)
-            ascat_sph = np.dot(asm, einc) # in par/perp basis
-            ascatsq = (np.abs(ascat_sph)**2).sum()
-            return ascatsq * np.sin(theta) * np.cos(theta)
+            return _scattered_ampsq(pol, theta, phi, amn, lmax) * cos(theta)
 
-        integral = _integrate4pi(costhetawt)
+        integral = self._integrate4pi(costhetawt, lmax)
 
         asym = integral / optics.wavevec**2 # need to divide by cscat
         return asym
 
+    def _integrate4pi(self, integrand, lmax):
+        """
+        Integrate over solid angle on the quadrature grid set by quad_order,
+        warning if comparison with a coarser grid suggests it has not
+        converged.
+        """
+        order = self.quad_order
+        if order is None:
+            order = lmax + 4
+        integral = _integrate4pi(integrand, order)
+        # The default grid integrates exactly, as does the one two orders
+        # coarser, so a difference means the grid is too coarse.
+        error = abs(integral - _integrate4pi(integrand, max(order - 2, 1)))
+        if error > 1e-6 * abs(integral):
+            warn("Quadrature over solid angle may not have converged " +
+                 "(estimated relative error {0:.1e}), ".format(
+                     error / abs(integral)) + "try a larger quad_order")
+        return integral
+
     def _calc_cross_sections(self, scatterer, optics):
         """
         Calculate scattering, absorption, and extinction cross
@@ -364,19 +556,149 @@ class Multisphere(FortranTheory):
         return np.array([cscat, cabs, cext, asym])
 
 
+# Default cache used by all Multisphere theories that do not ask for a private
+# one, so that the class level calls (which construct a new theory each time)
+# can reuse expansions too.  An expansion is at most a few hundred kB, the
+# memory limit keeps large clusters from piling up.
+_shared_amn_cache = LRUCache(64, maxbytes=64*2**20)
+
+# T-matrices are larger, several MB for big clusters, but the point of keeping
+# them is that each one replaces hundreds of solutions.
+_shared_tmatrix_cache = LRUCache(16, maxbytes=256*2**20)
+
+def _cluster_order_bound(centers, x):
+    """
+    Upper bound on the cluster expansion order amncalc will choose, from the
+    same estimates of the sphere (nodr) and cluster (nodrt) orders it uses
+    (see scsmfo_min.for).  This sets the size of the amn0 array it returns.
+    """
+    # distance of the far side of each sphere from the centroid
+    xc = np.sqrt((centers**2).sum(-1)) + x
+    return int(max((np.ceil(x + 4 * x**(1/3)) + 5).max(),
+                   (np.ceil(xc + 4 * xc**(1/3)) + 2).max()))
+
+def _vsh_orders(lmax):
+    """
+    orders n and m of the coefficients in the compact indexing SCSMFO uses
+    """
+    n = np.concatenate([np.repeat(l, 2*l + 1) for l in range(1, lmax + 1)])
+    m = np.concatenate([np.arange(-l, l + 1) for l in range(1, lmax + 1)])
+    return n, m
+
+def _plane_wave_coeffs(alpha, beta, lmax):
+    """
+    VSH coefficients of the two incident states of a plane wave propagating
+    in direction (theta, phi) = (beta, alpha) of the cluster frame, as set up
+    in amncalc (see scsmfo_min.for).  Returns an array (2, lmax*(lmax+2), 2)
+    indexed like amn.
+    """
+    n, m = _vsh_orders(lmax)
+    dbet = uts_scsmfo.rotcoef(cos(beta), 1, lmax, 1)[:, 1:lmax*(lmax+2)+1]
+    fac = 1j**(n+1) * np.sqrt(2*n + 1) / 2. * np.exp(-1j*m*alpha) * (-1.)**m
+    pmn = np.empty((2, len(n), 2), dtype='complex')
+    pmn[0, :, 0] = -fac * dbet[0]
+    pmn[1, :, 0] = fac * dbet[0]
+    pmn[:, :, 1] = fac * dbet[2]
+    return pmn
+
+def _rotate_amn(amn, alpha, beta, lmax, inverse=False):
+    """
+    Rotate expansion coefficients from the cluster frame into the frame of
+    light incident at Euler angles alpha, beta (or back, if inverse).  This
+    is rotvec from scsmfo_min.for with idir = 1 (idir = 2 for inverse).
+    """
+    dc = uts_scsmfo.rotcoef(cos(beta), lmax, lmax, lmax)
+    rotated = np.empty_like(amn)
+    for n in range(1, lmax + 1):
+        block = slice(n*n - 1, n*(n + 2))
+        # Wigner d matrix for order n, indexed [k, m]
+        d = dc[lmax-n:lmax+n+1, n*n:n*(n + 2)+1]
+        eal = np.exp(1j * np.arange(-n, n + 1) * alpha)[:, np.newaxis]
+        if inverse:
+            a = np.einsum('km,pkj->pmj', d, amn[:, block][:, ::-1]) * eal
+            rotated[:, block] = a[:, ::-1]
+        else:
+            rotated[:, block] = np.einsum('km,pkj->pmj', d,
+                                          amn[:, block] * eal)
+    return rotated
+
+def _tmatrix_amn(tmatrix, lmax, rot):
+    """
+    amn coefficients, for light incident along +z, of the cluster obtained by
+    applying the rotation matrix rot to the one tmatrix was computed for
+    (everything in the fortran code's coordinates).
+    """
+    # the direction of the incident light in the cluster frame
+    alpha = arctan2(rot[2, 1], rot[2, 0])
+    beta = np.arccos(np.clip(rot[2, 2], -1., 1.))
+    linc = int(round(np.sqrt(tmatrix.shape[1] // 2 + 1))) - 1
+    inc = _plane_wave_coeffs(alpha, beta, linc).reshape(-1, 2)
+    amn = _rotate_amn(np.dot(tmatrix, inc).reshape(2, -1, 2), alpha, beta,
+                      lmax)
+
+    # That leaves the cluster turned about the beam by the third Euler angle
+    # gamma, the angle of the lab x axis from the x axis of the incident
+    # frame.  Rotating about z multiplies coefficients by exp(i m gamma), and
+    # the two incident states carry an extra m of +1 and -1.
+    e_theta = np.array([cos(beta)*cos(alpha), cos(beta)*sin(alpha),
+                        -sin(beta)])
+    e_phi = np.array([-sin(alpha), cos(alpha), 0.])
+    gamma = arctan2(np.dot(rot[0], e_phi), np.dot(rot[0], e_theta))
+    _, m = _vsh_orders(lmax)
+    amn[:, :, 0] *= np.exp(1j * (m + 1) * gamma)
+    amn[:, :, 1] *= np.exp(1j * (m - 1) * gamma)
+    return amn
+
+def _rotation_between(ref, centers, tol=1e-6):
+    """
+    Find the rotation matrix taking the positions ref onto centers (both
+    relative to their centroid) by the Kabsch algorithm.  Returns None if
+    no proper rotation matches them to within tol.
+    """
+    u, _, vt = np.linalg.svd(np.dot(ref.T, centers))
+    if np.linalg.det(np.dot(u, vt)) < 0:
+        # the best fit is a reflection, so settle for the best rotation
+        u[:, -1] *= -1
+    rot = np.dot(u, vt).T
+    if np.abs(np.dot(ref, rot.T) - centers).max() > tol:
+        return None
+    return rot
+
 def _asm_far(theta, phi, amn, lmax):
     """
-    far field amplitude scattering matrix for fixed angles
+    far field amplitude scattering matrix for fixed angles.  theta and phi
+    may be arrays, giving an array of matrices (with the 2x2 matrix in the
+    last two dimensions)
     """
-    asm = np.roll(uts_scsmfo.asm(amn, lmax, theta, phi),
-                  -1).reshape((2,2)) * -0.5 #correction factor
-    return asm
+    theta, phi = np.broadcast_arrays(theta, phi)
+    sa = uts_scsmfo.asm_arr(amn, lmax, theta.ravel(), phi.ravel())
+    asm = np.roll(sa, -1, axis=0).reshape((2, 2, -1)) * -0.5 #correction factor
+    return np.rollaxis(asm, 2).reshape(theta.shape + (2, 2))
 
-def _integrate4pi(integrand):
+def _scattered_ampsq(pol, theta, phi, amn, lmax):
+    """
+    squared magnitude of the vector scattering amplitude for incident
+    polarization pol, at arrays of angles
+    """
+    # incident field in the par/perp basis, as in mieangfuncs.incfield
+    einc = np.array([pol[0] * cos(phi) + pol[1] * sin(phi),
+                     pol[0] * sin(phi) - pol[1] * cos(phi)])
+    ascat_sph = np.einsum('...ij,j...->...i', _asm_far(theta, phi, amn, lmax),
+                          einc)
+    return (np.abs(ascat_sph)**2).sum(-1)
+
+def _integrate4pi(integrand, order):
     '''
-    Integrate integrand(theta, phi) over 4 pi of spherical solid angle.
-    Integrand should already have factor of sin theta.
+    Integrate integrand(theta, phi) over 4 pi of spherical solid angle, using
+    Gauss-Legendre quadrature of the given order in cos theta and the
+    trapezoid rule with 2*order points in phi.  Integrand is called once,
+    with arrays of all the grid angles, and should not include the factor
+    of sin theta.
     '''
-    integral, error = dblquad(integrand, 0, 2 * np.pi, lambda theta:0.,
-                              lambda theta:np.pi)
-    return integral
+    mu, weights = np.polynomial.legendre.leggauss(order)
+    nphi = 2 * order
+    phi = np.arange(nphi) * 2 * np.pi / nphi
+    # keep equal thetas together so the far field code can reuse its
+    # angular functions
+    values = integrand(np.repeat(np.arccos(mu), nphi), np.tile(phi, order))
+    return np.dot(values.reshape(order, nphi).sum(1), weights) * 2*np.pi/nphi
@@ -24,10 +24,13 @@ calc_intensity and calc_holo, based on subclass's calc_field
 .. moduleauthor:: Thomas G. Dimiduk <tdimiduk@physics.harvard.edu>
 """
 
+import os
+import threading
 import numpy as np
+from multiprocessing.pool import ThreadPool
 from warnings import warn
 from ...core.marray import Image, VectorGrid, VectorSchema, dict_without, make_vector_schema
-from holopy.core.helpers import is_none
+from holopy.core.helpers import is_none, _ensure_array
 from ...core import Optics
 from ...core.holopy_object import HoloPyObject
 from ..binding_method import binding, finish_binding
@@ -51,11 +54,23 @@ class ScatteringTheory(HoloPyObject):
     """
 
     def __init__(self):
+        # Theories with a precision constructor argument can store their
+        # results in single precision, others always work in double.  Reject
+        # a bad precision now rather than at the first calculation.
+        _check_precision(getattr(self, 'precision', 'double'))
         # If the user instantiates a theory, we need to replace the classmethods
         # that instantiate an object with normal methods that reference the
         # theory object
         finish_binding(self)
 
+    @property
+    def _complex_dtype(self):
+        return _precision_dtypes[getattr(self, 'precision', 'double')]
+
+    @property
+    def _real_dtype(self):
+        return np.finfo(self._complex_dtype).dtype
+
     @classmethod
     @binding
     def calc_field(cls_self, scatterer, schema, scaling = 1.0):
@@ -117,7 +132,7 @@ class ScatteringTheory(HoloPyObject):
         of E x B cannot depend on Ez.
         """
         field = cls_self.calc_field(scatterer, schema = schema, scaling = scaling)
-        normal = np.array([0, 0, 1])
+        normal = np.array([0, 0, 1], dtype=np.finfo(field.dtype).dtype)
         normal = normal.reshape(_field_scalar_shape(field))
         return (abs(field*(1-normal))**2).sum(-1)
 
@@ -162,6 +177,76 @@ class ScatteringTheory(HoloPyObject):
         scat = cls_self.calc_field(scatterer, schema = schema, scaling = scaling)
         return scattered_field_to_hologram(scat, schema.optics)
 
+    @classmethod
+    @binding
+    def calc_holo_batch(cls_self, scatterers, schema, scalings=1.0, out=None):
+        """
+        Calculate holograms of many scatterers on the same schema
+
+        Parameters
+        ----------
+        scatterers : list of :mod:`.scatterer` objects
+            scatterers to compute holograms for, one hologram per scatterer
+        schema : :class:`.Schema` object
+            where to compute the holograms, shared by all of the scatterers
+        scalings : float or list of float
+            scaling value (alpha) for intensity of reference wave, either one
+            for all holograms or one per scatterer
+        out : ndarray (optional)
+            C-contiguous float array of shape (len(scatterers),) + schema.shape
+            to write the holograms into.  If not given, a new array is
+            allocated
+
+        Returns
+        -------
+        holos : ndarray
+            stacked holograms, holos[i] is the hologram of scatterers[i].
+            This is a plain array, it does not carry schema metadata
+
+        Notes
+        -----
+        This gives the same results as calling calc_holo for each scatterer,
+        but computes the schema's pixel positions only once and avoids
+        building intermediate marrays, so the per hologram overhead is
+        much smaller.  Use it for generating lots of synthetic holograms or
+        for grid searches.
+        """
+        scatterers = list(scatterers)
+        scalings = _ensure_array(scalings)
+        if len(scalings) == 1:
+            scalings = scalings.repeat(len(scatterers))
+        if len(scalings) != len(scatterers):
+            raise ValueError("Got {0} scalings for {1} scatterers, give either "
+                             "one scaling or one per scatterer".format(
+                                 len(scalings), len(scatterers)))
+
+        for scatterer in scatterers:
+            if isinstance(scatterer, Sphere) and is_none(scatterer.center):
+                raise NoCenter("Center is required for hologram calculation "
+                               "of a sphere")
+        if schema.optics.polarization.shape != (2,):
+            raise NoPolarization("Polarization is required for hologram "
+                                 "calculation")
+
+        shape = (len(scatterers),) + tuple(schema.shape)
+        if out is None:
+            out = np.empty(shape, dtype=cls_self._real_dtype)
+        elif (out.shape != shape or not out.flags.c_contiguous or
+              out.dtype.kind != 'f'):
+            raise ValueError("out must be a C-contiguous float array of "
+                             "shape {0}".format(shape))
+
+        cls_self._calc_holo_batch(scatterers, schema, scalings,
+                                  out.reshape(len(scatterers), -1))
+        return out
+
+    def _calc_holo_batch(self, scatterers, schema, scalings, out):
+        # Generic version, theories that can compute raw fields directly
+        # should override this with something faster.  out is a
+        # (n_scatterers, n_points) view of the output array
+        for i, (scatterer, scaling) in enumerate(zip(scatterers, scalings)):
+            out[i] = self.calc_holo(scatterer, schema, scaling).ravel()
+
     @classmethod
     @binding
     def calc_cross_sections(cls_self, scatterer, optics):
@@ -229,35 +314,127 @@ class ScatteringTheory(HoloPyObject):
 # Subclass of scattering theory, overrides functions that depend on array
 # ordering and handles the tranposes for sending values to/from fortran
 class FortranTheory(ScatteringTheory):
+    @property
+    def _n_threads(self):
+        # Subclasses take an n_threads constructor argument, if it is not
+        # given fall back to the environment and then to a single thread
+        n_threads = getattr(self, 'n_threads', None)
+        if n_threads is None:
+            n_threads = os.environ.get('HOLOPY_NUM_THREADS', 1)
+        return max(int(n_threads), 1)
+
+    def _map_points(self, kernel, points, *args):
+        """
+        Evaluate a Fortran field kernel, splitting the points across threads
+
+        Parameters
+        ----------
+        kernel : f2py function
+            Kernel taking a (3, N) array of points as its first argument and
+            returning the x, y, z field components at those points.  It must
+            be marked threadsafe (release the GIL) for threads to help.
+        points : ndarray (3, N)
+            Points (kr, theta, phi) to evaluate the kernel at
+        *args
+            The remaining arguments for kernel
+
+        Returns
+        -------
+        es_x, es_y, es_z : ndarray (N)
+            Field components, identical to calling kernel(points, *args)
+            directly regardless of the number of threads used
+        """
+        n_threads = min(self._n_threads,
+                        points.shape[1] // _min_points_per_thread)
+        if n_threads <= 1:
+            return kernel(points, *args)
+
+        edges = np.linspace(0, points.shape[1], n_threads+1).astype('int')
+        blocks = [points[:, start:stop] for start, stop in
+                  zip(edges[:-1], edges[1:])]
+        results = _thread_pool(n_threads).map(lambda b: kernel(b, *args),
+                                              blocks)
+        return [np.concatenate(component) for component in zip(*results)]
+
     def _calc_field(self, scatterer, schema):
-        def get_field(s):
-            positions = schema.positions.kr_theta_phi(s.center, schema.optics)
-            field = np.vstack(self._raw_fields(positions.T, s, schema.optics)).T
-            phase = np.exp(-1j*np.pi*2*s.center[2] / schema.optics.med_wavelen)
-            if self._scatterer_overlaps_schema(scatterer, schema):
-                inner = scatterer.contains(schema.positions.xyz())
-                field[inner] = np.vstack(
-                    self._raw_internal_fields(positions[inner].T, s,
-                                              schema.optics)).T
-            field *= phase
-            return make_vector_schema(schema).interpret_1d(field)
-
-
-        # See if we can handle the scatterer in one step
+        positions = schema.positions.xyz()
+        field = np.empty((len(positions), 3), dtype=self._complex_dtype)
+        self._superpose_fields(scatterer, schema, positions, field)
+        # attach the metadata only once, to the finished field
+        return make_vector_schema(schema).interpret_1d(field)
+        # TODO: fix internal field and re-enable this
+#        return self._set_internal_fields(field, scatterer)
+
+    def _superpose_fields(self, scatterer, schema, positions, out):
+        """
+        Compute the scattered field of scatterer into a preallocated buffer
+
+        Composite scatterers the theory cannot handle in one step are
+        superposed one component at a time.  Each component's field is added
+        straight into out, and the coordinate arrays are reused between
+        components, so memory use does not grow with the number of components.
+
+        Parameters
+        ----------
+        scatterer : :class:`.Scatterer`
+            The scatterer to compute the field of
+        schema : :class:`.Schema`
+            Provides the optics (and is checked for overlap with scatterer)
+        positions : ndarray (N, 3)
+            Cartesian positions to compute the field at
+        out : ndarray(complex) (N, 3)
+            Buffer the field is written to, its old contents are discarded.
+            It may be single precision, the field is always computed in
+            double precision and only rounded when it is stored in out.
+        """
         if self._can_handle(scatterer):
-            field = get_field(scatterer)
+            components = [scatterer]
         elif isinstance(scatterer, Scatterers):
-        # if it is a composite, try superposition
-            scatterers = scatterer.get_component_list()
-            field = get_field(scatterers[0])
-            for s in scatterers[1:]:
-                field += get_field(s)
+            components = scatterer.get_component_list()
         else:
             raise TheoryNotCompatibleError(self, scatterer)
 
-        return field
-        # TODO: fix internal field and re-enable this
-#        return self._set_internal_fields(field, scatterer)
+        optics = schema.optics
+        inner = None
+        if self._scatterer_overlaps_schema(scatterer, schema):
+            inner = scatterer.contains(positions)
+
+        kr_positions = np.empty((len(positions), 3))
+        scratch = np.empty((3, len(positions)))
+        component = np.empty(len(positions), dtype=out.dtype)
+        out[...] = 0
+        for s in components:
+            _kr_theta_phi(positions, s.center, optics, kr_positions, scratch)
+            # the kernels want (3, N) points, which kr_positions.T is without
+            # needing a copy
+            fields = self._raw_fields(kr_positions.T, s, optics)
+            if inner is not None:
+                internal = self._raw_internal_fields(kr_positions[inner].T, s,
+                                                     optics)
+            phase = np.exp(-1j*np.pi*2*s.center[2] / optics.med_wavelen)
+            for i, field in enumerate(fields):
+                np.multiply(field, phase, out=component)
+                if inner is not None:
+                    component[inner] = internal[i] * phase
+                out[:, i] += component
+
+    def _calc_holo_batch(self, scatterers, schema, scalings, out):
+        # compute the pixel positions once and reuse them (and scratch
+        # buffers for the field and intensities) for every scatterer
+        positions = schema.positions.xyz()
+        ref = np.append(schema.optics.polarization, 0)
+        field = np.empty((len(positions), 3), dtype=self._complex_dtype)
+        intensity = np.empty((len(positions), 2), dtype=self._real_dtype)
+
+        for i, (scatterer, scaling) in enumerate(zip(scatterers, scalings)):
+            self._superpose_fields(scatterer, schema, positions, field)
+            field *= scaling
+            field += ref
+            # only the x and y components reach a detector in the xy plane
+            # (see scattered_field_to_hologram)
+            np.abs(field[:, :2], out=intensity)
+            intensity **= 2
+            intensity.sum(-1, out=out[i])
 
 
     def _scatterer_overlaps_schema(self, scatterer, schema):
@@ -300,6 +477,56 @@ class FortranTheory(ScatteringTheory):
                                 fields[i, j, k] = 0
         return fields
 
+# Precisions theories can store fields and holograms in
+_precision_dtypes = {'double': np.dtype('complex128'),
+                     'single': np.dtype('complex64')}
+
+def _check_precision(precision):
+    if precision not in _precision_dtypes:
+        raise ValueError("precision must be one of {0}, not {1}".format(
+            sorted(_precision_dtypes.keys()), repr(precision)))
+
+# Don't bother splitting up calculations with fewer points than this per thread,
+# threading overhead would eat any gain
+_min_points_per_thread = 256
+
+_thread_pools = {}
+_thread_pools_lock = threading.Lock()
+def _thread_pool(n_threads):
+    # Thread pools are expensive to start, so keep one around for each thread
+    # count we are asked for.  They live at module level so that theory objects
+    # remain picklable
+    with _thread_pools_lock:
+        if n_threads not in _thread_pools:
+            _thread_pools[n_threads] = ThreadPool(n_threads)
+        return _thread_pools[n_threads]
+
+def _kr_theta_phi(positions, center, optics, out, scratch):
+    # Same as Positions.kr_theta_phi, but computed in place in the (N, 3) out
+    # using a (3, N) scratch buffer so that superposing many scatterers does
+    # not allocate new coordinate arrays for each one
+    x, y, z = scratch
+    np.subtract(positions[:, 0], center[0], out=x)
+    np.subtract(positions[:, 1], center[1], out=y)
+    # sign is reversed for z because of our choice of image centric rather
+    # than particle centric coordinate system
+    np.subtract(center[2], positions[:, 2], out=z)
+
+    kr, theta, phi = out.T
+    np.arctan2(y, x, out=phi)
+    # get phi between 0 and 2pi
+    phi[phi < 0] += 2*np.pi
+    x **= 2
+    y **= 2
+    x += y
+    np.sqrt(x, out=y)
+    np.arctan2(y, z, out=theta)
+    z **= 2
+    x += z
+    np.sqrt(x, out=kr)
+    kr *= optics.wavevec
+    return out
+
 def _field_scalar_shape(e):
     # this is a clever hack with list arithmetic to get [1, 3] or [1,
     # 1, 3] as needed
@@ -323,11 +550,15 @@ def scattered_field_to_hologram(scat, ref, detector_normal = (0, 0, 1)):
         (defaults to z hat, a detector in the x, y plane)
     """
     shape = _field_scalar_shape(scat)
+    # match the precision of the scattered field so that single precision
+    # fields give single precision holograms
+    dtype = np.finfo(scat.dtype).dtype
     if isinstance(ref, Optics):
         # add the z component to polarization and adjust the shape so that it is
         # broadcast correctly
-        ref = VectorGrid(np.append(ref.polarization, 0).reshape(shape))
-    detector_normal = np.array(detector_normal).reshape(shape)
+        ref = VectorGrid(np.append(ref.polarization, 0).reshape(shape).astype(
+            dtype))
+    detector_normal = np.array(detector_normal, dtype=dtype).reshape(shape)
 
     holo = Image((np.abs(scat+ref)**2 * (1 - detector_normal)).sum(axis=-1),
                  **dict_without(scat._dict, ['dtype', 'components']))